@@ -0,0 +1,76 @@
+"""
+분석 백엔드 선택 비즈니스 로직
+
+이 모듈은 무거운 집계를 실행할 분석 백엔드(pandas, DuckDB, Polars)의 목록과
+설치 여부/분석별 지원 여부에 따른 실제 사용 백엔드 결정 로직을 포함합니다.
+선택 의존성(duckdb, polars)이 없으면 모든 분석은 pandas 백엔드로 동작합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+from typing import Dict, Optional, Iterable
+
+from logic.duckdb_backend_logic import is_duckdb_available
+from logic.polars_backend_logic import is_polars_available
+
+# 분석 백엔드 {키: 표시 이름}
+ANALYSIS_BACKENDS = {
+    "pandas": "pandas (기본)",
+    "duckdb": "DuckDB (대용량 병렬 집계)",
+    "polars": "Polars (대용량 지연 쿼리)"
+}
+
+# 백엔드별 설치 여부 확인 함수 (pandas는 항상 사용 가능)
+_AVAILABILITY_CHECKS = {
+    "duckdb": is_duckdb_available,
+    "polars": is_polars_available
+}
+
+
+def is_backend_available(backend: str) -> bool:
+    """
+    백엔드 사용 가능 여부를 반환합니다.
+
+    Args:
+        backend: 백엔드 키
+
+    Returns:
+        bool: 등록된 백엔드이고 필요한 패키지가 설치되어 있으면 True
+    """
+    if backend not in ANALYSIS_BACKENDS:
+        return False
+    check = _AVAILABILITY_CHECKS.get(backend)
+    return check is None or check()
+
+
+def get_available_backends(supported: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    현재 환경에서 사용할 수 있는 분석 백엔드 목록을 반환합니다.
+
+    Args:
+        supported: 분석이 지원하는 백엔드 키 목록 (None이면 전체)
+
+    Returns:
+        Dict[str, str]: {백엔드 키: 표시 이름}
+    """
+    supported = set(ANALYSIS_BACKENDS if supported is None else supported)
+    return {
+        key: label for key, label in ANALYSIS_BACKENDS.items()
+        if key in supported and is_backend_available(key)
+    }
+
+
+def resolve_backend(backend: Optional[str], supported: Optional[Iterable[str]] = None) -> str:
+    """
+    요청한 백엔드를 실제 사용할 백엔드로 변환합니다.
+    (설치되어 있지 않거나 분석이 지원하지 않는 백엔드면 pandas)
+
+    Args:
+        backend: 요청한 백엔드 키
+        supported: 분석이 지원하는 백엔드 키 목록 (None이면 전체)
+
+    Returns:
+        str: "pandas", "duckdb" 또는 "polars"
+    """
+    if backend and backend in get_available_backends(supported):
+        return backend
+    return "pandas"
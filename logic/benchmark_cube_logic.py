@@ -0,0 +1,110 @@
+"""
+큐브 캐시 질의 벤치마크
+
+이 모듈은 데이터셋 큐브가 캐시된 뒤의 질의(프로모션 건수 행렬, 상담원 실적 분류 건수,
+일일 승인 현황) 지연 시간을 두 가지 행 수에서 측정합니다.
+차원 값 조합 수(셀 수)는 같고 행 수만 다른 무작위 데이터를 고정 시드로 생성하므로,
+캐시된 질의가 원본 행을 다시 읽지 않으면 두 행 수의 지연 시간이 거의 같아야 합니다.
+
+실행 방법:
+    python -m logic.benchmark_cube_logic
+    python -m logic.benchmark_cube_logic --rows 100000 2000000 --repeat 20
+"""
+
+import argparse
+import time
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, List
+
+from logic.promotion_logic import build_promotion_matrix_from_cube
+from logic.consultant_logic import _consultant_cube, _count_consultant_products, _first_order_rows
+from logic.daily_approval_logic import analyze_daily_approval
+from logic.dataset_cache_logic import clear_dataset_cache
+
+# 기본 행 수, 반복 횟수, 시드
+DEFAULT_ROWS = [100_000, 1_000_000]
+DEFAULT_REPEAT = 10
+SEED = 20240601
+
+CONSULTANTS = [f"상담사{i:02d}" for i in range(40)]
+CATEGORIES = ["안마의자", "라클라우드", "정수기", "비데"]
+SALES_TYPES = ["일반", "더케어", "멤버십"]
+
+
+def make_order_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    """프로모션/상담원 실적/일일 승인 질의에 공통으로 쓰는 무작위 주문 데이터프레임"""
+    rng = np.random.default_rng(seed)
+
+    def pick(values: List[str]) -> np.ndarray:
+        return np.array(values, dtype=object)[rng.integers(0, len(values), rows)]
+
+    return pd.DataFrame({
+        "상담사": pick(CONSULTANTS),
+        "상담사 조직": pick(["CRM파트", "온라인파트"]),
+        "판매 인입경로": pick(["CRM", "연계"]),
+        "판매채널": pick(["본사", "온라인"]),
+        "일반회차 캠페인": pick(["V-봄", "C-여름"]),
+        "대분류": pick(CATEGORIES),
+        "판매 유형": pick(SALES_TYPES),
+        "매출 금액": rng.integers(0, 5_000_000, rows),
+        "주문 일자": pd.Timestamp("2024-05-01") + pd.to_timedelta(rng.integers(0, 14, rows), unit="D"),
+    })
+
+
+def _median_seconds(query: Callable[[], object], repeat: int) -> float:
+    """첫 호출(큐브 생성)을 제외한 반복 호출의 중앙값 지연 시간 (초)"""
+    query()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings))
+
+
+def run_benchmark(row_counts: List[int], repeat: int = DEFAULT_REPEAT) -> pd.DataFrame:
+    """
+    행 수별로 캐시된 큐브 질의의 중앙값 지연 시간을 측정합니다.
+
+    Args:
+        row_counts: 측정할 행 수 목록
+        repeat: 질의별 반복 횟수
+
+    Returns:
+        pd.DataFrame: 질의 × 행 수 지연 시간 (밀리초)
+    """
+    results: Dict[int, Dict[str, float]] = {}
+    for rows in row_counts:
+        clear_dataset_cache()
+        df = make_order_frame(rows)
+        start, end = pd.Timestamp("2024-05-03"), pd.Timestamp("2024-05-10")
+
+        queries = {
+            "프로모션 건수 행렬": lambda: build_promotion_matrix_from_cube(df, start, end),
+            "상담원 실적 분류 건수": lambda: (
+                _count_consultant_products(_consultant_cube(df)), _first_order_rows(_consultant_cube(df))
+            ),
+            "일일 승인 현황": lambda: analyze_daily_approval(df, backend="pandas"),
+        }
+        results[rows] = {name: _median_seconds(query, repeat) * 1000 for name, query in queries.items()}
+
+    table = pd.DataFrame(results)
+    table.columns = [f"{rows:,}행 (ms)" for rows in row_counts]
+    table.index.name = "질의"
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="큐브 캐시 질의 지연 시간을 행 수별로 측정합니다.")
+    parser.add_argument("--rows", type=int, nargs=2, default=DEFAULT_ROWS, help="비교할 두 행 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="질의별 반복 횟수")
+    args = parser.parse_args()
+
+    table = run_benchmark(args.rows, args.repeat)
+    table["비율"] = table.iloc[:, 1] / table.iloc[:, 0]
+    print(table.round(2).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+"""
+콜타임 당일 스냅샷 비즈니스 로직
+
+이 모듈은 하루에 여러 번 업로드되는 콜타임 파일을 업로드 시각별 스냅샷
+(상담원 ID → 누적 통화 시간(초), 통화 건수, 그 시각의 목표 콜타임)으로 보관하고,
+스냅샷 사이의 상담원별 페이스(목표 대비 달성률) 변화를 계산하는 로직을 포함합니다.
+상담원명은 영업일별 ID 사전으로 정수 ID에 대응시키고, 스냅샷은 int32 배열만 보관합니다.
+업로드 파일은 내용 해시로 구분하여, 같은 파일을 다시 올리거나 화면이 다시 그려질 때는 재처리하지 않습니다.
+스냅샷은 구분(팀 등)과 영업일별로 분석 이력 DB(analysis_history_manager)에 저장하므로 앱을 다시 시작해도 유지되며,
+프로세스 안에서는 (구분, 영업일)별 저장소로 캐시합니다.
+그룹/층별로 나뉜 여러 콜타임 파일은 새 파일만 별도 프로세스에서 동시에 처리한 뒤(엑셀 파싱은 GIL에 묶이므로 스레드 대신 프로세스)
+상담원 기준으로 합쳐 하나의 스냅샷으로 기록합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime, date
+from typing import Tuple, Dict, List, Optional, Any, Sequence, Union
+
+from logic.consultant_logic import process_calltime_file, merge_calltime_frames
+from utils.analysis_history_manager import (
+    DEFAULT_DB_PATH, compute_source_hash, save_calltime_snapshot, load_calltime_snapshots
+)
+
+# 페이스 하락으로 표시할 달성률 하락 폭 (%p, 직전 스냅샷 대비)
+PACE_DROP_THRESHOLD = 10.0
+
+# 기본 스냅샷 구분 (팀을 나누지 않고 업로드하는 경우)
+DEFAULT_SNAPSHOT_SCOPE = "전체"
+
+# 구분별로 보관할 영업일 수 (오래된 영업일의 스냅샷부터 삭제)
+_MAX_SNAPSHOT_DAYS = 7
+
+# 프로세스 안에 캐시할 (구분, 영업일) 저장소 수
+_MAX_CACHED_STORES = 16
+
+# 처리된 콜타임 파일 캐시 크기 (파일 해시 기준)
+_MAX_PARSED_UPLOADS = 32
+
+# 콜타임 파일 동시 처리 프로세스 수
+_MAX_PARSE_WORKERS = 4
+
+# 처리된 콜타임 파일 {파일 해시: 콜타임 데이터프레임}
+_PARSED_UPLOADS: Dict[str, pd.DataFrame] = {}
+
+# DB에서 불러온 스냅샷 저장소 캐시 {(구분, 영업일 'YYYY-MM-DD'): CalltimeSnapshotStore}
+_SNAPSHOT_STORES: Dict[Tuple[str, str], "CalltimeSnapshotStore"] = {}
+
+
+@dataclass(frozen=True, eq=False)
+class CalltimeSnapshot:
+    """
+    콜타임 업로드 한 번의 스냅샷
+
+    Attributes:
+        taken_at: 업로드(최초 처리) 시각
+        source_hash: 원본 파일 내용 해시
+        ids: 상담원 ID (int32, 저장소 ID 사전 기준)
+        seconds: 누적 통화 시간 초 (int32)
+        calls: 누적 통화 건수 (int32)
+        targets: 업로드 시각까지의 목표 콜타임 초 (int32)
+    """
+    taken_at: datetime
+    source_hash: str
+    ids: np.ndarray
+    seconds: np.ndarray
+    calls: np.ndarray
+    targets: np.ndarray
+
+
+class CalltimeSnapshotStore:
+    """
+    구분(팀 등)별 영업일 하루의 콜타임 스냅샷 저장소
+
+    Attributes:
+        business_date: 영업일 ('YYYY-MM-DD')
+        scope: 스냅샷 구분
+        snapshots: 업로드 시각 오름차순 스냅샷 목록
+    """
+
+    def __init__(self, business_date: str, scope: str = DEFAULT_SNAPSHOT_SCOPE):
+        self.business_date = business_date
+        self.scope = scope
+        self.snapshots: List[CalltimeSnapshot] = []
+        self._ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_records(cls, business_date: str, scope: str, records: pd.DataFrame) -> "CalltimeSnapshotStore":
+        """
+        이력 DB에서 조회한 스냅샷 행으로 저장소를 만듭니다.
+
+        Args:
+            business_date: 영업일 ('YYYY-MM-DD')
+            scope: 스냅샷 구분
+            records: load_calltime_snapshots 결과
+
+        Returns:
+            CalltimeSnapshotStore: 스냅샷 저장소
+        """
+        store = cls(business_date, scope)
+        for (taken_at, source_hash), rows in records.groupby(["업로드시각", "파일해시"], sort=False):
+            store.add(
+                rows.rename(columns={"통화건수": "총 건수", "콜타임_초": "총 시간_초"}),
+                source_hash,
+                taken_at.to_pydatetime(),
+                pd.Series(rows["목표_초"].to_numpy(), index=rows["상담원명"].to_numpy())
+            )
+        return store
+
+    @property
+    def names(self) -> List[str]:
+        """ID 순서의 상담원명 목록"""
+        return list(self._ids)
+
+    def find(self, source_hash: str) -> Optional[CalltimeSnapshot]:
+        """파일 해시에 해당하는 스냅샷을 반환합니다. (없으면 None)"""
+        for snapshot in self.snapshots:
+            if snapshot.source_hash == source_hash:
+                return snapshot
+        return None
+
+    def add(
+        self,
+        calltime_df: pd.DataFrame,
+        source_hash: str,
+        taken_at: datetime,
+        target_seconds: Union[int, pd.Series] = 0
+    ) -> CalltimeSnapshot:
+        """
+        콜타임 데이터프레임을 스냅샷으로 추가합니다. (같은 파일 해시는 기존 스냅샷 반환)
+
+        Args:
+            calltime_df: process_calltime_file 결과 (상담원명, 총 건수, 총 시간_초)
+            source_hash: 원본 파일 내용 해시
+            taken_at: 업로드 시각
+            target_seconds: 업로드 시각까지의 목표 콜타임 초 (전체 공통 값 또는 상담원명 인덱스 Series)
+
+        Returns:
+            CalltimeSnapshot: 추가된 스냅샷
+        """
+        existing = self.find(source_hash)
+        if existing is not None:
+            return existing
+
+        names = calltime_df["상담원명"].astype(str).str.strip()
+        codes, uniques = pd.factorize(names)
+        ids = np.fromiter(
+            (self._ids.setdefault(name, len(self._ids)) for name in uniques),
+            dtype=np.int32, count=len(uniques)
+        )
+
+        # 같은 상담원이 여러 행이면 합산
+        seconds = pd.to_numeric(calltime_df["총 시간_초"], errors="coerce").fillna(0).to_numpy()
+        calls = pd.to_numeric(calltime_df["총 건수"], errors="coerce").fillna(0).to_numpy()
+        seconds = np.bincount(codes, weights=seconds, minlength=len(uniques))
+        calls = np.bincount(codes, weights=calls, minlength=len(uniques))
+
+        if isinstance(target_seconds, pd.Series):
+            targets = target_seconds.reindex(uniques).fillna(0).to_numpy()
+        else:
+            targets = np.full(len(uniques), target_seconds)
+
+        snapshot = CalltimeSnapshot(
+            taken_at=taken_at,
+            source_hash=source_hash,
+            ids=ids,
+            seconds=np.round(seconds).astype(np.int32),
+            calls=np.round(calls).astype(np.int32),
+            targets=np.round(targets).astype(np.int32)
+        )
+        self.snapshots.append(snapshot)
+        self.snapshots.sort(key=lambda item: item.taken_at)
+        return snapshot
+
+    def snapshot_values(self, snapshot: CalltimeSnapshot) -> pd.DataFrame:
+        """스냅샷의 상담원별 값 (이력 DB 저장 형식: 상담원명, 콜타임_초, 통화건수, 목표_초)"""
+        return pd.DataFrame({
+            "상담원명": np.asarray(self.names, dtype=object)[snapshot.ids],
+            "콜타임_초": snapshot.seconds,
+            "통화건수": snapshot.calls,
+            "목표_초": snapshot.targets
+        })
+
+    def _matrix(self, field: str) -> np.ndarray:
+        """스냅샷 × 상담원 ID 값 행렬 (스냅샷에 없는 상담원은 -1)"""
+        matrix = np.full((len(self.snapshots), len(self._ids)), -1, dtype=np.int64)
+        for row, snapshot in enumerate(self.snapshots):
+            matrix[row, snapshot.ids] = getattr(snapshot, field)
+        return matrix
+
+    def pace_curve(self) -> pd.DataFrame:
+        """
+        상담원별 스냅샷 시각의 누적 콜타임과 목표 대비 달성률을 반환합니다.
+
+        Returns:
+            pd.DataFrame: [시각, 상담원명, 콜타임_초, 통화건수, 목표_초, 달성률] (목표가 0인 시각의 달성률은 NaN)
+        """
+        columns = ["시각", "상담원명", "콜타임_초", "통화건수", "목표_초", "달성률"]
+        if not self.snapshots:
+            return pd.DataFrame(columns=columns)
+
+        rows = np.concatenate([np.full(len(snapshot.ids), row) for row, snapshot in enumerate(self.snapshots)])
+        ids = np.concatenate([snapshot.ids for snapshot in self.snapshots])
+        seconds = np.concatenate([snapshot.seconds for snapshot in self.snapshots]).astype(np.int64)
+        targets = np.concatenate([snapshot.targets for snapshot in self.snapshots]).astype(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(targets > 0, seconds / targets * 100, np.nan)
+
+        times = pd.DatetimeIndex([snapshot.taken_at for snapshot in self.snapshots])
+        curve = pd.DataFrame({
+            "시각": times[rows],
+            "상담원명": np.asarray(self.names, dtype=object)[ids],
+            "콜타임_초": seconds,
+            "통화건수": np.concatenate([snapshot.calls for snapshot in self.snapshots]),
+            "목표_초": targets,
+            "달성률": rates
+        }, columns=columns)
+        return curve.sort_values(["상담원명", "시각"], kind="stable").reset_index(drop=True)
+
+    def pace_changes(self, threshold: float = PACE_DROP_THRESHOLD) -> pd.DataFrame:
+        """
+        최근 두 스냅샷 사이의 상담원별 페이스 변화를 계산합니다.
+
+        구간 페이스는 두 스냅샷 사이에 늘어난 콜타임을 늘어난 목표로 나눈 값이며,
+        현재 달성률이 직전 대비 threshold(%p) 이상 떨어지면 페이스 하락으로 표시합니다.
+
+        Args:
+            threshold: 페이스 하락 기준 (%p)
+
+        Returns:
+            pd.DataFrame: [상담원명, 직전 달성률, 현재 달성률, 변화, 구간 콜타임_초, 구간 페이스, 하락]
+                (최근 두 스냅샷 모두에 있는 상담원만, 변화 오름차순 / 스냅샷이 2개 미만이면 빈 프레임)
+        """
+        columns = ["상담원명", "직전 달성률", "현재 달성률", "변화", "구간 콜타임_초", "구간 페이스", "하락"]
+        if len(self.snapshots) < 2:
+            return pd.DataFrame(columns=columns)
+
+        seconds = self._matrix("seconds")[-2:]
+        targets = self._matrix("targets")[-2:]
+        present = (seconds >= 0).all(axis=0)
+
+        seconds = seconds[:, present].astype(float)
+        targets = targets[:, present].astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(targets > 0, seconds / targets * 100, np.nan)
+            delta_seconds = seconds[1] - seconds[0]
+            delta_targets = targets[1] - targets[0]
+            interval_pace = np.where(delta_targets > 0, delta_seconds / delta_targets * 100, np.nan)
+
+        change = rates[1] - rates[0]
+        result = pd.DataFrame({
+            "상담원명": np.asarray(self.names, dtype=object)[present],
+            "직전 달성률": rates[0],
+            "현재 달성률": rates[1],
+            "변화": change,
+            "구간 콜타임_초": delta_seconds.astype(np.int64),
+            "구간 페이스": interval_pace,
+            "하락": np.nan_to_num(change, nan=0.0) <= -threshold
+        }, columns=columns)
+        return result.sort_values("변화", kind="stable", na_position="last").reset_index(drop=True)
+
+
+def _file_bytes(file) -> bytes:
+    """업로드 파일 객체의 전체 내용 (파일 위치는 유지)"""
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    position = file.tell()
+    file.seek(0)
+    content = file.read()
+    file.seek(position)
+    return content
+
+
+def _parse_calltime_bytes(content: bytes) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """콜타임 파일 내용 하나를 처리합니다. (프로세스 풀 작업 단위, 파일 객체 대신 bytes를 전달)"""
+    return process_calltime_file(BytesIO(content))
+
+
+def _parse_calltime_contents(contents: List[bytes]) -> List[Tuple[Optional[pd.DataFrame], Optional[str]]]:
+    """
+    콜타임 파일 내용들을 처리합니다. (2개 이상이면 프로세스 풀에서 동시에 처리)
+
+    Args:
+        contents: 파일 내용 목록
+
+    Returns:
+        List[Tuple[Optional[pd.DataFrame], Optional[str]]]: 파일별 process_calltime_file 결과
+    """
+    if len(contents) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(contents))) as executor:
+                return list(executor.map(_parse_calltime_bytes, contents))
+        except (OSError, BrokenProcessPool):
+            # 프로세스를 만들 수 없는 환경이면 순서대로 처리
+            pass
+    return [_parse_calltime_bytes(content) for content in contents]
+
+
+def load_calltime_uploads(files: Sequence[Any]) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[pd.DataFrame], Optional[str]]:
+    """
+    콜타임 업로드 파일들을 처리하여 하나의 콜타임 데이터프레임으로 합칩니다.
+
+    이미 처리한 파일(내용 해시 기준)은 다시 읽지 않고, 새 파일만 프로세스 풀에서 동시에 처리합니다.
+    여러 파일에 나온 상담원은 merge_calltime_frames 규칙으로 합산합니다. (같은 내용의 파일은 한 번만 반영)
+
+    Args:
+        files: 업로드된 콜타임 엑셀 파일 객체 목록
+
+    Returns:
+        Tuple: 통합 콜타임 데이터프레임, 파일 묶음 해시(파일 순서 무관), 충돌 내역, 오류 메시지(있는 경우)
+    """
+    files = [file for file in files if file is not None]
+    if not files:
+        return None, None, None, "콜타임 파일이 없습니다."
+
+    hashes = [compute_source_hash([file]) for file in files]
+    pending = {source_hash: file for source_hash, file in zip(hashes, files) if source_hash not in _PARSED_UPLOADS}
+
+    if pending:
+        results = dict(zip(pending, _parse_calltime_contents([_file_bytes(file) for file in pending.values()])))
+        for source_hash, (calltime_df, error) in results.items():
+            if error:
+                file_name = getattr(pending[source_hash], "name", "콜타임 파일")
+                return None, None, None, f"{file_name}: {error}" if len(files) > 1 else error
+        for source_hash, (calltime_df, _) in results.items():
+            if len(_PARSED_UPLOADS) >= _MAX_PARSED_UPLOADS:
+                _PARSED_UPLOADS.pop(next(iter(_PARSED_UPLOADS)))
+            _PARSED_UPLOADS[source_hash] = calltime_df
+
+    # 같은 내용의 파일을 두 번 올린 경우는 merge_calltime_frames가 한 번만 반영하고 충돌 내역에 표시
+    frames = [
+        (getattr(file, "name", source_hash), source_hash, _PARSED_UPLOADS[source_hash])
+        for source_hash, file in zip(hashes, files)
+    ]
+    calltime_df, conflicts = merge_calltime_frames(frames)
+
+    unique_hashes = sorted(set(hashes))
+    batch_hash = unique_hashes[0] if len(unique_hashes) == 1 else compute_source_hash(
+        [source_hash.encode() for source_hash in unique_hashes]
+    )
+    return calltime_df, batch_hash, conflicts, None
+
+
+def get_snapshot_store(
+    business_date: Union[date, datetime, str],
+    scope: str = DEFAULT_SNAPSHOT_SCOPE,
+    db_path: str = DEFAULT_DB_PATH
+) -> CalltimeSnapshotStore:
+    """
+    구분/영업일의 스냅샷 저장소를 반환합니다. (처음 조회하면 이력 DB에서 불러옴)
+
+    Args:
+        business_date: 영업일
+        scope: 스냅샷 구분 (예: 팀 이름, 기본값 "전체")
+        db_path: 이력 DB 파일 경로
+
+    Returns:
+        CalltimeSnapshotStore: 스냅샷 저장소
+    """
+    key = (scope, pd.Timestamp(business_date).strftime("%Y-%m-%d"))
+    store = _SNAPSHOT_STORES.get(key)
+    if store is None:
+        store = CalltimeSnapshotStore.from_records(key[1], scope, load_calltime_snapshots(scope, key[1], db_path))
+        if len(_SNAPSHOT_STORES) >= _MAX_CACHED_STORES:
+            _SNAPSHOT_STORES.pop(next(iter(_SNAPSHOT_STORES)))
+        _SNAPSHOT_STORES[key] = store
+    return store
+
+
+def record_calltime_snapshot(
+    calltime_df: pd.DataFrame,
+    source_hash: str,
+    business_date: Union[date, datetime, str],
+    taken_at: Optional[datetime] = None,
+    target_seconds: Union[int, pd.Series] = 0,
+    scope: str = DEFAULT_SNAPSHOT_SCOPE,
+    db_path: str = DEFAULT_DB_PATH
+) -> Tuple[CalltimeSnapshotStore, CalltimeSnapshot, Optional[str]]:
+    """
+    콜타임 업로드를 구분/영업일 스냅샷으로 기록하고 이력 DB에 저장합니다. (같은 파일은 한 번만 기록)
+
+    Args:
+        calltime_df: 콜타임 데이터프레임
+        source_hash: 원본 파일 내용 해시
+        business_date: 영업일
+        taken_at: 업로드 시각 (None이면 현재 시각)
+        target_seconds: 업로드 시각까지의 목표 콜타임 초 (전체 공통 값 또는 상담원명 인덱스 Series)
+        scope: 스냅샷 구분 (예: 팀 이름, 기본값 "전체")
+        db_path: 이력 DB 파일 경로
+
+    Returns:
+        Tuple[CalltimeSnapshotStore, CalltimeSnapshot, Optional[str]]:
+            저장소, 기록된(또는 기존) 스냅샷, DB 저장 오류 메시지(있는 경우, 스냅샷은 메모리에 유지)
+    """
+    store = get_snapshot_store(business_date, scope, db_path)
+    existing = store.find(source_hash)
+    if existing is not None:
+        return store, existing, None
+
+    snapshot = store.add(calltime_df, source_hash, taken_at or datetime.now(), target_seconds)
+    _, error = save_calltime_snapshot(
+        scope, store.business_date, source_hash, snapshot.taken_at, store.snapshot_values(snapshot),
+        keep_days=_MAX_SNAPSHOT_DAYS, db_path=db_path
+    )
+    return store, snapshot, error
+
+
+def clear_calltime_snapshots() -> None:
+    """처리된 파일 캐시와 스냅샷 저장소 캐시를 비웁니다. (이력 DB의 스냅샷은 유지)"""
+    _PARSED_UPLOADS.clear()
+    _SNAPSHOT_STORES.clear()
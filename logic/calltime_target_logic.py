@@ -0,0 +1,267 @@
+"""
+콜타임 목표 계산 비즈니스 로직
+
+이 모듈은 근무 형태(평일/휴일, 수동 설정)와 신입 그룹 목표를 상담원별 근무 프로필
+(하루 목표 초, 업무 시작/점심 시작/점심 종료/업무 종료 분)로 정리하고,
+현재 시각까지의 기대 콜타임, 진행률, 상태 이모지를 전체 상담원에 대해 배열 연산 한 번으로 계산하는 로직을 포함합니다.
+신입 그룹은 상담사 관리 JSON의 팀 이름이 신입 그룹 설정에 있는 경우이며, 근무 시간은 기본 근무 형태를 따르고 목표만 그룹 목표를 사용합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from datetime import datetime, time
+from typing import Dict, Optional, Any, Sequence, Union
+
+from utils.utils import is_holiday
+from utils.consultant_manager import get_consultant_team_map
+from utils.trainee_group_manager import load_trainee_groups
+
+# 근무 설정 상수
+WORK_CONFIG = {
+    "평일근무": {
+        "target_hours": 3,
+        "target_minutes": 30,
+        "work_start": "09:30",
+        "lunch_start": "11:50",
+        "lunch_end": "13:00",
+        "work_end": "18:30"
+    },
+    "휴일근무": {
+        "target_hours": 2,
+        "target_minutes": 0,
+        "work_start": "10:00",
+        "lunch_start": "12:30",
+        "lunch_end": "13:00",
+        "work_end": "15:30"
+    }
+}
+
+# 상태 이모지 기준 (기대 콜타임 대비 달성률 %)
+STATUS_ACHIEVED_RATE = 100.0
+STATUS_ALERT_RATE = 71.4  # 3시간 30분 목표 기준 2시간 30분 이하 페이스
+STATUS_ACHIEVED_EMOJI = "🚩"
+STATUS_ALERT_EMOJI = "⏰"
+
+# 근무 프로필 컬럼 (시각은 자정 기준 분)
+PROFILE_COLUMNS = ["프로필", "목표_초", "업무시작", "점심시작", "점심종료", "업무종료"]
+
+
+def get_work_config(target_date=None, manual_config=None):
+    """
+    근무 설정을 반환합니다.
+
+    Args:
+        target_date: 목표 날짜 (None이면 오늘)
+        manual_config: 수동 설정 딕셔너리 (None이면 자동)
+
+    Returns:
+        dict: 근무 설정
+    """
+    # 1. 수동 설정 최우선
+    if manual_config is not None:
+        return manual_config
+
+    # 2. 자동 감지
+    if target_date is None:
+        target_date = datetime.now()
+
+    # 3. 휴일 여부 확인 (기존 is_holiday 함수 활용)
+    if is_holiday(target_date):
+        return WORK_CONFIG["휴일근무"]
+    else:
+        return WORK_CONFIG["평일근무"]
+
+
+def get_work_profile_name(target_date=None, manual_config=None) -> str:
+    """
+    근무 설정의 표시 이름을 반환합니다. (get_work_config와 같은 우선순위)
+
+    Args:
+        target_date: 목표 날짜 (None이면 오늘)
+        manual_config: 수동 설정 딕셔너리 (None이면 자동)
+
+    Returns:
+        str: '수동 설정', '휴일근무' 또는 '평일근무'
+    """
+    if manual_config is not None:
+        return "수동 설정"
+    if target_date is None:
+        target_date = datetime.now()
+    return "휴일근무" if is_holiday(target_date) else "평일근무"
+
+
+def _clock_minutes(value: Union[str, time, datetime]) -> int:
+    """'HH:MM' 문자열 또는 시각을 자정 기준 분으로 변환합니다."""
+    if isinstance(value, str):
+        hours, minutes = map(int, value.split(":")[:2])
+        return hours * 60 + minutes
+    return value.hour * 60 + value.minute
+
+
+def _target_seconds(config: Dict[str, Any]) -> int:
+    """설정의 목표 시간/분을 초로 변환합니다."""
+    return int(config["target_hours"]) * 3600 + int(config["target_minutes"]) * 60
+
+
+def build_shift_profiles(
+    consultants: Sequence[str],
+    work_config: Dict[str, Any],
+    profile_name: str = "기본",
+    team_map: Optional[Dict[str, str]] = None,
+    trainee_groups: Optional[Dict[str, Dict]] = None
+) -> pd.DataFrame:
+    """
+    상담원별 근무 프로필을 만듭니다.
+
+    근무 시간은 모두 work_config(평일/휴일 또는 수동 설정)를 따르고,
+    신입 그룹 팀에 속한 상담원은 목표만 그룹 목표로 바꿉니다.
+
+    Args:
+        consultants: 상담원명 목록
+        work_config: 기본 근무 설정 (get_work_config 결과)
+        profile_name: 기본 프로필 표시 이름 (예: '평일근무', '수동 설정')
+        team_map: 상담원명 → 팀 이름 (None이면 상담사 관리 JSON에서 로드)
+        trainee_groups: 신입 그룹 설정 (None이면 신입 그룹 JSON에서 로드)
+
+    Returns:
+        pd.DataFrame: 상담원명 인덱스 × PROFILE_COLUMNS (프로필 = 기본 프로필 이름 또는 신입 그룹명)
+    """
+    if team_map is None:
+        team_map = get_consultant_team_map()
+    if trainee_groups is None:
+        trainee_groups = load_trainee_groups()
+
+    names = pd.Index(consultants, name="상담원명")
+    teams = pd.Series(names.map(lambda name: team_map.get(name)), index=names)
+    groups = teams.where(teams.isin(list(trainee_groups)))
+
+    group_targets = pd.Series({group: _target_seconds(config) for group, config in trainee_groups.items()}, dtype="float64")
+    targets = groups.map(group_targets).fillna(_target_seconds(work_config))
+
+    profiles = pd.DataFrame({
+        "프로필": groups.fillna(profile_name),
+        "목표_초": targets.astype(np.int64),
+        "업무시작": _clock_minutes(work_config["work_start"]),
+        "점심시작": _clock_minutes(work_config["lunch_start"]),
+        "점심종료": _clock_minutes(work_config["lunch_end"]),
+        "업무종료": _clock_minutes(work_config["work_end"])
+    }, index=names, columns=PROFILE_COLUMNS)
+    return profiles
+
+
+def expected_calltime_seconds(profiles: pd.DataFrame, current_time: Optional[Union[time, datetime]] = None) -> np.ndarray:
+    """
+    현재 시각까지의 상담원별 기대 콜타임을 계산합니다.
+
+    하루 목표를 점심시간을 제외한 근무 시간에 비례 배분하며(분 단위),
+    업무 시작 전은 0, 업무 종료 후는 하루 목표 전체입니다.
+
+    Args:
+        profiles: 근무 프로필 (build_shift_profiles 결과)
+        current_time: 현재 시각 (None이면 실제 현재 시각)
+
+    Returns:
+        np.ndarray: 상담원별 기대 콜타임 (초, int64)
+    """
+    if current_time is None:
+        current_time = datetime.now().time()
+    now = _clock_minutes(current_time)
+
+    start = profiles["업무시작"].to_numpy(dtype=np.int64)
+    lunch_start = profiles["점심시작"].to_numpy(dtype=np.int64)
+    lunch_end = profiles["점심종료"].to_numpy(dtype=np.int64)
+    end = profiles["업무종료"].to_numpy(dtype=np.int64)
+    targets = profiles["목표_초"].to_numpy(dtype=np.int64)
+
+    # 오전(업무 시작~점심 시작) + 오후(점심 종료~업무 종료) 중 현재까지 경과한 분
+    morning = np.clip(np.minimum(now, lunch_start) - start, 0, None)
+    afternoon = np.clip(np.minimum(now, end) - lunch_end, 0, None)
+    work_minutes = (end - start) - (lunch_end - lunch_start)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.where(work_minutes > 0, np.floor((morning + afternoon) / work_minutes * targets), targets)
+    return np.where(now < start, 0, np.where(now > end, targets, expected)).astype(np.int64)
+
+
+def calculate_target_calltime_seconds(current_time=None, work_config=None):
+    """
+    현재 시간 기준으로 목표 콜타임을 계산합니다.
+
+    Args:
+        current_time: 현재 시간 (None일 경우 실제 현재 시간 사용)
+        work_config: 근무 설정 딕셔너리 (None이면 기본 평일 설정)
+
+    Returns:
+        int: 현재 시간까지 목표 콜타임 (초 단위)
+    """
+    if work_config is None:
+        work_config = WORK_CONFIG["평일근무"]
+    profile = build_shift_profiles(["기본"], work_config, team_map={}, trainee_groups={})
+    return int(expected_calltime_seconds(profile, current_time)[0])
+
+
+def status_emojis(calltime_seconds: Any, expected_seconds: Any) -> np.ndarray:
+    """
+    기대 콜타임 대비 달성률에 따른 상태 이모지를 계산합니다.
+
+    Args:
+        calltime_seconds: 상담원별 현재 콜타임 (초)
+        expected_seconds: 상담원별 기대 콜타임 (초, 0이면 달성으로 간주)
+
+    Returns:
+        np.ndarray: 상태 이모지 ('🚩' 달성, '⏰' 분발 필요, '' 그 외)
+    """
+    calltime_seconds = np.asarray(calltime_seconds, dtype=float)
+    expected_seconds = np.asarray(expected_seconds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(expected_seconds > 0, calltime_seconds / expected_seconds * 100, 100.0)
+    return np.select(
+        [rates >= STATUS_ACHIEVED_RATE, rates <= STATUS_ALERT_RATE],
+        [STATUS_ACHIEVED_EMOJI, STATUS_ALERT_EMOJI],
+        default=""
+    )
+
+
+def compute_calltime_targets(
+    performance_df: pd.DataFrame,
+    work_config: Dict[str, Any],
+    current_time: Optional[Union[time, datetime]] = None,
+    full_day: bool = False,
+    profile_name: str = "기본",
+    team_map: Optional[Dict[str, str]] = None,
+    trainee_groups: Optional[Dict[str, Dict]] = None
+) -> pd.DataFrame:
+    """
+    상담원 실적표의 상담원별 목표, 기대 콜타임, 진행률, 상태 이모지를 한 번에 계산합니다.
+
+    Args:
+        performance_df: 상담원 실적 데이터프레임 (상담사, 콜타임_초)
+        work_config: 기본 근무 설정
+        current_time: 현재 시각 (None이면 실제 현재 시각)
+        full_day: 하루 전체 집계 여부 (전일자 조회 시 True, 기대 콜타임 = 하루 목표)
+        profile_name: 기본 프로필 표시 이름
+        team_map: 상담원명 → 팀 이름 (None이면 상담사 관리 JSON에서 로드)
+        trainee_groups: 신입 그룹 설정 (None이면 신입 그룹 JSON에서 로드)
+
+    Returns:
+        pd.DataFrame: performance_df와 같은 인덱스 × [프로필, 목표_초, 기대_초, 진행률, 상태]
+            (진행률은 하루 목표 대비 %, 최대 100)
+    """
+    profiles = build_shift_profiles(
+        performance_df["상담사"].tolist(), work_config, profile_name, team_map, trainee_groups
+    )
+    targets = profiles["목표_초"].to_numpy()
+    expected = targets.copy() if full_day else expected_calltime_seconds(profiles, current_time)
+    calltime = pd.to_numeric(performance_df["콜타임_초"], errors="coerce").fillna(0).to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        progress = np.where(targets > 0, np.minimum(100.0, calltime / targets * 100), 100.0)
+
+    return pd.DataFrame({
+        "프로필": profiles["프로필"].to_numpy(),
+        "목표_초": targets,
+        "기대_초": expected,
+        "진행률": progress,
+        "상태": status_emojis(calltime, expected)
+    }, index=performance_df.index)
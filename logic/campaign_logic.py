@@ -6,6 +6,7 @@ UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되
 """
 
 import pandas as pd
+import numpy as np
 import streamlit as st
 import io
 from io import BytesIO  # BytesIO를 명시적으로 import
@@ -16,13 +17,79 @@ from typing import Tuple, Dict, List, Optional, Any, Union
 
 # 설정 가져오기 (config.py에서 상수 가져오기)
 from utils.config import CAMPAIGN_SETTINGS
+from logic.analysis_backend_logic import resolve_backend
+from logic.duckdb_backend_logic import count_crosstab
+from logic.string_predicate_logic import contains
 
-def process_campaign_files(files) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], int, int]:
+# 교차표 집계를 지원하는 분석 백엔드
+CAMPAIGN_BACKENDS = ("pandas", "duckdb")
+
+def get_campaign_type_order(campaigns: pd.Series) -> np.ndarray:
+    """
+    캠페인명별 정렬 순서 값을 계산하는 함수 (캠페인 → 정규 → 재분배 → 기타)
+
+    Args:
+        campaigns: 캠페인명 시리즈
+
+    Returns:
+        np.ndarray: CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"] 기준 정렬 순서 값
+    """
+    type_order = CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]
+    names = campaigns.astype(str).str.lower()
+
+    return np.select(
+        [
+            names.str.contains('캠', regex=False).to_numpy(),
+            names.str.contains('정규', regex=False).to_numpy(),
+            names.str.contains('재분배', regex=False).to_numpy()
+        ],
+        [type_order["CAMPAIGN"], type_order["REGULAR"], type_order["REDISTRIBUTION"]],
+        default=type_order["OTHER"]
+    )
+
+
+def build_campaign_crosstab(df: pd.DataFrame, index_col: str, columns_col: str) -> pd.DataFrame:
+    """
+    두 컬럼의 조합별 레코드 수를 범주 코드 기반으로 집계하는 함수 (pivot_table(aggfunc='size')와 동일)
+
+    값은 각각 한 번만 factorize 하고, 코드 조합을 bincount로 세어 행렬을 만듭니다.
+    (두 컬럼 중 하나라도 비어 있는 행은 제외)
+
+    Args:
+        df: 원본 데이터프레임
+        index_col: 행으로 사용할 컬럼 (예: 일반회차 캠페인)
+        columns_col: 열로 사용할 컬럼 (예: 상담DB상태)
+
+    Returns:
+        pd.DataFrame: index_col 값 × columns_col 값 레코드 수 (각 축은 값 오름차순)
+    """
+    row_codes, row_values = pd.factorize(df[index_col], sort=True)
+    col_codes, col_values = pd.factorize(df[columns_col], sort=True)
+
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    counts = np.bincount(
+        row_codes[valid] * len(col_values) + col_codes[valid],
+        minlength=len(row_values) * len(col_values)
+    ).reshape(len(row_values), len(col_values))
+
+    # 데이터가 있는 행/열만 유지 (pivot_table과 동일)
+    row_mask = counts.sum(axis=1) > 0
+    col_mask = counts.sum(axis=0) > 0
+
+    return pd.DataFrame(
+        counts[row_mask][:, col_mask],
+        index=pd.Index(row_values[row_mask], name=index_col),
+        columns=pd.Index(col_values[col_mask], name=columns_col)
+    )
+
+
+def process_campaign_files(files, backend: str = "pandas") -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], int, int]:
     """
     다수의 엑셀 파일을 처리하는 함수
 
     Args:
         files: 업로드된 엑셀 파일 목록
+        backend: 집계 백엔드 ("pandas" | "duckdb", duckdb가 없으면 pandas)
 
     Returns:
         Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], int, int]:
@@ -82,7 +149,7 @@ def process_campaign_files(files) -> Tuple[Optional[pd.DataFrame], Optional[pd.D
                 df = df.dropna(subset=["일반회차 캠페인"])
                 
                 # 캠페인 값이 "캠", "정규", "재분배" 중 하나 이상 포함된 행만 유지
-                df = df[df["일반회차 캠페인"].astype(str).str.contains("캠|정규|재분배|V-|C-|C_|AS-", case=False)]
+                df = df[contains(df, "일반회차 캠페인", "캠|정규|재분배|V-|C-|C_|AS-", case=False)]
             
             # 전체 데이터에 추가
             all_data.append(df)
@@ -117,61 +184,29 @@ def process_campaign_files(files) -> Tuple[Optional[pd.DataFrame], Optional[pd.D
             st.error("일반회차 캠페인 또는 상담DB상태 컬럼이 없습니다.")
             return None, None, 0, 0
         
-        # 피벗 테이블 생성 - 일반회차 캠페인 × 상담DB상태의 레코드 수
-        pivot_df = pd.pivot_table(
-            combined_df,
-            index='일반회차 캠페인',
-            columns='상담DB상태',
-            aggfunc='size',  # 각 조합의 레코드 수를 계산
-            fill_value=0     # 없는 조합은 0으로 채움
-        )
+        # 교차표 생성 - 일반회차 캠페인 × 상담DB상태의 레코드 수
+        if resolve_backend(backend, CAMPAIGN_BACKENDS) == "duckdb":
+            pivot_df = count_crosstab(combined_df, '일반회차 캠페인', '상담DB상태')
+        else:
+            pivot_df = build_campaign_crosstab(combined_df, '일반회차 캠페인', '상담DB상태')
+        
+        # 캠페인 타입 순서(캠페인 → 정규 → 재분배 → 기타) 다음 캠페인 이름 오름차순으로 정렬
+        # (교차표 행은 이미 캠페인 이름 오름차순이므로 타입 순서로만 안정 정렬)
+        type_order = get_campaign_type_order(pivot_df.index.to_series())
+        pivot_df = pivot_df.iloc[np.argsort(type_order, kind='stable')]
+        
+        # 총합계 행 추가 (상태별 합계)
+        pivot_df.loc['총합계'] = pivot_df.sum(axis=0)
         
         # 총합계 열 추가
         pivot_df['총합계'] = pivot_df.sum(axis=1)
         
-        # 전환율 계산 (주문승인/총합계)
+        # 전환율 계산 (주문승인/총합계, 총합계 행 포함)
         if '주문승인' in pivot_df.columns:
             pivot_df['전환율'] = pivot_df['주문승인'] / pivot_df['총합계'] * 100
         
-        # 캠페인 타입 분류 함수 추가
-        def get_campaign_type(campaign_name):
-            campaign_name = str(campaign_name).lower()
-            if '캠' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["CAMPAIGN"]  # 캠페인
-            elif '정규' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["REGULAR"]  # 정규
-            elif '재분배' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["REDISTRIBUTION"]  # 재분배
-            else:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["OTHER"]  # 기타
-        
-        # 인덱스 리셋 및 정렬 카테고리 추가
-        pivot_df = pivot_df.reset_index()
-        pivot_df['정렬순서'] = pivot_df['일반회차 캠페인'].apply(get_campaign_type)
-        
-        # 정렬순서로 먼저 정렬하고, 그 다음 캠페인 이름으로 오름차순 정렬
-        pivot_df = pivot_df.sort_values(by=['정렬순서', '일반회차 캠페인'], ascending=[True, True])
-        
-        # 정렬순서 컬럼 제거
-        pivot_df = pivot_df.drop(columns=['정렬순서'])
-        
-        # 인덱스 리셋
-        pivot_df = pivot_df.reset_index(drop=True)
-        
-        # 총합계 행 계산
-        total_row = pd.DataFrame(pivot_df.drop(columns=['일반회차 캠페인']).sum(axis=0)).T
-        total_row['일반회차 캠페인'] = '총합계'
-        
-        # 총합계 행의 전환율 계산
-        if '주문승인' in total_row.columns and '총합계' in total_row.columns:
-            total_row['전환율'] = total_row['주문승인'] / total_row['총합계'] * 100
-        
-        # 일반회차 캠페인 열을 행 레이블로 변경
-        pivot_df = pivot_df.rename(columns={'일반회차 캠페인': '행 레이블'})
-        total_row = total_row.rename(columns={'일반회차 캠페인': '행 레이블'})
-        
-        # 총합계 행을 맨 아래에 추가
-        result_df = pd.concat([pivot_df, total_row], ignore_index=True)
+        # 일반회차 캠페인을 행 레이블 열로 변경
+        result_df = pivot_df.rename_axis('행 레이블').reset_index()
         
         # 컬럼 순서 정의
         column_order = CAMPAIGN_SETTINGS["COLUMN_ORDER"]
@@ -228,71 +263,41 @@ def process_consultant_data(cleaned_data) -> Tuple[Optional[pd.DataFrame], Optio
         if new_status_df.empty:
             return None, "상담DB상태가 '신규'인 데이터가 없습니다."
             
-        # 캠페인 × 상담사 그룹별 개수 계산
-        result_df = pd.DataFrame(new_status_df.groupby(["일반회차 캠페인", consultant_col]).size()).reset_index()
-        result_df.columns = ["일반회차 캠페인", "상담사", "신규건수"]
-        
-        # 캠페인별 정렬 함수 적용
-        def get_campaign_type(campaign_name):
-            campaign_name = str(campaign_name).lower()
-            if '캠' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["CAMPAIGN"]  # 캠페인
-            elif '정규' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["REGULAR"]  # 정규
-            elif '재분배' in campaign_name:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["REDISTRIBUTION"]  # 재분배
-            else:
-                return CAMPAIGN_SETTINGS["CAMPAIGN_TYPE_ORDER"]["OTHER"]  # 기타
-        
-        # 정렬 순서 적용
-        result_df["정렬순서"] = result_df["일반회차 캠페인"].apply(get_campaign_type)
-        result_df = result_df.sort_values(by=["정렬순서", "일반회차 캠페인", "신규건수"], 
-                                         ascending=[True, True, False])
-        
-        # 정렬순서 컬럼 제거
-        result_df = result_df.drop(columns=["정렬순서"])
-        
-        # 총합계 계산
-        campaign_totals = result_df.groupby("일반회차 캠페인")["신규건수"].sum().reset_index()
-        campaign_totals.columns = ["일반회차 캠페인", "소계"]
-        
-        # 캠페인별 소계 추가
-        final_result = []
-        
-        # 각 캠페인별로 상담사 정보 추가
-        for campaign in result_df["일반회차 캠페인"].unique():
-            # 캠페인 소계 행 추가
-            campaign_total = campaign_totals[campaign_totals["일반회차 캠페인"] == campaign]["소계"].values[0]
-            final_result.append({
-                "일반회차 캠페인": campaign,
-                "상담사": "",  # 빈 값
-                "신규건수": campaign_total,
-                "행타입": "캠페인"
-            })
-            
-            # 해당 캠페인의 상담사별 행 추가
-            consultants = result_df[result_df["일반회차 캠페인"] == campaign]
-            for _, row in consultants.iterrows():
-                final_result.append({
-                    "일반회차 캠페인": "",  # 빈 값
-                    "상담사": row["상담사"],
-                    "신규건수": row["신규건수"],
-                    "행타입": "상담사"
-                })
+        # 캠페인 × 상담사 그룹별 개수 계산 (롤업: 상담사 → 캠페인 소계 → 총합계)
+        consultant_counts = new_status_df.groupby(["일반회차 캠페인", consultant_col]).size()
+        campaign_totals = consultant_counts.groupby(level=0).sum()
+        total_count = consultant_counts.sum()
+        
+        consultant_rows = consultant_counts.rename("신규건수").reset_index()
+        consultant_rows.columns = ["일반회차 캠페인", "상담사", "신규건수"]
+        campaign_rows = campaign_totals.rename("신규건수").reset_index()
+        
+        # 정렬 키: 캠페인 타입 순서 → 캠페인 이름 → (캠페인 행 먼저) → 신규건수 내림차순
+        consultant_rows["정렬순서"] = get_campaign_type_order(consultant_rows["일반회차 캠페인"])
+        campaign_rows["정렬순서"] = get_campaign_type_order(campaign_rows["일반회차 캠페인"])
+        consultant_rows["행타입"] = "상담사"
+        campaign_rows["행타입"] = "캠페인"
+        campaign_rows["상담사"] = ""
+        consultant_rows["행순서"] = 1
+        campaign_rows["행순서"] = 0
+        
+        final_df = pd.concat([campaign_rows, consultant_rows], ignore_index=True)
+        final_df["정렬건수"] = np.where(final_df["행순서"] == 0, 0, -final_df["신규건수"])
+        final_df = final_df.sort_values(
+            by=["정렬순서", "일반회차 캠페인", "행순서", "정렬건수"], kind="stable"
+        )
         
-        # 결과 DataFrame 생성 (지금까지 모은 결과)
-        final_df = pd.DataFrame(final_result)
+        # 상담사 행은 캠페인명을 비워서 표시
+        final_df.loc[final_df["행타입"] == "상담사", "일반회차 캠페인"] = ""
+        final_df = final_df[["일반회차 캠페인", "상담사", "신규건수", "행타입"]]
         
-        # 총합계 행 계산
-        total_count = result_df["신규건수"].sum()
+        # 총합계 행을 맨 마지막에 추가
         total_row = pd.DataFrame([{
             "일반회차 캠페인": "총합계",
             "상담사": "",
             "신규건수": total_count,
             "행타입": "총합계"
         }])
-        
-        # 총합계 행을 맨 마지막에 추가
         final_df = pd.concat([final_df, total_row], ignore_index=True)
         
         return final_df, None
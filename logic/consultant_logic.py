@@ -14,7 +14,11 @@ from datetime import datetime, timedelta
 from typing import Tuple, Dict, List, Optional, Any, Union
 
 # utils.py에서 필요한 함수 가져오기
-from utils.utils import format_time, peek_file_content
+from utils.utils import format_time, format_duration, parse_duration_seconds, duration_to_excel_time, peek_file_content
+from utils.consultant_alias_manager import resolve_consultant_names, SCOPE_CALLTIME_TO_ORDER
+from logic.filter_logic import HQ_ONLINE_CHANNEL, HAS_CAMPAIGN, compile_mask
+from logic.cube_logic import get_cube, COUNT_MEASURE
+from logic.dataset_cache_logic import get_dataset_cache
 
 def process_consultant_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
@@ -259,35 +263,14 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                 for pattern in invalid_patterns:
                     result_df = result_df[~result_df['상담원명'].astype(str).str.contains(pattern)]
                 
-                # 0:00:00이나 '0' 값을 가진 시간은 제거
-                zero_time_patterns = ['0:00:00', '00:00:00', '0']
-                result_df = result_df[~result_df['총 시간'].astype(str).isin(zero_time_patterns)].copy()
+                # 시간을 초로 변환 (문자열, datetime.time, timedelta, Excel 시간 값 모두 처리)
+                result_df['총 시간_초'] = parse_duration_seconds(result_df['총 시간']).to_numpy()
                 
-                # 시간을 초로 변환
-                def time_to_seconds(time_str):
-                    try:
-                        if pd.isna(time_str):
-                            return 0
-                        
-                        time_str = str(time_str)
-                        time_parts = re.findall(r'\d+', time_str)
-                        
-                        if not time_parts:
-                            return 0
-                            
-                        # 시간 형식에 따라 변환
-                        if len(time_parts) == 3:  # HH:MM:SS
-                            h, m, s = map(int, time_parts)
-                            return h * 3600 + m * 60 + s
-                        elif len(time_parts) == 2:  # MM:SS
-                            m, s = map(int, time_parts)
-                            return m * 60 + s
-                        else:
-                            return int(time_parts[0])
-                    except:
-                        return 0
+                # 0:00:00이나 '0' 값을 가진 시간은 제거
+                result_df = result_df[result_df['총 시간_초'] > 0].copy()
                 
-                result_df['총 시간_초'] = result_df['총 시간'].apply(time_to_seconds)
+                # 표시용 시간은 H:MM:SS 문자열로 통일
+                result_df['총 시간'] = format_duration(result_df['총 시간_초']).to_numpy()
                 
                 return result_df, None
             else:
@@ -341,22 +324,10 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                                 
                                 # 0:00:00 시간은 제외
                                 if time not in ['0:00:00', '00:00:00', '0']:
-                                    # 시간을 초로 변환
-                                    time_parts = re.findall(r'\d+', time)
-                                    if len(time_parts) == 3:  # HH:MM:SS
-                                        h, m, s = map(int, time_parts)
-                                        seconds = h * 3600 + m * 60 + s
-                                    elif len(time_parts) == 2:  # MM:SS
-                                        m, s = map(int, time_parts)
-                                        seconds = m * 60 + s
-                                    else:
-                                        seconds = 0
-                                    
                                     result_data.append({
                                         '상담원명': name,
                                         '총 건수': count,
-                                        '총 시간': time,
-                                        '총 시간_초': seconds
+                                        '총 시간': time
                                     })
                             except:
                                 continue
@@ -364,6 +335,8 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                     # 결과 데이터프레임 생성
                     if result_data:
                         result_df = pd.DataFrame(result_data)
+                        # 시간을 초로 변환 (전체 행을 한 번에)
+                        result_df['총 시간_초'] = parse_duration_seconds(result_df['총 시간']).to_numpy()
                         return result_df, None
                     else:
                         return None, "유효한 상담원 데이터를 추출할 수 없습니다."
@@ -376,6 +349,151 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     except Exception as e:
         return None, f"콜타임 파일 처리 중 오류가 발생했습니다: {str(e)}"
 
+def merge_calltime_frames(frames: List[Tuple[str, str, pd.DataFrame]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    여러 콜타임 파일(그룹/층별로 나뉜 PBX 리포트)의 처리 결과를 상담원 기준으로 합칩니다.
+
+    내용이 같은 파일(파일 해시가 같은 경우)을 여러 번 올렸으면 처음 파일만 반영하고,
+    서로 다른 파일에 같은 상담원이 나오면 건수와 시간이 같더라도 합산한 뒤 충돌 내역으로 알립니다.
+    (파일이 하나면 그대로 반환)
+
+    Args:
+        frames: [(파일명, 파일 내용 해시, process_calltime_file 결과)] 목록
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]:
+            - 통합 콜타임 데이터프레임 (상담원명, 총 건수, 총 시간, 총 시간_초 / 상담원 첫 등장 순서)
+            - 충돌 내역 (여러 행에 나온 상담원의 [상담원명, 파일, 총 건수, 총 시간, 처리],
+              처리 = '반영'(합산 대상) 또는 '중복 파일 제외'(같은 내용의 파일을 다시 올린 경우))
+    """
+    conflict_columns = ["상담원명", "파일", "총 건수", "총 시간", "처리"]
+    if len(frames) == 1:
+        return frames[0][2], pd.DataFrame(columns=conflict_columns)
+
+    rows = pd.concat(
+        [df[["상담원명", "총 건수", "총 시간_초"]].assign(파일=name, 파일순서=position)
+         for position, (name, _, df) in enumerate(frames)],
+        ignore_index=True
+    )
+    rows["상담원명"] = rows["상담원명"].astype(str).str.strip()
+    rows["총 건수"] = pd.to_numeric(rows["총 건수"], errors="coerce").fillna(0).astype(np.int64)
+    rows["총 시간_초"] = pd.to_numeric(rows["총 시간_초"], errors="coerce").fillna(0).astype(np.int64)
+
+    # 같은 내용의 파일은 처음 나온 파일만, 나머지는 상담원별 합산
+    hashes = pd.Series([source_hash for _, source_hash, _ in frames])
+    first_positions = hashes.groupby(hashes, sort=False).transform(lambda group: group.index[0]).to_numpy()
+    file_positions = rows["파일순서"].to_numpy()
+    duplicated = first_positions[file_positions] != file_positions
+
+    merged = rows[~duplicated].groupby("상담원명", sort=False)[["총 건수", "총 시간_초"]].sum().reset_index()
+    merged.insert(2, "총 시간", format_duration(merged["총 시간_초"]).to_numpy())
+
+    repeated = rows["상담원명"].duplicated(keep=False).to_numpy()
+    conflicts = rows[repeated].assign(
+        **{"총 시간": format_duration(rows.loc[repeated, "총 시간_초"]).to_numpy(),
+           "처리": np.where(duplicated[repeated], "중복 파일 제외", "반영")}
+    )
+    conflicts = conflicts.sort_values("상담원명", kind="stable")[conflict_columns].reset_index(drop=True)
+    return merged, conflicts
+
+
+# 상담원 실적 분류 (건수 컬럼 순서)
+CONSULTANT_PRODUCT_COLUMNS = ["안마의자", "라클라우드", "정수기", "더케어", "멤버십"]
+
+# 실적 집계 큐브 차원 (상담사 + 필터/캠페인/분류 컬럼)
+CONSULTANT_CUBE_DIMENSIONS = ["상담사", "판매채널", "일반회차 캠페인", "캠페인", "대분류", "판매 유형"]
+
+# 데이터셋 캐시 이름공간 {"filtered_original_data": 필터링된 원본 데이터}
+_CACHE_NAMESPACE = "consultant_performance"
+
+
+def _is_valid_campaign(value: Any) -> bool:
+    """
+    캠페인 값이 유효한지 확인합니다.
+    ("캠" 또는 "분배"를 포함하거나, "C" 또는 "V"로 시작하는 경우)
+    """
+    campaign_value = str(value).strip()
+    return bool(campaign_value) and (
+        '캠' in campaign_value or
+        '분배' in campaign_value or
+        campaign_value.startswith('C') or
+        campaign_value.startswith('V')
+    )
+
+
+def _classify_consultant_sale(sale_type: str, category: str) -> Optional[str]:
+    """
+    판매 유형과 대분류로 실적 분류를 결정합니다. (분류 대상이 아니면 None)
+    """
+    # 판매 유형에 '케어'가 포함되면 더케어, '멤버십'이 포함되면 멤버십
+    if '케어' in sale_type:
+        return "더케어"
+    if '멤버십' in sale_type or '멤버쉽' in sale_type:
+        return "멤버십"
+    # 그 외에는 대분류에 따라 분류
+    if '안마의자' in category:
+        return "안마의자"
+    if '라클라우드' in category:
+        return "라클라우드"
+    if '정수기' in category:
+        return "정수기"
+    return None
+
+
+def _consultant_cube(consultant_df: pd.DataFrame):
+    """상담주문계약내역의 실적 집계 큐브 (데이터셋별 캐시)"""
+    return get_cube(consultant_df, [col for col in CONSULTANT_CUBE_DIMENSIONS if col in consultant_df.columns])
+
+
+def _first_order_rows(cube) -> pd.Series:
+    """
+    상담사별 첫 주문 행 위치를 큐브 셀에서 구합니다. (상담사 조직 결정용, 결측값 상담사 제외)
+
+    셀은 원본 첫 등장 순서로 번호가 매겨지므로 상담사의 첫 셀의 첫 행이 그 상담사의 첫 주문 행입니다.
+    """
+    codes, first_cells = np.unique(cube.codes["상담사"], return_index=True)
+    rows = pd.Series(cube.first_rows[first_cells], index=cube.labels["상담사"].take(codes))
+    return rows[rows.index.notna()]
+
+
+def _count_consultant_products(cube) -> pd.DataFrame:
+    """
+    상담사 × 실적 분류 건수를 주문 데이터 큐브에서 집계합니다.
+
+    캠페인 유효성과 분류 규칙은 행 대신 큐브 셀(차원 값 조합)마다 한 번만 평가하므로
+    상담원 수나 주문 행 수와 관계없이 셀 수만큼만 계산합니다.
+
+    Args:
+        cube: 상담주문계약내역 큐브 (_consultant_cube 결과)
+
+    Returns:
+        pd.DataFrame: 상담사 인덱스 × CONSULTANT_PRODUCT_COLUMNS 건수
+    """
+    cells = cube.cells
+
+    # 판매채널/일반회차 캠페인 필터는 행 마스크와 같은 스펙을 셀에 적용
+    valid_cells = cube.mask(HQ_ONLINE_CHANNEL & HAS_CAMPAIGN)
+
+    # 캠페인 컬럼에 유효한 값이 있는 셀만 유지
+    if '캠페인' in cells.columns:
+        valid_cells = valid_cells & np.array([_is_valid_campaign(value) for value in cells['캠페인']], dtype=bool)
+
+    # 판매 유형과 대분류에 따라 분류
+    sale_types = [str(value).lower() for value in cells['판매 유형']] if '판매 유형' in cells.columns else [''] * len(cells)
+    categories = [str(value).lower() for value in cells['대분류']] if '대분류' in cells.columns else [''] * len(cells)
+    classes = np.array([
+        _classify_consultant_sale(sale_type, category)
+        for sale_type, category in zip(sale_types, categories)
+    ], dtype=object)
+
+    selected = valid_cells & pd.notna(classes)
+    counts = cube.rollup(["상담사", "실적분류"], selected, derived={"실적분류": classes})[COUNT_MEASURE]
+    return (
+        counts.unstack("실적분류", fill_value=0)
+        .reindex(columns=CONSULTANT_PRODUCT_COLUMNS, fill_value=0)
+    )
+
+
 def analyze_consultant_performance(consultant_df: pd.DataFrame, calltime_df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[str]]:
     """
     상담원 실적을 분석하는 함수
@@ -396,17 +514,14 @@ def analyze_consultant_performance(consultant_df: pd.DataFrame, calltime_df: pd.
             return None, None, "데이터가 비어 있습니다."
             
         # 판매채널이 "본사" 또는 "온라인"인 데이터만 필터링
+        # 일반회차 캠페인 값이 있는 행만 유지 (있는 경우, 데이터셋별로 한 번만 복사)
         filtered_original_data = None
         if '판매채널' in consultant_df.columns:
-            valid_channels = ['본사', '온라인']
-            filtered_original_data = consultant_df[consultant_df['판매채널'].isin(valid_channels)].copy()
-            
-            # 일반회차 캠페인 값이 있는 행만 유지 (있는 경우)
-            if '일반회차 캠페인' in filtered_original_data.columns:
-                filtered_original_data = filtered_original_data[
-                    filtered_original_data['일반회차 캠페인'].notna() & 
-                    (filtered_original_data['일반회차 캠페인'] != '')
-                ]
+            cached = get_dataset_cache(consultant_df, _CACHE_NAMESPACE)
+            if "filtered_original_data" not in cached:
+                valid_rows = compile_mask(consultant_df, HQ_ONLINE_CHANNEL & HAS_CAMPAIGN)
+                cached["filtered_original_data"] = consultant_df[valid_rows].copy()
+            filtered_original_data = cached["filtered_original_data"]
         
         # 관리자 목록 (분석에서 제외)
         excluded_consultants = ['김은아', '김지원', '민건희', '홍민지', '안병민']
@@ -419,120 +534,53 @@ def analyze_consultant_performance(consultant_df: pd.DataFrame, calltime_df: pd.
         consultants = [consultant for consultant in calltime_df["상담원명"].unique().tolist() 
                       if consultant not in excluded_consultants]
         
+        # 상담원명에 비정상적인 값이 있는 경우 제외
+        invalid_names = ['휴식', '후처리', '대기', '기타', '합계', '00:00:00', '0:00:00']
+        consultants = [consultant for consultant in consultants
+                       if isinstance(consultant, str) and consultant not in invalid_names]
+        
+        # 주문 데이터 큐브 (데이터셋별 캐시) - 이후 집계는 원본 행 대신 셀 단위로 수행
+        cube = _consultant_cube(consultant_df)
+        
+        # 콜타임 상담원명 → 주문 데이터 상담사 이름 매칭 (고유 이름 기준, 학습된 별칭 사용)
+        name_map, ambiguous_names = resolve_consultant_names(
+            consultants, cube.labels["상담사"].to_numpy(), scope=SCOPE_CALLTIME_TO_ORDER
+        )
+        
+        # 상담사 × 제품 분류 건수 (주문 데이터 큐브에서 한 번에 집계)
+        product_counts = _count_consultant_products(cube)
+        
+        # 상담사별 첫 주문 행 위치 (상담사 조직 결정용)
+        first_order_rows = _first_order_rows(cube)
+        
         # 결과 데이터프레임을 위한 리스트
         result_data = []
         
         # 각 상담원별 대분류 집계
         for consultant in consultants:
             try:
-                # 상담원명이 문자열인지 확인
-                if not isinstance(consultant, str):
-                    continue
-                    
-                # 상담원명에 비정상적인 값이 있는지 확인 
-                if consultant in ['휴식', '후처리', '대기', '기타', '합계', '00:00:00', '0:00:00']:
-                    continue
-                
-                # 상담사 컬럼 매핑 (이름이 정확히 일치하지 않을 수 있음)
-                exact_match = consultant_df[consultant_df["상담사"] == consultant]
-                
-                # 정확히 일치하는 데이터가 없으면 유사 매칭 시도
-                if exact_match.empty:
-                    # 상담원명 전처리
-                    consultant_clean = consultant.strip()
-                    
-                    # 포함 관계 확인
-                    matches = []
-                    for idx, row in consultant_df.iterrows():
-                        consultant_name = str(row["상담사"]).strip()
-                        # 상담원명이 포함되거나 상담원명에 포함되는 경우
-                        if (consultant_clean in consultant_name) or (consultant_name in consultant_clean):
-                            matches.append(idx)
-                    
-                    consultant_data = consultant_df.loc[matches] if matches else pd.DataFrame(columns=consultant_df.columns)
-                else:
-                    consultant_data = exact_match
+                # 매칭된 이름 (모호하거나 매칭되지 않으면 주문 데이터 없음)
+                matched_name = name_map.get(consultant)
+                has_orders = matched_name is not None and matched_name in first_order_rows.index
                 
                 # 상담사 조직 정보 결정
                 if consultant in online_consultants:
                     organization = "온라인파트"
-                elif not consultant_data.empty:
-                    organization = consultant_data["상담사 조직"].iloc[0]
+                elif has_orders:
+                    organization = consultant_df["상담사 조직"].iloc[first_order_rows[matched_name]]
                 else:
                     organization = "CRM파트"  # 기본값을 CRM파트로 설정
                 
-                # 판매채널이 "본사" 또는 "온라인"인 데이터만 필터링
-                if not consultant_data.empty and '판매채널' in consultant_data.columns:
-                    # "본사" 또는 "온라인"인 행만 유지
-                    valid_channels = ['본사', '온라인']
-                    consultant_data = consultant_data[consultant_data['판매채널'].isin(valid_channels)]
-                    
-                    if consultant_data.empty:
-                        consultant_data = pd.DataFrame(columns=consultant_data.columns)
-                
-                # 일반회차 캠페인 컬럼이 있는 경우 필터링
-                if not consultant_data.empty and '일반회차 캠페인' in consultant_data.columns:
-                    # 값이 없거나 빈 문자열인 행 제거
-                    valid_rows = consultant_data['일반회차 캠페인'].notna() & (consultant_data['일반회차 캠페인'] != '')
-                    consultant_data = consultant_data[valid_rows]
-                    
-                    if consultant_data.empty:
-                        consultant_data = pd.DataFrame(columns=consultant_data.columns)
-
-                # 캠페인 컬럼에 유효한 값이 있는 데이터만 필터링
-                if not consultant_data.empty and '캠페인' in consultant_data.columns:
-                    # 캠페인 컬럼이 유효한 값을 가진 행만 필터링
-                    valid_rows = []
-                    for idx, row in consultant_data.iterrows():
-                        campaign_value = str(row.get('캠페인', '')).strip()
-                        
-                        # 캠페인 값이 유효한지 확인
-                        # 1. "캠"을 포함하거나
-                        # 2. "분배"를 포함하거나
-                        # 3. "C"로 시작하거나
-                        # 4. "V"로 시작하는 경우
-                        if campaign_value and (
-                            '캠' in campaign_value or 
-                            '분배' in campaign_value or 
-                            campaign_value.startswith('C') or 
-                            campaign_value.startswith('V')
-                        ):
-                            valid_rows.append(idx)
-                    
-                    if valid_rows:
-                        consultant_data = consultant_data.loc[valid_rows]
-                    else:
-                        consultant_data = pd.DataFrame(columns=consultant_data.columns)
-                
-                # 5가지 분류로 나누어 카운트
-                anma_count = 0
-                lacloud_count = 0
-                water_count = 0
-                thecare_count = 0
-                membership_count = 0
-                
-                if not consultant_data.empty:
-                    # 판매 유형 컬럼이 있는지 확인
-                    has_sale_type = '판매 유형' in consultant_data.columns
-                    
-                    # 각 행에 대해 판매 유형과 대분류에 따라 분류
-                    for idx, row in consultant_data.iterrows():
-                        sale_type = str(row.get('판매 유형', '')).lower() if has_sale_type else ''
-                        category = str(row.get('대분류', '')).lower()
-                        
-                        # 판매 유형에 '케어'가 포함되면 더케어로 분류
-                        if '케어' in sale_type:
-                            thecare_count += 1
-                        # 판매 유형에 '멤버십'이 포함되면 멤버십으로 분류
-                        elif '멤버십' in sale_type or '멤버쉽' in sale_type:
-                            membership_count += 1
-                        # 그 외에는 대분류에 따라 분류
-                        elif '안마의자' in category:
-                            anma_count += 1
-                        elif '라클라우드' in category:
-                            lacloud_count += 1
-                        elif '정수기' in category:
-                            water_count += 1
+                # 5가지 분류 건수
+                if has_orders and matched_name in product_counts.index:
+                    counts = product_counts.loc[matched_name]
+                else:
+                    counts = pd.Series(0, index=CONSULTANT_PRODUCT_COLUMNS)
+                anma_count = int(counts["안마의자"])
+                lacloud_count = int(counts["라클라우드"])
+                water_count = int(counts["정수기"])
+                thecare_count = int(counts["더케어"])
+                membership_count = int(counts["멤버십"])
                 
                 # 총 건수
                 total_count = anma_count + lacloud_count + water_count + thecare_count + membership_count
@@ -570,6 +618,9 @@ def analyze_consultant_performance(consultant_df: pd.DataFrame, calltime_df: pd.
         # 조직별 그룹화 및 정렬 (건수 내림차순, 콜타임 내림차순)
         result_df = result_df.sort_values(by=["조직", "건수", "콜타임_초"], ascending=[True, False, False])
         
+        # 후보가 여러 명이라 매칭하지 않은 이름 (UI 경고 표시용)
+        result_df.attrs["ambiguous_names"] = ambiguous_names
+        
         return result_df, filtered_original_data, None
         
     except Exception as e:
@@ -579,43 +630,15 @@ def time_string_to_excel_time(time_str):
     """
     시간 문자열을 Excel 시간 값으로 변환하는 함수
     Excel에서 시간은 일(day)의 분수로 저장됨 (1시간 = 1/24)
+    여러 값을 변환할 때는 utils.duration_to_excel_time을 사용합니다.
     
     Args:
-        time_str: 시간 문자열 (예: "4:12:42", "0:45:30")
+        time_str: 시간 값 (예: "4:12:42", "0:45:30", datetime.time)
         
     Returns:
         float: Excel 시간 값
     """
-    try:
-        if pd.isna(time_str) or str(time_str).strip() == '':
-            return 0
-        
-        time_str = str(time_str).strip()
-        # 숫자와 콜론만 추출
-        time_parts = re.findall(r'\d+', time_str)
-        
-        if not time_parts:
-            return 0
-        
-        # 시간 형식에 따라 변환
-        if len(time_parts) == 3:  # HH:MM:SS
-            hours, minutes, seconds = map(int, time_parts)
-        elif len(time_parts) == 2:  # MM:SS
-            hours = 0
-            minutes, seconds = map(int, time_parts)
-        else:  # SS
-            hours = 0
-            minutes = 0
-            seconds = int(time_parts[0])
-        
-        # Excel 시간 값으로 변환 (하루의 분수)
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-        excel_time = total_seconds / (24 * 60 * 60)  # 1일 = 86400초
-        
-        return excel_time
-        
-    except Exception:
-        return 0
+    return float(duration_to_excel_time([time_str]).iloc[0])
 
 def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFrame = None) -> Optional[bytes]:
     """
@@ -748,6 +771,7 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
         crm_df = download_df[download_df["조직"] == "CRM파트"].sort_values(by=["건수"], ascending=[False]).copy()
         crm_df['순위'] = range(1, len(crm_df) + 1)
         crm_df = crm_df[['순위', '상담사', '안마의자', '라클라우드', '정수기', '더케어', '멤버십', '건수', '콜건수', '콜타임']]
+        crm_excel_times = duration_to_excel_time(crm_df['콜타임']).to_numpy()
         
         # CRM 데이터 작성
         for idx, row_data in enumerate(crm_df.values):
@@ -762,7 +786,7 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
                     worksheet.write(row_num, col_num, cell_value, number_format)
                 # 시간 형식 (콜타임) - Excel 시간 값으로 변환
                 elif col_num == 9:
-                    excel_time_value = time_string_to_excel_time(cell_value)
+                    excel_time_value = crm_excel_times[idx]
                     worksheet.write_number(row_num, col_num, excel_time_value, time_format)
                 # 일반 데이터
                 else:
@@ -782,18 +806,8 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
             "콜건수": round(crm_df["콜건수"].mean(), 1)
         }
 
-        # CRM 평균 콜타임 계산
-        crm_time_seconds = []
-        for time_str in crm_df["콜타임"]:
-            parts = str(time_str).split(":")
-            if len(parts) == 3:
-                hours, minutes, seconds = map(int, parts)
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-                crm_time_seconds.append(total_seconds)
-
-        avg_crm_seconds = sum(crm_time_seconds) / len(crm_time_seconds) if crm_time_seconds else 0
-        # Excel 시간 값으로 변환
-        crm_avg_excel_time = avg_crm_seconds / (24 * 60 * 60)
+        # CRM 평균 콜타임 계산 (Excel 시간 값)
+        crm_avg_excel_time = crm_excel_times.mean() if len(crm_excel_times) > 0 else 0
         
         worksheet.write(row_num, 0, crm_summary["순위"], summary_format)
         worksheet.write(row_num, 1, crm_summary["상담사"], summary_format)
@@ -811,6 +825,7 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
         online_df = download_df[download_df["조직"] == "온라인파트"].sort_values(by=["건수"], ascending=[False]).copy()
         online_df['순위'] = range(1, len(online_df) + 1)
         online_df = online_df[['순위', '상담사', '안마의자', '라클라우드', '정수기', '더케어', '멤버십', '건수', '콜건수', '콜타임']]
+        online_excel_times = duration_to_excel_time(online_df['콜타임']).to_numpy()
         
         # 온라인 데이터 작성
         for idx, row_data in enumerate(online_df.values):
@@ -825,7 +840,7 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
                     worksheet.write(row_num, col_num, cell_value, number_format)
                 # 시간 형식 (콜타임) - Excel 시간 값으로 변환
                 elif col_num == 9:
-                    excel_time_value = time_string_to_excel_time(cell_value)
+                    excel_time_value = online_excel_times[idx]
                     worksheet.write_number(row_num, col_num, excel_time_value, time_format)
                 # 일반 데이터
                 else:
@@ -846,18 +861,8 @@ def create_excel_report(performance_df: pd.DataFrame, filtered_data: pd.DataFram
                 "콜건수": round(online_df["콜건수"].mean(), 1)
             }
 
-            # 온라인 평균 콜타임 계산
-            online_time_seconds = []
-            for time_str in online_df["콜타임"]:
-                parts = str(time_str).split(":")
-                if len(parts) == 3:
-                    hours, minutes, seconds = map(int, parts)
-                    total_seconds = hours * 3600 + minutes * 60 + seconds
-                    online_time_seconds.append(total_seconds)
-
-            avg_online_seconds = sum(online_time_seconds) / len(online_time_seconds) if online_time_seconds else 0
-            # Excel 시간 값으로 변환
-            online_avg_excel_time = avg_online_seconds / (24 * 60 * 60)
+            # 온라인 평균 콜타임 계산 (Excel 시간 값)
+            online_avg_excel_time = online_excel_times.mean() if len(online_excel_times) > 0 else 0
 
             worksheet.write(row_num, 0, online_summary["순위"], summary_format)
             worksheet.write(row_num, 1, online_summary["상담사"], summary_format)
@@ -0,0 +1,261 @@
+"""
+주문/승인 데이터 큐브 비즈니스 로직
+
+이 모듈은 상담주문/승인 데이터를 차원(일자, 상담사, 제품, 채널, 캠페인 등) 조합별
+셀로 한 번 집계해 두고, 슬라이스/다이스/롤업 질의를 원본 행 대신 셀 단위로 처리하는 로직을 포함합니다.
+차원 값은 정수 코드로, 측정값(건수, 금액 합계)은 셀별 배열로 저장하므로
+질의 비용은 원본 행 수가 아니라 셀 수(차원 값 조합 수)에 비례합니다.
+셀별 차원 값은 데이터프레임(cells)으로도 제공하므로 filter_logic의 필터 스펙과
+classify_products 같은 기존 행 단위 규칙을 그대로 셀에 적용할 수 있습니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Any, Sequence
+
+from logic.filter_logic import FilterSpec, compile_mask
+from logic.dataset_cache_logic import get_dataset_cache
+
+# 건수 측정값 이름
+COUNT_MEASURE = "건수"
+
+# 데이터셋 캐시 이름공간 {(차원, 측정값): 큐브}
+_CACHE_NAMESPACE = "cubes"
+
+
+class OrderCube:
+    """
+    차원 값 조합(셀)별 건수/금액 합계 큐브
+
+    Attributes:
+        dimensions: 차원 컬럼 목록
+        cells: 셀별 차원 값 데이터프레임 (행 = 셀)
+        codes: 차원별 셀 코드 배열 (labels의 위치)
+        labels: 차원별 값 인덱스 (원본 데이터 등장 순서, 결측값 포함, 원본 dtype 유지)
+        measures: 측정값별 셀 배열 (건수 + 금액 합계)
+        first_rows: 셀별 원본 첫 행 위치 (등장 순서 정렬용)
+        row_cells: 원본 행별 셀 번호
+    """
+
+    def __init__(
+        self,
+        dimensions: List[str],
+        codes: Dict[str, np.ndarray],
+        labels: Dict[str, pd.Index],
+        measures: Dict[str, np.ndarray],
+        first_rows: np.ndarray,
+        row_cells: np.ndarray
+    ):
+        self.dimensions = dimensions
+        self.codes = codes
+        self.labels = labels
+        self.measures = measures
+        self.first_rows = first_rows
+        self.row_cells = row_cells
+        self.cells = pd.DataFrame({dim: labels[dim].take(codes[dim]) for dim in dimensions})
+
+    def __len__(self) -> int:
+        return len(self.first_rows)
+
+    def mask(self, spec: FilterSpec) -> np.ndarray:
+        """
+        필터 스펙을 셀에 적용한 불리언 마스크를 반환합니다. (셀 데이터프레임 기준으로 캐시)
+
+        Args:
+            spec: 필터 스펙 (차원 컬럼만 참조해야 원본 행 필터와 같은 결과)
+
+        Returns:
+            np.ndarray: 셀별 불리언 마스크
+        """
+        return compile_mask(self.cells, spec)
+
+    def isin(self, dimension: str, values: Sequence[Any]) -> np.ndarray:
+        """차원 값이 목록에 포함되는 셀 마스크 (다이스)"""
+        label_mask = self.labels[dimension].isin(list(values))
+        return label_mask[self.codes[dimension]]
+
+    def slice(self, dimension: str, value: Any) -> np.ndarray:
+        """차원 값이 value인 셀 마스크 (슬라이스)"""
+        return self.isin(dimension, [value])
+
+    def total(self, mask: Optional[np.ndarray] = None) -> pd.Series:
+        """
+        선택한 셀의 측정값 합계를 반환합니다.
+
+        Args:
+            mask: 셀 마스크 (None이면 전체)
+
+        Returns:
+            pd.Series: {측정값: 합계}
+        """
+        return pd.Series({
+            name: values[mask].sum() if mask is not None else values.sum()
+            for name, values in self.measures.items()
+        })
+
+    def rollup(
+        self,
+        dimensions: List[str],
+        mask: Optional[np.ndarray] = None,
+        order: str = "label",
+        derived: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        선택한 셀을 차원별로 합산합니다. (선택된 셀이 없는 차원 값 조합은 제외)
+
+        Args:
+            dimensions: 그룹 차원 목록 (빈 목록이면 total과 같은 1행)
+            mask: 셀 마스크 (None이면 전체)
+            order: "label"이면 차원 값 오름차순, "first"면 원본 데이터 첫 등장 순서
+            derived: 셀 단위로 계산한 파생 차원 {이름: 셀별 값} (예: 제품분류)
+
+        Returns:
+            pd.DataFrame: 차원 인덱스(2개 이상이면 MultiIndex) × 측정값 컬럼
+        """
+        if not dimensions:
+            return self.total(mask).to_frame().T
+
+        selected = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        derived = derived or {}
+
+        # 차원별 (셀 코드, 값 인덱스) - 파생 차원은 선택된 셀 기준으로 코드화
+        key_codes = []
+        key_labels = []
+        for dim in dimensions:
+            if dim in derived:
+                codes, uniques = pd.factorize(pd.Series(np.asarray(derived[dim], dtype=object)[selected]), use_na_sentinel=False)
+                key_codes.append(codes)
+                key_labels.append(pd.Index(uniques))
+            else:
+                key_codes.append(self.codes[dim][selected])
+                key_labels.append(self.labels[dim])
+
+        # 차원 코드 조합을 하나의 정수 키로 변환 (조합 수는 셀 수 이하)
+        shape = [max(len(labels), 1) for labels in key_labels]
+        keys = np.ravel_multi_index(key_codes, shape)
+        group_keys, group_ids = np.unique(keys, return_inverse=True)
+        group_ids = group_ids.reshape(-1)
+        n_groups = len(group_keys)
+
+        result = {}
+        for name, values in self.measures.items():
+            sums = np.bincount(group_ids, weights=values[selected], minlength=n_groups)
+            result[name] = sums.astype(values.dtype) if values.dtype.kind in "iu" else sums
+
+        group_codes = np.unravel_index(group_keys, shape)
+        if len(dimensions) == 1:
+            index = key_labels[0].take(group_codes[0]).rename(dimensions[0])
+        else:
+            index = pd.MultiIndex.from_arrays(
+                [labels.take(codes) for labels, codes in zip(key_labels, group_codes)],
+                names=dimensions
+            )
+        rolled = pd.DataFrame(result, index=index)
+
+        if order == "first":
+            first_rows = np.full(n_groups, np.iinfo(np.int64).max)
+            np.minimum.at(first_rows, group_ids, self.first_rows[selected])
+            rolled = rolled.iloc[np.argsort(first_rows, kind="stable")]
+        else:
+            rolled = rolled.sort_index(na_position="last")
+
+        return rolled
+
+    def row_values(self, cell_values: np.ndarray, row_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        셀별 값을 원본 행으로 펼칩니다. (셀 단위로 계산한 분류 결과를 행 컬럼으로 추가할 때 사용)
+
+        Args:
+            cell_values: 셀별 값 배열
+            row_mask: 원본 행 마스크 (None이면 전체 행)
+
+        Returns:
+            np.ndarray: 행별 값
+        """
+        row_cells = self.row_cells if row_mask is None else self.row_cells[row_mask]
+        return np.asarray(cell_values)[row_cells]
+
+
+def build_cube(df: pd.DataFrame, dimensions: List[str], measures: Sequence[str] = ()) -> OrderCube:
+    """
+    데이터프레임을 차원 값 조합(셀)별로 집계한 큐브를 만듭니다.
+
+    Args:
+        df: 원본 데이터프레임
+        dimensions: 차원 컬럼 목록 (결측값도 하나의 차원 값으로 유지)
+        measures: 합계를 구할 숫자 컬럼 목록 (결측값은 pandas sum처럼 제외)
+
+    Returns:
+        OrderCube: 큐브
+    """
+    n_rows = len(df)
+
+    # 차원별 정수 코드 (원본 등장 순서, 결측값 포함)
+    row_codes = {}
+    labels = {}
+    for dim in dimensions:
+        codes, uniques = pd.factorize(df[dim], use_na_sentinel=False)
+        labels[dim] = pd.Index(uniques)
+        # factorize는 None/NaN을 하나의 결측값으로 합치므로, 결측값 라벨은 원본의 첫 결측값(None 등)으로 유지
+        na_codes = np.flatnonzero(labels[dim].isna())
+        if len(na_codes) and labels[dim].dtype == object:
+            values = labels[dim].to_numpy(copy=True)
+            values[na_codes[0]] = df[dim].iloc[int(np.argmax(codes == na_codes[0]))]
+            labels[dim] = pd.Index(values, dtype=object)
+        row_codes[dim] = codes
+
+    # 차원 코드 조합 → 셀 번호 (첫 등장 순서이므로 셀 번호가 새로 커지는 행이 각 셀의 첫 행)
+    if dimensions:
+        shape = [max(len(labels[dim]), 1) for dim in dimensions]
+        if float(np.prod(shape, dtype=float)) < 2 ** 62:
+            combined = np.ravel_multi_index([row_codes[dim] for dim in dimensions], shape)
+        else:
+            combined = pd.MultiIndex.from_arrays([row_codes[dim] for dim in dimensions])
+        row_cells, _ = pd.factorize(combined)
+    else:
+        row_cells = np.zeros(n_rows, dtype=np.int64)
+    n_cells = int(row_cells.max()) + 1 if n_rows else 0
+
+    running_max = np.maximum.accumulate(row_cells) if n_rows else row_cells
+    first_rows = np.flatnonzero(np.r_[True, running_max[1:] > running_max[:-1]]) if n_rows else np.array([], dtype=np.int64)
+
+    cell_measures = {COUNT_MEASURE: np.bincount(row_cells, minlength=n_cells).astype(np.int64)}
+    for column in measures:
+        values = df[column].to_numpy()
+        sums = np.bincount(row_cells, weights=np.nan_to_num(values.astype(float)), minlength=n_cells)
+        cell_measures[column] = sums.astype(values.dtype) if values.dtype.kind in "iu" else sums
+
+    return OrderCube(
+        dimensions=list(dimensions),
+        codes={dim: row_codes[dim][first_rows] for dim in dimensions},
+        labels=labels,
+        measures=cell_measures,
+        first_rows=first_rows,
+        row_cells=row_cells
+    )
+
+
+def get_cube(df: pd.DataFrame, dimensions: List[str], measures: Sequence[str] = ()) -> OrderCube:
+    """
+    데이터셋별로 캐시된 큐브를 가져옵니다. (없으면 build_cube로 생성)
+
+    데이터셋은 객체 동일성(is)으로 비교하므로, 데이터를 제자리에서 수정했다면
+    dataset_cache_logic.clear_dataset_cache()를 호출해야 합니다.
+
+    Args:
+        df: 원본 데이터프레임
+        dimensions: 차원 컬럼 목록
+        measures: 합계를 구할 숫자 컬럼 목록
+
+    Returns:
+        OrderCube: 큐브
+    """
+    cubes = get_dataset_cache(df, _CACHE_NAMESPACE)
+    key = (tuple(dimensions), tuple(measures))
+    cube = cubes.get(key)
+    if cube is None:
+        cube = build_cube(df, list(dimensions), measures)
+        cubes[key] = cube
+    return cube
+
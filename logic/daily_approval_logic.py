@@ -14,8 +14,18 @@ from datetime import datetime, timedelta
 from typing import Tuple, Dict, List, Optional, Any, Union
 
 # utils.py에서 필요한 함수 가져오기
-from utils.utils import format_time, peek_file_content
-from utils.consultant_manager import load_consultants, get_team_by_consultant, get_all_consultants
+from utils.utils import format_time, format_duration, parse_duration_seconds, peek_file_content
+from utils.consultant_manager import load_consultants, get_all_consultants, get_consultant_team_map
+from utils.consultant_alias_manager import resolve_consultant_names, SCOPE_ROSTER_TO_CALLTIME
+from logic.analysis_backend_logic import resolve_backend
+from logic.polars_backend_logic import sum_daily_approval_metrics
+from logic.cube_logic import get_cube, COUNT_MEASURE
+
+# 일일 승인 현황 제품 {제품: 대분류 포함 키워드}
+APPROVAL_CATEGORY_KEYWORDS = {"안마의자": "안마", "라클라우드": "라클", "정수기": "정수기"}
+
+# 집계 단계를 지원하는 분석 백엔드
+DAILY_APPROVAL_BACKENDS = ("pandas", "polars")
 
 def process_approval_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
@@ -264,35 +274,14 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                 for pattern in invalid_patterns:
                     result_df = result_df[~result_df['상담원명'].astype(str).str.contains(pattern)]
                 
-                # 0:00:00이나 '0' 값을 가진 시간은 제거
-                zero_time_patterns = ['0:00:00', '00:00:00', '0']
-                result_df = result_df[~result_df['총 시간'].astype(str).isin(zero_time_patterns)].copy()
+                # 시간을 초로 변환 (문자열, datetime.time, timedelta, Excel 시간 값 모두 처리)
+                result_df['총 시간_초'] = parse_duration_seconds(result_df['총 시간']).to_numpy()
                 
-                # 시간을 초로 변환
-                def time_to_seconds(time_str):
-                    try:
-                        if pd.isna(time_str):
-                            return 0
-                        
-                        time_str = str(time_str)
-                        time_parts = re.findall(r'\d+', time_str)
-                        
-                        if not time_parts:
-                            return 0
-                            
-                        # 시간 형식에 따라 변환
-                        if len(time_parts) == 3:  # HH:MM:SS
-                            h, m, s = map(int, time_parts)
-                            return h * 3600 + m * 60 + s
-                        elif len(time_parts) == 2:  # MM:SS
-                            m, s = map(int, time_parts)
-                            return m * 60 + s
-                        else:
-                            return int(time_parts[0])
-                    except:
-                        return 0
+                # 0:00:00이나 '0' 값을 가진 시간은 제거
+                result_df = result_df[result_df['총 시간_초'] > 0].copy()
                 
-                result_df['총 시간_초'] = result_df['총 시간'].apply(time_to_seconds)
+                # 표시용 시간은 H:MM:SS 문자열로 통일
+                result_df['총 시간'] = format_duration(result_df['총 시간_초']).to_numpy()
                 
                 return result_df, None
             else:
@@ -346,22 +335,10 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                                 
                                 # 0:00:00 시간은 제외
                                 if time not in ['0:00:00', '00:00:00', '0']:
-                                    # 시간을 초로 변환
-                                    time_parts = re.findall(r'\d+', time)
-                                    if len(time_parts) == 3:  # HH:MM:SS
-                                        h, m, s = map(int, time_parts)
-                                        seconds = h * 3600 + m * 60 + s
-                                    elif len(time_parts) == 2:  # MM:SS
-                                        m, s = map(int, time_parts)
-                                        seconds = m * 60 + s
-                                    else:
-                                        seconds = 0
-                                    
                                     result_data.append({
                                         '상담원명': name,
                                         '총 건수': count,
-                                        '총 시간': time,
-                                        '총 시간_초': seconds
+                                        '총 시간': time
                                     })
                             except:
                                 continue
@@ -369,6 +346,8 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
                     # 결과 데이터프레임 생성
                     if result_data:
                         result_df = pd.DataFrame(result_data)
+                        # 시간을 초로 변환 (전체 행을 한 번에)
+                        result_df['총 시간_초'] = parse_duration_seconds(result_df['총 시간']).to_numpy()
                         return result_df, None
                     else:
                         return None, "유효한 상담원 데이터를 추출할 수 없습니다."
@@ -381,12 +360,13 @@ def process_calltime_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     except Exception as e:
         return None, f"콜타임 파일 처리 중 오류가 발생했습니다: {str(e)}"
 
-def analyze_daily_approval(approval_df: pd.DataFrame) -> Tuple[Optional[Dict], Optional[str]]:
+def analyze_daily_approval(approval_df: pd.DataFrame, backend: str = "pandas") -> Tuple[Optional[Dict], Optional[str]]:
     """
     일일 승인 현황을 분석하는 함수
     
     Args:
         approval_df: 승인 데이터프레임
+        backend: 집계 백엔드 ("pandas" | "polars", polars가 없으면 pandas)
         
     Returns:
         Tuple[Optional[Dict], Optional[str]]: 분석 결과 딕셔너리와 오류 메시지(있는 경우)
@@ -409,14 +389,24 @@ def analyze_daily_approval(approval_df: pd.DataFrame) -> Tuple[Optional[Dict], O
         if not pd.api.types.is_datetime64_any_dtype(approval_df["주문 일자"]):
             approval_df["주문 일자"] = pd.to_datetime(approval_df["주문 일자"], errors='coerce')
         
-        # 가장 최근 날짜 찾기
-        latest_date = approval_df["주문 일자"].dropna().max()
+        # Polars 백엔드는 상담사 컬럼이 있고 매출 금액이 숫자형일 때만 사용 (그 외는 pandas와 같은 오류/결과)
+        use_polars = (
+            resolve_backend(backend, DAILY_APPROVAL_BACKENDS) == "polars"
+            and "상담사" in approval_df.columns
+            and pd.api.types.is_numeric_dtype(approval_df["매출 금액"])
+            and not pd.api.types.is_bool_dtype(approval_df["매출 금액"])
+        )
+        
+        # pandas 백엔드는 상담사 × 대분류 × 주문 일자 큐브 (데이터셋별 캐시)에서 셀 단위로 집계하므로
+        # 큐브가 캐시된 뒤에는 원본 행을 다시 읽지 않음
+        cube = None if use_polars else get_cube(approval_df, ["상담사", "대분류", "주문 일자"], ["매출 금액"])
+        
+        # 가장 최근 날짜 찾기 (큐브는 주문 일자 고유값에서 찾음)
+        order_dates = approval_df["주문 일자"] if cube is None else cube.labels["주문 일자"]
+        latest_date = order_dates.dropna().max()
         if pd.isna(latest_date):
             latest_date = datetime.now()
             
-        # 모든 상담사 목록 로드 (JSON 파일에서)
-        all_consultants = get_all_consultants()
-        
         # 결과 저장을 위한 데이터 구조
         results = {
             'consultant_data': [],
@@ -443,140 +433,69 @@ def analyze_daily_approval(approval_df: pd.DataFrame) -> Tuple[Optional[Dict], O
             'latest_date': latest_date
         }
         
-        # 일일 데이터 (최신 날짜) 필터링
-        if latest_date is not None:
-            daily_df = approval_df[approval_df["주문 일자"].dt.date == latest_date.date()].copy()
-            
-            # 일일 안마의자 건수 및 매출
-            daily_anma_df = daily_df[daily_df["대분류"].str.contains("안마", case=False, na=False)]
-            results['daily_data']['anma_count'] = len(daily_anma_df)
-            results['daily_data']['anma_sales'] = daily_anma_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-            
-            # 일일 라클라우드 건수 및 매출
-            daily_lacloud_df = daily_df[daily_df["대분류"].str.contains("라클", case=False, na=False)]
-            results['daily_data']['lacloud_count'] = len(daily_lacloud_df)
-            results['daily_data']['lacloud_sales'] = daily_lacloud_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-            
-            # 일일 정수기 건수 및 매출
-            daily_water_df = daily_df[daily_df["대분류"].str.contains("정수기", case=False, na=False)]
-            results['daily_data']['water_count'] = len(daily_water_df)
-            results['daily_data']['water_sales'] = daily_water_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-            
-            # 일일 총합
-            results['daily_data']['total_count'] = (
-                results['daily_data']['anma_count'] + 
-                results['daily_data']['lacloud_count'] + 
-                results['daily_data']['water_count']
-            )
-            results['daily_data']['total_sales'] = (
-                results['daily_data']['anma_sales'] + 
-                results['daily_data']['lacloud_sales'] + 
-                results['daily_data']['water_sales']
-            )
-        
-        # 전체 누적 분석
-        # 안마의자 건수 및 매출
-        anma_df = approval_df[approval_df["대분류"].str.contains("안마", case=False, na=False)]
-        results['total_data']['anma_count'] = len(anma_df)
-        results['total_data']['anma_sales'] = anma_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-        
-        # 라클라우드 건수 및 매출
-        lacloud_df = approval_df[approval_df["대분류"].str.contains("라클", case=False, na=False)]
-        results['total_data']['lacloud_count'] = len(lacloud_df)
-        results['total_data']['lacloud_sales'] = lacloud_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-        
-        # 정수기 건수 및 매출
-        water_df = approval_df[approval_df["대분류"].str.contains("정수기", case=False, na=False)]
-        results['total_data']['water_count'] = len(water_df)
-        results['total_data']['water_sales'] = water_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-        
-        # 총합
-        results['total_data']['total_count'] = (
-            results['total_data']['anma_count'] + 
-            results['total_data']['lacloud_count'] + 
-            results['total_data']['water_count']
-        )
-        results['total_data']['total_sales'] = (
-            results['total_data']['anma_sales'] + 
-            results['total_data']['lacloud_sales'] + 
-            results['total_data']['water_sales']
-        )
+        # 모든 상담사 목록과 소속 팀 인덱스 로드 (JSON 파일은 한 번만 읽음)
+        all_consultants = get_all_consultants()
+        team_map = get_consultant_team_map()
         
-        # 상담원별 분석 (JSON에 등록된 모든 상담원 포함)
-        for consultant_name in all_consultants:
-            # 상담사별 데이터 필터링
-            consultant_df = approval_df[approval_df["상담사"] == consultant_name]
-            
-            # 상담사 데이터가 없는 경우 빈 데이터 생성
-            if consultant_df.empty:
-                team = get_team_by_consultant(consultant_name) or "기타"
-                results['consultant_data'].append({
-                    "상담사": consultant_name,
-                    "조직": team,
-                    "안마의자": 0,
-                    "안마의자_매출액": 0,
-                    "라클라우드": 0,
-                    "라클라우드_매출액": 0,
-                    "정수기": 0,
-                    "정수기_매출액": 0,
-                    "누적건수": 0,
-                    "누적매출액": 0,
-                    "일일건수": 0,
-                    "일일매출액": 0,
-                    "콜건수": 0,
-                    "콜타임": "0:00:00",
-                    "콜타임_초": 0
-                })
-                continue
-            
-            # 소속 팀 확인
-            team = get_team_by_consultant(consultant_name) or "기타"
-            
-            # 안마의자 건수 및 매출
-            anma_count = len(consultant_df[consultant_df["대분류"].str.contains("안마", case=False, na=False)])
-            anma_sales = consultant_df[consultant_df["대분류"].str.contains("안마", case=False, na=False)]["매출 금액"].sum() / 1000000
-            
-            # 라클라우드 건수 및 매출
-            lacloud_count = len(consultant_df[consultant_df["대분류"].str.contains("라클", case=False, na=False)])
-            lacloud_sales = consultant_df[consultant_df["대분류"].str.contains("라클", case=False, na=False)]["매출 금액"].sum() / 1000000
-            
-            # 정수기 건수 및 매출
-            water_count = len(consultant_df[consultant_df["대분류"].str.contains("정수기", case=False, na=False)])
-            water_sales = consultant_df[consultant_df["대분류"].str.contains("정수기", case=False, na=False)]["매출 금액"].sum() / 1000000
-            
-            # 누적 총합
-            total_count = anma_count + lacloud_count + water_count
-            total_sales = anma_sales + lacloud_sales + water_sales
-            
-            # 일일 데이터 계산 (최신 날짜)
-            daily_count = 0
-            daily_sales = 0
-            
-            if latest_date is not None:
-                daily_consultant_df = consultant_df[consultant_df["주문 일자"].dt.date == latest_date.date()]
-                
-                if not daily_consultant_df.empty:
-                    daily_count = len(daily_consultant_df)
-                    daily_sales = daily_consultant_df["매출 금액"].sum() / 1000000  # 백만 단위로 변환
-            
-            # 상담원 데이터 추가
-            results['consultant_data'].append({
-                "상담사": consultant_name,
-                "조직": team,
-                "안마의자": anma_count,
-                "안마의자_매출액": anma_sales,
-                "라클라우드": lacloud_count,
-                "라클라우드_매출액": lacloud_sales,
-                "정수기": water_count,
-                "정수기_매출액": water_sales,
-                "누적건수": total_count,
-                "누적매출액": total_sales,
-                "일일건수": daily_count,
-                "일일매출액": daily_sales,
-                "콜건수": 0,  # 콜타임 데이터와 매칭 시 업데이트
-                "콜타임": "0:00:00",  # 콜타임 데이터와 매칭 시 업데이트
-                "콜타임_초": 0  # 콜타임 데이터와 매칭 시 업데이트
-            })
+        if use_polars:
+            # 상담사별 / 전체 누적 / 일일 합계를 한 번의 지연 쿼리로 집계
+            consultant_sums, total_sums, daily_sums = sum_daily_approval_metrics(
+                approval_df, latest_date.date(), APPROVAL_CATEGORY_KEYWORDS
+            )
+        else:
+            # 제품 카테고리 / 최신 일자 조건은 셀의 차원 값에만 적용
+            cells = cube.cells
+            is_latest_day = (cells["주문 일자"].dt.date == latest_date.date()).to_numpy()
+            category_masks = {
+                product: cells["대분류"].str.contains(keyword, case=False, na=False).to_numpy(dtype=bool)
+                for product, keyword in APPROVAL_CATEGORY_KEYWORDS.items()
+            }
+            has_consultant = cells["상담사"].notna().to_numpy()
+            
+            # 셀 단위 집계 프레임 (카테고리별 건수/매출, 일일 건수/매출)
+            counts = cube.measures[COUNT_MEASURE]
+            sales = cube.measures["매출 금액"]
+            metrics = pd.DataFrame(index=cells.index)
+            for product, mask in category_masks.items():
+                metrics[product] = np.where(mask, counts, 0)
+                metrics[f"{product}_매출액"] = np.where(mask, sales, 0).astype(sales.dtype)
+            metrics["일일건수"] = np.where(is_latest_day, counts, 0)
+            metrics["일일매출액"] = np.where(is_latest_day, sales, 0).astype(sales.dtype)
+            
+            # 전체 누적 / 일일 / 상담사별 합계
+            total_sums = metrics.sum()
+            daily_sums = metrics[is_latest_day].sum()
+            consultant_sums = metrics[has_consultant].groupby(cells.loc[has_consultant, "상담사"]).sum()
+        
+        for summary_key, sums in (('total_data', total_sums), ('daily_data', daily_sums)):
+            summary = results[summary_key]
+            for product, prefix in (("안마의자", "anma"), ("라클라우드", "lacloud"), ("정수기", "water")):
+                summary[f'{prefix}_count'] = int(sums[product])
+                summary[f'{prefix}_sales'] = sums[f"{product}_매출액"] / 1000000  # 백만 단위로 변환
+            summary['total_count'] = summary['anma_count'] + summary['lacloud_count'] + summary['water_count']
+            summary['total_sales'] = summary['anma_sales'] + summary['lacloud_sales'] + summary['water_sales']
+        
+        # 상담원별 분석 (JSON에 등록된 모든 상담원 포함, 실적이 없으면 0)
+        consultant_summary = consultant_sums.reindex(all_consultants, fill_value=0)
+        sales_columns = ["안마의자_매출액", "라클라우드_매출액", "정수기_매출액", "일일매출액"]
+        consultant_summary[sales_columns] = consultant_summary[sales_columns] / 1000000  # 백만 단위로 변환
+        consultant_summary["누적건수"] = consultant_summary[["안마의자", "라클라우드", "정수기"]].sum(axis=1)
+        consultant_summary["누적매출액"] = consultant_summary[["안마의자_매출액", "라클라우드_매출액", "정수기_매출액"]].sum(axis=1)
+        
+        consultant_summary.index.name = "상담사"
+        consultant_summary = consultant_summary.reset_index()
+        consultant_summary.insert(1, "조직", consultant_summary["상담사"].map(team_map).fillna("기타"))
+        
+        # 콜타임 데이터와 매칭 시 업데이트
+        consultant_summary["콜건수"] = 0
+        consultant_summary["콜타임"] = "0:00:00"
+        consultant_summary["콜타임_초"] = 0
+        
+        results['consultant_data'] = consultant_summary[[
+            "상담사", "조직", "안마의자", "안마의자_매출액", "라클라우드", "라클라우드_매출액",
+            "정수기", "정수기_매출액", "누적건수", "누적매출액", "일일건수", "일일매출액",
+            "콜건수", "콜타임", "콜타임_초"
+        ]].to_dict('records')
         
         # 누적매출액 기준으로 내림차순 정렬
         results['consultant_data'] = sorted(
@@ -608,34 +527,27 @@ def match_consultant_calltime(
     if calltime_df is None or calltime_df.empty:
         return approval_results
     
+    # 등록 상담사명 → 콜타임 상담원명 매칭 (고유 이름 기준, 학습된 별칭 사용)
+    name_map, ambiguous_names = resolve_consultant_names(
+        [data["상담사"] for data in approval_results['consultant_data']],
+        calltime_df["상담원명"].unique(),
+        scope=SCOPE_ROSTER_TO_CALLTIME
+    )
+    approval_results['ambiguous_calltime_names'] = ambiguous_names
+    
+    # 상담원명별 첫 번째 행의 콜타임 정보
+    calltime_lookup = calltime_df.drop_duplicates(subset=["상담원명"]).set_index("상담원명")
+    
     # 상담원 데이터 업데이트
-    for i, consultant_data in enumerate(approval_results['consultant_data']):
-        consultant_name = consultant_data["상담사"]
-        
-        # 정확히 일치하는 이름 검색
-        calltime_match = calltime_df[calltime_df["상담원명"] == consultant_name]
-        
-        # 일치하는 데이터가 없으면 유사 매칭 시도
-        if calltime_match.empty:
-            # 상담원명 전처리
-            consultant_clean = consultant_name.strip()
-            
-            # 포함 관계 확인
-            for _, row in calltime_df.iterrows():
-                calltime_name = str(row["상담원명"]).strip()
-                # 상담원명이 포함되거나 상담원명에 포함되는 경우
-                if (consultant_clean in calltime_name) or (calltime_name in consultant_clean):
-                    # 콜타임 정보 업데이트
-                    approval_results['consultant_data'][i]["콜건수"] = row["총 건수"]
-                    approval_results['consultant_data'][i]["콜타임"] = row["총 시간"]
-                    approval_results['consultant_data'][i]["콜타임_초"] = row.get("총 시간_초", 0)
-                    break
-        else:
-            # 첫 번째 일치하는 행의 콜타임 정보 사용
-            row = calltime_match.iloc[0]
-            approval_results['consultant_data'][i]["콜건수"] = row["총 건수"]
-            approval_results['consultant_data'][i]["콜타임"] = row["총 시간"]
-            approval_results['consultant_data'][i]["콜타임_초"] = row.get("총 시간_초", 0)
+    for consultant_data in approval_results['consultant_data']:
+        matched_name = name_map.get(consultant_data["상담사"])
+        if matched_name is None:
+            continue
+        
+        row = calltime_lookup.loc[matched_name]
+        consultant_data["콜건수"] = row["총 건수"]
+        consultant_data["콜타임"] = row["총 시간"]
+        consultant_data["콜타임_초"] = row.get("총 시간_초", 0)
     
     return approval_results
 
@@ -10,11 +10,22 @@ import numpy as np
 from io import BytesIO
 import re
 import xlsxwriter
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any, Union, Tuple
 
 # utils.py에서 필요한 함수 가져오기
 from utils.utils import format_time, peek_file_content
+from logic.analysis_backend_logic import resolve_backend
+from logic.duckdb_backend_logic import sum_approval_by_product
+from logic import polars_backend_logic
+from logic.cube_logic import build_cube, COUNT_MEASURE
+from logic.prefix_sum_logic import DailyPrefixSums, build_prefix_sums
+from logic.string_predicate_logic import contains, startswith, matches
+from logic.dataset_cache_logic import get_dataset_cache
+
+# 제품별 승인매출 집계를 지원하는 분석 백엔드
+SALES_ANALYSIS_BACKENDS = ("pandas", "duckdb", "polars")
 
 
 # 목표 데이터 정의 - 2025년 4월 기준 (설치매출 기준)
@@ -41,24 +52,33 @@ INSTALLATION_TARGET_DATA = {
     }
 }
 
-# 승인매출 목표 데이터 계산 (설치매출 목표의 105%)
-TARGET_DATA = {}
-for product, targets in INSTALLATION_TARGET_DATA.items():
-    TARGET_DATA[product] = {
-        "직접": {
-            "건수": targets["직접"]["건수"],  # 건수는 동일
-            "매출액": int(targets["직접"]["매출액"] * 1.05)  # 매출액은 105%
-        },
-        "연계": {
-            "건수": targets["연계"]["건수"],  # 건수는 동일
-            "매출액": int(targets["연계"]["매출액"] * 1.05)  # 매출액은 105%
-        },
-        "온라인": {
-            "건수": targets["온라인"]["건수"],  # 건수는 동일
-            "매출액": int(targets["온라인"]["매출액"] * 1.05)  # 매출액은 105%
+# 승인매출 목표 비율 (설치매출 목표 대비)
+APPROVAL_TARGET_RATE = 1.05
+
+def derive_approval_targets(installation_targets: Dict[str, Dict[str, Dict[str, Optional[int]]]]) -> Dict[str, Dict[str, Dict[str, Optional[int]]]]:
+    """
+    설치매출 목표로부터 승인매출 목표를 계산하는 함수 (건수는 동일, 매출액은 105%)
+    
+    Args:
+        installation_targets: {제품: {구분(직접/연계/온라인): {"건수", "매출액"}}} 설치매출 목표
+        
+    Returns:
+        Dict: 같은 구조의 승인매출 목표
+    """
+    return {
+        product: {
+            channel: {
+                "건수": values["건수"],  # 건수는 동일
+                "매출액": int(values["매출액"] * APPROVAL_TARGET_RATE)  # 매출액은 105%
+            }
+            for channel, values in targets.items()
         }
+        for product, targets in installation_targets.items()
     }
 
+# 승인매출 목표 데이터 계산 (설치매출 목표의 105%)
+TARGET_DATA = derive_approval_targets(INSTALLATION_TARGET_DATA)
+
 # 월별 합계 목표 (상단 합계 행 계산용)
 TOTAL_TARGET = {
     "직접": {"건수": sum(item["직접"]["건수"] for item in TARGET_DATA.values() if item["직접"]["건수"] is not None),
@@ -347,180 +367,202 @@ def process_installation_file(file) -> Tuple[Optional[pd.DataFrame], Optional[st
     except Exception as e:
         return None, f"설치매출 파일 처리 중 오류가 발생했습니다: {str(e)}"
 
-def analyze_installation_by_product_model(installation_df):
-    """
-    제품별 설치현황을 분석하는 함수 (안마의자 제품별 설치현황 표 생성)
-    
-    Args:
-        installation_df: 설치매출 데이터프레임
-        
-    Returns:
-        pd.DataFrame: 분석 결과 데이터프레임
-    """
-    if installation_df is None or installation_df.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
-    
-    # 품목명 컬럼 확인
-    product_name_col = None
-    for col_name in ['품목명', '상품명', '제품명', '품목 명', '상품 명', '제품 명']:
-        if col_name in installation_df.columns:
-            product_name_col = col_name
-            break
-    
-    if product_name_col is None:
-        # 품목명 컬럼이 없는 경우 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
-    
-    # 1. 안마의자 필터링 - 대분류 열과 품목명 열을 모두 확인
-    massage_chair_mask = installation_df["대분류"].astype(str).str.contains("안마의자", case=False, na=False)
-
-    # 품목명에도 '안마'가 포함된 항목 추가 (대분류가 다른 경우를 위해)
-    massage_chair_mask |= installation_df[product_name_col].astype(str).str.contains("안마", case=False, na=False)
-
-    massage_chair_data = installation_df[massage_chair_mask].copy()
+# 제품별 설치현황 대상 제품군 {제품군: (대분류 키워드, 품목명 키워드, 더케어 제외 여부)}
+PRODUCT_MODEL_LINES = {
+    "안마의자": ("안마의자", "안마", True),
+    "라클라우드": ("라클라우드", None, False),
+    "정수기": ("정수기", None, False)
+}
 
-    # 더케어 제외 - 판매유형에 "더케어"가 포함된 항목 제거
-    if "판매유형" in massage_chair_data.columns:
-        thecare_mask = massage_chair_data["판매유형"].astype(str).str.contains("더케어", case=False, na=False)
-        massage_chair_data = massage_chair_data[~thecare_mask].copy()
-    
-    if massage_chair_data.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
-    
-    # 2. 캠페인 필터링 (본사/연계합계와 동일) - 유연하게 수정
-    campaign_mask = (
-        massage_chair_data['일반회차 캠페인'].astype(str).str.strip() != ""  # ① 공백이 아닌 경우
-    ) & (
-        massage_chair_data['일반회차 캠페인'].astype(str).str.contains(r'^C|^V|^AS|캠|정규|재분배', case=False, na=False)  # ② C-, V-, 캠, 정규, 재분배 포함
-    ) & ~(
-        massage_chair_data['일반회차 캠페인'].astype(str).str.startswith('CB-', na=False)  # ③ CB- 제외
-    )
+# 품목명 앞 괄호 태그 (리퍼 제품 표시, 예: (A)팔콘S, (A) 팔콘S, (S)파라오네오)
+_LEADING_TAG_PATTERN = re.compile(r'^(?:\([^)]*\)\s*)+')
 
+@lru_cache(maxsize=4096)
+def _normalize_product_text(key: str) -> str:
+    """품목명 문자열 정리 (결과는 프로세스 안에서만 캐시 - 정리 규칙이 바뀌면 바로 반영)"""
+    # 앞에 괄호가 있는 경우 제거 (리퍼 제품 처리)
+    name_str = _LEADING_TAG_PATTERN.sub("", key.strip()).strip()
     
-    filtered_data = massage_chair_data[campaign_mask].copy()
-    
-    if filtered_data.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
-    
-    # 3. 품목명 정리 (괄호 제거) - 개선된 방식으로
-    def clean_product_name(name):
-        if pd.isna(name):
-            return ""
-
-        name_str = str(name).strip()
-
-        # 앞에 괄호가 있는 경우 제거 (리퍼 제품 처리)
-        # 예: (A)팔콘S, (A) 팔콘S, (S)파라오네오 등
-        while name_str.startswith("(") and ")" in name_str:
-            # 첫 번째 닫는 괄호 위치 찾기
-            close_pos = name_str.find(")")
-            if close_pos >= 0:
-                # 괄호와 그 내용을 제거
-                name_str = name_str[close_pos + 1:].strip()
-            else:
-                break
-
+    if name_str.startswith("에덴로보"):
         # 에덴로보 통합 - 에덴로보로 시작하는 모든 제품은 "에덴로보"로 통합
-        if name_str.startswith("에덴로보"):
-            return "에덴로보"
-
+        name_str = "에덴로보"
+    else:
         # 괄호가 있으면 괄호 앞부분만 사용
         if '(' in name_str:
             name_str = name_str.split('(')[0].strip()
-
+        
         # 공백이 있다면 첫 단어만 추출 (ex: "팔코닉 B&O" -> "팔코닉")
         # 단, '+' 기호가 있거나 에덴로보인 경우는 제외
         if ' ' in name_str and '+' not in name_str and not name_str.startswith("에덴로보"):
             name_str = name_str.split(' ')[0].strip()
+    
+    return name_str
 
-        return name_str
+def normalize_product_name(name: Any) -> str:
+    """
+    품목명을 모델명으로 정리하는 함수 (괄호 태그/옵션 제거, 에덴로보 통합, 첫 단어 추출)
     
-    filtered_data['정리품목명'] = filtered_data[product_name_col].apply(clean_product_name)
+    Args:
+        name: 원본 품목명
+        
+    Returns:
+        str: 정리된 모델명 (결측값이면 빈 문자열)
+    """
+    if pd.isna(name):
+        return ""
+    return _normalize_product_text(str(name))
+
+def normalize_product_names(names: pd.Series) -> np.ndarray:
+    """
+    품목명 컬럼을 모델명으로 정리하는 함수 (고유 품목명만 정리한 뒤 행으로 펼침)
     
-    # 4. 직접/연계 분리 - 판매인입경로에 CRM이 포함된 경우 직접, 아닌 경우 연계
-    direct_mask = filtered_data['판매인입경로'].astype(str).str.contains('CRM', case=False, na=False)
-    direct_data = filtered_data[direct_mask]
-    affiliate_data = filtered_data[~direct_mask]
+    Args:
+        names: 품목명 시리즈
+        
+    Returns:
+        np.ndarray: 행별 정리된 모델명 (결측값은 빈 문자열)
+    """
+    codes, uniques = pd.factorize(names)
+    normalized = np.array([normalize_product_name(name) for name in uniques] + [""], dtype=object)
+    # 결측값 코드(-1)는 마지막의 빈 문자열을 가리킴
+    return normalized[codes]
+
+def _empty_model_table() -> pd.DataFrame:
+    """제품별 설치현황 빈 결과 (합계 행만)"""
+    return pd.DataFrame({
+        "제품명": ["합계"],
+        "직접": [0],
+        "연계": [0],
+        "총건": [0],
+        "비율": ["100.0%"]
+    })
+
+def _model_table(models: np.ndarray, is_direct: np.ndarray) -> pd.DataFrame:
+    """
+    모델별 직접/연계 건수 표를 만드는 함수 (총건 내림차순 + 합계 행)
     
-    # 5. 결과 데이터프레임 생성
-    result_data = []
+    Args:
+        models: 행별 정리된 모델명 (빈 문자열은 집계에서 제외, 비율 분모에는 포함)
+        is_direct: 행별 직접(판매인입경로 CRM) 여부
+        
+    Returns:
+        pd.DataFrame: 제품명/직접/연계/총건/비율 데이터프레임
+    """
+    if len(models) == 0:
+        return _empty_model_table()
     
-    # 각 제품별 건수 집계
-    product_models = filtered_data['정리품목명'].dropna().unique()
+    frame = pd.DataFrame({"제품명": models, "직접": is_direct})
+    frame = frame[frame["제품명"] != ""]
     
-    for model in product_models:
-        if not model:  # 빈 문자열 제외
-            continue
-            
-        direct_count = len(direct_data[direct_data['정리품목명'] == model])
-        affiliate_count = len(affiliate_data[affiliate_data['정리품목명'] == model])
-        total_count = direct_count + affiliate_count
-        
-        if total_count == 0:  # 건수가 0인 경우 제외
-            continue
-            
-        # 각 제품의 비율 계산
-        percentage = (total_count / len(filtered_data)) * 100
-        
+    # 모델 첫 등장 순서로 집계한 뒤 총건 기준 내림차순 (동률은 등장 순서 유지)
+    counts = frame.groupby("제품명", sort=False)["직접"].agg(["sum", "size"])
+    counts = counts.sort_values("size", ascending=False, kind="stable")
+    
+    result_data = []
+    for model, (direct_count, total_count) in counts.iterrows():
         result_data.append({
             "제품명": model,
-            "직접": direct_count,
-            "연계": affiliate_count,
-            "총건": total_count,
-            "비율": f"{percentage:.1f}%"
+            "직접": int(direct_count),
+            "연계": int(total_count - direct_count),
+            "총건": int(total_count),
+            "비율": f"{total_count / len(models) * 100:.1f}%"
         })
     
-    # 정렬 (총건 기준 내림차순)
-    result_data = sorted(result_data, key=lambda x: x["총건"], reverse=True)
-    
     # 합계 추가
     total_direct = sum(item["직접"] for item in result_data)
     total_affiliate = sum(item["연계"] for item in result_data)
-    total_count = total_direct + total_affiliate
-    
     result_data.append({
         "제품명": "합계",
         "직접": total_direct,
         "연계": total_affiliate,
-        "총건": total_count,
+        "총건": total_direct + total_affiliate,
         "비율": "100.0%"
     })
     
-    # 데이터프레임으로 변환
-    result_df = pd.DataFrame(result_data)
+    return pd.DataFrame(result_data)
+
+def analyze_installation_by_product_lines(installation_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    제품군(안마의자, 라클라우드, 정수기)별 모델 설치현황을 한 번에 분석하는 함수
+    
+    캠페인/직접 여부 판정과 품목명 정리는 전체 데이터에 한 번만 수행하고
+    제품군별로는 해당 행의 모델 건수만 집계합니다.
     
-    return result_df
+    Args:
+        installation_df: 설치매출 데이터프레임
+        
+    Returns:
+        Dict[str, pd.DataFrame]: {제품군: 제품명/직접/연계/총건/비율 데이터프레임}
+    """
+    if installation_df is None or installation_df.empty:
+        return {line: _empty_model_table() for line in PRODUCT_MODEL_LINES}
+    
+    # 품목명 컬럼 확인
+    product_name_col = None
+    for col_name in ['품목명', '상품명', '제품명', '품목 명', '상품 명', '제품 명']:
+        if col_name in installation_df.columns:
+            product_name_col = col_name
+            break
+    
+    if product_name_col is None:
+        # 품목명 컬럼이 없는 경우 빈 결과 반환
+        return {line: _empty_model_table() for line in PRODUCT_MODEL_LINES}
+    
+    # 더케어 - 판매유형에 "더케어"가 포함된 항목
+    if "판매유형" in installation_df.columns:
+        thecare_mask = contains(installation_df, "판매유형", "더케어", case=False)
+    else:
+        thecare_mask = np.zeros(len(installation_df), dtype=bool)
+    
+    # 1. 제품군 필터링 - 대분류 열(및 지정된 경우 품목명 열) 확인
+    line_masks = {}
+    for line, (category_keyword, name_keyword, exclude_thecare) in PRODUCT_MODEL_LINES.items():
+        line_mask = contains(installation_df, "대분류", category_keyword, case=False)
+        if name_keyword:
+            # 품목명에 키워드가 포함된 항목 추가 (대분류가 다른 경우를 위해)
+            line_mask = line_mask | contains(installation_df, product_name_col, name_keyword, case=False)
+        if exclude_thecare:
+            line_mask = line_mask & ~thecare_mask
+        line_masks[line] = line_mask
+    
+    # 2. 캠페인 필터링 (본사/연계합계와 동일)
+    campaign_mask = (
+        ~contains(installation_df, '일반회차 캠페인', r'^\s*$')  # ① 공백이 아닌 경우
+        & contains(installation_df, '일반회차 캠페인', r'^C|^V|^AS|캠|정규|재분배', case=False)  # ② C-, V-, 캠, 정규, 재분배 포함
+        & ~startswith(installation_df, '일반회차 캠페인', 'CB-')  # ③ CB- 제외
+    )
+    
+    # 3. 직접/연계 분리 - 판매인입경로에 CRM이 포함된 경우 직접, 아닌 경우 연계
+    direct_mask = contains(installation_df, '판매인입경로', 'CRM', case=False)
+    
+    # 4. 품목명 정리 - 제품군과 캠페인 조건을 통과한 행의 고유 품목명만 정리
+    selected = campaign_mask & np.logical_or.reduce(list(line_masks.values()))
+    models = np.full(len(installation_df), "", dtype=object)
+    models[selected] = normalize_product_names(installation_df[product_name_col][selected])
+    
+    # 5. 제품군별 모델 건수 집계
+    return {
+        line: _model_table(models[line_mask & campaign_mask], direct_mask[line_mask & campaign_mask])
+        for line, line_mask in line_masks.items()
+    }
+
+def analyze_installation_by_product_model(installation_df: pd.DataFrame, product_line: str = "안마의자") -> pd.DataFrame:
+    """
+    제품별 설치현황을 분석하는 함수 (기본값: 안마의자 제품별 설치현황 표 생성)
+    
+    Args:
+        installation_df: 설치매출 데이터프레임
+        product_line: 제품군 (PRODUCT_MODEL_LINES 키)
+        
+    Returns:
+        pd.DataFrame: 분석 결과 데이터프레임
+    """
+    return analyze_installation_by_product_lines(installation_df)[product_line]
 
 def analyze_sales_data(
     approval_df: pd.DataFrame, 
-    installation_df: Optional[pd.DataFrame] = None
+    installation_df: Optional[pd.DataFrame] = None,
+    backend: str = "pandas"
 ) -> Dict[str, Any]:
     """
     승인매출과 설치매출 데이터를 분석하는 함수
@@ -528,6 +570,7 @@ def analyze_sales_data(
     Args:
         approval_df: 승인매출 데이터프레임
         installation_df: 설치매출 데이터프레임 (선택사항)
+        backend: 집계 백엔드 ("pandas" | "duckdb" | "polars", 설치되지 않았으면 pandas)
         
     Returns:
         Dict[str, Any]: 분석 결과를 담은 딕셔너리
@@ -564,7 +607,7 @@ def analyze_sales_data(
             latest_date_for_filter = None
         
         # 1. 누적승인실적 분석
-        cumulative_approval = analyze_approval_data_by_product(approval_df)
+        cumulative_approval = analyze_approval_data_by_product(approval_df, backend)
         results["cumulative_approval"] = cumulative_approval
         
         # 2. 최신 날짜 기준 승인실적 분석
@@ -574,7 +617,7 @@ def analyze_sales_data(
             daily_df = approval_df[approval_df['주문 일자'].dt.date == latest_date_for_filter.date()].copy()
             
             if not daily_df.empty:
-                daily_approval = analyze_approval_data_by_product(daily_df)
+                daily_approval = analyze_approval_data_by_product(daily_df, backend)
         
         results["daily_approval"] = daily_approval
         results["latest_date"] = latest_date
@@ -583,7 +626,7 @@ def analyze_sales_data(
         cumulative_installation = None
         if installation_df is not None and not installation_df.empty:
             installation_df = installation_df.drop_duplicates()  # ✅ 중복 제거
-            cumulative_installation = analyze_approval_data_by_product(installation_df)
+            cumulative_installation = analyze_approval_data_by_product(installation_df, backend)
 
         
         results["cumulative_installation"] = cumulative_installation
@@ -632,19 +675,121 @@ def analyze_daily_approval_by_date(approval_df: pd.DataFrame, selected_date: dat
         print(f"일일 승인실적 분석 중 오류: {str(e)}")  # 콘솔에 오류 출력
         return pd.DataFrame()  # 오류 발생 시 빈 데이터프레임 반환
 
-def analyze_approval_data_by_product(df: pd.DataFrame) -> pd.DataFrame:
+def _approval_product_masks(frame: pd.DataFrame, products: List[str]) -> Dict[Tuple[str, str], np.ndarray]:
+    """
+    제품 × 구분(총승인/본사/연계/온라인) 필터 마스크를 계산하는 함수
+    
+    Args:
+        frame: 승인매출 행 또는 큐브 셀 데이터프레임 (일반회차 캠페인, 판매인입경로, 대분류, 판매유형 컬럼)
+        products: 제품 목록
+        
+    Returns:
+        Dict[Tuple[str, str], np.ndarray]: {(제품, 구분): 불리언 마스크}
+    """
+    # 1. 본사/연계합계: "CB-"로 시작하는 캠페인 제외, "V-", "C-"로 시작하거나 "캠", "정규", "분배"를 포함하는 캠페인
+    total_mask = matches(frame, '일반회차 캠페인', r'^(?!CB-).*$')
+    campaign_mask = (
+        startswith(frame, '일반회차 캠페인', ('V', 'C', 'AS')) |
+        contains(frame, '일반회차 캠페인', '캠|정규|분배')
+    )
+    hq_link_mask = total_mask & campaign_mask
+    
+    # 2. 본사: "CRM"을 포함하는 판매인입경로 / 3. 연계: "CRM"을 포함하지 않는 판매인입경로
+    crm_inflow = contains(frame, '판매인입경로', 'CRM')
+    
+    # 4. 온라인: "CB-"로 시작하는 캠페인
+    online_mask = startswith(frame, '일반회차 캠페인', 'CB-')
+    
+    segments = {
+        "총승인": hq_link_mask,
+        "본사": hq_link_mask & crm_inflow,
+        "연계": hq_link_mask & ~crm_inflow,
+        "온라인": online_mask
+    }
+    
+    # 제품 필터 마스크 - 더케어와 안마의자 구분
+    is_massage_chair = contains(frame, '대분류', "안마의자", case=False)
+    if "판매유형" in frame.columns:
+        is_thecare = contains(frame, '판매유형', "더케어", case=False)
+    else:
+        is_thecare = None
+    
+    masks = {}
+    for product in products:
+        if product == "더케어":
+            # 더케어: 대분류가 안마의자이고, 판매유형에 "더케어" 포함 (판매유형 컬럼이 없으면 0건)
+            product_mask = is_massage_chair & is_thecare if is_thecare is not None else np.zeros(len(frame), dtype=bool)
+        elif product == "안마의자":
+            # 안마의자: 대분류가 안마의자이고, 판매유형에 "더케어"가 포함되지 않음 (판매유형 컬럼이 없으면 모두 포함)
+            product_mask = is_massage_chair & ~is_thecare if is_thecare is not None else is_massage_chair
+        else:
+            # 라클라우드, 정수기: 기존 로직 유지
+            product_mask = contains(frame, '대분류', product, case=False)
+        
+        for segment, segment_mask in segments.items():
+            masks[(product, segment)] = segment_mask & product_mask
+    
+    return masks
+
+def _sum_approval_by_product(df: pd.DataFrame, products: List[str], revenue_column: str) -> Dict[Tuple[str, str], Tuple[int, Any]]:
+    """
+    제품 × 구분(총승인/본사/연계/온라인)별 건수와 매출액을 pandas로 집계하는 함수
+    
+    매출액이 숫자형이면 필터 컬럼 값 조합(큐브 셀)별로 먼저 합산한 뒤 셀에 문자열 필터를 적용하므로
+    문자열 비교는 행 수가 아니라 캠페인/인입경로/제품 조합 수만큼만 수행됩니다.
+    
+    Args:
+        df: 중복 제거된 승인매출 데이터프레임
+        products: 제품 목록
+        revenue_column: 매출액 컬럼명
+        
+    Returns:
+        Dict[Tuple[str, str], Tuple[int, Any]]: {(제품, 구분): (건수, 매출액 합계)}
+    """
+    revenue = df[revenue_column]
+    if pd.api.types.is_numeric_dtype(revenue) and not pd.api.types.is_bool_dtype(revenue):
+        dimensions = ['일반회차 캠페인', '판매인입경로', '대분류'] + (['판매유형'] if '판매유형' in df.columns else [])
+        cube = build_cube(df, dimensions, [revenue_column])
+        frame = cube.cells
+        counts = cube.measures[COUNT_MEASURE]
+        amounts = cube.measures[revenue_column]
+    else:
+        # 숫자형이 아닌 매출액은 행 단위로 pandas sum 결과를 유지
+        frame = df
+        counts = np.ones(len(df), dtype=np.int64)
+        amounts = revenue
+    
+    totals = {}
+    for key, mask in _approval_product_masks(frame, products).items():
+        totals[key] = (int(counts[mask].sum()), amounts[mask].sum())
+    
+    return totals
+
+def analyze_approval_data_by_product(df: pd.DataFrame, backend: str = "pandas") -> pd.DataFrame:
     """
     제품별로 승인매출 데이터를 분석하는 함수 (요구된 표 형식에 맞춤)
     
     Args:
         df: 승인매출 데이터프레임
+        backend: 집계 백엔드 ("pandas" | "duckdb" | "polars", 설치되지 않았으면 pandas)
         
     Returns:
         pd.DataFrame: 분석 결과 데이터프레임
     """
 
+    # DuckDB/Polars 백엔드는 필요한 컬럼이 모두 있고 매출액이 숫자형일 때만 사용 (그 외는 pandas와 같은 오류/결과)
+    resolved_backend = resolve_backend(backend, SALES_ANALYSIS_BACKENDS)
+    use_query_backend = (
+        resolved_backend in ("duckdb", "polars")
+        and all(col in df.columns for col in ["계약 번호", "일반회차 캠페인", "판매인입경로", "대분류", "매출액"])
+        and pd.api.types.is_numeric_dtype(df["매출액"])
+        and not pd.api.types.is_bool_dtype(df["매출액"])
+    )
+
     # ✅ 중복 제거 (접수번호나 유니크 키가 없다면 전체 행 기준으로)
-    df = df.drop_duplicates(subset=["계약 번호"])  # 또는 ["접수번호", "제품명"] 등
+    # DuckDB/Polars 백엔드는 집계 쿼리 안에서 같은 기준(첫 행 유지)으로 중복 제거
+    if not use_query_backend:
+        df = df.drop_duplicates(subset=["계약 번호"])  # 또는 ["접수번호", "제품명"] 등
 
     if df.empty:
         # 빈 결과 반환
@@ -690,364 +835,193 @@ def analyze_approval_data_by_product(df: pd.DataFrame) -> pd.DataFrame:
             "온라인달성률_매출액": [0, 0, 0, 0, 0]
         })
     
-    # 필터링 조건 정의
-    # 1. 본사/연계합계: "CB-"로 시작하는 캠페인 제외, "V-", "C-"로 시작하거나 "캠", "정규", "분배"를 포함하는 캠페인
-    total_mask = df['일반회차 캠페인'].astype(str).str.match(r'^(?!CB-).*$')
-    campaign_mask = (
-        df['일반회차 캠페인'].astype(str).str.startswith('V') | 
-        df['일반회차 캠페인'].astype(str).str.startswith('C') |
-        df['일반회차 캠페인'].astype(str).str.startswith('AS') | 
-        df['일반회차 캠페인'].astype(str).str.contains('캠') | 
-        df['일반회차 캠페인'].astype(str).str.contains('정규') | 
-        df['일반회차 캠페인'].astype(str).str.contains('분배')
-    )
-    hq_link_df = df[total_mask & campaign_mask].copy()
-    
-    # 2. 본사: "CRM"을 포함하는 판매인입경로
-    hq_mask = hq_link_df['판매인입경로'].astype(str).str.contains('CRM')
-    hq_df = hq_link_df[hq_mask].copy()
-    
-    # 3. 연계: "CRM"을 포함하지 않는 판매인입경로
-    link_mask = ~hq_link_df['판매인입경로'].astype(str).str.contains('CRM')
-    link_df = hq_link_df[link_mask].copy()
+    # 제품 × 구분별 건수/매출액 집계
+    if use_query_backend and resolved_backend == "duckdb":
+        totals = sum_approval_by_product(df, products, revenue_column, "판매유형" in df.columns)
+    elif use_query_backend:
+        totals = polars_backend_logic.sum_approval_by_product(df, products, revenue_column, "판매유형" in df.columns)
+    else:
+        totals = _sum_approval_by_product(df, products, revenue_column)
     
-    # 4. 온라인: "CB-"로 시작하는 캠페인
-    online_mask = df['일반회차 캠페인'].astype(str).str.startswith('CB-')
-    online_df = df[online_mask].copy()
+    # 실적 표 생성 후 기본 목표(TARGET_DATA) 기준 달성률 계산
+    return apply_targets(_product_result_frame(totals, products), TARGET_DATA)
+
+def _product_result_frame(totals: Dict[Tuple[str, str], Tuple[int, Any]], products: List[str]) -> pd.DataFrame:
+    """
+    제품 × 구분별 (건수, 매출액) 합계로 제품별 실적 표를 만드는 함수 (목표/달성률은 0, apply_targets에서 계산)
     
-    # 결과 저장을 위한 데이터 구조
+    Args:
+        totals: {(제품, 구분): (건수, 매출액)} 합계
+        products: 제품 목록
+        
+    Returns:
+        pd.DataFrame: 제품 + 총합계 행의 실적 데이터프레임
+    """
+    # 결과 저장을 위한 데이터 구조 (실적만 집계, 목표/달성률은 apply_targets에서 계산)
     result_data = []
     
     # 각 제품별 집계
     for product in products:
-        # 목표 데이터 가져오기
-        target_direct_count = TARGET_DATA[product]["직접"]["건수"]  # 본사 목표 건수
-        target_direct_amount = TARGET_DATA[product]["직접"]["매출액"]  # 본사 목표 매출액
-        target_affiliate_count = TARGET_DATA[product]["연계"]["건수"]  # 연계 목표 건수
-        target_affiliate_amount = TARGET_DATA[product]["연계"]["매출액"]  # 연계 목표 매출액
-        target_online_amount = TARGET_DATA[product]["온라인"]["매출액"]  # 온라인 목표 매출액
-
-        # 목표 합계 계산
-        target_total_count = (target_direct_count or 0) + (target_affiliate_count or 0)  # 건수 목표 합계
-        target_total_amount = target_direct_amount + target_affiliate_amount  # 매출액 목표 합계
-
-        # 제품 필터 마스크 - 더케어와 안마의자 구분
-        if product == "더케어":
-            # 더케어: 대분류가 안마의자이고, 판매유형에 "더케어" 포함
-            if "판매유형" in df.columns:
-                product_mask_hq_link = (
-                    hq_link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    hq_link_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_hq = (
-                    hq_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    hq_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_link = (
-                    link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    link_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_online = (
-                    online_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    online_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-            else:
-                # 판매유형 컬럼이 없으면 더케어는 0건
-                product_mask_hq_link = pd.Series([False] * len(hq_link_df), index=hq_link_df.index)
-                product_mask_hq = pd.Series([False] * len(hq_df), index=hq_df.index)
-                product_mask_link = pd.Series([False] * len(link_df), index=link_df.index)
-                product_mask_online = pd.Series([False] * len(online_df), index=online_df.index)
-        elif product == "안마의자":
-            # 안마의자: 대분류가 안마의자이고, 판매유형에 "더케어"가 포함되지 않음
-            if "판매유형" in df.columns:
-                product_mask_hq_link = (
-                    hq_link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    ~hq_link_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_hq = (
-                    hq_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    ~hq_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_link = (
-                    link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    ~link_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-                product_mask_online = (
-                    online_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False) &
-                    ~online_df['판매유형'].astype(str).str.contains("더케어", case=False, na=False)
-                )
-            else:
-                # 판매유형 컬럼이 없으면 안마의자는 모두 포함
-                product_mask_hq_link = hq_link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False)
-                product_mask_hq = hq_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False)
-                product_mask_link = link_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False)
-                product_mask_online = online_df['대분류'].astype(str).str.contains("안마의자", case=False, na=False)
-        else:
-            # 라클라우드, 정수기: 기존 로직 유지
-            product_mask_hq_link = hq_link_df['대분류'].astype(str).str.contains(product, case=False, na=False)
-            product_mask_hq = hq_df['대분류'].astype(str).str.contains(product, case=False, na=False)
-            product_mask_link = link_df['대분류'].astype(str).str.contains(product, case=False, na=False)
-            product_mask_online = online_df['대분류'].astype(str).str.contains(product, case=False, na=False)
-
-        # 1. 총승인(본사/연계)
-        hq_link_product = hq_link_df[product_mask_hq_link]
-        total_count = len(hq_link_product)
-        total_amount = hq_link_product[revenue_column].sum()
-
-        # 달성률 계산 (목표가 0인 경우 0으로 처리)
-        count_achievement_rate = (total_count / target_total_count * 100) if target_total_count > 0 else 0
-        amount_achievement_rate = (total_amount / target_total_amount * 100) if target_total_amount > 0 else 0
-
-        # 2. 본사직접승인
-        hq_product = hq_df[product_mask_hq]
-        direct_count = len(hq_product)
-        direct_amount = hq_product[revenue_column].sum()
-
-        # 3. 연계승인
-        link_product = link_df[product_mask_link]
-        affiliate_count = len(link_product)
-        affiliate_amount = link_product[revenue_column].sum()
-
-        # 4. 온라인
-        online_product = online_df[product_mask_online]
-        online_count = len(online_product)
-        online_amount = online_product[revenue_column].sum()
-        
-        # 온라인 달성률 계산
-        online_achievement_rate = (online_amount / target_online_amount * 100) if target_online_amount > 0 else 0
+        total_count, total_amount = totals[(product, "총승인")]  # 1. 총승인(본사/연계)
+        direct_count, direct_amount = totals[(product, "본사")]  # 2. 본사직접승인
+        affiliate_count, affiliate_amount = totals[(product, "연계")]  # 3. 연계승인
+        online_count, online_amount = totals[(product, "온라인")]  # 4. 온라인
         
         # 결과 추가
         result_data.append({
             "제품": product,
-            "목표_건수": target_total_count,
-            "목표_매출액": target_total_amount,
+            "목표_건수": 0,
+            "목표_매출액": 0,
             "총승인(본사/연계)_건수": total_count,
             "총승인(본사/연계)_매출액": total_amount,
-            "달성률_건수": count_achievement_rate,
-            "달성률_매출액": amount_achievement_rate,
+            "달성률_건수": 0,
+            "달성률_매출액": 0,
             "본사직접승인_건수": direct_count,
             "본사직접승인_매출액": direct_amount,
             "연계승인_건수": affiliate_count,
             "연계승인_매출액": affiliate_amount,
             "온라인_건수": online_count,
             "온라인_매출액": online_amount,
-            "온라인달성률_매출액": online_achievement_rate
+            "온라인달성률_매출액": 0
         })
     
-    # 총합계 행 추가
-    # 목표 총합계
-    target_total_count = sum(row["목표_건수"] for row in result_data)
-    target_total_amount = sum(row["목표_매출액"] for row in result_data)
-    target_total_online_amount = sum(TARGET_DATA[product]["온라인"]["매출액"] for product in products)
-    
-    # 실적 합계
-    total_count_sum = sum(row["총승인(본사/연계)_건수"] for row in result_data)
-    total_amount_sum = sum(row["총승인(본사/연계)_매출액"] for row in result_data)
-    direct_count_sum = sum(row["본사직접승인_건수"] for row in result_data)
-    direct_amount_sum = sum(row["본사직접승인_매출액"] for row in result_data)
-    affiliate_count_sum = sum(row["연계승인_건수"] for row in result_data)
-    affiliate_amount_sum = sum(row["연계승인_매출액"] for row in result_data)
-    online_count_sum = sum(row["온라인_건수"] for row in result_data)
-    online_amount_sum = sum(row["온라인_매출액"] for row in result_data)
-    
-    # 총 달성률 계산
-    total_count_achievement_rate = (total_count_sum / target_total_count * 100) if target_total_count > 0 else 0
-    total_amount_achievement_rate = (total_amount_sum / target_total_amount * 100) if target_total_amount > 0 else 0
-    online_total_achievement_rate = (online_amount_sum / target_total_online_amount * 100) if target_total_online_amount > 0 else 0
-    
-    # 총합계 행 추가
-    result_data.append({
-        "제품": "총합계",
-        "목표_건수": target_total_count,
-        "목표_매출액": target_total_amount,
-        "총승인(본사/연계)_건수": total_count_sum,
-        "총승인(본사/연계)_매출액": total_amount_sum,
-        "달성률_건수": total_count_achievement_rate,
-        "달성률_매출액": total_amount_achievement_rate,
-        "본사직접승인_건수": direct_count_sum,
-        "본사직접승인_매출액": direct_amount_sum,
-        "연계승인_건수": affiliate_count_sum,
-        "연계승인_매출액": affiliate_amount_sum,
-        "온라인_건수": online_count_sum,
-        "온라인_매출액": online_amount_sum,
-        "온라인달성률_매출액": online_total_achievement_rate
-    })
+    # 총합계 행 추가 (실적 합계)
+    total_row = {"제품": "총합계"}
+    for column in result_data[0]:
+        if column != "제품":
+            total_row[column] = sum(row[column] for row in result_data)
+    result_data.append(total_row)
     
-    # 데이터프레임으로 변환
-    result_df = pd.DataFrame(result_data)
+    return pd.DataFrame(result_data)
+
+def build_target_arrays(targets: Dict[str, Dict[str, Dict[str, Optional[int]]]], products: List[str]) -> Dict[str, np.ndarray]:
+    """
+    제품(+총합계) 행 순서에 맞춘 목표 배열을 만드는 함수
     
-    return result_df
+    Args:
+        targets: {제품: {구분(직접/연계/온라인): {"건수", "매출액"}}} 승인매출 목표
+        products: 결과 프레임의 제품 열 순서 (총합계는 제품 목표의 합계)
+        
+    Returns:
+        Dict[str, np.ndarray]: {"목표_건수", "목표_매출액", "온라인목표_매출액": 행별 목표}
+    """
+    product_rows = [product for product in products if product != "총합계"]
+    count = {}
+    amount = {}
+    online = {}
+    for product in product_rows:
+        target = targets.get(product, {})
+        count[product] = (target.get("직접", {}).get("건수") or 0) + (target.get("연계", {}).get("건수") or 0)
+        amount[product] = (target.get("직접", {}).get("매출액") or 0) + (target.get("연계", {}).get("매출액") or 0)
+        online[product] = target.get("온라인", {}).get("매출액") or 0
+    
+    arrays = {}
+    for name, values in (("목표_건수", count), ("목표_매출액", amount), ("온라인목표_매출액", online)):
+        total = sum(values.values())
+        arrays[name] = np.array([total if product == "총합계" else values[product] for product in products])
+    return arrays
+
+# 달성률 컬럼 {달성률 컬럼: (실적 컬럼, 목표 배열 이름)}
+ACHIEVEMENT_COLUMNS = {
+    "달성률_건수": ("총승인(본사/연계)_건수", "목표_건수"),
+    "달성률_매출액": ("총승인(본사/연계)_매출액", "목표_매출액"),
+    "온라인달성률_매출액": ("온라인_매출액", "온라인목표_매출액")
+}
 
-def analyze_installation_by_product_model(installation_df):
+def apply_targets(result_df: pd.DataFrame, targets: Dict[str, Dict[str, Dict[str, Optional[int]]]]) -> pd.DataFrame:
     """
-    제품별 설치현황을 분석하는 함수 (안마의자 제품별 설치현황 표 생성)
+    제품별 실적 프레임에 목표를 적용하고 달성률을 다시 계산하는 함수
+    (실적은 그대로 두고 목표/달성률 컬럼만 교체하므로 목표 변경 시 재분석이 필요 없음)
     
     Args:
-        installation_df: 설치매출 데이터프레임
+        result_df: analyze_approval_data_by_product 결과 (제품 컬럼 + 실적 컬럼)
+        targets: {제품: {구분(직접/연계/온라인): {"건수", "매출액"}}} 승인매출 목표
         
     Returns:
-        pd.DataFrame: 분석 결과 데이터프레임
+        pd.DataFrame: 목표_건수/목표_매출액/달성률 컬럼을 새 목표로 계산한 데이터프레임 (목표가 0이면 달성률 0)
     """
-    if installation_df is None or installation_df.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
+    if result_df is None or result_df.empty or "제품" not in result_df.columns:
+        return result_df
     
-    # 품목명 컬럼 확인
-    product_name_col = None
-    for col_name in ['품목명', '상품명', '제품명', '품목 명', '상품 명', '제품 명']:
-        if col_name in installation_df.columns:
-            product_name_col = col_name
-            break
+    target_arrays = build_target_arrays(targets, list(result_df["제품"]))
+    applied = result_df.copy()
+    applied["목표_건수"] = target_arrays["목표_건수"]
+    applied["목표_매출액"] = target_arrays["목표_매출액"]
     
-    if product_name_col is None:
-        # 품목명 컬럼이 없는 경우 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
+    for rate_column, (actual_column, target_name) in ACHIEVEMENT_COLUMNS.items():
+        actual = applied[actual_column].to_numpy(dtype=float)
+        target = target_arrays[target_name].astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            applied[rate_column] = np.where(target > 0, actual / target * 100, 0.0)
     
-    # 1. 안마의자 필터링 - 대분류 열과 품목명 열을 모두 확인
-    massage_chair_mask = installation_df["대분류"].astype(str).str.contains("안마의자", case=False, na=False)
+    return applied
 
-    # 품목명에도 '안마'가 포함된 항목 추가 (대분류가 다른 경우를 위해)
-    massage_chair_mask |= installation_df[product_name_col].astype(str).str.contains("안마", case=False, na=False)
+# 승인매출 누적합 데이터셋 캐시 이름공간 {"prefix": 누적합}
+_PREFIX_CACHE_NAMESPACE = "approval_prefix_sums"
 
-    massage_chair_data = installation_df[massage_chair_mask].copy()
+# 기간 질의 대상 제품 (analyze_approval_data_by_product와 동일)
+RANGE_PRODUCTS = ["안마의자", "라클라우드", "정수기", "더케어"]
 
-    # 더케어 제외 - 판매유형에 "더케어"가 포함된 항목 제거
-    if "판매유형" in massage_chair_data.columns:
-        thecare_mask = massage_chair_data["판매유형"].astype(str).str.contains("더케어", case=False, na=False)
-        massage_chair_data = massage_chair_data[~thecare_mask].copy()
+def get_approval_prefix_sums(df: pd.DataFrame) -> DailyPrefixSums:
+    """
+    승인매출 데이터의 제품 × 구분별 일자 누적합(건수, 매출액)을 가져오는 함수 (데이터셋별 캐시)
     
-    if massage_chair_data.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
+    계약 번호 기준 중복 제거는 전체 데이터에서 한 번 하므로(첫 행 유지), 계약은 첫 행의 주문 일자에 집계됩니다.
     
-    # 2. 캠페인 필터링 (본사/연계합계와 동일) - 유연하게 수정
-    campaign_mask = (
-        massage_chair_data['일반회차 캠페인'].astype(str).str.strip() != ""  # ① 공백이 아닌 경우
-    ) & (
-        massage_chair_data['일반회차 캠페인'].astype(str).str.contains(r'^C|^V|^AS|캠|정규|재분배', case=False, na=False)  # ② C-, V-, 캠, 정규, 재분배 포함
-    ) & ~(
-        massage_chair_data['일반회차 캠페인'].astype(str).str.startswith('CB-', na=False)  # ③ CB- 제외
+    Args:
+        df: 승인매출 데이터프레임 (주문 일자, 일반회차 캠페인, 판매인입경로, 대분류, 매출액)
+        
+    Returns:
+        DailyPrefixSums: (제품, 구분) 항목별 누적합
+    """
+    cached = get_dataset_cache(df, _PREFIX_CACHE_NAMESPACE)
+    if "prefix" in cached:
+        return cached["prefix"]
+    
+    frame = df.drop_duplicates(subset=["계약 번호"]).copy() if "계약 번호" in df.columns else df.copy()
+    if not pd.api.types.is_numeric_dtype(frame["매출액"]) or pd.api.types.is_bool_dtype(frame["매출액"]):
+        frame["매출액"] = pd.to_numeric(frame["매출액"], errors='coerce')
+    # 시각은 버리고 일자만 차원으로 사용 (셀 수 감소)
+    frame["주문 일자"] = pd.to_datetime(frame["주문 일자"], errors='coerce').dt.normalize()
+    
+    # 제품/구분 조건은 큐브 셀(일자 × 필터 컬럼 조합)에만 적용
+    dimensions = ["주문 일자", "일반회차 캠페인", "판매인입경로", "대분류"] + (["판매유형"] if "판매유형" in frame.columns else [])
+    cube = build_cube(frame, dimensions, ["매출액"])
+    masks = _approval_product_masks(cube.cells, RANGE_PRODUCTS)
+    prefix = build_prefix_sums(
+        cube.cells["주문 일자"],
+        list(masks.items()),
+        {"건수": cube.measures[COUNT_MEASURE], "매출액": cube.measures["매출액"]}
     )
-
-    
-    filtered_data = massage_chair_data[campaign_mask].copy()
-    
-    if filtered_data.empty:
-        # 빈 결과 반환
-        return pd.DataFrame({
-            "제품명": ["합계"],
-            "직접": [0],
-            "연계": [0],
-            "총건": [0],
-            "비율": ["100.0%"]
-        })
     
-    # 3. 품목명 정리 (괄호 제거) - 개선된 방식으로
-    def clean_product_name(name):
-        if pd.isna(name):
-            return ""
-
-        name_str = str(name).strip()
-
-        # 앞에 괄호가 있는 경우 제거 (리퍼 제품 처리)
-        # 예: (A)팔콘S, (A) 팔콘S, (S)파라오네오 등
-        while name_str.startswith("(") and ")" in name_str:
-            # 첫 번째 닫는 괄호 위치 찾기
-            close_pos = name_str.find(")")
-            if close_pos >= 0:
-                # 괄호와 그 내용을 제거
-                name_str = name_str[close_pos + 1:].strip()
-            else:
-                break
-
-        # 에덴로보 통합 - 에덴로보로 시작하는 모든 제품은 "에덴로보"로 통합
-        if name_str.startswith("에덴로보"):
-            return "에덴로보"
-
-        # 괄호가 있으면 괄호 앞부분만 사용
-        if '(' in name_str:
-            name_str = name_str.split('(')[0].strip()
-
-        # 공백이 있다면 첫 단어만 추출 (ex: "팔코닉 B&O" -> "팔코닉")
-        # 단, '+' 기호가 있거나 에덴로보인 경우는 제외
-        if ' ' in name_str and '+' not in name_str and not name_str.startswith("에덴로보"):
-            name_str = name_str.split(' ')[0].strip()
+    cached["prefix"] = prefix
+    return prefix
 
-        return name_str
-    
-    filtered_data['정리품목명'] = filtered_data[product_name_col].apply(clean_product_name)
-    
-    # 4. 직접/연계 분리 - 판매인입경로에 CRM이 포함된 경우 직접, 아닌 경우 연계
-    direct_mask = filtered_data['판매인입경로'].astype(str).str.contains('CRM', case=False, na=False)
-    direct_data = filtered_data[direct_mask]
-    affiliate_data = filtered_data[~direct_mask]
-    
-    # 5. 결과 데이터프레임 생성
-    result_data = []
-    
-    # 각 제품별 건수 집계
-    product_models = filtered_data['정리품목명'].dropna().unique()
+def analyze_approval_range(
+    df: pd.DataFrame,
+    start: date,
+    end: date,
+    targets: Optional[Dict[str, Dict[str, Dict[str, Optional[int]]]]] = None
+) -> pd.DataFrame:
+    """
+    기간(시작일~종료일)의 제품별 승인실적 표를 누적합으로 계산하는 함수
+    (analyze_approval_data_by_product와 같은 형식, 원본 행을 다시 필터링하지 않음)
     
-    for model in product_models:
-        if not model:  # 빈 문자열 제외
-            continue
-            
-        direct_count = len(direct_data[direct_data['정리품목명'] == model])
-        affiliate_count = len(affiliate_data[affiliate_data['정리품목명'] == model])
-        total_count = direct_count + affiliate_count
-        
-        if total_count == 0:  # 건수가 0인 경우 제외
-            continue
-            
-        # 각 제품의 비율 계산
-        percentage = (total_count / len(filtered_data)) * 100
+    Args:
+        df: 승인매출 데이터프레임
+        start: 시작일
+        end: 종료일
+        targets: 승인매출 목표 (None이면 TARGET_DATA)
         
-        result_data.append({
-            "제품명": model,
-            "직접": direct_count,
-            "연계": affiliate_count,
-            "총건": total_count,
-            "비율": f"{percentage:.1f}%"
-        })
-    
-    # 정렬 (총건 기준 내림차순)
-    result_data = sorted(result_data, key=lambda x: x["총건"], reverse=True)
-    
-    # 합계 추가
-    total_direct = sum(item["직접"] for item in result_data)
-    total_affiliate = sum(item["연계"] for item in result_data)
-    total_count = total_direct + total_affiliate
-    
-    result_data.append({
-        "제품명": "합계",
-        "직접": total_direct,
-        "연계": total_affiliate,
-        "총건": total_count,
-        "비율": "100.0%"
-    })
-    
-    # 데이터프레임으로 변환
-    result_df = pd.DataFrame(result_data)
-    
-    return result_df
+    Returns:
+        pd.DataFrame: 기간 실적 데이터프레임
+    """
+    totals_frame = get_approval_prefix_sums(df).range_total(start, end)
+    totals = {
+        key: (int(round(row["건수"])), row["매출액"])
+        for key, row in totals_frame.iterrows()
+    }
+    return apply_targets(_product_result_frame(totals, RANGE_PRODUCTS), targets if targets is not None else TARGET_DATA)
 
 def create_excel_report(
     cumulative_approval: pd.DataFrame,
@@ -1331,17 +1305,20 @@ def create_excel_report(
                 
                 current_row += 1
             
-            # 4. 안마의자 제품별 설치현황 추가 (설치매출 데이터가 있는 경우)
+            # 4. 제품군별 설치현황 추가 (설치매출 데이터가 있는 경우)
             if original_installation_df is not None and not original_installation_df.empty:
-                # 안마의자 제품별 분석 실행
-                massage_chair_model_df = analyze_installation_by_product_model(original_installation_df)
+                # 제품군별 분석 실행 (안마의자는 항상, 다른 제품군은 설치 건수가 있을 때만 표시)
+                model_tables = analyze_installation_by_product_lines(original_installation_df)
                 
-                if not massage_chair_model_df.empty:
+                for product_line, model_df in model_tables.items():
+                    if product_line != "안마의자" and model_df["총건"].iloc[-1] == 0:
+                        continue
+                    
                     # 약간의 간격 추가
                     current_row += 2
                     
                     # 헤더 작성
-                    worksheet1.merge_range(current_row, 0, current_row, 4, '안마의자 제품별 설치현황', sub_header_format)
+                    worksheet1.merge_range(current_row, 0, current_row, 4, f'{product_line} 제품별 설치현황', sub_header_format)
                     current_row += 1
                     
                     # 컬럼 헤더
@@ -1353,7 +1330,7 @@ def create_excel_report(
                     current_row += 1
                     
                     # 데이터 작성
-                    for idx, (_, row) in enumerate(massage_chair_model_df.iterrows()):
+                    for idx, (_, row) in enumerate(model_df.iterrows()):
                         is_total = row['제품명'] == '합계'
                         row_format = sub_header_format if is_total else data_format
                         
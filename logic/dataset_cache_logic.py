@@ -0,0 +1,46 @@
+"""
+데이터셋별 캐시 비즈니스 로직
+
+이 모듈은 필터 마스크, 문자열 조건, 큐브, 누적합처럼 같은 데이터프레임에 대해 반복 계산되는
+중간 결과를 데이터셋 단위로 보관하는 공통 캐시를 포함합니다.
+데이터셋은 객체 동일성(is)과 행 수로 비교하고 최근 데이터셋 몇 개만 유지하며,
+각 모듈은 이름공간(namespace)별 딕셔너리에 자기 결과를 저장합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+from typing import Tuple, Dict, Any, Hashable
+
+# 데이터셋 캐시 {id(데이터셋): (데이터셋, 행 수, {이름공간: {키: 결과}})}
+# 데이터셋은 객체 동일성(is)으로 비교하고, 최근 데이터셋 몇 개만 유지
+_DATASET_CACHE: Dict[int, Tuple[pd.DataFrame, int, Dict[str, Dict[Hashable, Any]]]] = {}
+MAX_CACHED_DATASETS = 8
+
+
+def get_dataset_cache(df: pd.DataFrame, namespace: str) -> Dict[Hashable, Any]:
+    """
+    데이터셋의 이름공간별 캐시 딕셔너리를 가져옵니다. (데이터셋이 바뀌었으면 새로 생성)
+
+    데이터셋은 객체 동일성(is)으로 비교하므로, 데이터를 제자리에서 수정했다면
+    clear_dataset_cache()를 호출해야 합니다.
+
+    Args:
+        df: 데이터프레임
+        namespace: 캐시 이름공간 (예: "filter_masks", "cubes")
+
+    Returns:
+        Dict[Hashable, Any]: 호출한 모듈이 결과를 저장하는 딕셔너리
+    """
+    cached = _DATASET_CACHE.get(id(df))
+    if cached is None or cached[0] is not df or cached[1] != len(df):
+        if id(df) not in _DATASET_CACHE and len(_DATASET_CACHE) >= MAX_CACHED_DATASETS:
+            _DATASET_CACHE.pop(next(iter(_DATASET_CACHE)))
+        cached = (df, len(df), {})
+        _DATASET_CACHE[id(df)] = cached
+
+    return cached[2].setdefault(namespace, {})
+
+
+def clear_dataset_cache() -> None:
+    """데이터셋별 캐시(필터 마스크, 문자열 조건, 큐브, 누적합)를 모두 비웁니다."""
+    _DATASET_CACHE.clear()
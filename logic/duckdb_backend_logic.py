@@ -0,0 +1,213 @@
+"""
+DuckDB 분석 백엔드 비즈니스 로직
+
+이 모듈은 수백만 행 규모의 월/분기 비교용 데이터를 인프로세스 DuckDB로 집계하는 로직을 포함합니다.
+데이터프레임(또는 캐시된 Parquet 파일)을 등록하고 무거운 건수/금액 집계만 SQL로 실행하며,
+최종 테이블 구성은 기존 pandas 코드가 그대로 수행하므로 UI와 엑셀 출력은 변경이 필요 없습니다.
+duckdb 패키지가 없으면 analysis_backend_logic이 pandas 백엔드로 대체합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import os
+import pandas as pd
+import numpy as np
+from typing import Tuple, Dict, List, Any, Union
+
+try:
+    import duckdb
+except ImportError:  # 선택 의존성
+    duckdb = None
+
+# 행 순서 보존용 임시 컬럼 (중복 제거 시 첫 행 유지)
+_ROW_COLUMN = "__row_no"
+
+
+def is_duckdb_available() -> bool:
+    """duckdb 패키지 설치 여부를 반환합니다."""
+    return duckdb is not None
+
+
+def _connect():
+    """모든 코어를 사용하는 인메모리 DuckDB 연결을 만듭니다."""
+    con = duckdb.connect(database=":memory:")
+    con.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+    return con
+
+
+def _register_source(con, name: str, source: Union[pd.DataFrame, str], columns: List[str]) -> None:
+    """
+    데이터프레임 또는 Parquet 파일 경로를 뷰로 등록합니다.
+
+    Args:
+        con: DuckDB 연결
+        name: 뷰 이름
+        source: 데이터프레임 또는 Parquet 파일 경로
+        columns: 사용할 컬럼 (행 순서 컬럼은 자동 추가)
+    """
+    if isinstance(source, str):
+        column_sql = ", ".join(_quote(col) for col in columns)
+        con.execute(
+            f"CREATE VIEW {name} AS SELECT {column_sql}, file_row_number AS {_ROW_COLUMN} "
+            f"FROM read_parquet({_literal(source)}, file_row_number = true)"
+        )
+    else:
+        frame = source[columns]
+        frame = frame.assign(**{_ROW_COLUMN: np.arange(len(frame))})
+        con.register(name, frame)
+
+
+def _quote(identifier: str) -> str:
+    """SQL 식별자 인용"""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    """SQL 문자열 리터럴"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _text(column: str) -> str:
+    """pandas의 astype(str)처럼 결측값을 'nan'으로 보는 문자열 식"""
+    return f"COALESCE(CAST({_quote(column)} AS VARCHAR), 'nan')"
+
+
+def count_by_keys(source: Union[pd.DataFrame, str], keys: List[str]) -> pd.Series:
+    """
+    키 조합별 행 수를 집계합니다. (groupby(keys, dropna=False).size()와 동일한 시리즈)
+
+    Args:
+        source: 데이터프레임 또는 Parquet 파일 경로
+        keys: 그룹 키 컬럼 목록
+
+    Returns:
+        pd.Series: 키 멀티인덱스(결측값 포함, 오름차순)의 건수 시리즈
+    """
+    con = _connect()
+    try:
+        _register_source(con, "data", source, keys)
+        key_sql = ", ".join(_quote(key) for key in keys)
+        result = con.execute(
+            f"SELECT {key_sql}, count(*) AS n FROM data GROUP BY {key_sql}"
+        ).df()
+    finally:
+        con.close()
+
+    # 결과 행 수는 키 조합 수만큼이므로 정렬/인덱스 구성은 pandas에서 수행 (pandas와 같은 정렬 규칙)
+    index = pd.MultiIndex.from_frame(result[keys]) if len(keys) > 1 else pd.Index(result[keys[0]], name=keys[0])
+    counts = pd.Series(result["n"].to_numpy(dtype=np.int64), index=index)
+    return counts.sort_index(na_position="last")
+
+
+def count_crosstab(source: Union[pd.DataFrame, str], index_col: str, columns_col: str) -> pd.DataFrame:
+    """
+    두 컬럼 조합별 레코드 수 교차표를 만듭니다. (campaign_logic.build_campaign_crosstab과 동일)
+
+    Args:
+        source: 데이터프레임 또는 Parquet 파일 경로
+        index_col: 행으로 사용할 컬럼
+        columns_col: 열로 사용할 컬럼
+
+    Returns:
+        pd.DataFrame: index_col 값 × columns_col 값 레코드 수 (각 축은 값 오름차순)
+    """
+    counts = count_by_keys(source, [index_col, columns_col])
+    counts = counts[
+        counts.index.get_level_values(index_col).notna()
+        & counts.index.get_level_values(columns_col).notna()
+    ]
+    crosstab = counts.unstack(fill_value=0).astype(np.int64)
+    crosstab.index.name = index_col
+    crosstab.columns.name = columns_col
+    return crosstab
+
+
+def sum_approval_by_product(
+    source: Union[pd.DataFrame, str],
+    products: List[str],
+    revenue_column: str,
+    has_sales_type: bool
+) -> Dict[Tuple[str, str], Tuple[int, Any]]:
+    """
+    계약 번호 기준 중복 제거 후 제품 × 구분(총승인/본사/연계/온라인)별 건수와 매출액을 집계합니다.
+    (daily_sales_logic.analyze_approval_data_by_product의 pandas 집계와 같은 조건)
+
+    Args:
+        source: 승인매출 데이터프레임 또는 Parquet 파일 경로
+        products: 제품 목록 (안마의자, 라클라우드, 정수기, 더케어)
+        revenue_column: 매출액 컬럼명
+        has_sales_type: 판매유형 컬럼 존재 여부 (더케어/안마의자 구분 기준)
+
+    Returns:
+        Dict[Tuple[str, str], Tuple[int, Any]]: {(제품, 구분): (건수, 매출액 합계)}
+    """
+    campaign = _text("일반회차 캠페인")
+    inflow_has_crm = f"contains({_text('판매인입경로')}, 'CRM')"
+    category = f"lower({_text('대분류')})"
+
+    # 구분 조건
+    hq_link = (
+        f"(NOT starts_with({campaign}, 'CB-')) AND ("
+        f"starts_with({campaign}, 'V') OR starts_with({campaign}, 'C') OR starts_with({campaign}, 'AS') "
+        f"OR contains({campaign}, '캠') OR contains({campaign}, '정규') OR contains({campaign}, '분배'))"
+    )
+    segments = {
+        "총승인": hq_link,
+        "본사": f"({hq_link}) AND {inflow_has_crm}",
+        "연계": f"({hq_link}) AND NOT {inflow_has_crm}",
+        "온라인": f"starts_with({campaign}, 'CB-')"
+    }
+
+    # 제품 조건
+    is_anma = f"contains({category}, '안마의자')"
+    is_care = f"contains(lower({_text('판매유형')}), '더케어')" if has_sales_type else "FALSE"
+    product_conditions = {}
+    for product in products:
+        if product == "더케어":
+            product_conditions[product] = f"{is_anma} AND {is_care}"
+        elif product == "안마의자":
+            product_conditions[product] = f"{is_anma} AND NOT ({is_care})"
+        else:
+            product_conditions[product] = f"contains({category}, {_literal(product.lower())})"
+
+    # 구분/제품 조건은 행마다 한 번만 계산하고, 집계는 불리언 컬럼 조합으로 수행
+    flag_sql = ", ".join(
+        [f"({condition}) AS {_quote('seg_' + segment)}" for segment, condition in segments.items()]
+        + [f"({condition}) AS {_quote('prod_' + product)}" for product, condition in product_conditions.items()]
+    )
+    aggregates = []
+    for product in product_conditions:
+        for segment in segments:
+            condition = f"{_quote('seg_' + segment)} AND {_quote('prod_' + product)}"
+            aggregates.append(f"count(*) FILTER (WHERE {condition})")
+            aggregates.append(f"COALESCE(sum(amount) FILTER (WHERE {condition}), 0)")
+
+    columns = ["계약 번호", "일반회차 캠페인", "판매인입경로", "대분류", revenue_column]
+    if has_sales_type:
+        columns.append("판매유형")
+
+    con = _connect()
+    try:
+        _register_source(con, "data", source, columns)
+        row = con.execute(
+            f"WITH deduped AS ("
+            f"SELECT * FROM data QUALIFY row_number() OVER (PARTITION BY {_quote('계약 번호')} ORDER BY {_ROW_COLUMN}) = 1"
+            f"), flags AS MATERIALIZED (SELECT {_quote(revenue_column)} AS amount, {flag_sql} FROM deduped"
+            f") SELECT {', '.join(aggregates)} FROM flags"
+        ).fetchone()
+    finally:
+        con.close()
+
+    # 매출액 합계는 원본 컬럼 dtype으로 맞춤 (pandas sum 결과와 같은 타입)
+    if isinstance(source, pd.DataFrame):
+        amount_type = source[revenue_column].dtype.type
+    else:
+        amount_type = np.float64
+
+    totals = {}
+    position = 0
+    for product in product_conditions:
+        for segment in segments:
+            totals[(product, segment)] = (int(row[position]), amount_type(row[position + 1]))
+            position += 2
+
+    return totals
@@ -0,0 +1,222 @@
+"""
+공통 데이터 필터 비즈니스 로직
+
+이 모듈은 분석 탭들이 반복해서 사용하는 필터(기간, 판매채널, CRM 인입경로, CRM 조직,
+일반회차 캠페인 값 존재 여부)를 And(&) / Or(|) / Not(~)으로 조합 가능한 필터 스펙으로 정의하고,
+데이터셋별로 하위 마스크를 캐시하여 불리언 마스크로 변환하는 로직을 포함합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass
+from typing import Tuple, Dict, Any, Hashable
+
+from logic.string_predicate_logic import contains
+from logic.dataset_cache_logic import get_dataset_cache
+
+# 데이터셋 캐시 이름공간 {필터 스펙: 마스크}
+_CACHE_NAMESPACE = "filter_masks"
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """
+    필터 스펙 기본 클래스 (불변 객체이므로 캐시 키로 사용)
+
+    spec_a & spec_b, spec_a | spec_b, ~spec_a 로 조합합니다.
+    """
+
+    def __and__(self, other: "FilterSpec") -> "FilterSpec":
+        return And(_flatten(And, self) + _flatten(And, other))
+
+    def __or__(self, other: "FilterSpec") -> "FilterSpec":
+        return Or(_flatten(Or, self) + _flatten(Or, other))
+
+    def __invert__(self) -> "FilterSpec":
+        return self.spec if isinstance(self, Not) else Not(self)
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        데이터프레임에 대한 불리언 마스크를 계산합니다. (캐시 없이)
+
+        단일 조건 스펙(DateBetween, IsIn 등)은 이 메서드를 구현하고,
+        조합 스펙(And/Or/Not)은 하위 스펙의 evaluate 결과를 조합합니다.
+        """
+        raise NotImplementedError
+
+
+def _evaluate_composite(spec: FilterSpec, df: pd.DataFrame) -> np.ndarray:
+    """조합 스펙을 캐시 없이 평가합니다. (빈 캐시로 compile)"""
+    return _compile(df, spec, {}).copy()
+
+
+@dataclass(frozen=True)
+class And(FilterSpec):
+    """모든 하위 스펙을 만족 (하위 스펙이 없으면 전체 행)"""
+    specs: Tuple[FilterSpec, ...] = ()
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return _evaluate_composite(self, df)
+
+
+@dataclass(frozen=True)
+class Or(FilterSpec):
+    """하위 스펙 중 하나 이상 만족 (하위 스펙이 없으면 빈 결과)"""
+    specs: Tuple[FilterSpec, ...] = ()
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return _evaluate_composite(self, df)
+
+
+@dataclass(frozen=True)
+class Not(FilterSpec):
+    """하위 스펙을 만족하지 않음"""
+    spec: FilterSpec = None
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return _evaluate_composite(self, df)
+
+
+@dataclass(frozen=True)
+class DateBetween(FilterSpec):
+    """날짜 컬럼이 start 이상 end 이하 (컬럼이 없으면 전체 행)"""
+    column: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        if self.column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        values = df[self.column]
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.to_datetime(values, errors='coerce')
+        return ((values >= self.start) & (values <= self.end)).to_numpy()
+
+
+@dataclass(frozen=True)
+class IsIn(FilterSpec):
+    """컬럼 값이 목록에 포함 (컬럼이 없으면 전체 행)"""
+    column: str
+    values: Tuple[Any, ...]
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        if self.column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        return df[self.column].isin(self.values).to_numpy()
+
+
+@dataclass(frozen=True)
+class Contains(FilterSpec):
+    """컬럼 문자열에 패턴(정규식) 포함 (컬럼이 없으면 전체 행)"""
+    column: str
+    pattern: str
+    case: bool = False
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        if self.column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        return contains(df, self.column, self.pattern, case=self.case)
+
+
+@dataclass(frozen=True)
+class NotEmpty(FilterSpec):
+    """컬럼 값이 결측값도 빈 문자열도 아님 (컬럼이 없으면 전체 행)"""
+    column: str
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        if self.column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        values = df[self.column]
+        return (values.notna() & (values != '')).to_numpy()
+
+
+# 전체 행 (필터 조합 시작값)
+ALL_ROWS = And()
+
+# 자주 쓰는 필터
+CRM_INFLOW = Contains("판매 인입경로", "CRM")               # 직접승인 (판매 인입경로가 CRM)
+CRM_ORGANIZATION = Contains("상담사 조직", "CRM")           # CRM파트/CRM팀 (온라인파트 제외)
+HQ_ONLINE_CHANNEL = IsIn("판매채널", ("본사", "온라인"))     # 판매채널 본사/온라인
+HAS_CAMPAIGN = NotEmpty("일반회차 캠페인")                  # 일반회차 캠페인 값 있음
+
+
+def date_between(column: str, start_date: Any, end_date: Any) -> FilterSpec:
+    """
+    날짜 범위 필터를 만듭니다. (시작일/종료일 중 하나라도 없으면 전체 행)
+
+    Args:
+        column: 날짜 컬럼명
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        FilterSpec: 날짜 범위 필터
+    """
+    if not start_date or not end_date:
+        return ALL_ROWS
+    return DateBetween(column, pd.Timestamp(start_date), pd.Timestamp(end_date))
+
+
+def _flatten(kind: type, spec: FilterSpec) -> Tuple[FilterSpec, ...]:
+    """같은 종류의 조합(And/Or)은 하위 스펙을 펼쳐서 캐시 키를 단순하게 유지합니다."""
+    return spec.specs if type(spec) is kind else (spec,)
+
+
+def _compile(df: pd.DataFrame, spec: FilterSpec, masks: Dict[Hashable, np.ndarray]) -> np.ndarray:
+    """필터 스펙을 하위 마스크 캐시를 거쳐 불리언 마스크로 변환합니다."""
+    mask = masks.get(spec)
+    if mask is not None:
+        return mask
+
+    if isinstance(spec, And):
+        mask = np.ones(len(df), dtype=bool)
+        for sub_spec in spec.specs:
+            mask = mask & _compile(df, sub_spec, masks)
+    elif isinstance(spec, Or):
+        mask = np.zeros(len(df), dtype=bool)
+        for sub_spec in spec.specs:
+            mask = mask | _compile(df, sub_spec, masks)
+    elif isinstance(spec, Not):
+        mask = ~_compile(df, spec.spec, masks)
+    else:
+        mask = np.asarray(spec.evaluate(df), dtype=bool)
+
+    # 캐시된 마스크가 호출한 쪽에서 수정되지 않도록 읽기 전용으로 저장
+    mask.flags.writeable = False
+    masks[spec] = mask
+    return mask
+
+
+def compile_mask(df: pd.DataFrame, spec: FilterSpec) -> np.ndarray:
+    """
+    필터 스펙을 데이터프레임에 대한 불리언 마스크로 변환합니다.
+
+    하위 마스크는 (데이터셋, 필터 스펙) 단위로 캐시되므로 같은 데이터셋에서
+    옵션 하나만 바뀐 필터는 캐시된 마스크들의 AND/OR만 다시 계산합니다.
+    데이터셋은 객체 동일성(is)으로 비교하므로, 데이터를 제자리에서 수정했다면
+    dataset_cache_logic.clear_dataset_cache()를 호출해야 합니다.
+
+    Args:
+        df: 데이터프레임
+        spec: 필터 스펙
+
+    Returns:
+        np.ndarray: 행별 불리언 마스크 (읽기 전용)
+    """
+    return _compile(df, spec, get_dataset_cache(df, _CACHE_NAMESPACE))
+
+
+def apply_filter(df: pd.DataFrame, spec: FilterSpec) -> pd.DataFrame:
+    """
+    필터 스펙에 해당하는 행만 남긴 데이터프레임을 반환합니다.
+
+    Args:
+        df: 데이터프레임
+        spec: 필터 스펙
+
+    Returns:
+        pd.DataFrame: 필터링된 데이터프레임 (복사본)
+    """
+    return df[compile_mask(df, spec)].copy()
+
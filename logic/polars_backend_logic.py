@@ -0,0 +1,276 @@
+"""
+Polars 분석 백엔드 비즈니스 로직
+
+이 모듈은 가장 무거운 분석(프로모션 제품 분류/건수 행렬, 일일 승인 현황 집계,
+제품별 승인매출 집계)의 분류와 집계 단계를 Polars 지연(lazy) 쿼리로 실행하는 로직을 포함합니다.
+쿼리는 필요한 컬럼만 읽고 여러 집계를 한 번의 실행으로 처리하며, 결과는 pandas 백엔드와 같은
+중간 구조(건수 행렬, 집계 시리즈, {(제품, 구분): (건수, 매출액)})로 반환하므로
+최종 테이블 구성은 기존 pandas 코드가 그대로 수행합니다.
+polars 패키지가 없으면 analysis_backend_logic이 pandas 백엔드로 대체합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from datetime import date
+from typing import Tuple, Dict, List, Any
+
+try:
+    import polars as pl
+except ImportError:  # 선택 의존성
+    pl = None
+
+# 쿼리 내부에서만 사용하는 임시 컬럼
+_CLASS_COLUMN = "__제품분류"
+_LATEST_COLUMN = "__최신일자"
+
+
+def is_polars_available() -> bool:
+    """polars 패키지 설치 여부를 반환합니다."""
+    return pl is not None
+
+
+def _to_polars(df: pd.DataFrame, columns: List[str]) -> "pl.DataFrame":
+    """
+    필요한 컬럼만 Polars 데이터프레임으로 변환합니다.
+
+    값 타입이 섞여 있어 그대로 변환할 수 없는 컬럼은 pandas의 astype(str)과 같은 문자열로 변환합니다.
+
+    Args:
+        df: 데이터프레임
+        columns: 변환할 컬럼 목록
+
+    Returns:
+        pl.DataFrame: Polars 데이터프레임
+    """
+    series = []
+    for column in columns:
+        try:
+            series.append(pl.from_pandas(df[column].reset_index(drop=True)))
+        except Exception:
+            series.append(pl.Series(column, df[column].astype(str).to_numpy(dtype=object), dtype=pl.Utf8))
+    return pl.DataFrame(series)
+
+
+def _text(column: str) -> "pl.Expr":
+    """pandas의 astype(str)처럼 결측값을 'nan'으로 보는 문자열 식"""
+    return pl.col(column).cast(pl.Utf8).fill_null("nan")
+
+
+def _contains(expr: "pl.Expr", keyword: str, case: bool = True) -> "pl.Expr":
+    """문자열 포함 여부 (결측값은 False)"""
+    if not case:
+        expr = expr.str.to_lowercase()
+        keyword = keyword.lower()
+    return expr.str.contains(keyword, literal=True).fill_null(False)
+
+
+def count_promotion_products(filtered_df: pd.DataFrame, products: List[str]) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    프로모션 필터링 결과의 제품 분류와 상담사 × 제품 건수 행렬을 한 번의 지연 쿼리로 계산합니다.
+    (promotion_logic.classify_products + build_promotion_matrix와 같은 결과)
+
+    Args:
+        filtered_df: 기간/인입경로/조직 필터링된 데이터프레임 (상담사, 대분류, 판매 유형, 매출 금액 컬럼 필요)
+        products: 건수 행렬 제품 컬럼 목록
+
+    Returns:
+        Tuple[np.ndarray, pd.DataFrame]: 행별 제품분류, 상담사(등장 순서) × 제품 건수 + 승인액 행렬
+    """
+    category = _text("대분류").str.to_lowercase()
+    sales_type = _text("판매 유형").str.to_lowercase()
+    is_lacloud = _contains(category, "라클")
+    is_anma = _contains(category, "안마")
+    is_water = _contains(category, "정수기")
+    is_care = _contains(sales_type, "케어")
+    is_member = _contains(sales_type, "멤버")
+
+    # classify_products와 같은 우선순위 (분류되지 않으면 null → 대분류 값 사용)
+    product_class = (
+        pl.when(is_lacloud).then(pl.lit("라클라우드"))
+        .when(is_anma & is_care).then(pl.lit("더케어"))
+        .when(is_anma).then(pl.lit("안마의자"))
+        .when(is_water & is_member).then(pl.lit("멤버십"))
+        .when(is_water).then(pl.lit("정수기"))
+        .otherwise(pl.lit(None, dtype=pl.Utf8))
+    )
+
+    query = (
+        _to_polars(filtered_df, ["상담사", "대분류", "판매 유형", "매출 금액"])
+        .lazy()
+        .with_columns(product_class.alias(_CLASS_COLUMN))
+    )
+    label = pl.coalesce(pl.col(_CLASS_COLUMN), pl.col("대분류").cast(pl.Utf8))
+    classes_query = query.select(_CLASS_COLUMN)
+    matrix_query = query.group_by("상담사", maintain_order=True).agg(
+        [(label == product).sum().alias(product) for product in products]
+        + [pl.col("매출 금액").sum()]
+    )
+    classes_frame, grouped = pl.collect_all([classes_query, matrix_query])
+
+    # 분류되지 않은 행은 원본 대분류 값 그대로 사용
+    classes = classes_frame[_CLASS_COLUMN].to_numpy().astype(object)
+    unclassified = classes_frame[_CLASS_COLUMN].is_null().to_numpy()
+    classes[unclassified] = filtered_df["대분류"].to_numpy(dtype=object)[unclassified]
+
+    # 상담사 결측값은 pandas crosstab/groupby처럼 건수/승인액 0
+    has_consultant = grouped["상담사"].is_not_null().to_numpy()
+    matrix = pd.DataFrame(
+        {product: grouped[product].to_numpy().astype(np.int64) * has_consultant for product in products},
+        index=pd.Index(filtered_df["상담사"].unique(), name="상담사")
+    )
+    amounts = grouped["매출 금액"].fill_null(0).to_numpy()
+    matrix["승인액"] = np.where(has_consultant, amounts, 0).astype(filtered_df["매출 금액"].dtype)
+
+    return classes, matrix
+
+
+def sum_daily_approval_metrics(
+    approval_df: pd.DataFrame,
+    latest_day: date,
+    category_keywords: Dict[str, str]
+) -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
+    """
+    일일 승인 현황의 제품별 건수/매출액과 최신 일자 건수/매출액을 한 번의 지연 쿼리로 집계합니다.
+    (daily_approval_logic.analyze_daily_approval의 행 단위 집계 프레임과 같은 컬럼)
+
+    Args:
+        approval_df: 승인 데이터프레임 (상담사, 주문 일자(datetime), 대분류, 매출 금액 컬럼 필요)
+        latest_day: 최신 일자
+        category_keywords: {제품: 대분류 포함 키워드}
+
+    Returns:
+        Tuple[pd.DataFrame, pd.Series, pd.Series]: 상담사별 합계, 전체 누적 합계, 최신 일자 합계
+    """
+    sales_dtype = approval_df["매출 금액"].dtype
+    is_latest = (pl.col("주문 일자").dt.date() == pl.lit(latest_day)).fill_null(False)
+
+    metric_exprs = []
+    for product, keyword in category_keywords.items():
+        is_product = _contains(pl.col("대분류").cast(pl.Utf8), keyword, case=False)
+        metric_exprs.append(is_product.cast(pl.Int64).alias(product))
+        metric_exprs.append(
+            pl.when(is_product).then(pl.col("매출 금액")).otherwise(0).alias(f"{product}_매출액")
+        )
+    metric_exprs.append(pl.col(_LATEST_COLUMN).cast(pl.Int64).alias("일일건수"))
+    metric_exprs.append(
+        pl.when(pl.col(_LATEST_COLUMN)).then(pl.col("매출 금액")).otherwise(0).alias("일일매출액")
+    )
+    metric_columns = [expr.meta.output_name() for expr in metric_exprs]
+
+    rows = (
+        _to_polars(approval_df, ["상담사", "주문 일자", "대분류", "매출 금액"])
+        .lazy()
+        .with_columns(is_latest.alias(_LATEST_COLUMN))
+        .with_columns(metric_exprs)
+    )
+    consultant_query = (
+        rows.filter(pl.col("상담사").is_not_null())
+        .group_by("상담사")
+        .agg(pl.col(metric_columns).sum())
+    )
+    total_query = rows.select(pl.col(metric_columns).sum())
+    daily_query = rows.filter(pl.col(_LATEST_COLUMN)).select(pl.col(metric_columns).sum())
+    consultant_frame, total_frame, daily_frame = pl.collect_all([consultant_query, total_query, daily_query])
+
+    # 건수는 int64, 매출액은 원본 컬럼 dtype으로 맞춤 (pandas sum 결과와 같은 타입)
+    dtypes = {column: (sales_dtype if "매출액" in column else np.int64) for column in metric_columns}
+
+    consultant_sums = pd.DataFrame(
+        {column: consultant_frame[column].fill_null(0).to_numpy().astype(dtypes[column]) for column in metric_columns},
+        index=pd.Index(consultant_frame["상담사"].to_list(), name="상담사")
+    )
+
+    total_sums = pd.Series(total_frame.fill_null(0).row(0, named=True))
+    daily_sums = pd.Series(daily_frame.fill_null(0).row(0, named=True))
+
+    return consultant_sums, total_sums, daily_sums
+
+
+def sum_approval_by_product(
+    df: pd.DataFrame,
+    products: List[str],
+    revenue_column: str,
+    has_sales_type: bool
+) -> Dict[Tuple[str, str], Tuple[int, Any]]:
+    """
+    계약 번호 기준 중복 제거 후 제품 × 구분(총승인/본사/연계/온라인)별 건수와 매출액을 집계합니다.
+    (daily_sales_logic.analyze_approval_data_by_product의 pandas 집계와 같은 조건)
+
+    Args:
+        df: 승인매출 데이터프레임 (중복 제거 전)
+        products: 제품 목록 (안마의자, 라클라우드, 정수기, 더케어)
+        revenue_column: 매출액 컬럼명
+        has_sales_type: 판매유형 컬럼 존재 여부 (더케어/안마의자 구분 기준)
+
+    Returns:
+        Dict[Tuple[str, str], Tuple[int, Any]]: {(제품, 구분): (건수, 매출액 합계)}
+    """
+    campaign = _text("일반회차 캠페인")
+    inflow_has_crm = _contains(_text("판매인입경로"), "CRM")
+    category = _text("대분류")
+
+    # 구분 조건
+    is_online = campaign.str.starts_with("CB-")
+    hq_link = ~is_online & (
+        campaign.str.starts_with("V") | campaign.str.starts_with("C") | campaign.str.starts_with("AS")
+        | _contains(campaign, "캠") | _contains(campaign, "정규") | _contains(campaign, "분배")
+    )
+    segments = {
+        "총승인": hq_link,
+        "본사": hq_link & inflow_has_crm,
+        "연계": hq_link & ~inflow_has_crm,
+        "온라인": is_online
+    }
+
+    # 제품 조건
+    is_anma = _contains(category, "안마의자", case=False)
+    is_care = _contains(_text("판매유형"), "더케어", case=False) if has_sales_type else pl.lit(False)
+    product_conditions = {}
+    for product in products:
+        if product == "더케어":
+            product_conditions[product] = is_anma & is_care
+        elif product == "안마의자":
+            product_conditions[product] = is_anma & ~is_care
+        else:
+            product_conditions[product] = _contains(category, product, case=False)
+
+    # 구분/제품 조건은 행마다 한 번만 계산하고, 집계는 불리언 컬럼 조합으로 수행
+    flags = (
+        [condition.alias(f"seg_{segment}") for segment, condition in segments.items()]
+        + [condition.alias(f"prod_{product}") for product, condition in product_conditions.items()]
+    )
+    aggregates = []
+    for product in product_conditions:
+        for segment in segments:
+            condition = pl.col(f"seg_{segment}") & pl.col(f"prod_{product}")
+            aggregates.append(condition.sum().alias(f"{product}|{segment}|count"))
+            aggregates.append(
+                pl.col(revenue_column).filter(condition).sum().alias(f"{product}|{segment}|amount")
+            )
+
+    columns = ["계약 번호", "일반회차 캠페인", "판매인입경로", "대분류", revenue_column]
+    if has_sales_type:
+        columns.append("판매유형")
+
+    row = (
+        _to_polars(df, columns)
+        .lazy()
+        .unique(subset=["계약 번호"], keep="first", maintain_order=True)
+        .select([pl.col(revenue_column)] + flags)
+        .select(aggregates)
+        .collect()
+        .row(0, named=True)
+    )
+
+    # 매출액 합계는 원본 컬럼 dtype으로 맞춤 (pandas sum 결과와 같은 타입)
+    amount_type = df[revenue_column].dtype.type
+
+    return {
+        (product, segment): (
+            int(row[f"{product}|{segment}|count"]),
+            amount_type(row[f"{product}|{segment}|amount"] or 0)
+        )
+        for product in product_conditions
+        for segment in segments
+    }
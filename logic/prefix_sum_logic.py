@@ -0,0 +1,208 @@
+"""
+일자 누적합(prefix sum) 기간 질의 비즈니스 로직
+
+이 모듈은 주요 측정값(건수, 금액)을 항목(제품×구분, 상담사×제품 등)별로
+일자 순서의 누적합 배열로 한 번 만들어 두고, 임의의 기간 합계를
+두 번의 배열 조회와 뺄셈(P[종료일 + 1] - P[시작일])으로 계산하는 로직을 포함합니다.
+주간 누계, 월 누계, 사용자 지정 기간과 전월 동기간 비교가 원본 행 필터링 없이 처리됩니다.
+누적합은 큐브 셀(일자 × 차원 값 조합) 단위로 만들므로 생성 비용도 원본 행 수가 아니라 셀 수에 비례합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from datetime import date, datetime
+from typing import Tuple, Dict, Optional, Hashable, Sequence, Union
+
+DateLike = Union[date, datetime, pd.Timestamp, str]
+
+
+class DailyPrefixSums:
+    """
+    항목별 일자 누적합 배열
+
+    Attributes:
+        days: 연속된 일자 인덱스 (데이터의 첫 일자 ~ 마지막 일자, 실적 없는 날 포함)
+        keys: 항목 인덱스
+        sums: 측정값별 누적합 배열 (행 = 일자 + 1, 첫 행은 0 / 열 = 항목)
+    """
+
+    def __init__(self, days: pd.DatetimeIndex, keys: pd.Index, sums: Dict[str, np.ndarray]):
+        self.days = days
+        self.keys = keys
+        self.sums = sums
+
+    @property
+    def first_day(self) -> Optional[pd.Timestamp]:
+        return self.days[0] if len(self.days) else None
+
+    @property
+    def last_day(self) -> Optional[pd.Timestamp]:
+        return self.days[-1] if len(self.days) else None
+
+    def covers(self, start: DateLike, end: DateLike) -> bool:
+        """
+        기간(시작일~종료일, 양 끝 포함)이 데이터 범위(first_day~last_day) 안에 모두 들어가는지 반환합니다.
+
+        range_total은 범위 밖 일자를 잘라내므로, 범위를 벗어난 기간의 합계는 실적이 없는 것인지
+        데이터가 없는 것인지 구분되지 않습니다. 이 경우 호출한 쪽에서 합계를 표시하지 않아야 합니다.
+
+        Args:
+            start: 시작일
+            end: 종료일
+
+        Returns:
+            bool: 기간 전체가 데이터 범위 안이면 True
+        """
+        if not len(self.days):
+            return False
+        return pd.Timestamp(start).normalize() >= self.days[0] and pd.Timestamp(end).normalize() <= self.days[-1]
+
+    def _bounds(self, start: DateLike, end: DateLike) -> Tuple[int, int]:
+        """기간을 누적합 행 위치 (lo, hi)로 변환합니다. (데이터 범위 밖은 잘라냄, 빈 기간은 lo == hi)"""
+        if not len(self.days):
+            return 0, 0
+        start_day = pd.Timestamp(start).normalize()
+        end_day = pd.Timestamp(end).normalize()
+        lo = int(np.clip((start_day - self.days[0]).days, 0, len(self.days)))
+        hi = int(np.clip((end_day - self.days[0]).days + 1, 0, len(self.days)))
+        return lo, max(lo, hi)
+
+    def range_total(self, start: DateLike, end: DateLike) -> pd.DataFrame:
+        """
+        기간(시작일~종료일, 양 끝 포함)의 항목별 측정값 합계를 반환합니다.
+
+        Args:
+            start: 시작일
+            end: 종료일
+
+        Returns:
+            pd.DataFrame: 항목 인덱스 × 측정값 컬럼 (데이터 범위 밖 일자는 제외, covers로 포함 여부 확인)
+        """
+        lo, hi = self._bounds(start, end)
+        return pd.DataFrame({name: sums[hi] - sums[lo] for name, sums in self.sums.items()}, index=self.keys)
+
+    def daily(self, measure: str) -> pd.DataFrame:
+        """측정값의 일자 × 항목 일별 값 (누적합의 차분)"""
+        return pd.DataFrame(np.diff(self.sums[measure], axis=0), index=self.days, columns=self.keys)
+
+
+def _accumulate(
+    cell_days: pd.Series,
+    member_cells: np.ndarray,
+    member_keys: np.ndarray,
+    keys: pd.Index,
+    cell_measures: Dict[str, np.ndarray]
+) -> DailyPrefixSums:
+    """(셀, 항목) 소속 쌍을 일자 × 항목 버킷으로 합산한 뒤 일자 방향 누적합을 만듭니다."""
+    days = pd.to_datetime(cell_days, errors="coerce").dt.normalize()
+    valid_day = days.notna().to_numpy()
+
+    if not valid_day.any():
+        empty_days = pd.DatetimeIndex([], name="일자")
+        return DailyPrefixSums(empty_days, keys, {name: np.zeros((1, len(keys))) for name in cell_measures})
+
+    first_day = days[valid_day].min()
+    day_index = np.where(valid_day, (days - first_day).dt.days.fillna(0).to_numpy(dtype=np.int64), -1)
+    n_days = int(day_index.max()) + 1
+    n_keys = len(keys)
+
+    # 일자가 없는 셀 제외
+    valid_members = valid_day[member_cells]
+    member_cells = member_cells[valid_members]
+    buckets = day_index[member_cells] * n_keys + member_keys[valid_members]
+
+    sums = {}
+    for name, values in cell_measures.items():
+        weights = np.nan_to_num(np.asarray(values, dtype=float))[member_cells]
+        totals = np.bincount(buckets, weights=weights, minlength=n_days * n_keys).reshape(n_days, n_keys)
+        prefix = np.zeros((n_days + 1, n_keys))
+        np.cumsum(totals, axis=0, out=prefix[1:])
+        sums[name] = prefix
+
+    all_days = pd.date_range(first_day, periods=n_days, freq="D", name="일자")
+    return DailyPrefixSums(all_days, keys, sums)
+
+
+def build_prefix_sums(
+    cell_days: pd.Series,
+    cell_keys: Sequence[Tuple[Hashable, np.ndarray]],
+    cell_measures: Dict[str, np.ndarray]
+) -> DailyPrefixSums:
+    """
+    셀(또는 행)별 일자/측정값과 항목 소속 마스크로 항목별 일자 누적합을 만듭니다.
+
+    한 셀이 여러 항목에 속할 수 있으며(예: 제품 × 총승인/본사), 일자가 없는 셀은 제외합니다.
+
+    Args:
+        cell_days: 셀별 일자 (시각은 버림)
+        cell_keys: [(항목, 셀 마스크)] 목록 (항목 순서 유지)
+        cell_measures: {측정값 이름: 셀별 값}
+
+    Returns:
+        DailyPrefixSums: 항목별 누적합
+    """
+    keys = pd.Index([key for key, _ in cell_keys], tupleize_cols=False)
+    members = [np.flatnonzero(np.asarray(mask, dtype=bool)) for _, mask in cell_keys]
+    member_cells = np.concatenate(members) if members else np.array([], dtype=np.int64)
+    member_keys = np.repeat(np.arange(len(keys)), [len(cells) for cells in members])
+    return _accumulate(cell_days, member_cells, member_keys, keys, cell_measures)
+
+
+def build_coded_prefix_sums(
+    cell_days: pd.Series,
+    key_codes: np.ndarray,
+    keys: pd.Index,
+    cell_measures: Dict[str, np.ndarray]
+) -> DailyPrefixSums:
+    """
+    셀마다 항목이 하나인 경우(예: 상담사 × 제품) 항목 코드로 일자 누적합을 만듭니다.
+
+    Args:
+        cell_days: 셀별 일자 (시각은 버림)
+        key_codes: 셀별 항목 위치 (keys 기준, -1이면 제외)
+        keys: 항목 인덱스
+        cell_measures: {측정값 이름: 셀별 값}
+
+    Returns:
+        DailyPrefixSums: 항목별 누적합
+    """
+    member_cells = np.flatnonzero(np.asarray(key_codes) >= 0)
+    return _accumulate(cell_days, member_cells, np.asarray(key_codes)[member_cells], keys, cell_measures)
+
+
+def same_period_last_month(start: DateLike, end: DateLike) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    전월 동기간을 계산합니다. (말일이 없는 달은 해당 월 말일로 맞춤, 예: 3/31 → 2/28)
+
+    Args:
+        start: 시작일
+        end: 종료일
+
+    Returns:
+        Tuple[pd.Timestamp, pd.Timestamp]: 전월 시작일, 전월 종료일
+    """
+    offset = pd.DateOffset(months=1)
+    return pd.Timestamp(start).normalize() - offset, pd.Timestamp(end).normalize() - offset
+
+
+def period_presets(as_of: DateLike) -> Dict[str, Tuple[Tuple[pd.Timestamp, pd.Timestamp], Tuple[pd.Timestamp, pd.Timestamp]]]:
+    """
+    기준일의 기간 비교 프리셋을 만듭니다.
+
+    Args:
+        as_of: 기준일 (보통 데이터의 최신 일자)
+
+    Returns:
+        Dict: {프리셋 이름: ((시작일, 종료일), (비교 시작일, 비교 종료일))}
+            - 주간 누계: 이번 주 월요일~기준일 vs 지난주 같은 요일까지
+            - 월간 누계: 이번 달 1일~기준일 vs 전월 동기간
+    """
+    as_of = pd.Timestamp(as_of).normalize()
+    week_start = as_of - pd.Timedelta(days=as_of.weekday())
+    month_start = as_of.replace(day=1)
+    return {
+        "주간 누계": ((week_start, as_of), (week_start - pd.Timedelta(days=7), as_of - pd.Timedelta(days=7))),
+        "월간 누계": ((month_start, as_of), same_period_last_month(month_start, as_of))
+    }
+
@@ -17,6 +17,15 @@ from datetime import datetime
 import json
 import os
 
+from logic.promotion_ranking_logic import rank_results, ranking_keys, allocate_rewards, format_reward
+from logic.filter_logic import FilterSpec, ALL_ROWS, CRM_INFLOW, CRM_ORGANIZATION, compile_mask, date_between
+from logic.analysis_backend_logic import resolve_backend
+from logic.polars_backend_logic import count_promotion_products
+from logic.cube_logic import get_cube, COUNT_MEASURE
+from logic.string_predicate_logic import contains
+from logic.dataset_cache_logic import clear_dataset_cache
+from logic.prefix_sum_logic import DailyPrefixSums, build_coded_prefix_sums
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -63,6 +72,33 @@ def classify_product(row: pd.Series) -> str:
     # 분류되지 않은 경우 대분류 그대로 반환
     return row["대분류"]
 
+def classify_products(df: pd.DataFrame) -> pd.Series:
+    """
+    classify_product 규칙으로 전체 행의 제품을 한 번에 분류합니다.
+
+    Args:
+        df: 데이터프레임 (대분류, 판매 유형 컬럼 필요)
+
+    Returns:
+        pd.Series: 행별 제품분류 (분류되지 않으면 대분류 값)
+    """
+    # classify_product의 소문자 비교 (한글 키워드는 대소문자 구분 없이 비교한 결과와 동일)
+    is_lacloud = contains(df, "대분류", "라클", case=False)
+    is_anma = contains(df, "대분류", "안마", case=False)
+    is_water = contains(df, "대분류", "정수기", case=False)
+    is_care = contains(df, "판매 유형", "케어", case=False)
+    is_member = contains(df, "판매 유형", "멤버", case=False)
+
+    classes = np.select(
+        [is_lacloud, is_anma & is_care, is_anma, is_water & is_member, is_water],
+        ["라클라우드", "더케어", "안마의자", "멤버십", "정수기"],
+        default=""
+    ).astype(object)
+    unclassified = ~(is_lacloud | is_anma | is_water)
+    classes[unclassified] = df["대분류"].to_numpy(dtype=object)[unclassified]
+
+    return pd.Series(classes, index=df.index, name="제품분류")
+
 def clean_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     의미없는 컬럼 제거 함수
@@ -155,9 +191,7 @@ def process_promotion_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]
         df = df[df["일반회차 캠페인"].notna()]  # 비어있지 않은 값
         
         # "V-", "C-", "캠", "정규", "재분배", "CB-" 중 하나라도 포함하는 값 필터링
-        campaign_mask = (
-            df["일반회차 캠페인"].astype(str).str.contains("V-|C-|AS-|캠|정규|재분배|CB-", case=False)
-        )
+        campaign_mask = contains(df, "일반회차 캠페인", "V-|C-|AS-|캠|정규|재분배|CB-", case=False)
         df = df[campaign_mask].copy()
         
         # 상담사가 "fmin2"인 행 제외 (공용아이디 제외)
@@ -177,6 +211,501 @@ def process_promotion_file(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]
     except Exception as e:
         return None, f"프로모션 파일 처리 중 오류가 발생했습니다: {str(e)}"
 
+# 단계별 분석 캐시 {단계: (입력 객체, 입력 파라미터, 결과)}
+# 가중치/등급/기준치만 바뀌면 필터링과 집계는 재사용하고 점수 계산만 다시 수행
+_PROMOTION_STAGE_CACHE: Dict[str, Tuple[Any, Any, Any]] = {}
+
+PROMOTION_PRODUCTS = ["안마의자", "라클라우드", "정수기", "더케어", "멤버십"]
+
+# 분류/건수 행렬 단계를 지원하는 분석 백엔드
+PROMOTION_BACKENDS = ("pandas", "polars")
+
+# 프로모션 큐브 차원 (필터와 제품 분류가 참조하는 컬럼)
+PROMOTION_CUBE_DIMENSIONS = ["주문 일자", "판매 인입경로", "상담사 조직", "상담사", "대분류", "판매 유형"]
+
+
+def _get_cached_stage(stage: str, source: Any, params: Any, compute) -> Any:
+    """
+    입력 객체와 파라미터가 같으면 캐시된 단계 결과를 반환하고, 아니면 다시 계산합니다.
+
+    입력 데이터프레임은 객체 동일성(is)으로 비교하므로, 데이터가 바뀌면
+    새 데이터프레임을 넘기거나 clear_promotion_cache()를 호출해야 합니다.
+    """
+    cached = _PROMOTION_STAGE_CACHE.get(stage)
+    if cached is not None and cached[0] is source and cached[1] == params:
+        return cached[2]
+
+    result = compute()
+    _PROMOTION_STAGE_CACHE[stage] = (source, params, result)
+    return result
+
+
+def clear_promotion_cache() -> None:
+    """프로모션 분석 단계별 캐시와 데이터셋별 캐시(필터 마스크, 큐브, 문자열 조건)를 비웁니다."""
+    _PROMOTION_STAGE_CACHE.clear()
+    clear_dataset_cache()
+
+
+def _promotion_filter_spec(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    include_online: bool,
+    include_indirect: bool
+) -> FilterSpec:
+    """기간 / 직접승인(판매 인입경로 CRM) / CRM파트 필터 조합"""
+    spec = ALL_ROWS
+    if start_date and end_date:
+        spec &= date_between("주문 일자", start_date, end_date)
+    if not include_indirect:
+        spec &= CRM_INFLOW
+    if not include_online:
+        spec &= CRM_ORGANIZATION
+    return spec
+
+
+def _promotion_cube(df: pd.DataFrame):
+    """필터/분류 컬럼을 차원으로, 매출 금액(숫자형일 때)을 측정값으로 하는 큐브 (데이터셋별 캐시)"""
+    dimensions = [col for col in PROMOTION_CUBE_DIMENSIONS if col in df.columns]
+    measures = []
+    if (
+        "매출 금액" in df.columns
+        and pd.api.types.is_numeric_dtype(df["매출 금액"])
+        and not pd.api.types.is_bool_dtype(df["매출 금액"])
+    ):
+        measures.append("매출 금액")
+    return get_cube(df, dimensions, measures)
+
+
+def _cube_product_classes(cube) -> np.ndarray:
+    """큐브 셀별 제품분류 (셀의 대분류/판매 유형 값에 classify_products 적용, 큐브별 캐시)"""
+    return _get_cached_stage("classify", cube, None, lambda: classify_products(cube.cells).to_numpy())
+
+
+def _filter_promotion_rows(
+    df: pd.DataFrame,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_online: bool = False,
+    include_indirect: bool = False
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    기간/인입경로/조직 필터 마스크와 필터링된 데이터프레임(제품분류 제외)을 반환합니다.
+    """
+    # 하위 마스크는 데이터셋별로 캐시되므로 온라인/연계승인 옵션 변경 시 마스크 AND만 다시 계산
+    spec = _promotion_filter_spec(start_date, end_date, include_online, include_indirect)
+    mask = compile_mask(df, spec)
+    filtered_df = df[mask].copy()
+
+    if start_date and end_date and "주문 일자" in filtered_df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(filtered_df["주문 일자"]):
+            filtered_df["주문 일자"] = pd.to_datetime(filtered_df["주문 일자"], errors='coerce')
+
+    return mask, filtered_df
+
+
+def filter_promotion_data(
+    df: pd.DataFrame,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_online: bool = False,
+    include_indirect: bool = False
+) -> pd.DataFrame:
+    """
+    프로모션 분석 1단계: 기간/인입경로/조직 필터링 후 제품분류 컬럼 추가
+
+    Args:
+        df: 데이터프레임
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        include_online: 온라인파트 포함 여부 (기본값: False, CRM파트만)
+        include_indirect: 연계승인 포함 여부 (기본값: False, 직접승인만)
+
+    Returns:
+        pd.DataFrame: 필터링된 데이터프레임 (제품분류 컬럼 포함)
+    """
+    mask, filtered_df = _filter_promotion_rows(df, start_date, end_date, include_online, include_indirect)
+
+    # 제품 분류 컬럼 추가 (분류는 큐브 셀 단위로 한 번만 계산하고 행으로 펼침)
+    cube = _promotion_cube(df)
+    filtered_df["제품분류"] = cube.row_values(_cube_product_classes(cube), mask)
+
+    return filtered_df
+
+
+def _filter_and_count_polars(
+    df: pd.DataFrame,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    include_online: bool,
+    include_indirect: bool
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    필터링은 캐시된 마스크로, 제품 분류와 건수 행렬은 Polars 지연 쿼리로 계산합니다.
+    (filter_promotion_data + build_promotion_matrix와 같은 결과)
+    """
+    _, filtered_df = _filter_promotion_rows(df, start_date, end_date, include_online, include_indirect)
+
+    if filtered_df.empty:
+        filtered_df["제품분류"] = classify_products(filtered_df).to_numpy()
+        return filtered_df, pd.DataFrame(columns=PROMOTION_PRODUCTS + ["승인액"])
+
+    product_classes, matrix = count_promotion_products(filtered_df, PROMOTION_PRODUCTS)
+    filtered_df["제품분류"] = product_classes
+    return filtered_df, matrix
+
+
+def build_promotion_matrix(filtered_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    프로모션 분석 2단계: 상담사 × 제품 건수 행렬과 승인액 집계
+
+    Args:
+        filtered_df: filter_promotion_data 결과 데이터프레임
+
+    Returns:
+        pd.DataFrame: 상담사(등장 순서)를 인덱스로 하는 제품별 건수 + 승인액 데이터프레임
+    """
+    consultants = filtered_df["상담사"].unique()
+
+    # 상담사 × 제품 건수 행렬 (한 번의 crosstab)
+    matrix = (
+        pd.crosstab(filtered_df["상담사"], filtered_df["제품분류"])
+        .reindex(index=consultants, columns=PROMOTION_PRODUCTS, fill_value=0)
+        .rename_axis(index="상담사", columns=None)
+    )
+    matrix["승인액"] = (
+        filtered_df.groupby("상담사")["매출 금액"].sum()
+        .reindex(consultants, fill_value=0)
+        .to_numpy()
+    )
+
+    return matrix
+
+
+def build_promotion_amount_matrix(filtered_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    상담사 × 제품 승인액 행렬 (시나리오별로 포함 제품의 승인액만 합산할 때 사용)
+
+    Args:
+        filtered_df: get_promotion_matrix가 반환한 필터링된 데이터프레임 (제품분류 포함)
+
+    Returns:
+        pd.DataFrame: 상담사(등장 순서)를 인덱스로 하는 제품별 승인액 데이터프레임
+    """
+    def compute():
+        if filtered_df.empty:
+            return pd.DataFrame(columns=PROMOTION_PRODUCTS, dtype=float)
+
+        consultants = filtered_df["상담사"].unique()
+        return (
+            filtered_df.groupby(["상담사", "제품분류"])["매출 금액"].sum()
+            .unstack("제품분류", fill_value=0)
+            .reindex(index=consultants, columns=PROMOTION_PRODUCTS, fill_value=0)
+            .rename_axis(index="상담사", columns=None)
+        )
+
+    return _get_cached_stage("amounts", filtered_df, None, compute)
+
+
+def build_promotion_matrix_from_cube(
+    df: pd.DataFrame,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_online: bool = False,
+    include_indirect: bool = False
+) -> pd.DataFrame:
+    """
+    프로모션 분석 2단계를 데이터셋 큐브에서 계산합니다. (build_promotion_matrix와 같은 결과)
+
+    필터와 제품 분류는 큐브 셀의 차원 값에 적용하고, 건수/승인액은 셀 합계를 롤업하므로
+    기간이나 옵션을 바꿔도 원본 행을 다시 집계하지 않습니다.
+
+    Args:
+        df: 원본 데이터프레임 (매출 금액 컬럼이 숫자형이어야 함)
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+
+    Returns:
+        pd.DataFrame: 상담사(등장 순서)를 인덱스로 하는 제품별 건수 + 승인액 데이터프레임
+    """
+    cube = _promotion_cube(df)
+    cell_mask = cube.mask(_promotion_filter_spec(start_date, end_date, include_online, include_indirect))
+
+    # 상담사 등장 순서 / 승인액 (상담사 결측값은 crosstab/groupby처럼 건수·승인액 0)
+    by_consultant = cube.rollup(["상담사"], cell_mask, order="first")
+    by_product = cube.rollup(
+        ["상담사", "제품분류"], cell_mask, order="first",
+        derived={"제품분류": _cube_product_classes(cube)}
+    )
+    counts = by_product[COUNT_MEASURE]
+    counts = counts[
+        counts.index.get_level_values("상담사").notna()
+        & counts.index.get_level_values("제품분류").notna()
+    ]
+
+    matrix = (
+        counts.unstack("제품분류", fill_value=0)
+        .reindex(index=by_consultant.index, columns=PROMOTION_PRODUCTS, fill_value=0)
+        .rename_axis(index="상담사", columns=None)
+    )
+    amounts = by_consultant["매출 금액"].to_numpy()
+    matrix["승인액"] = np.where(by_consultant.index.notna(), amounts, 0).astype(amounts.dtype)
+
+    return matrix
+
+
+def get_promotion_matrix(
+    df: pd.DataFrame,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_online: bool = False,
+    include_indirect: bool = False,
+    backend: str = "pandas"
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    필터링(1단계)과 건수 행렬(2단계)을 캐시를 거쳐 가져옵니다.
+
+    Args:
+        df: 데이터프레임
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+        backend: 분류/집계 백엔드 ("pandas" | "polars", polars가 없으면 pandas)
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: 필터링된 데이터프레임, 상담사 × 제품 건수 행렬
+    """
+    # Polars 백엔드는 분류/집계에 필요한 컬럼이 모두 있고 매출 금액이 숫자형일 때만 사용
+    use_polars = (
+        resolve_backend(backend, PROMOTION_BACKENDS) == "polars"
+        and all(col in df.columns for col in ["상담사", "대분류", "판매 유형", "매출 금액"])
+        and pd.api.types.is_numeric_dtype(df["매출 금액"])
+        and not pd.api.types.is_bool_dtype(df["매출 금액"])
+    )
+    if use_polars:
+        return _get_cached_stage(
+            "polars", df,
+            (len(df), start_date, end_date, include_online, include_indirect),
+            lambda: _filter_and_count_polars(df, start_date, end_date, include_online, include_indirect)
+        )
+
+    filtered_df = _get_cached_stage(
+        "filter", df,
+        (len(df), start_date, end_date, include_online, include_indirect),
+        lambda: filter_promotion_data(df, start_date, end_date, include_online, include_indirect)
+    )
+
+    if filtered_df.empty:
+        return filtered_df, pd.DataFrame(columns=PROMOTION_PRODUCTS + ["승인액"])
+
+    # 상담사/매출 금액(숫자형)이 있으면 큐브 롤업, 아니면 필터링된 행에서 직접 집계
+    cube = _promotion_cube(df)
+    if "상담사" in cube.dimensions and "매출 금액" in cube.measures:
+        compute_matrix = lambda: build_promotion_matrix_from_cube(
+            df, start_date, end_date, include_online, include_indirect
+        )
+    else:
+        compute_matrix = lambda: build_promotion_matrix(filtered_df)
+    matrix = _get_cached_stage("matrix", filtered_df, None, compute_matrix)
+
+    return filtered_df, matrix
+
+
+def get_promotion_prefix_sums(
+    df: pd.DataFrame,
+    include_online: bool = False,
+    include_indirect: bool = False
+) -> DailyPrefixSums:
+    """
+    상담사 × 제품분류별 일자 누적합(건수, 승인액)을 가져옵니다. (데이터셋/옵션별 캐시)
+
+    기간 외 필터(인입경로/조직)와 제품 분류는 큐브 셀에 적용하며,
+    PROMOTION_PRODUCTS에 없는 분류는 "기타"로 모아 승인액 합계에만 반영합니다.
+
+    Args:
+        df: 원본 데이터프레임
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+
+    Returns:
+        DailyPrefixSums: (상담사, 제품분류) 항목별 누적합
+    """
+    def compute() -> DailyPrefixSums:
+        cube = _promotion_cube(df)
+        cell_mask = cube.mask(_promotion_filter_spec(None, None, include_online, include_indirect))
+
+        product_labels = PROMOTION_PRODUCTS + ["기타"]
+        product_codes = pd.Index(PROMOTION_PRODUCTS).get_indexer(_cube_product_classes(cube))
+        product_codes[product_codes < 0] = len(PROMOTION_PRODUCTS)
+
+        # 상담사 결측값은 crosstab/groupby처럼 제외 (결측값을 뺀 상담사 목록 기준으로 코드 재배치)
+        has_label = ~cube.labels["상담사"].isna()
+        consultant_labels = cube.labels["상담사"][has_label]
+        consultant_positions = np.cumsum(has_label) - 1
+        consultant_codes = cube.codes["상담사"]
+        valid = cell_mask & has_label[consultant_codes]
+        key_codes = np.where(valid, consultant_positions[consultant_codes] * len(product_labels) + product_codes, -1)
+        keys = pd.MultiIndex.from_product([consultant_labels, product_labels], names=["상담사", "제품분류"])
+
+        measures = {"건수": cube.measures[COUNT_MEASURE]}
+        if "매출 금액" in cube.measures:
+            measures["승인액"] = cube.measures["매출 금액"]
+        return build_coded_prefix_sums(cube.cells["주문 일자"], key_codes, keys, measures)
+
+    return _get_cached_stage("prefix", df, (len(df), include_online, include_indirect), compute)
+
+
+def compare_promotion_periods(
+    df: pd.DataFrame,
+    current: Tuple[Any, Any],
+    previous: Tuple[Any, Any],
+    include_online: bool = False,
+    include_indirect: bool = False
+) -> pd.DataFrame:
+    """
+    두 기간의 상담사별 제품 건수와 승인액을 누적합으로 비교합니다.
+
+    Args:
+        df: 원본 데이터프레임
+        current: (시작일, 종료일) 기준 기간
+        previous: (시작일, 종료일) 비교 기간
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+
+    Returns:
+        pd.DataFrame: 상담사 인덱스 × [제품별 기준 건수, 건수_기준, 건수_비교, 건수_증감,
+                      승인액_기준, 승인액_비교, 승인액_증감] (두 기간 모두 실적 없는 상담사 제외, 기준 건수 내림차순)
+                      데이터 범위가 기간을 모두 포함하지 않으면 그 기간의 값과 증감은 NaN
+    """
+    prefix = get_promotion_prefix_sums(df, include_online, include_indirect)
+    current_total = prefix.range_total(*current)
+    previous_total = prefix.range_total(*previous)
+
+    current_counts = current_total["건수"].unstack("제품분류").reindex(columns=PROMOTION_PRODUCTS)
+    previous_counts = previous_total["건수"].unstack("제품분류").reindex(columns=PROMOTION_PRODUCTS)
+
+    result = current_counts.astype(np.int64)
+    result["건수_기준"] = result[PROMOTION_PRODUCTS].sum(axis=1)
+    result["건수_비교"] = previous_counts.sum(axis=1).astype(np.int64)
+    result["건수_증감"] = result["건수_기준"] - result["건수_비교"]
+    if "승인액" in current_total.columns:
+        result["승인액_기준"] = current_total["승인액"].groupby(level="상담사", sort=False).sum()
+        result["승인액_비교"] = previous_total["승인액"].groupby(level="상담사", sort=False).sum()
+        result["승인액_증감"] = result["승인액_기준"] - result["승인액_비교"]
+
+    measure_columns = [column for column in ("건수_기준", "건수_비교", "승인액_기준", "승인액_비교") if column in result.columns]
+    result = result[(result[measure_columns] != 0).any(axis=1)]
+    result = result.sort_values("건수_기준", ascending=False, kind="stable").rename_axis(index="상담사", columns=None)
+
+    # 데이터 범위 밖 일자는 0으로 잘리므로, 일부라도 벗어난 기간의 값은 0 대신 결측값으로 표시
+    uncovered_columns = []
+    if not prefix.covers(*current):
+        uncovered_columns += PROMOTION_PRODUCTS + ["건수_기준", "승인액_기준"]
+    if not prefix.covers(*previous):
+        uncovered_columns += ["건수_비교", "승인액_비교"]
+    if uncovered_columns:
+        uncovered_columns += ["건수_증감", "승인액_증감"]
+        uncovered_columns = [column for column in uncovered_columns if column in result.columns]
+        result[uncovered_columns] = result[uncovered_columns].astype(float)
+        result[uncovered_columns] = np.nan
+    return result
+
+
+# 분석 기준별 기본 동점 해소 기준 [(컬럼, 오름차순 여부)]
+DEFAULT_TIE_BREAKERS = {
+    "제품별": [("승인액", False)],
+    "건수별": [("승인액", False)],
+    "금액별": [("승인건수", False)]
+}
+
+
+def score_promotion_matrix(
+    matrix: pd.DataFrame,
+    analysis_mode: str,
+    product_weights: Dict[str, int],
+    include_services: bool,
+    min_criteria: int,
+    promotion_tiers: List[Dict],
+    rank_method: str = "competition",
+    tie_breakers: Optional[List[Tuple[str, bool]]] = None
+) -> pd.DataFrame:
+    """
+    프로모션 분석 3단계: 승인건수/점수 계산, 정렬, 순위 및 등급 판정
+
+    Args:
+        matrix: build_promotion_matrix 결과 데이터프레임
+        analysis_mode: 분석 기준 ("제품별" | "건수별" | "금액별")
+        product_weights: 제품별 가중치
+        include_services: 서비스성 제품 포함 여부
+        min_criteria: 최소 기준치 (승인 건수)
+        promotion_tiers: 프로모션 구간 설정
+        rank_method: 동점 순위 방식 (기본값: "competition", 동점은 같은 순위, "ordinal"은 정렬 순서대로 순번)
+        tie_breakers: [(컬럼, 오름차순 여부)] 동점 해소 기준 (None이면 DEFAULT_TIE_BREAKERS의 분석 기준별 기본값)
+
+    Returns:
+        pd.DataFrame: 결과 데이터프레임
+    """
+    product_counts = matrix[PROMOTION_PRODUCTS]
+    result_df = matrix.reset_index()
+
+    # 총 승인 건수
+    if include_services:
+        # 서비스 포함 시 모든 제품 카운트
+        result_df["승인건수"] = product_counts.sum(axis=1).to_numpy()
+    else:
+        # 서비스 제외 시 안마의자, 라클라우드, 정수기만
+        result_df["승인건수"] = product_counts[["안마의자", "라클라우드", "정수기"]].sum(axis=1).to_numpy()
+
+    # 승인액 컬럼을 승인건수 뒤로 이동
+    result_df["승인액"] = result_df.pop("승인액")
+
+    # 제품별 점수 계산 (건수 행렬 · 가중치 벡터)
+    if analysis_mode == "제품별":
+        weight_vector = np.array([product_weights.get(product, 0) for product in PROMOTION_PRODUCTS])
+        result_df["점수"] = product_counts.to_numpy() @ weight_vector
+
+    # 정렬 기준 (제품별: 점수, 금액별: 승인액, 건수별: 승인건수) + 동점 해소 기준
+    sort_column = {"제품별": "점수", "금액별": "승인액"}.get(analysis_mode, "승인건수")
+    if tie_breakers is None:
+        tie_breakers = DEFAULT_TIE_BREAKERS.get(analysis_mode, DEFAULT_TIE_BREAKERS["건수별"])
+
+    # 정렬 및 순위 부여 (동점 처리 방식은 rank_method)
+    result_df = rank_results(result_df, [sort_column], [False], method=rank_method, tie_breakers=tie_breakers)
+
+    # 프로모션 대상 판정
+    if analysis_mode == "제품별":
+        # 점수 구간에 따른 등급 판정 (min_score 내림차순으로 먼저 만족하는 구간)
+        sorted_tiers = sorted(promotion_tiers, key=lambda x: x["min_score"], reverse=True)
+        scores = result_df["점수"].to_numpy()
+        tier_conditions = [
+            (scores >= tier["min_score"]) if tier.get("max_score") is None
+            else (scores >= tier["min_score"]) & (scores <= tier["max_score"])
+            for tier in sorted_tiers
+        ]
+        result_df["프로모션등급"] = np.select(
+            tier_conditions, [tier["name"] for tier in sorted_tiers], default="대상 제외"
+        ) if sorted_tiers else "대상 제외"
+    else:
+        # 건수별/금액별은 최소 기준치 충족 여부만 표시
+        result_df["프로모션대상"] = np.where(result_df["승인건수"] >= min_criteria, "Y", "N")
+
+    # 컬럼 순서 재정렬
+    if analysis_mode == "제품별":
+        columns = ["순위", "상담사", "안마의자", "라클라우드", "정수기"]
+        if include_services:
+            columns.extend(["더케어", "멤버십"])
+        columns.extend(["승인건수", "승인액", "점수", "프로모션등급"])
+    else:
+        columns = ["순위", "상담사", "안마의자", "라클라우드", "정수기"]
+        if include_services:
+            columns.extend(["더케어", "멤버십"])
+        columns.extend(["승인건수", "승인액", "프로모션대상"])
+
+    return result_df[columns]
+
+
 def analyze_promotion_data_new(
     df: pd.DataFrame,
     analysis_mode: str,  # "제품별" | "건수별" | "금액별"
@@ -187,7 +716,10 @@ def analyze_promotion_data_new(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     include_online: bool = False,  # 온라인파트 포함 여부
-    include_indirect: bool = False  # 연계승인 포함 여부 (기본값: False, 직접승인만)
+    include_indirect: bool = False,  # 연계승인 포함 여부 (기본값: False, 직접승인만)
+    rank_method: str = "competition",  # 동점 순위 방식 (promotion_ranking_logic.RANK_METHODS)
+    backend: str = "pandas",  # 분류/집계 백엔드 (analysis_backend_logic.ANALYSIS_BACKENDS)
+    tie_breakers: Optional[List[Tuple[str, bool]]] = None  # 동점 해소 기준 [(컬럼, 오름차순 여부)]
 ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
     새로운 프로모션 분석 함수
@@ -203,157 +735,29 @@ def analyze_promotion_data_new(
         end_date: 종료 날짜
         include_online: 온라인파트 포함 여부 (기본값: False, CRM파트만)
         include_indirect: 연계승인 포함 여부 (기본값: False, 직접승인만)
+        rank_method: 동점 순위 방식 (기본값: "competition", 동점은 같은 순위, "ordinal"은 정렬 순서대로 순번)
+        backend: 분류/집계 백엔드 (기본값: "pandas", "polars"는 설치된 경우만 사용)
+        tie_breakers: 동점 해소 기준 [(컬럼, 오름차순 여부)] (None이면 분석 기준별 기본값)
 
     Returns:
         Tuple[Optional[pd.DataFrame], Optional[str], Optional[pd.DataFrame]]:
             결과 데이터프레임, 오류 메시지, 필터링된 원본 데이터
     """
     try:
-        # 데이터 복사
-        filtered_df = df.copy()
-        original_filtered_df = None  # 필터링된 원본 데이터 저장용
-
-        # 날짜 범위 필터링
-        if start_date and end_date:
-            if "주문 일자" in filtered_df.columns:
-                if not pd.api.types.is_datetime64_any_dtype(filtered_df["주문 일자"]):
-                    filtered_df["주문 일자"] = pd.to_datetime(filtered_df["주문 일자"], errors='coerce')
-                filtered_df = filtered_df[(filtered_df["주문 일자"] >= start_date) &
-                                         (filtered_df["주문 일자"] <= end_date)]
-
-        # 판매 인입경로 필터링 (직접승인/연계승인)
-        if "판매 인입경로" in filtered_df.columns:
-            if not include_indirect:
-                # 직접승인만 포함 (판매 인입경로가 CRM인 경우만)
-                filtered_df = filtered_df[
-                    filtered_df["판매 인입경로"].astype(str).str.contains("CRM|crm", case=False, na=False)
-                ]
-            # include_indirect=True이면 필터링 없이 전체 포함
-
-        # 상담사 조직 필터링
-        if "상담사 조직" in filtered_df.columns:
-            if not include_online:
-                # CRM파트만 포함 (온라인파트 제외)
-                # "CRM팀", "CRM파트" 등 다양한 명칭 포함
-                filtered_df = filtered_df[
-                    filtered_df["상담사 조직"].astype(str).str.contains("CRM|crm", case=False, na=False)
-                ]
-
-        # 제품 분류 컬럼 추가
-        filtered_df["제품분류"] = filtered_df.apply(classify_product, axis=1)
-
-        # 필터링된 원본 데이터 저장 (엑셀 다운로드용)
-        original_filtered_df = filtered_df.copy()
-
-        # 상담사별 집계
-        result_data = []
-        consultants = filtered_df["상담사"].unique()
-
-        for consultant in consultants:
-            consultant_df = filtered_df[filtered_df["상담사"] == consultant]
-
-            # 제품별 건수 집계
-            product_counts = {}
-            for product in ["안마의자", "라클라우드", "정수기", "더케어", "멤버십"]:
-                count = len(consultant_df[consultant_df["제품분류"] == product])
-                product_counts[product] = count
-
-            # 총 승인 건수 및 승인액
-            if include_services:
-                # 서비스 포함 시 모든 제품 카운트
-                total_count = sum(product_counts.values())
-            else:
-                # 서비스 제외 시 안마의자, 라클라우드, 정수기만
-                total_count = (product_counts["안마의자"] +
-                             product_counts["라클라우드"] +
-                             product_counts["정수기"])
-
-            total_amount = consultant_df["매출 금액"].sum()
-
-            # 제품별 점수 계산 (제품별 기준인 경우)
-            product_score = 0
-            if analysis_mode == "제품별":
-                for product, count in product_counts.items():
-                    weight = product_weights.get(product, 0)
-                    product_score += count * weight
-
-            # 결과 딕셔너리
-            result_dict = {
-                "상담사": consultant,
-                "안마의자": product_counts["안마의자"],
-                "라클라우드": product_counts["라클라우드"],
-                "정수기": product_counts["정수기"],
-                "더케어": product_counts["더케어"],
-                "멤버십": product_counts["멤버십"],
-                "승인건수": total_count,
-                "승인액": total_amount
-            }
-
-            # 제품별 모드인 경우 점수 추가
-            if analysis_mode == "제품별":
-                result_dict["점수"] = product_score
-
-            result_data.append(result_dict)
+        # 1~2단계: 필터링 및 건수 행렬 (입력이 같으면 캐시 사용)
+        original_filtered_df, matrix = get_promotion_matrix(
+            df, start_date, end_date, include_online, include_indirect, backend
+        )
 
         # 결과 없음
-        if not result_data:
+        if original_filtered_df.empty:
             return None, "조건에 맞는 상담사가 없습니다.", original_filtered_df
 
-        # 데이터프레임 생성
-        result_df = pd.DataFrame(result_data)
-
-        # 정렬 기준 설정
-        if analysis_mode == "제품별":
-            # 1차: 점수, 2차: 승인액
-            result_df = result_df.sort_values(by=["점수", "승인액"], ascending=[False, False])
-        elif analysis_mode == "금액별":
-            # 1차: 승인액, 2차: 승인건수
-            result_df = result_df.sort_values(by=["승인액", "승인건수"], ascending=[False, False])
-        else:  # 건수별
-            # 1차: 승인건수, 2차: 승인액
-            result_df = result_df.sort_values(by=["승인건수", "승인액"], ascending=[False, False])
-
-        # 순위 부여
-        result_df["순위"] = range(1, len(result_df) + 1)
-
-        # 프로모션 대상 판정
-        if analysis_mode == "제품별":
-            # 점수 구간에 따른 등급 판정
-            def get_tier(score):
-                for tier in sorted(promotion_tiers, key=lambda x: x["min_score"], reverse=True):
-                    min_score = tier["min_score"]
-                    max_score = tier.get("max_score")
-
-                    if max_score is None:
-                        # 최대값이 없으면 min_score 이상인 경우
-                        if score >= min_score:
-                            return tier["name"]
-                    else:
-                        # 범위 확인
-                        if min_score <= score <= max_score:
-                            return tier["name"]
-                return "대상 제외"
-
-            result_df["프로모션등급"] = result_df["점수"].apply(get_tier)
-        else:
-            # 건수별/금액별은 최소 기준치 충족 여부만 표시
-            result_df["프로모션대상"] = result_df["승인건수"].apply(
-                lambda x: "Y" if x >= min_criteria else "N"
-            )
-
-        # 컬럼 순서 재정렬
-        if analysis_mode == "제품별":
-            columns = ["순위", "상담사", "안마의자", "라클라우드", "정수기"]
-            if include_services:
-                columns.extend(["더케어", "멤버십"])
-            columns.extend(["승인건수", "승인액", "점수", "프로모션등급"])
-        else:
-            columns = ["순위", "상담사", "안마의자", "라클라우드", "정수기"]
-            if include_services:
-                columns.extend(["더케어", "멤버십"])
-            columns.extend(["승인건수", "승인액", "프로모션대상"])
-
-        result_df = result_df[columns]
+        # 3단계: 점수/정렬/등급 (가중치, 등급, 기준치 변경 시 이 단계만 재실행)
+        result_df = score_promotion_matrix(
+            matrix, analysis_mode, product_weights, include_services, min_criteria, promotion_tiers,
+            rank_method=rank_method, tie_breakers=tie_breakers
+        )
 
         return result_df, None, original_filtered_df
 
@@ -373,7 +777,11 @@ def analyze_promotion_data(
     end_date: Optional[datetime] = None,    # 날짜 범위 끝
     promotion_type: str = "포상금",         # 프로모션 유형: "포상금" 또는 "추첨권"
     reward_config: List[Dict[str, int]] = None,  # 포상금 설정 리스트 [{"amount": 금액, "count": 인원수}, ...]
-    lottery_weights: Dict[str, int] = None  # 제품별 추첨권 가중치
+    lottery_weights: Dict[str, int] = None,  # 제품별 추첨권 가중치
+    rank_method: str = "competition",  # 동점 순위 방식 (promotion_ranking_logic.RANK_METHODS)
+    split_ties: bool = True,  # 포상 구간 경계에 걸친 동점자 포상금 분할 여부
+    tie_breakers: Optional[List[Tuple[str, bool]]] = None,  # 동점 해소 기준 [(컬럼, 오름차순 여부)]
+    lottery_count_config: Optional[List[Dict[str, int]]] = None  # 승인 건수 구간별 추첨권 [{"min_count": 건수, "tickets": 장수}, ...]
 ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
     커스텀 프로모션 기준에 따라 상담사별 실적을 분석하는 함수
@@ -391,54 +799,46 @@ def analyze_promotion_data(
         promotion_type: 프로모션 유형 ("포상금" 또는 "추첨권")
         reward_config: 포상금 설정 리스트 [{"amount": 금액, "count": 인원수}, ...]
         lottery_weights: 제품별 추첨권 가중치 (예: {"안마의자": 3, "라클라우드": 2, "정수기": 1})
+        rank_method: 동점 순위 방식 ("competition" | "modified" | "dense" | "ordinal", 기본값: "competition")
+        split_ties: 포상 구간 경계에 걸친 동점자 포상금 분할 여부
+        tie_breakers: 기준 목록 뒤에 적용할 동점 해소 기준 [(컬럼, 오름차순 여부)] (예: [("상담사", True)])
+        lottery_count_config: 승인 건수 기반 추첨권 구간 (있으면 제품별 가중치 대신 도달한 가장 높은 구간의 장수)
         
     Returns:
         Tuple[Optional[pd.DataFrame], Optional[str]]: 결과 데이터프레임과 오류 메시지(있는 경우)
     """
     try:
-        # 데이터 필터링
-        filtered_df = df.copy()
-        
-        # 날짜 기준 필터링 (주문 일자)
+        # 데이터 필터링 (날짜 기준 + 옵션에 따라 직접 판매만)
+        spec = ALL_ROWS
         if start_date is not None and end_date is not None:
-            if "주문 일자" in filtered_df.columns:
-                # datetime 형식 확인
-                if not pd.api.types.is_datetime64_any_dtype(filtered_df["주문 일자"]):
-                    filtered_df["주문 일자"] = pd.to_datetime(filtered_df["주문 일자"], errors='coerce')
-                
-                # 시작일과 종료일 포함하여 필터링
-                filtered_df = filtered_df[(filtered_df["주문 일자"] >= start_date) & 
-                                         (filtered_df["주문 일자"] <= end_date)]
-        
-        # 1. 직접 판매만 필터링 (옵션에 따라)
+            spec &= date_between("주문 일자", start_date, end_date)
         if direct_only:
-            filtered_df = filtered_df[filtered_df["판매 인입경로"].astype(str).str.contains("CRM", case=False)]
+            spec &= CRM_INFLOW
+        filtered_df = df[compile_mask(df, spec)].copy()
         
         # 2. 제품 카테고리 필터링
-        product_mask = pd.Series(False, index=filtered_df.index)
+        product_mask = np.zeros(len(filtered_df), dtype=bool)
         for product in include_products:
-            product_mask |= filtered_df["대분류"].astype(str).str.contains(product, case=False)
+            product_mask |= contains(filtered_df, "대분류", product, case=False)
+        
+        # 서비스 품목 마스크 (더케어: 대분류 안마의자 + 판매 유형 "케어", 멤버십: 대분류 정수기 + 판매 유형 "멤버십")
+        is_anma = contains(filtered_df, "대분류", "안마의자", case=False)
+        is_lacloud = contains(filtered_df, "대분류", "라클라우드", case=False)
+        is_water = contains(filtered_df, "대분류", "정수기", case=False)
+        care_mask = is_anma & contains(filtered_df, "판매 유형", "케어", case=False)
+        membership_mask = is_water & contains(filtered_df, "판매 유형", "멤버십|멤버쉽", case=False)
         
         # 3. 서비스 품목 처리
         # 서비스 품목을 포함하지 않는 경우
         if not include_services:
-            # 더케어 필터링 (대분류가 안마의자이고 판매 유형에 "케어"가 포함된 것 제외)
-            care_mask = (
-                filtered_df["대분류"].astype(str).str.contains("안마의자", case=False) & 
-                filtered_df["판매 유형"].astype(str).str.contains("케어", case=False)
-            )
-            
-            # 멤버십 필터링 (대분류가 정수기이고 판매 유형에 "멤버십"이 포함된 것 제외)
-            membership_mask = (
-                filtered_df["대분류"].astype(str).str.contains("정수기", case=False) & 
-                filtered_df["판매 유형"].astype(str).str.contains("멤버십|멤버쉽", case=False)
-            )
-            
             # 서비스 품목이 아닌 것만 유지
-            filtered_df = filtered_df[~(care_mask | membership_mask) & product_mask]
+            keep_mask = ~(care_mask | membership_mask) & product_mask
         else:
             # 서비스 품목 포함 시에는 선택된 제품 카테고리만 필터링
-            filtered_df = filtered_df[product_mask]
+            keep_mask = product_mask
+        filtered_df = filtered_df[keep_mask]
+        is_anma, is_lacloud, is_water = is_anma[keep_mask], is_lacloud[keep_mask], is_water[keep_mask]
+        care_mask, membership_mask = care_mask[keep_mask], membership_mask[keep_mask]
         
         # 4. 상담사별 실적 집계
         result_data = []
@@ -448,51 +848,34 @@ def analyze_promotion_data(
         
         for consultant in consultants:
             # 해당 상담사의 데이터 추출
-            consultant_df = filtered_df[filtered_df["상담사"] == consultant]
-            
-            # 서비스 품목 마스크 먼저 생성
-            care_mask = (
-                consultant_df["대분류"].astype(str).str.contains("안마의자", case=False) & 
-                consultant_df["판매 유형"].astype(str).str.contains("케어", case=False)
-            )
-            
-            membership_mask = (
-                consultant_df["대분류"].astype(str).str.contains("정수기", case=False) & 
-                consultant_df["판매 유형"].astype(str).str.contains("멤버십|멤버쉽", case=False)
-            )
+            consultant_rows = (filtered_df["상담사"] == consultant).to_numpy()
             
             # 서비스 품목 건수
-            care_count = len(consultant_df[care_mask])
-            membership_count = len(consultant_df[membership_mask])
+            care_count = int((care_mask & consultant_rows).sum())
+            membership_count = int((membership_mask & consultant_rows).sum())
             
             # 제품별 건수 - 서비스 제외하고 계산
-            anma_count = len(consultant_df[
-                consultant_df["대분류"].astype(str).str.contains("안마의자", case=False) & 
-                ~care_mask  # 케어 서비스가 아닌 안마의자만 카운트
-            ])
-            
-            lacloud_count = len(consultant_df[
-                consultant_df["대분류"].astype(str).str.contains("라클라우드", case=False)
-            ])
-            
-            water_count = len(consultant_df[
-                consultant_df["대분류"].astype(str).str.contains("정수기", case=False) & 
-                ~membership_mask  # 멤버십이 아닌 정수기만 카운트
-            ])
+            anma_count = int((is_anma & ~care_mask & consultant_rows).sum())  # 케어 서비스가 아닌 안마의자만 카운트
+            lacloud_count = int((is_lacloud & consultant_rows).sum())
+            water_count = int((is_water & ~membership_mask & consultant_rows).sum())  # 멤버십이 아닌 정수기만 카운트
             
             # 총 승인 건수
-            total_count = len(consultant_df)
+            total_count = int(consultant_rows.sum())
             
             # 총 매출액
-            total_amount = consultant_df["매출 금액"].sum()
+            total_amount = filtered_df["매출 금액"][consultant_rows].sum()
             
             # 최소 조건 확인
             if total_count < min_condition:
                 continue
                 
-            # 추첨권 계산 (추첨권 프로모션인 경우)
+            # 추첨권 계산 (추첨권 프로모션인 경우, 승인 건수 구간 설정이 있으면 구간별 장수)
             lottery_tickets = 0
-            if promotion_type == "추첨권" and lottery_weights:
+            if promotion_type == "추첨권" and lottery_count_config:
+                # 도달한 구간 중 기준 건수가 가장 높은 구간 하나만 적용
+                reached = [config for config in lottery_count_config if total_count >= config["min_count"]]
+                lottery_tickets = max(reached, key=lambda config: config["min_count"])["tickets"] if reached else 0
+            elif promotion_type == "추첨권" and lottery_weights:
                 lottery_tickets = (
                     anma_count * lottery_weights.get("안마의자", 0) +
                     lacloud_count * lottery_weights.get("라클라우드", 0) +
@@ -548,30 +931,23 @@ def analyze_promotion_data(
             sort_columns.append("추첨권")
             ascending_values.append(False)  # 내림차순
         
-        # 정렬
-        if sort_columns:
-            result_df = result_df.sort_values(by=sort_columns, ascending=ascending_values)
-        
-        # 순위 부여
-        result_df["순위"] = range(1, len(result_df) + 1)
+        # 정렬 및 순위 부여 (동점 처리 방식은 rank_method, 기준 목록 뒤에 동점 해소 기준 적용)
+        sort_columns, ascending_values = ranking_keys(
+            sort_columns, ascending_values,
+            [(column, direction) for column, direction in tie_breakers or [] if column in result_df.columns]
+        )
+        result_df = rank_results(result_df, sort_columns, ascending_values, method=rank_method)
         
         # 포상금 결정 (포상금 프로모션인 경우)
         if promotion_type == "포상금" and reward_config:
-            # 등수 범위별 포상금액 적용
-            def get_reward_amount(rank):
-                current_pos = 1
-                for config in reward_config:
-                    amount = config["amount"]
-                    count = config["count"]
-                    if current_pos <= rank <= current_pos + count - 1:
-                        return f"{amount:,d}원"
-                    current_pos += count
-                return "N"
-            
-            result_df["포상금"] = result_df["순위"].apply(get_reward_amount)
+            # 등수 범위별 포상금액 적용 (구간 경계에 걸친 동점자는 split_ties에 따라 분할)
+            reward_amounts, in_band = allocate_rewards(
+                result_df, sort_columns, reward_config, method=rank_method, split_ties=split_ties
+            )
+            result_df["포상금"] = format_reward(reward_amounts, in_band)
         else:
             # 추첨권 프로모션 또는 포상금 설정이 없는 경우 포상 획득 여부만 표시
-            result_df["포상획득여부"] = result_df["순위"].apply(lambda x: "Y" if x <= reward_positions else "N")
+            result_df["포상획득여부"] = np.where(result_df["순위"] <= reward_positions, "Y", "N")
         
         # 컬럼 순서 재정렬
         columns = ["순위", "상담사"]
@@ -630,7 +1006,7 @@ def create_promotion_excel(result_df: pd.DataFrame, original_df: pd.DataFrame, a
 
         # 결과 데이터를 순위별로 정렬 (순위 컬럼이 있는 경우)
         if '순위' in result_df.columns:
-            result_df = result_df.sort_values('순위').reset_index(drop=True)
+            result_df = result_df.sort_values('순위', kind='stable').reset_index(drop=True)
 
         with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
             # 워크북 객체 먼저 가져오기
@@ -0,0 +1,297 @@
+"""
+추첨권 프로모션 추첨 비즈니스 로직
+
+이 모듈은 상담사별 추첨권 수를 가중치로 하는 추첨(시드 고정 재현 가능),
+추첨 전 당첨 확률 몬테카를로 추정, 감사용 추첨 로그 내보내기 로직을 포함합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from io import BytesIO
+import hashlib
+from datetime import datetime
+from typing import Tuple, Optional
+
+
+def build_ticket_table(
+    result_df: pd.DataFrame,
+    ticket_column: str = "추첨권",
+    name_column: str = "상담사"
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    분석 결과에서 추첨 대상(추첨권 1장 이상) 테이블을 만듭니다.
+
+    Args:
+        result_df: 프로모션 분석 결과 데이터프레임
+        ticket_column: 추첨권 수 컬럼 (제품별 분석은 "점수" 사용 가능)
+        name_column: 상담사 컬럼
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], Optional[str]]: [상담사, 추첨권] 데이터프레임과 오류 메시지
+    """
+    if result_df is None or result_df.empty:
+        return None, "추첨할 데이터가 없습니다."
+
+    if ticket_column not in result_df.columns or name_column not in result_df.columns:
+        return None, f"{name_column}, {ticket_column} 컬럼이 필요합니다."
+
+    tickets = pd.DataFrame({
+        "상담사": result_df[name_column].astype(str).to_numpy(),
+        "추첨권": pd.to_numeric(result_df[ticket_column], errors="coerce").fillna(0).to_numpy()
+    })
+
+    # 추첨권은 정수 장 수 (소수점 이하 버림), 0장 이하는 추첨 대상 제외
+    tickets["추첨권"] = np.floor(tickets["추첨권"]).astype(int)
+    tickets = tickets[tickets["추첨권"] > 0].reset_index(drop=True)
+
+    if tickets.empty:
+        return None, "추첨권을 보유한 상담사가 없습니다."
+
+    return tickets, None
+
+
+def ticket_table_fingerprint(tickets: pd.DataFrame) -> str:
+    """
+    추첨 입력(상담사, 추첨권)의 SHA-256 지문을 계산합니다. (추첨 로그 검증용)
+
+    Args:
+        tickets: build_ticket_table 결과
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    payload = "\n".join(f"{name}\t{count}" for name, count in zip(tickets["상담사"], tickets["추첨권"]))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def draw_lottery(
+    tickets: pd.DataFrame,
+    n_winners: int,
+    seed: int,
+    with_replacement: bool = False
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    추첨권 수에 비례하는 가중 추첨을 수행합니다. (누적합 + searchsorted 방식)
+
+    회차마다 [0, 남은 총 추첨권) 구간의 난수를 하나 뽑고, 상담사별 누적 추첨권 구간에서
+    난수가 속한 상담사를 당첨자로 정합니다. 같은 입력과 시드이면 항상 같은 결과가 나옵니다.
+
+    Args:
+        tickets: build_ticket_table 결과 [상담사, 추첨권]
+        n_winners: 당첨자 수 (추첨 회차 수)
+        seed: 난수 시드
+        with_replacement: True면 중복 당첨 허용, False면 당첨자는 이후 회차에서 제외
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], Optional[str]]: 회차별 추첨 로그와 오류 메시지
+    """
+    try:
+        if tickets is None or tickets.empty:
+            return None, "추첨권을 보유한 상담사가 없습니다."
+
+        if n_winners <= 0:
+            return None, "당첨자 수는 1명 이상이어야 합니다."
+
+        if not with_replacement and n_winners > len(tickets):
+            return None, f"중복 당첨 없이 추첨할 수 있는 최대 인원은 {len(tickets)}명입니다."
+
+        rng = np.random.default_rng(seed)
+        names = tickets["상담사"].to_numpy()
+        weights = tickets["추첨권"].to_numpy(dtype=np.int64).copy()
+
+        log_rows = []
+        for draw_no in range(1, n_winners + 1):
+            cumulative = np.cumsum(weights)
+            total_tickets = int(cumulative[-1])
+
+            # 0 ~ (남은 총 추첨권 - 1) 중 당첨 추첨권 번호
+            ticket_no = int(rng.integers(0, total_tickets))
+            winner = int(np.searchsorted(cumulative, ticket_no, side="right"))
+
+            log_rows.append({
+                "회차": draw_no,
+                "당첨번호": ticket_no + 1,
+                "총추첨권": total_tickets,
+                "구간시작": int(cumulative[winner] - weights[winner]) + 1,
+                "구간끝": int(cumulative[winner]),
+                "당첨자": names[winner],
+                "당첨자추첨권": int(weights[winner]),
+                "당첨확률": weights[winner] / total_tickets
+            })
+
+            if not with_replacement:
+                weights[winner] = 0
+
+        return pd.DataFrame(log_rows), None
+
+    except Exception as e:
+        return None, f"추첨 중 오류: {str(e)}"
+
+
+def _sample_with_replacement(rng: np.random.Generator, cumulative: np.ndarray,
+                             size: int, n_draws: int) -> np.ndarray:
+    """누적 추첨권 구간에 난수 행렬을 searchsorted 하여 (size × n_draws) 당첨자 인덱스를 반환합니다."""
+    return np.searchsorted(cumulative, rng.random((size, n_draws)) * cumulative[-1], side="right")
+
+
+def _distinct_per_row(winners: np.ndarray) -> np.ndarray:
+    """각 행(시뮬레이션)에서 중복을 제거한 당첨자 인덱스를 1차원 배열로 반환합니다."""
+    if winners.shape[1] == 1:
+        return winners.ravel()
+    sorted_winners = np.sort(winners, axis=1)
+    distinct = np.ones(sorted_winners.shape, dtype=bool)
+    distinct[:, 1:] = sorted_winners[:, 1:] != sorted_winners[:, :-1]
+    return sorted_winners[distinct]
+
+
+def _sample_without_replacement(rng: np.random.Generator, weights: np.ndarray, cumulative: np.ndarray,
+                                size: int, n_winners: int) -> np.ndarray:
+    """
+    중복 없는 순차 가중 추첨을 (size × n_winners) 당첨자 인덱스로 샘플링합니다.
+
+    상담사별 지수분포 키(E / 추첨권)가 작은 n_winners명을 고르며, 회차별 순차 추첨과 분포가 같습니다.
+    재추첨이 없으므로 추첨권이 한 상담사에게 몰려 있어도 시뮬레이션 수에 비례하는 시간에 끝납니다.
+    """
+    n_candidates = len(weights)
+    if n_winners == 1:
+        return _sample_with_replacement(rng, cumulative, size, 1)
+
+    if n_winners == n_candidates:
+        return np.broadcast_to(np.arange(n_candidates), (size, n_candidates))
+
+    keys = rng.standard_exponential((size, n_candidates)) / weights
+    return np.argpartition(keys, n_winners - 1, axis=1)[:, :n_winners]
+
+
+def estimate_win_probabilities(
+    tickets: pd.DataFrame,
+    n_winners: int,
+    n_simulations: int = 1000000,
+    seed: Optional[int] = None,
+    with_replacement: bool = False,
+    chunk_size: int = 100000
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    추첨 전 상담사별 당첨 확률을 몬테카를로 시뮬레이션으로 추정합니다.
+
+    - 중복 허용: 누적합 구간에 난수 행렬을 한 번에 searchsorted
+    - 중복 없음: 지수분포 키 방식으로 회차별 순차 추첨과 같은 분포를 청크 단위로 샘플링
+
+    Args:
+        tickets: build_ticket_table 결과 [상담사, 추첨권]
+        n_winners: 당첨자 수
+        n_simulations: 시뮬레이션 추첨 횟수
+        seed: 난수 시드
+        with_replacement: 중복 당첨 허용 여부
+        chunk_size: 한 번에 처리할 시뮬레이션 수 (메모리 사용량 제한)
+
+    Returns:
+        Tuple[Optional[pd.DataFrame], Optional[str]]:
+            [상담사, 추첨권, 추첨권비율, 당첨확률, 기대당첨횟수] 데이터프레임과 오류 메시지
+    """
+    try:
+        if tickets is None or tickets.empty:
+            return None, "추첨권을 보유한 상담사가 없습니다."
+
+        n_candidates = len(tickets)
+        if n_winners <= 0 or (not with_replacement and n_winners > n_candidates):
+            return None, "당첨자 수가 올바르지 않습니다."
+
+        rng = np.random.default_rng(seed)
+        weights = tickets["추첨권"].to_numpy(dtype=float)
+        cumulative = np.cumsum(weights)
+
+        win_any = np.zeros(n_candidates, dtype=np.int64)  # 1회 이상 당첨된 시뮬레이션 수
+        win_total = np.zeros(n_candidates, dtype=np.int64)  # 총 당첨 횟수
+
+        remaining = n_simulations
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            remaining -= size
+
+            if with_replacement:
+                winners = _sample_with_replacement(rng, cumulative, size, n_winners)
+                win_total += np.bincount(winners.ravel(), minlength=n_candidates)
+                win_any += np.bincount(_distinct_per_row(winners), minlength=n_candidates)
+            else:
+                winners = _sample_without_replacement(rng, weights, cumulative, size, n_winners)
+                counts = np.bincount(winners.ravel(), minlength=n_candidates)
+                win_any += counts
+                win_total += counts
+
+        probabilities = tickets[["상담사", "추첨권"]].copy()
+        probabilities["추첨권비율"] = weights / cumulative[-1]
+        probabilities["당첨확률"] = win_any / n_simulations
+        probabilities["기대당첨횟수"] = win_total / n_simulations
+        probabilities = probabilities.sort_values(
+            by=["당첨확률", "추첨권"], ascending=[False, False]
+        ).reset_index(drop=True)
+
+        return probabilities, None
+
+    except Exception as e:
+        return None, f"당첨 확률 추정 중 오류: {str(e)}"
+
+
+def create_lottery_log_excel(
+    draw_log: pd.DataFrame,
+    tickets: pd.DataFrame,
+    seed: int,
+    with_replacement: bool,
+    probabilities: Optional[pd.DataFrame] = None
+) -> Optional[bytes]:
+    """
+    추첨 로그를 감사용 엑셀 파일로 생성합니다.
+
+    시트 구성: 추첨정보(시드, 방식, 입력 지문), 추첨로그, 추첨권현황, (선택) 당첨확률
+
+    Args:
+        draw_log: draw_lottery 결과
+        tickets: 추첨에 사용한 추첨권 테이블
+        seed: 추첨 시드
+        with_replacement: 중복 당첨 허용 여부
+        probabilities: estimate_win_probabilities 결과 (선택)
+
+    Returns:
+        Optional[bytes]: 엑셀 바이너리 데이터
+    """
+    try:
+        output = BytesIO()
+
+        info_df = pd.DataFrame([
+            ("추첨일시", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ("난수 시드", str(seed)),
+            ("추첨 방식", "중복 당첨 허용" if with_replacement else "중복 당첨 없음"),
+            ("난수 생성기", f"numpy.random.default_rng (numpy {np.__version__})"),
+            ("추첨 대상 인원", f"{len(tickets)}명"),
+            ("총 추첨권", f"{int(tickets['추첨권'].sum()):,}장"),
+            ("입력 지문 (SHA-256)", ticket_table_fingerprint(tickets))
+        ], columns=["항목", "값"])
+
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            workbook = writer.book
+            header_format = workbook.add_format({
+                'bold': True,
+                'bg_color': '#4472C4',
+                'font_color': 'white',
+                'border': 1,
+                'align': 'center'
+            })
+
+            sheets = [("추첨정보", info_df), ("추첨로그", draw_log), ("추첨권현황", tickets)]
+            if probabilities is not None:
+                sheets.append(("당첨확률", probabilities))
+
+            for sheet_name, sheet_df in sheets:
+                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                worksheet = writer.sheets[sheet_name]
+                for col_idx, col_name in enumerate(sheet_df.columns):
+                    worksheet.write(0, col_idx, col_name, header_format)
+                    worksheet.set_column(col_idx, col_idx, 70 if col_name == "값" else 14)
+
+        return output.getvalue()
+
+    except Exception as e:
+        print(f"추첨 로그 엑셀 생성 중 오류: {str(e)}")
+        return None
@@ -0,0 +1,231 @@
+"""
+프로모션 순위 / 포상금 배분 비즈니스 로직
+
+이 모듈은 프로모션 결과의 동점 처리 순위(competition, modified, dense, ordinal),
+동점 해소 기준(tie_breakers), 포상금 구간(reward_config) 배분 로직을 포함합니다.
+analyze_promotion_data와 analyze_promotion_data_new가 함께 사용합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Tuple, Dict, List, Optional
+
+# 순위 방식
+# - competition: 동점은 같은 순위, 다음 순위는 건너뜀 (1, 2, 2, 4) (기본값)
+# - modified: 동점은 그룹의 마지막 순위 (1, 3, 3, 4)
+# - dense: 동점은 같은 순위, 다음 순위는 이어짐 (1, 2, 2, 3)
+# - ordinal: 동점이어도 정렬 순서대로 1, 2, 3, 4 (명시적으로 선택한 경우만)
+RANK_METHODS = {
+    "competition": "공동 순위 (1,2,2,4)",
+    "modified": "공동 순위 - 하위 (1,3,3,4)",
+    "dense": "연속 순위 (1,2,2,3)",
+    "ordinal": "순번 (동점 무시)"
+}
+
+# 같은 동작의 이전 이름 (예전에 저장된 설정 호환)
+RANK_METHOD_ALIASES = {"min": "competition"}
+
+DEFAULT_RANK_METHOD = "competition"
+
+
+# 동점 해소 기준 후보 {컬럼: 표시 이름} (결과에 있는 컬럼만 사용)
+TIE_BREAKER_COLUMNS = {
+    "승인액": "승인액",
+    "승인건수": "승인건수",
+    "점수": "점수",
+    "누적승인(액)": "누적승인(액)",
+    "누적승인(건)": "누적승인(건)",
+    "추첨권": "추첨권",
+    "안마의자": "안마의자 건수",
+    "라클라우드": "라클라우드 건수",
+    "정수기": "정수기 건수",
+    "상담사": "상담사 이름"
+}
+
+
+def resolve_rank_method(method: Optional[str]) -> str:
+    """
+    순위 방식 이름을 RANK_METHODS의 키로 바꿉니다. (이전 이름은 같은 동작의 키로, 없으면 기본값)
+
+    Args:
+        method: 순위 방식 이름 (예: "min", "competition", None)
+
+    Returns:
+        str: RANK_METHODS의 키 (예: "competition")
+    """
+    if not method:
+        return DEFAULT_RANK_METHOD
+    return RANK_METHOD_ALIASES.get(method, method)
+
+
+def ranking_keys(
+    sort_columns: List[str],
+    ascending: Optional[List[bool]] = None,
+    tie_breakers: Optional[List[Tuple[str, bool]]] = None
+) -> Tuple[List[str], List[bool]]:
+    """
+    정렬 기준 뒤에 동점 해소 기준을 순서대로 붙인 정렬(동점 판정) 컬럼과 방향을 반환합니다.
+
+    이미 정렬 기준에 있는 컬럼은 동점 해소 기준에서 건너뜁니다.
+
+    Args:
+        sort_columns: 정렬 컬럼 목록 (예: ["승인건수"])
+        ascending: 컬럼별 오름차순 여부 (기본값: 모두 내림차순)
+        tie_breakers: [(컬럼, 오름차순 여부)] 동점 해소 기준 (앞쪽이 우선)
+
+    Returns:
+        Tuple[List[str], List[bool]]: 정렬 컬럼 목록, 컬럼별 오름차순 여부
+    """
+    columns = list(sort_columns)
+    directions = list(ascending) if ascending is not None else [False] * len(columns)
+    for column, column_ascending in tie_breakers or []:
+        if column not in columns:
+            columns.append(column)
+            directions.append(bool(column_ascending))
+    return columns, directions
+
+
+def _tie_group_bounds(sorted_df: pd.DataFrame, sort_columns: List[str], method: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정렬된 데이터프레임의 동점 그룹 시작 위치(1부터)와 그룹 크기를 행별로 반환합니다.
+
+    Args:
+        sorted_df: 정렬 기준으로 정렬된 데이터프레임
+        sort_columns: 정렬(동점 판정) 컬럼 목록
+        method: 순위 방식 (ordinal이면 모든 행이 크기 1인 그룹)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 행별 그룹 시작 위치, 행별 그룹 크기
+    """
+    n_rows = len(sorted_df)
+    positions = np.arange(1, n_rows + 1)
+
+    if method == "ordinal" or not sort_columns or n_rows == 0:
+        return positions, np.ones(n_rows, dtype=np.int64)
+
+    # 이전 행과 정렬 키가 하나라도 다르면 새 그룹
+    keys = sorted_df[sort_columns]
+    new_group = keys.ne(keys.shift()).any(axis=1).to_numpy()
+    new_group[0] = True
+
+    group_ids = np.cumsum(new_group) - 1
+    group_starts = positions[new_group]
+    group_sizes = np.diff(np.append(group_starts, n_rows + 1))
+
+    return group_starts[group_ids], group_sizes[group_ids]
+
+
+def rank_results(
+    df: pd.DataFrame,
+    sort_columns: List[str],
+    ascending: Optional[List[bool]] = None,
+    method: str = DEFAULT_RANK_METHOD,
+    rank_column: str = "순위",
+    tie_breakers: Optional[List[Tuple[str, bool]]] = None
+) -> pd.DataFrame:
+    """
+    정렬 기준과 동점 해소 기준으로 정렬하고 순위 컬럼을 추가합니다.
+
+    정렬 기준과 동점 해소 기준 값이 모두 같은 행만 동점으로 보고,
+    동점 안에서는 원래 행 순서를 유지합니다. (안정 정렬)
+
+    Args:
+        df: 결과 데이터프레임
+        sort_columns: 정렬 컬럼 목록 (예: ["승인건수"])
+        ascending: 컬럼별 오름차순 여부 (기본값: 모두 내림차순)
+        method: 순위 방식 (RANK_METHODS 참고, 이전 이름 "min"도 허용)
+        rank_column: 순위 컬럼명
+        tie_breakers: [(컬럼, 오름차순 여부)] 동점 해소 기준 (앞쪽이 우선, 예: [("승인액", False), ("상담사", True)],
+            결과에 없는 컬럼은 무시)
+
+    Returns:
+        pd.DataFrame: 정렬 및 순위가 추가된 데이터프레임
+    """
+    method = resolve_rank_method(method)
+    if method not in RANK_METHODS:
+        raise ValueError(f"지원하지 않는 순위 방식입니다: {method}")
+
+    tie_breakers = [(column, direction) for column, direction in tie_breakers or [] if column in df.columns]
+    sort_columns, ascending = ranking_keys(sort_columns, ascending, tie_breakers)
+    if sort_columns:
+        df = df.sort_values(by=sort_columns, ascending=ascending, kind="stable")
+
+    group_starts, group_sizes = _tie_group_bounds(df, sort_columns, method)
+
+    if method == "dense":
+        df[rank_column] = np.cumsum(np.diff(np.append(0, group_starts)) > 0)
+    elif method == "modified":
+        df[rank_column] = group_starts + group_sizes - 1
+    else:
+        # ordinal은 그룹 크기가 1이므로 시작 위치가 곧 순번
+        df[rank_column] = group_starts
+
+    return df
+
+
+def allocate_rewards(
+    sorted_df: pd.DataFrame,
+    sort_columns: List[str],
+    reward_config: List[Dict[str, int]],
+    method: str = DEFAULT_RANK_METHOD,
+    split_ties: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    rank_results로 정렬된 결과에 포상금 구간을 배분합니다.
+
+    reward_config의 인원수 누적합을 구간 경계로 보고 정렬 위치를 searchsorted로 구간에 매핑합니다.
+    동점 그룹이 구간 경계에 걸치면:
+    - split_ties=True: 그룹이 차지하는 위치들의 포상금 합계를 그룹 인원이 나눠 가짐 (원 단위 버림)
+    - split_ties=False: 그룹 전원이 그룹 첫 위치의 포상금을 받음
+
+    Args:
+        sorted_df: rank_results 결과 데이터프레임
+        sort_columns: 동점 판정 컬럼 목록 (ranking_keys 결과, 동점 해소 기준 포함)
+        reward_config: 포상금 설정 리스트 [{"amount": 금액, "count": 인원수}, ...]
+        method: 순위 방식 (ordinal이면 동점 처리 없음)
+        split_ties: 구간 경계에 걸친 동점 그룹의 포상금 분할 여부
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 행별 포상금, 행별 포상 구간 포함 여부
+    """
+    n_rows = len(sorted_df)
+    if not reward_config or n_rows == 0:
+        return np.zeros(n_rows), np.zeros(n_rows, dtype=bool)
+
+    amounts = np.array([config["amount"] for config in reward_config], dtype=float)
+    boundaries = np.cumsum([config["count"] for config in reward_config])
+    total_positions = int(boundaries[-1])
+
+    group_starts, group_sizes = _tie_group_bounds(sorted_df, sort_columns, method)
+    in_band = group_starts <= total_positions
+
+    if split_ties:
+        # 위치별 포상금 누적합으로 그룹이 차지하는 위치들의 포상금 합계 계산
+        position_amounts = amounts[np.searchsorted(boundaries, np.arange(total_positions), side="right")]
+        prefix = np.concatenate([[0.0], np.cumsum(position_amounts)])
+        group_ends = np.minimum(group_starts + group_sizes - 1, total_positions)
+        group_begins = np.minimum(group_starts - 1, total_positions)
+        rewards = np.floor((prefix[group_ends] - prefix[group_begins]) / group_sizes)
+    else:
+        bands = np.searchsorted(boundaries, group_starts - 1, side="right")
+        rewards = np.where(in_band, amounts[np.minimum(bands, len(amounts) - 1)], 0.0)
+
+    return np.where(in_band, rewards, 0.0), in_band
+
+
+def format_reward(amounts: np.ndarray, in_band: np.ndarray) -> np.ndarray:
+    """
+    포상금 표시 문자열을 만듭니다. (구간 밖이면 "N")
+
+    Args:
+        amounts: 행별 포상금
+        in_band: 행별 포상 구간 포함 여부
+
+    Returns:
+        np.ndarray: "150,000원" 또는 "N"
+    """
+    return np.array([
+        f"{int(amount):,d}원" if included else "N"
+        for amount, included in zip(amounts, in_band)
+    ], dtype=object)
@@ -0,0 +1,357 @@
+"""
+프로모션 시나리오 비교 비즈니스 로직
+
+이 모듈은 여러 프로모션 설정(가중치, 등급 구간, 최소 기준, 포상금 테이블)을
+같은 상담사 × 제품 건수 행렬 위에서 한 번에 평가하여 비교하는 로직을 포함합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Tuple, Dict, List, Optional
+
+from logic.promotion_logic import PROMOTION_PRODUCTS, load_promotion_config
+
+# 기본 제품 / 서비스성 제품
+CORE_PRODUCTS = ["안마의자", "라클라우드", "정수기"]
+SERVICE_PRODUCTS = ["더케어", "멤버십"]
+
+# 시나리오 분석 기준 (promotion_config.json의 analysis_mode + 추첨권)
+SCENARIO_MODES = ["제품별", "건수별", "금액별", "추첨권"]
+
+# 추첨권 계산 방식 (제품별 가중치 합 / 승인 건수 구간별 장수)
+LOTTERY_METHODS = ["product_weight", "approval_count"]
+
+# data/promotion_config.json 형식의 분석 기준별 정렬 키 (앞쪽이 우선)
+SORT_KEYS_BY_MODE = {
+    "제품별": ["점수", "승인액"],
+    "건수별": ["승인건수", "승인액"],
+    "금액별": ["승인액", "승인건수"],
+    "추첨권": ["추첨권", "승인액"]
+}
+
+
+def normalize_promotion_scenario(name: str, config: Dict) -> Dict:
+    """
+    프로모션 설정을 시나리오 평가용 공통 형식으로 변환합니다.
+
+    지원 형식:
+    1. data/promotion_config.json 형식 (product_weights, promotion_tiers, minimum_criteria ...)
+       - 등급별 포상금은 promotion_tiers 항목의 "reward" 키(선택)로 지정
+       - 순위별 포상금은 "reward_table" 키(선택)로 지정 [{"amount": 금액, "count": 인원수}, ...]
+    2. promotion_configs/*.json 형식 ({"type": "reward"|"lottery", "data": ..., "settings": {...}})
+       - 추첨권은 "lottery_method"가 "approval_count"이면 "lottery_count_config" 구간
+         [{"min_count": 건수, "tickets": 장수}, ...] 중 도달한 가장 높은 구간의 장수를 받음
+
+    Args:
+        name: 시나리오 이름
+        config: 설정 딕셔너리
+
+    Returns:
+        Dict: 시나리오 딕셔너리
+            {"name", "mode", "products", "weights", "min_count", "tiers", "reward_table",
+             "lottery_method", "ticket_tiers", "sort_keys"}
+    """
+    lottery_method = "product_weight"
+    ticket_tiers = []
+
+    if "settings" in config:
+        # promotion_configs/*.json 형식
+        settings = config.get("settings", {})
+        products = list(settings.get("include_products", CORE_PRODUCTS))
+        if settings.get("include_services", False):
+            products.extend(SERVICE_PRODUCTS)
+
+        if settings.get("promotion_type") == "추첨권":
+            mode = "추첨권"
+            weights = config.get("data", {}) or {}
+            reward_table = []
+            if config.get("lottery_method") == "approval_count":
+                lottery_method = "approval_count"
+                ticket_tiers = config.get("lottery_count_config", []) or []
+        else:
+            criteria = settings.get("criteria", ["승인건수"])
+            mode = "금액별" if criteria and criteria[0] == "승인액" else "건수별"
+            weights = {}
+            reward_table = config.get("data", []) or []
+
+        # 정렬은 analyze_promotion_data와 같이 기준 목록 순서 (추첨권은 기준이 없으면 추첨권 순)
+        sort_keys = [
+            criterion for criterion in settings.get("criteria", ["승인건수"])
+            if criterion in ("승인건수", "승인액") or (criterion == "추첨권" and mode == "추첨권")
+        ]
+        if mode == "추첨권" and not sort_keys:
+            sort_keys = ["추첨권"]
+
+        min_count = settings.get("min_condition", 0)
+        tiers = []
+    else:
+        # data/promotion_config.json 형식
+        mode = config.get("analysis_mode", "건수별")
+        products = list(CORE_PRODUCTS)
+        if config.get("include_service_products", False):
+            products.extend(SERVICE_PRODUCTS)
+
+        weights = config.get("product_weights", {})
+        min_count = config.get("minimum_criteria", {}).get("count", 0)
+        tiers = config.get("promotion_tiers", [])
+        reward_table = config.get("reward_table", [])
+        sort_keys = SORT_KEYS_BY_MODE.get(mode, SORT_KEYS_BY_MODE["건수별"])
+
+    return {
+        "name": name,
+        "mode": mode if mode in SCENARIO_MODES else "건수별",
+        "products": products,
+        "weights": weights,
+        "min_count": min_count or 0,
+        "tiers": sorted(tiers, key=lambda x: x["min_score"], reverse=True),
+        "reward_table": reward_table,
+        "lottery_method": lottery_method,
+        "ticket_tiers": sorted(ticket_tiers, key=lambda x: x["min_count"], reverse=True),
+        "sort_keys": list(sort_keys)
+    }
+
+
+def load_promotion_scenarios(config_names: List[str]) -> Tuple[List[Dict], List[str]]:
+    """
+    promotion_configs 폴더에 저장된 설정들을 시나리오로 불러옵니다.
+
+    Args:
+        config_names: 설정 이름 목록
+
+    Returns:
+        Tuple[List[Dict], List[str]]: 시나리오 목록, 오류 메시지 목록
+    """
+    scenarios = []
+    errors = []
+
+    for config_name in config_names:
+        config_data, error = load_promotion_config(config_name)
+        if error:
+            errors.append(error)
+            continue
+        scenarios.append(normalize_promotion_scenario(config_name, config_data))
+
+    return scenarios, errors
+
+
+def _reward_by_rank(reward_table: List[Dict[str, int]], size: int) -> np.ndarray:
+    """
+    포상금 테이블을 순위별 금액 배열로 펼칩니다. (index 0 = 1위)
+
+    Args:
+        reward_table: [{"amount": 금액, "count": 인원수}, ...]
+        size: 배열 길이 (상담사 수)
+
+    Returns:
+        np.ndarray: 순위별 포상금
+    """
+    rewards = np.zeros(size)
+    if reward_table:
+        amounts = np.repeat(
+            [item.get("amount", 0) for item in reward_table],
+            [max(item.get("count", 0), 0) for item in reward_table]
+        )[:size]
+        rewards[:len(amounts)] = amounts
+    return rewards
+
+
+def _unique_scenario_names(names: List[str]) -> List[str]:
+    """
+    중복된 시나리오 이름에 번호를 붙여 고유하게 만듭니다. (예: "현재 설정", "현재 설정 (2)")
+
+    Args:
+        names: 시나리오 이름 목록
+
+    Returns:
+        List[str]: 고유한 시나리오 이름 목록 (처음 나온 이름은 그대로 유지)
+    """
+    used = set(names)
+    seen = set()
+    unique = []
+    for name in names:
+        if name in seen:
+            suffix = 2
+            while f"{name} ({suffix})" in used:
+                suffix += 1
+            name = f"{name} ({suffix})"
+            used.add(name)
+        seen.add(name)
+        unique.append(name)
+    return unique
+
+
+def simulate_promotion_scenarios(
+    matrix: pd.DataFrame,
+    scenarios: List[Dict],
+    product_amounts: Optional[pd.DataFrame] = None
+) -> Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]:
+    """
+    여러 프로모션 시나리오를 같은 건수 행렬에서 한 번에 평가합니다.
+
+    건수/점수/승인액은 (상담사 × 제품) 행렬과 (제품 × 시나리오) 행렬의 곱으로 계산하며,
+    시나리오에 포함되지 않은 제품은 건수와 점수(추첨권)에 더하지 않습니다.
+    순위는 시나리오 축 전체에 대한 안정 정렬로 한 번에 계산합니다.
+    기간과 온라인/연계승인 필터는 건수 행렬을 만들 때 적용된 값을 모든 시나리오가 공유하고,
+    상담사 이름이 없는 행은 평가하지 않습니다.
+
+    순위 기준 (시나리오의 sort_keys, 대상자가 항상 비대상자보다 앞 순위):
+    - promotion_configs 형식: 설정의 기준 목록 순서 (analyze_promotion_data와 같음)
+    - data/promotion_config.json 형식: SORT_KEYS_BY_MODE (예: 제품별은 점수 → 승인액)
+
+    대상 판정:
+    - 제품별: 등급 구간에 해당하는 경우 (등급 설정이 없으면 최소 기준 건수)
+    - 건수별/금액별: 승인건수가 최소 기준 이상
+    - 추첨권: 승인건수가 최소 기준 이상이고 추첨권이 1장 이상
+
+    추첨권 장수는 제품별 가중치 합(product_weight) 또는 승인건수가 도달한 구간의 장수(approval_count)이며,
+    같은 이름의 시나리오는 번호를 붙여 구분합니다. (예: "현재 설정 (2)")
+
+    Args:
+        matrix: promotion_logic.build_promotion_matrix 결과 (상담사 인덱스, 제품별 건수 + 승인액)
+        scenarios: normalize_promotion_scenario 결과 목록
+        product_amounts: 상담사 × 제품 승인액 (promotion_logic.build_promotion_amount_matrix 결과,
+            있으면 시나리오에 포함된 제품의 승인액만 합산, 없으면 matrix의 승인액 사용)
+
+    Returns:
+        Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]:
+            {"summary": 시나리오별 요약, "labels": 상담사 × 시나리오 등급/대상 여부,
+             "ranks": 상담사 × 시나리오 순위, "scores": 상담사 × 시나리오 점수(추첨권),
+             "payouts": 상담사 × 시나리오 포상금,
+             "tier_distribution": 시나리오 × 등급 인원수}, 오류 메시지
+    """
+    try:
+        if matrix is None or matrix.empty:
+            return None, "시나리오를 평가할 데이터가 없습니다."
+
+        if not scenarios:
+            return None, "비교할 시나리오가 없습니다."
+
+        # 상담사 이름이 없는 행 제외 (analyze_promotion_data와 같이 건수 0으로 대상 외)
+        matrix = matrix[matrix.index.notna()]
+        if matrix.empty:
+            return None, "시나리오를 평가할 상담사가 없습니다."
+
+        consultants = matrix.index
+        names = _unique_scenario_names([scenario["name"] for scenario in scenarios])
+        n_consultants = len(consultants)
+
+        counts_matrix = matrix[PROMOTION_PRODUCTS].to_numpy(dtype=float)  # 상담사 × 제품
+
+        # 제품 × 시나리오 행렬 (집계 포함 여부, 가중치)
+        include_matrix = np.array([
+            [product in scenario["products"] for product in PROMOTION_PRODUCTS]
+            for scenario in scenarios
+        ], dtype=float).T
+        weight_matrix = np.array([
+            [scenario["weights"].get(product, 0) for product in PROMOTION_PRODUCTS]
+            for scenario in scenarios
+        ], dtype=float).T
+
+        # 상담사 × 시나리오 건수 / 점수 / 승인액 (포함 제품만, 한 번의 행렬 곱)
+        total_counts = counts_matrix @ include_matrix
+        scores = counts_matrix @ (weight_matrix * include_matrix)
+        if product_amounts is not None:
+            amount_matrix = product_amounts.reindex(index=consultants, columns=PROMOTION_PRODUCTS, fill_value=0)
+            amounts = amount_matrix.to_numpy(dtype=float) @ include_matrix
+        else:
+            amounts = np.repeat(matrix["승인액"].to_numpy(dtype=float)[:, None], len(scenarios), axis=1)
+
+        modes = np.array([scenario["mode"] for scenario in scenarios])
+        min_counts = np.array([scenario["min_count"] for scenario in scenarios], dtype=float)
+        meets_minimum = total_counts >= min_counts
+
+        # 등급 판정 (제품별 시나리오만, 구간 수가 적어 시나리오별로 처리)
+        labels = np.where(meets_minimum, "Y", "N").astype(object)
+        qualified = meets_minimum.copy()
+        tier_rewards = np.zeros((n_consultants, len(scenarios)))
+
+        for idx, scenario in enumerate(scenarios):
+            if scenario["mode"] == "추첨권":
+                if scenario.get("lottery_method") == "approval_count":
+                    # 승인건수가 도달한 가장 높은 구간의 장수 (구간은 min_count 내림차순)
+                    scores[:, idx] = np.select(
+                        [total_counts[:, idx] >= tier["min_count"] for tier in scenario["ticket_tiers"]],
+                        [tier["tickets"] for tier in scenario["ticket_tiers"]],
+                        default=0
+                    )
+                qualified[:, idx] &= scores[:, idx] > 0
+                labels[:, idx] = np.where(qualified[:, idx], "Y", "N")
+            elif scenario["mode"] == "제품별" and scenario["tiers"]:
+                column_scores = scores[:, idx]
+                tier_conditions = [
+                    (column_scores >= tier["min_score"]) if tier.get("max_score") is None
+                    else (column_scores >= tier["min_score"]) & (column_scores <= tier["max_score"])
+                    for tier in scenario["tiers"]
+                ]
+                labels[:, idx] = np.select(
+                    tier_conditions, [tier["name"] for tier in scenario["tiers"]], default="대상 제외"
+                )
+                tier_rewards[:, idx] = np.select(
+                    tier_conditions, [tier.get("reward", 0) or 0 for tier in scenario["tiers"]], default=0
+                )
+                qualified[:, idx] = labels[:, idx] != "대상 제외"
+
+        # 정렬 키 (키 × 상담사 × 시나리오, 키가 적은 시나리오는 0으로 채워 순서에 영향 없음)
+        key_values = {"승인건수": total_counts, "승인액": amounts, "점수": scores, "추첨권": scores}
+        n_keys = max(len(scenario["sort_keys"]) for scenario in scenarios)
+        sort_keys = np.zeros((n_keys, n_consultants, len(scenarios)))
+        for idx, scenario in enumerate(scenarios):
+            for position, key in enumerate(scenario["sort_keys"]):
+                sort_keys[position, :, idx] = key_values[key][:, idx]
+
+        # 안정 정렬을 마지막 키 → 첫 키 → 대상 여부 순으로 적용 (동점은 상담사 등장 순서 유지)
+        order = np.tile(np.arange(n_consultants)[:, None], (1, len(scenarios)))
+        for key in [-sort_keys[position] for position in reversed(range(n_keys))] + [~qualified]:
+            order = np.take_along_axis(
+                order, np.argsort(np.take_along_axis(key, order, axis=0), axis=0, kind="stable"), axis=0
+            )
+
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, n_consultants + 1)[:, None], axis=0)
+
+        # 순위별 포상금 (대상자만) + 등급별 포상금
+        rank_rewards = np.stack([
+            _reward_by_rank(scenario["reward_table"], n_consultants) for scenario in scenarios
+        ])  # 시나리오 × 순위
+        payouts = (
+            np.take_along_axis(rank_rewards.T, ranks - 1, axis=0) + tier_rewards
+        ) * qualified
+
+        # 결과 데이터프레임
+        labels_df = pd.DataFrame(labels, index=consultants, columns=names)
+        ranks_df = pd.DataFrame(ranks, index=consultants, columns=names)
+        scores_df = pd.DataFrame(scores, index=consultants, columns=names)
+        payouts_df = pd.DataFrame(payouts, index=consultants, columns=names)
+
+        tier_distribution = (
+            labels_df.where(pd.DataFrame(qualified, index=consultants, columns=names))
+            .apply(lambda column: column.value_counts())
+            .fillna(0)
+            .astype(int)
+            .T
+            .reindex(names)
+        )
+
+        summary_df = pd.DataFrame({
+            "시나리오": names,
+            "분석기준": modes,
+            "대상인원": qualified.sum(axis=0),
+            "총포상금": payouts.sum(axis=0),
+            "등급분포": [
+                " / ".join(f"{label} {count}명" for label, count in row.items() if count > 0)
+                for _, row in tier_distribution.iterrows()
+            ]
+        })
+
+        return {
+            "summary": summary_df,
+            "labels": labels_df,
+            "ranks": ranks_df,
+            "scores": scores_df,
+            "payouts": payouts_df,
+            "tier_distribution": tier_distribution
+        }, None
+
+    except Exception as e:
+        return None, f"시나리오 비교 중 오류: {str(e)}"
@@ -0,0 +1,361 @@
+"""
+승인-설치 대사(reconciliation) 비즈니스 로직
+
+이 모듈은 승인매출과 설치매출 데이터를 계약 번호로 맞춰 보고
+설치 완료 / 미설치(승인만 있음) / 미승인 설치(설치만 있음) 계약을 나누고,
+제품별 승인→설치 리드타임 분포와 미설치 경과일 분포를 계산하는 로직을 포함합니다.
+계약 번호는 두 파일을 합쳐 한 번 factorize 한 정수 코드로 비교(해시 조인)하므로
+분기 단위 파일도 행 수에 비례하는 시간으로 처리합니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from io import BytesIO
+from typing import Tuple, Dict, Optional, Any
+
+from logic.string_predicate_logic import contains
+
+# 대사 기준 컬럼
+CONTRACT_KEY = "계약 번호"
+
+# 일자 컬럼 (설치매출 파일의 설치 일자는 처리 단계에서 "주문 일자"로 표준화됨)
+DATE_COLUMN = "주문 일자"
+
+# 대사 대상 제품 (어느 제품에도 해당하지 않으면 "기타")
+RECONCILIATION_PRODUCTS = ["안마의자", "라클라우드", "정수기", "더케어"]
+OTHER_PRODUCT = "기타"
+TOTAL_ROW = "총합계"
+
+# 리드타임/경과일 구간 (일) - 구간 시작값과 라벨, 음수(설치일이 승인일보다 빠름)는 "확인 필요"
+LAG_BIN_EDGES = [0, 1, 4, 8, 15, 31, 61]
+LAG_BIN_LABELS = ["당일", "1~3일", "4~7일", "8~14일", "15~30일", "31~60일", "61일 이상"]
+INVALID_LAG_LABEL = "확인 필요"
+
+# 대사 결과 캐시 {(id(승인), id(설치)): (승인, 설치, 승인 행 수, 설치 행 수, 결과)}
+_RECONCILIATION_CACHE: Dict[Tuple[int, int], Tuple[pd.DataFrame, pd.DataFrame, int, int, Dict[str, Any]]] = {}
+_MAX_CACHED_RESULTS = 4
+
+
+def _normalize_key(value: Any) -> str:
+    """계약 번호를 비교용 문자열로 정리합니다. (12345.0 → '12345', 앞뒤 공백 제거)"""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _integer_keys(keys: pd.Series) -> Optional[pd.Series]:
+    """숫자형 계약 번호가 모두 정수 값이면 정수형(결측 허용)으로 변환합니다. (그 외는 None)"""
+    if not pd.api.types.is_numeric_dtype(keys) or pd.api.types.is_bool_dtype(keys):
+        return None
+    values = keys.dropna()
+    if pd.api.types.is_float_dtype(keys) and not (values == np.floor(values)).all():
+        return None
+    return keys.astype("Int64")
+
+
+def _contract_codes(approval_keys: pd.Series, installation_keys: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    두 파일의 계약 번호를 같은 정수 코드 공간으로 변환합니다. (결측/빈 값은 -1)
+
+    두 파일 모두 숫자형이면 정수 값으로 바로 비교하고, 그렇지 않으면 고유값만 문자열로 정리한 뒤
+    다시 factorize 하므로 숫자/문자열로 읽힌 계약 번호도 같은 키로 맞춰집니다.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 승인 행별 코드, 설치 행별 코드
+    """
+    integer_keys = [_integer_keys(keys) for keys in (approval_keys, installation_keys)]
+    if all(keys is not None for keys in integer_keys):
+        codes, _ = pd.factorize(pd.concat(integer_keys, ignore_index=True))
+        return codes[:len(approval_keys)], codes[len(approval_keys):]
+
+    codes, uniques = pd.factorize(pd.concat([approval_keys, installation_keys], ignore_index=True))
+    normalized = np.array([_normalize_key(value) for value in uniques], dtype=object)
+    unique_codes, _ = pd.factorize(normalized)
+    unique_codes[normalized == ""] = -1
+
+    row_codes = np.where(codes >= 0, unique_codes.take(codes), -1) if len(uniques) else codes
+    return row_codes[:len(approval_keys)], row_codes[len(approval_keys):]
+
+
+def _first_rows(codes: np.ndarray) -> np.ndarray:
+    """계약 번호별 첫 행 위치 (원본 순서, 결측 제외) - drop_duplicates(keep='first')와 같음"""
+    valid_rows = np.flatnonzero(codes >= 0)
+    _, first = np.unique(codes[valid_rows], return_index=True)
+    return np.sort(valid_rows[first])
+
+
+def _product_labels(frame: pd.DataFrame) -> np.ndarray:
+    """
+    행별 제품을 분류합니다. (승인매출 집계와 같은 규칙: 판매유형에 더케어가 포함된 안마의자는 더케어)
+
+    Returns:
+        np.ndarray: 행별 제품 라벨
+    """
+    labels = np.full(len(frame), OTHER_PRODUCT, dtype=object)
+    if "대분류" not in frame.columns:
+        return labels
+
+    is_massage_chair = contains(frame, "대분류", "안마의자", case=False)
+    is_thecare = contains(frame, "판매유형", "더케어", case=False) if "판매유형" in frame.columns else np.zeros(len(frame), dtype=bool)
+    for product in ["정수기", "라클라우드"]:
+        labels[contains(frame, "대분류", product, case=False)] = product
+    labels[is_massage_chair & ~is_thecare] = "안마의자"
+    labels[is_massage_chair & is_thecare] = "더케어"
+    return labels
+
+
+def _lag_bins(days: np.ndarray) -> np.ndarray:
+    """일수를 구간 번호로 변환합니다. (0 = 확인 필요, 1.. = LAG_BIN_LABELS 순서)"""
+    return np.digitize(days, LAG_BIN_EDGES)
+
+
+def _histogram(products: np.ndarray, days: np.ndarray) -> pd.DataFrame:
+    """
+    제품 × 일수 구간 건수표를 만듭니다.
+
+    Args:
+        products: 행별 제품 라벨
+        days: 행별 일수 (결측 제외된 값)
+
+    Returns:
+        pd.DataFrame: 제품(+총합계) 인덱스 × 구간 컬럼 (확인 필요 건이 있을 때만 해당 컬럼 포함)
+    """
+    product_index = RECONCILIATION_PRODUCTS + [OTHER_PRODUCT]
+    product_codes = pd.Index(product_index).get_indexer(products)
+    n_bins = len(LAG_BIN_LABELS) + 1
+
+    counts = np.bincount(product_codes * n_bins + _lag_bins(days), minlength=len(product_index) * n_bins)
+    histogram = pd.DataFrame(
+        counts.reshape(len(product_index), n_bins),
+        index=pd.Index(product_index, name="제품"),
+        columns=[INVALID_LAG_LABEL] + LAG_BIN_LABELS
+    )
+    histogram.loc[TOTAL_ROW] = histogram.sum()
+    if histogram[INVALID_LAG_LABEL].sum() == 0:
+        histogram = histogram.drop(columns=INVALID_LAG_LABEL)
+    return histogram
+
+
+def _day_numbers(values: pd.Series) -> np.ndarray:
+    """일자 컬럼을 일 단위 정수(에포크 기준)로 변환합니다. (결측은 NaN)"""
+    dates = pd.to_datetime(values, errors="coerce").dt.normalize()
+    return np.where(dates.notna(), dates.to_numpy(dtype="datetime64[D]").astype(np.int64), np.nan)
+
+
+def reconcile_contracts(
+    approval_df: pd.DataFrame,
+    installation_df: pd.DataFrame
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    승인매출과 설치매출을 계약 번호로 대사합니다.
+
+    각 파일은 계약 번호 기준으로 중복 제거(첫 행 유지)하며, 계약 번호가 없는 행은 대사에서 제외합니다.
+
+    Args:
+        approval_df: 승인매출 데이터프레임 (계약 번호, 주문 일자, 대분류)
+        installation_df: 설치매출 데이터프레임 (계약 번호, 주문 일자 = 설치 일자, 대분류)
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: 대사 결과와 오류 메시지(있는 경우)
+            - summary: 제품별 승인/설치완료/미설치/설치율/리드타임 통계/미승인 설치 건수
+              (리드타임 통계는 설치일이 승인일보다 빠른 '확인 필요' 건을 제외하고 계산)
+            - installed: 설치 완료 계약 (승인 행 + 설치일자, 리드타임(일))
+            - pending: 미설치 계약 (승인 행 + 경과일)
+            - orphan: 미승인 설치 계약 (설치 행)
+            - lag_histogram: 제품 × 리드타임 구간 건수
+            - pending_aging: 제품 × 미설치 경과일 구간 건수
+            - as_of: 기준일 (두 파일의 최신 일자)
+            - missing_keys: 계약 번호가 없어 제외된 행 수 {"승인": n, "설치": n}
+    """
+    try:
+        if approval_df is None or approval_df.empty:
+            return None, "승인매출 데이터가 비어 있습니다."
+        if installation_df is None or installation_df.empty:
+            return None, "설치매출 데이터가 비어 있습니다."
+        for name, frame in (("승인매출", approval_df), ("설치매출", installation_df)):
+            if CONTRACT_KEY not in frame.columns:
+                return None, f"{name} 파일에 {CONTRACT_KEY} 컬럼이 없습니다."
+
+        # 계약 번호 해시 조인 (두 파일 공통 코드) 및 계약 번호 기준 중복 제거
+        approval_codes, installation_codes = _contract_codes(approval_df[CONTRACT_KEY], installation_df[CONTRACT_KEY])
+        missing_keys = {"승인": int((approval_codes < 0).sum()), "설치": int((installation_codes < 0).sum())}
+        approval_rows = _first_rows(approval_codes)
+        installation_rows = _first_rows(installation_codes)
+        approvals = approval_df.iloc[approval_rows].reset_index(drop=True)
+        installations = installation_df.iloc[installation_rows].reset_index(drop=True)
+        approval_codes = approval_codes[approval_rows]
+        installation_codes = installation_codes[installation_rows]
+
+        n_codes = int(max(approval_codes.max(initial=-1), installation_codes.max(initial=-1))) + 1
+        installation_position = np.full(n_codes, -1, dtype=np.int64)
+        installation_position[installation_codes] = np.arange(len(installation_codes))
+        approved = np.zeros(n_codes, dtype=bool)
+        approved[approval_codes] = True
+
+        matched_installation = installation_position[approval_codes]
+        is_installed = matched_installation >= 0
+        is_orphan = ~approved[installation_codes]
+
+        # 제품 분류 (승인 건은 승인 파일, 미승인 설치 건은 설치 파일 기준)
+        approval_products = _product_labels(approvals)
+        installation_products = _product_labels(installations)
+
+        # 일자 (일 단위) 및 기준일
+        approval_days = _day_numbers(approvals[DATE_COLUMN]) if DATE_COLUMN in approvals.columns else np.full(len(approvals), np.nan)
+        installation_days = _day_numbers(installations[DATE_COLUMN]) if DATE_COLUMN in installations.columns else np.full(len(installations), np.nan)
+        latest_day = np.nanmax(np.concatenate([approval_days, installation_days, [np.nan]])) if len(approval_days) + len(installation_days) else np.nan
+        as_of = pd.Timestamp(np.datetime64(int(latest_day), "D")) if not np.isnan(latest_day) else None
+
+        lags = installation_days[matched_installation[is_installed]] - approval_days[is_installed]
+        ages = latest_day - approval_days[~is_installed]
+
+        # 세부 목록
+        installed = approvals[is_installed].copy()
+        installed.insert(0, "제품", approval_products[is_installed])
+        if DATE_COLUMN in installations.columns:
+            installed["설치일자"] = installations[DATE_COLUMN].to_numpy()[matched_installation[is_installed]]
+        installed["리드타임(일)"] = lags
+
+        pending = approvals[~is_installed].copy()
+        pending.insert(0, "제품", approval_products[~is_installed])
+        pending["경과일"] = ages
+
+        orphan = installations[is_orphan].copy()
+        orphan.insert(0, "제품", installation_products[is_orphan])
+
+        # 제품별 요약
+        installed_products = approval_products[is_installed]
+        rows = []
+        for product in RECONCILIATION_PRODUCTS + [OTHER_PRODUCT, TOTAL_ROW]:
+            if product == TOTAL_ROW:
+                product_approvals = np.ones(len(approvals), dtype=bool)
+                product_lags = lags
+                product_orphans = int(is_orphan.sum())
+            else:
+                product_approvals = approval_products == product
+                product_lags = lags[installed_products == product]
+                product_orphans = int((is_orphan & (installation_products == product)).sum())
+            # 음수 리드타임(설치일이 승인일보다 빠름)은 데이터 확인 대상이므로 통계에서 제외
+            valid_lags = product_lags[product_lags >= 0]
+            approved_count = int(product_approvals.sum())
+            installed_count = int((product_approvals & is_installed).sum())
+            if product == OTHER_PRODUCT and approved_count == 0 and product_orphans == 0:
+                continue
+            rows.append({
+                "제품": product,
+                "승인": approved_count,
+                "설치완료": installed_count,
+                "미설치": approved_count - installed_count,
+                "설치율": installed_count / approved_count * 100 if approved_count else 0.0,
+                "평균_리드타임": valid_lags.mean() if len(valid_lags) else np.nan,
+                "중앙값_리드타임": np.median(valid_lags) if len(valid_lags) else np.nan,
+                "P90_리드타임": np.percentile(valid_lags, 90) if len(valid_lags) else np.nan,
+                "미승인설치": product_orphans
+            })
+
+        valid_lag_rows = ~np.isnan(lags)
+        valid_age_rows = ~np.isnan(ages)
+        return {
+            "summary": pd.DataFrame(rows),
+            "installed": installed,
+            "pending": pending,
+            "orphan": orphan,
+            "lag_histogram": _histogram(installed_products[valid_lag_rows], lags[valid_lag_rows]),
+            "pending_aging": _histogram(approval_products[~is_installed][valid_age_rows], ages[valid_age_rows]),
+            "as_of": as_of,
+            "missing_keys": missing_keys
+        }, None
+
+    except Exception as e:
+        return None, f"승인-설치 대사 중 오류가 발생했습니다: {str(e)}"
+
+
+def get_reconciliation(
+    approval_df: pd.DataFrame,
+    installation_df: pd.DataFrame
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    데이터셋 쌍별로 캐시된 대사 결과를 가져옵니다. (없으면 reconcile_contracts로 계산)
+
+    데이터셋은 객체 동일성(is)으로 비교하므로, 데이터를 제자리에서 수정했다면
+    clear_reconciliation_cache()를 호출해야 합니다.
+
+    Args:
+        approval_df: 승인매출 데이터프레임
+        installation_df: 설치매출 데이터프레임
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: 대사 결과와 오류 메시지(있는 경우)
+    """
+    key = (id(approval_df), id(installation_df))
+    cached = _RECONCILIATION_CACHE.get(key)
+    if (
+        cached is not None
+        and cached[0] is approval_df and cached[1] is installation_df
+        and cached[2] == len(approval_df) and cached[3] == len(installation_df)
+    ):
+        return cached[4], None
+
+    result, error = reconcile_contracts(approval_df, installation_df)
+    if result is not None:
+        if len(_RECONCILIATION_CACHE) >= _MAX_CACHED_RESULTS:
+            _RECONCILIATION_CACHE.pop(next(iter(_RECONCILIATION_CACHE)))
+        _RECONCILIATION_CACHE[key] = (approval_df, installation_df, len(approval_df), len(installation_df), result)
+    return result, error
+
+
+def create_reconciliation_excel(result: Dict[str, Any]) -> Optional[bytes]:
+    """
+    대사 결과를 엑셀 파일로 변환합니다. (요약/리드타임 분포/미설치/설치완료/미승인 설치 시트)
+
+    Args:
+        result: reconcile_contracts 결과
+
+    Returns:
+        Optional[bytes]: 엑셀 바이너리 데이터 또는 None (오류 발생 시)
+    """
+    try:
+        output = BytesIO()
+
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            workbook = writer.book
+            header_format = workbook.add_format({
+                'bold': True,
+                'bg_color': '#00498c',
+                'font_color': 'white',
+                'border': 1,
+                'align': 'center',
+                'valign': 'vcenter'
+            })
+
+            result["summary"].to_excel(writer, sheet_name="요약", index=False, float_format="%.1f")
+
+            # 리드타임 분포 / 미설치 경과일 분포를 한 시트에 위아래로 배치
+            distribution_sheet = "리드타임 분포"
+            aging_row = len(result["lag_histogram"]) + 4
+            result["lag_histogram"].to_excel(writer, sheet_name=distribution_sheet, startrow=1)
+            result["pending_aging"].to_excel(writer, sheet_name=distribution_sheet, startrow=aging_row + 1)
+            worksheet = writer.sheets[distribution_sheet]
+            worksheet.write(0, 0, "승인 → 설치 리드타임 (설치 완료 건)", header_format)
+            worksheet.write(aging_row, 0, "미설치 경과일 (기준일까지)", header_format)
+            worksheet.set_column(0, 0, 12)
+
+            for sheet_name, key in (("미설치", "pending"), ("설치완료", "installed"), ("미승인 설치", "orphan")):
+                frame = result[key]
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+                sheet = writer.sheets[sheet_name]
+                for col_idx, column in enumerate(frame.columns):
+                    sheet.write(0, col_idx, column, header_format)
+                sheet.set_column(0, max(len(frame.columns) - 1, 0), 14)
+
+        return output.getvalue()
+
+    except Exception as e:
+        print(f"대사 엑셀 생성 오류: {str(e)}")
+        return None
+
+
+def clear_reconciliation_cache() -> None:
+    """대사 결과 캐시를 비웁니다."""
+    _RECONCILIATION_CACHE.clear()
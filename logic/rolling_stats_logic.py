@@ -0,0 +1,317 @@
+"""
+이동평균/이상치 비즈니스 로직
+
+이 모듈은 승인 데이터를 일자 × 항목(제품, 상담사, 조직별 제품) 승인 건수로 집계하고,
+7일/28일 이동평균과 z-점수 기반 급증/급감 플래그를 계산하는 로직을 포함합니다.
+이동 통계는 최근 28일 링 버퍼와 구간별 누적합으로 유지하므로, 새 일자가 추가되면
+전체 이력을 다시 계산하지 않고 추가된 일자만 반영합니다. (일자당 비용은 항목 수에 비례)
+일자는 승인 데이터에 등장한 날짜만 사용하므로 주말/휴무일은 이력에서 제외됩니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Tuple, Dict, List, Hashable
+
+from logic.cube_logic import get_cube, COUNT_MEASURE
+from logic.daily_approval_logic import APPROVAL_CATEGORY_KEYWORDS
+from logic.string_predicate_logic import contains
+from utils.consultant_manager import get_consultant_team_map
+
+# 이동평균 구간 (일)
+ROLLING_WINDOWS = (7, 28)
+
+# 이상치 판단 기준 |z| (직전 28일 평균/표준편차 기준)
+ANOMALY_Z_THRESHOLD = 2.0
+
+# z-점수를 계산하기 위한 최소 직전 이력 일수
+MIN_HISTORY_DAYS = 7
+
+# 이상치로 표시할 최소 직전 평균 건수 (건수가 거의 없는 항목의 잡음 제외)
+MIN_BASELINE_COUNT = 1.0
+
+# 항목 구분
+GROUP_PRODUCT = "제품"
+GROUP_CONSULTANT = "상담사"
+GROUP_TEAM_PRODUCT = "조직별 제품"
+
+# 이동 통계 캐시 {이름: RollingWindowStats}
+_STATS_CACHE: Dict[Hashable, "RollingWindowStats"] = {}
+
+
+def build_daily_counts(df: pd.DataFrame, date_column: str = "주문 일자") -> pd.DataFrame:
+    """
+    승인 데이터를 일자 × 항목 승인 건수로 집계합니다.
+
+    제품은 대분류에 APPROVAL_CATEGORY_KEYWORDS 키워드가 포함된 건수이며,
+    상담사/조직별 제품은 상담사 컬럼이 있을 때만 집계합니다. (조직은 상담사 관리 JSON의 팀, 없으면 '기타')
+
+    Args:
+        df: 승인 데이터프레임 (주문 일자, 대분류 필요)
+        date_column: 일자 컬럼명
+
+    Returns:
+        pd.DataFrame: 일자 인덱스(오름차순) × (구분, 항목) 컬럼 건수 (해당 일자에 실적이 없는 항목은 0)
+    """
+    dimensions = [column for column in ("상담사", "대분류", date_column) if column in df.columns]
+    if date_column not in dimensions or "대분류" not in dimensions:
+        return pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=["구분", "항목"]))
+
+    # 상담사 × 대분류 × 일자 큐브 (데이터셋별 캐시)의 셀 단위로 집계
+    cube = get_cube(df, dimensions)
+    cells = cube.cells
+    counts = cube.measures[COUNT_MEASURE]
+    days = pd.to_datetime(cells[date_column], errors="coerce").dt.normalize()
+    valid_day = days.notna().to_numpy()
+
+    has_consultant = "상담사" in cells.columns
+    if has_consultant:
+        consultants = cells["상담사"]
+        valid_consultant = valid_day & consultants.notna().to_numpy()
+        teams = consultants.map(get_consultant_team_map()).fillna("기타")
+
+    frames = []
+    for product, keyword in APPROVAL_CATEGORY_KEYWORDS.items():
+        product_mask = valid_day & contains(cells, "대분류", keyword, case=False)
+        frames.append(pd.DataFrame({
+            "일자": days[product_mask], "구분": GROUP_PRODUCT, "항목": product, "건수": counts[product_mask]
+        }))
+        if has_consultant:
+            team_mask = product_mask & valid_consultant
+            frames.append(pd.DataFrame({
+                "일자": days[team_mask], "구분": GROUP_TEAM_PRODUCT,
+                "항목": teams[team_mask].astype(str) + " · " + product, "건수": counts[team_mask]
+            }))
+
+    if has_consultant:
+        # 상담사는 제품 구분 없이 전체 승인 건수
+        frames.append(pd.DataFrame({
+            "일자": days[valid_consultant], "구분": GROUP_CONSULTANT,
+            "항목": consultants[valid_consultant].astype(str), "건수": counts[valid_consultant]
+        }))
+
+    long_df = pd.concat(frames, ignore_index=True)
+    daily = long_df.pivot_table(index="일자", columns=["구분", "항목"], values="건수", aggfunc="sum", fill_value=0)
+    # 실적이 없는 제품도 0 건으로 유지
+    for product in APPROVAL_CATEGORY_KEYWORDS:
+        if (GROUP_PRODUCT, product) not in daily.columns:
+            daily[(GROUP_PRODUCT, product)] = 0
+    return daily.sort_index().astype(np.int64)
+
+
+class RollingWindowStats:
+    """
+    항목별 이동평균/z-점수를 누적합으로 유지하는 증분 계산기
+
+    Attributes:
+        columns: 항목 목록 (새 항목은 append 시 뒤에 추가되며 이전 이력은 0으로 간주)
+        days: 반영된 일자 목록
+        daily: 반영된 일자 × 항목 건수 (캐시 재사용 시 기존 이력과 비교용)
+        latest: 마지막 일자의 항목별 통계 데이터프레임
+    """
+
+    def __init__(self, windows: Tuple[int, ...] = ROLLING_WINDOWS):
+        self.windows = tuple(sorted(windows))
+        self.capacity = self.windows[-1]
+        self.columns = pd.Index([])
+        self.days: List[pd.Timestamp] = []
+        self.daily = pd.DataFrame()
+        self.latest = pd.DataFrame()
+        self._buffer = np.zeros((self.capacity, 0))
+        self._sums = {window: np.zeros(0) for window in self.windows}
+        self._squares = np.zeros(0)
+        self._averages: List[Dict[int, np.ndarray]] = []
+        self._checkpoint = None
+
+    def _grow(self, columns: pd.Index) -> None:
+        """새 항목 열을 0 이력으로 추가합니다."""
+        new_columns = columns.difference(self.columns, sort=False)
+        if len(new_columns) == 0:
+            return
+        pad = len(new_columns)
+        self.columns = self.columns.append(new_columns)
+        self._buffer = np.pad(self._buffer, ((0, 0), (0, pad)))
+        self._sums = {window: np.pad(sums, (0, pad)) for window, sums in self._sums.items()}
+        self._squares = np.pad(self._squares, (0, pad))
+
+    def _save_checkpoint(self) -> None:
+        """마지막 일자를 되돌릴 수 있도록 추가 직전 상태를 저장합니다."""
+        self._checkpoint = (
+            self.columns, self._buffer.copy(), dict(self._sums), self._squares,
+            self.latest, len(self._averages)
+        )
+
+    def rollback(self) -> bool:
+        """
+        마지막으로 추가한 일자를 되돌립니다. (같은 날 파일을 다시 올려 당일 건수가 바뀐 경우)
+
+        Returns:
+            bool: 되돌렸으면 True (저장된 상태가 없으면 False)
+        """
+        if self._checkpoint is None:
+            return False
+        self.columns, self._buffer, self._sums, self._squares, self.latest, n_averages = self._checkpoint
+        del self._averages[n_averages:]
+        self.days.pop()
+        self.daily = self.daily.iloc[:-1]
+        self._checkpoint = None
+        return True
+
+    def append(self, day: pd.Timestamp, values: pd.Series) -> pd.DataFrame:
+        """
+        하루치 항목별 건수를 반영하고 해당 일자의 통계를 반환합니다.
+
+        Args:
+            day: 일자 (이전에 반영한 일자보다 뒤여야 함)
+            values: 항목별 건수 (없는 항목은 0)
+
+        Returns:
+            pd.DataFrame: 항목별 당일/이동평균/직전평균/z-점수/이상 통계
+        """
+        self._grow(values.index)
+        self._save_checkpoint()
+        current = values.reindex(self.columns, fill_value=0).to_numpy(dtype=float)
+        n_days = len(self.days)
+        position = n_days % self.capacity
+
+        # z-점수는 당일을 제외한 직전 capacity일 기준 (표본 표준편차)
+        n_previous = min(n_days, self.capacity)
+        previous_sum = self._sums[self.capacity]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            baseline = previous_sum / n_previous if n_previous else np.full(len(current), np.nan)
+            variance = (self._squares - n_previous * baseline ** 2) / (n_previous - 1) if n_previous > 1 else np.full(len(current), np.nan)
+            std = np.sqrt(np.clip(variance, 0, None))
+            z_scores = np.where(std > 0, (current - baseline) / std, np.nan)
+        if n_previous < MIN_HISTORY_DAYS:
+            z_scores = np.full(len(current), np.nan)
+
+        # 구간별 누적합 갱신 (구간 밖으로 나가는 일자 차감)
+        for window in self.windows:
+            sums = self._sums[window] + current
+            if n_days >= window:
+                sums = sums - self._buffer[(n_days - window) % self.capacity]
+            self._sums[window] = sums
+        if n_days >= self.capacity:
+            self._squares = self._squares - self._buffer[position] ** 2
+        self._squares = self._squares + current ** 2
+        self._buffer[position] = current
+
+        averages = {window: self._sums[window] / min(n_days + 1, window) for window in self.windows}
+        self._averages.append(averages)
+        self.days.append(pd.Timestamp(day))
+        self.daily = pd.concat([self.daily, values.to_frame(pd.Timestamp(day)).T]).fillna(0)
+
+        anomaly = np.where(
+            np.isnan(z_scores) | (np.abs(z_scores) < ANOMALY_Z_THRESHOLD) | (np.fmax(baseline, current) < MIN_BASELINE_COUNT),
+            "",
+            np.where(z_scores < 0, "급감", "급증")
+        )
+        latest = pd.DataFrame({"당일": current}, index=self.columns)
+        for window in self.windows:
+            latest[f"MA{window}"] = averages[window]
+        latest["직전평균"] = baseline
+        latest["표준편차"] = std
+        latest["z"] = z_scores
+        latest["이상"] = anomaly
+        self.latest = latest
+        return latest
+
+    def extend(self, daily: pd.DataFrame) -> pd.DataFrame:
+        """
+        일자 × 항목 건수를 일자 순서대로 모두 반영합니다.
+
+        Args:
+            daily: build_daily_counts 결과 (또는 같은 형태의 일부 일자)
+
+        Returns:
+            pd.DataFrame: 마지막 일자의 항목별 통계
+        """
+        for day, values in daily.iterrows():
+            self.append(day, values)
+        return self.latest
+
+    def trend(self, column: Hashable) -> pd.DataFrame:
+        """
+        한 항목의 일자별 건수와 이동평균 추이를 반환합니다.
+
+        Args:
+            column: 항목 (columns 값)
+
+        Returns:
+            pd.DataFrame: 일자 인덱스 × (건수, MA7, MA28)
+        """
+        position = self.columns.get_loc(column)
+        trend = pd.DataFrame(index=pd.DatetimeIndex(self.days, name="일자"))
+        trend["건수"] = self.daily[column].to_numpy() if column in self.daily.columns else 0
+        for window in self.windows:
+            trend[f"MA{window}"] = [
+                averages[window][position] if position < len(averages[window]) else 0.0
+                for averages in self._averages
+            ]
+        return trend
+
+
+def update_rolling_stats(name: Hashable, daily: pd.DataFrame) -> Tuple[RollingWindowStats, str]:
+    """
+    캐시된 이동 통계에 새 일자만 추가합니다.
+
+    이전에 반영한 이력이 새 집계의 앞부분과 같으면 뒤에 추가된 일자만 반영하고,
+    마지막 일자만 바뀐 경우(같은 날 파일 재업로드)는 그 일자를 되돌린 뒤 다시 반영합니다.
+    그 외에는 처음부터 다시 계산합니다.
+
+    Args:
+        name: 캐시 이름 (예: 탭 이름)
+        daily: build_daily_counts 결과
+
+    Returns:
+        Tuple[RollingWindowStats, str]: 이동 통계, 갱신 방식 ("증분", "재계산", "변경 없음")
+    """
+    stats = _STATS_CACHE.get(name)
+    mode = "재계산"
+
+    if stats is not None and stats.days and len(daily) >= len(stats.days):
+        history = daily.iloc[:len(stats.days)]
+        if list(history.index) == stats.days:
+            # 새 집계에 없는 기존 항목은 0으로 비교
+            columns = stats.daily.columns.union(history.columns, sort=False)
+            cached = stats.daily.reindex(columns=columns, fill_value=0).to_numpy()
+            current = history.reindex(columns=columns, fill_value=0).to_numpy()
+            changed_rows = np.flatnonzero((cached != current).any(axis=1))
+            if len(changed_rows) == 0:
+                mode = "증분" if len(daily) > len(stats.days) else "변경 없음"
+            elif changed_rows.tolist() == [len(stats.days) - 1] and stats.rollback():
+                mode = "증분"
+
+    if mode == "재계산":
+        stats = RollingWindowStats()
+        _STATS_CACHE[name] = stats
+
+    stats.extend(daily.iloc[len(stats.days):])
+    return stats, mode
+
+
+def summarize_anomalies(stats: RollingWindowStats) -> pd.DataFrame:
+    """
+    마지막 일자 통계를 표시용 표로 변환합니다. (이상 항목 우선, |z| 내림차순)
+
+    Args:
+        stats: 이동 통계
+
+    Returns:
+        pd.DataFrame: 구분, 항목, 당일, MA7, MA28, 직전평균, z, 이상 컬럼
+    """
+    if stats.latest.empty:
+        return pd.DataFrame(columns=["구분", "항목", "당일", "MA7", "MA28", "직전평균", "z", "이상"])
+
+    table = stats.latest.copy()
+    table.index = pd.MultiIndex.from_tuples(list(table.index), names=["구분", "항목"])
+    table = table.reset_index()
+    table["_flagged"] = table["이상"] != ""
+    table["_abs_z"] = table["z"].abs().fillna(-1)
+    table = table.sort_values(["_flagged", "_abs_z"], ascending=[False, False], kind="stable")
+    return table[["구분", "항목", "당일"] + [f"MA{window}" for window in stats.windows] + ["직전평균", "z", "이상"]].reset_index(drop=True)
+
+
+def clear_rolling_cache() -> None:
+    """이동 통계 캐시를 비웁니다."""
+    _STATS_CACHE.clear()
@@ -14,6 +14,12 @@ from dateutil.relativedelta import relativedelta
 
 # 상담사 관리 모듈
 from utils.consultant_manager import load_consultants, get_all_consultants
+from logic.filter_logic import IsIn, HAS_CAMPAIGN, apply_filter
+from logic.analysis_backend_logic import resolve_backend
+from logic.duckdb_backend_logic import count_by_keys
+
+# 집계 테이블을 지원하는 분석 백엔드
+AGGREGATION_BACKENDS = ("pandas", "duckdb")
 
 
 def process_sales_files(
@@ -120,12 +126,13 @@ def filter_sales_data(
         registered_consultants = get_all_consultants()
 
         # 상담사 필터링 (로우데이터용 - 예약일자 필터 X)
-        filtered_df = df[df['상담사'].isin(registered_consultants)].copy()
+        spec = IsIn('상담사', tuple(registered_consultants))
 
         # 일반회차 캠페인 빈값 처리
-        if not include_empty_campaign and '일반회차 캠페인' in df.columns:
-            filtered_df = filtered_df[filtered_df['일반회차 캠페인'].notna()]
-            filtered_df = filtered_df[filtered_df['일반회차 캠페인'] != '']
+        if not include_empty_campaign:
+            spec &= HAS_CAMPAIGN
+
+        filtered_df = apply_filter(df, spec)
 
         # 상담주문번호 기준 중복 제거 (첫 번째 행만 유지)
         if '상담주문번호' in filtered_df.columns:
@@ -265,12 +272,64 @@ def filter_by_reservation_date(
         return None, f"예약일자 필터링 중 오류: {str(e)}", None
 
 
-def create_aggregation_tables(df: pd.DataFrame) -> Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]:
+def _build_campaign_grouped_table(campaign_counts: pd.Series) -> pd.DataFrame:
+    """
+    캠페인별 헤더 행(▼ 캠페인명), 상담사 행, 마지막 총건 행으로 구성된 테이블을 만듭니다.
+
+    Args:
+        campaign_counts: (일반회차 캠페인, 상담사) 멀티인덱스의 건수 시리즈
+
+    Returns:
+        pd.DataFrame: 일반회차 캠페인, 상담사, 건수 컬럼 테이블
+    """
+    campaign_consultant = campaign_counts.reset_index(name='건수')
+
+    # 캠페인 빈값 처리
+    campaign_consultant['일반회차 캠페인'] = campaign_consultant['일반회차 캠페인'].fillna('(빈값)')
+
+    # 캠페인별로 정렬 (같은 캠페인 안에서는 건수 내림차순)
+    campaign_consultant = campaign_consultant.sort_values(['일반회차 캠페인', '건수'], ascending=[True, False])
+
+    campaigns = campaign_consultant['일반회차 캠페인'].to_numpy()
+    n_rows = len(campaigns)
+
+    # 캠페인이 바뀌는 위치마다 헤더 행 1개씩 끼워 넣은 출력 위치 계산
+    is_first = np.ones(n_rows, dtype=bool)
+    is_first[1:] = campaigns[1:] != campaigns[:-1]
+    campaign_no = np.cumsum(is_first)  # 1부터 시작하는 캠페인 번호
+    data_positions = np.arange(n_rows) + campaign_no
+    header_positions = data_positions[is_first] - 1
+
+    n_output = n_rows + len(header_positions) + 1
+    campaign_column = np.full(n_output, '', dtype=object)
+    consultant_column = np.full(n_output, '', dtype=object)
+    count_column = np.full(n_output, '', dtype=object)
+
+    # 캠페인명 헤더 행
+    campaign_column[header_positions] = '▼ ' + campaign_consultant['일반회차 캠페인'].astype(str).to_numpy()[is_first]
+
+    # 상담사별 데이터 행
+    consultant_column[data_positions] = campaign_consultant['상담사'].to_numpy()
+    count_column[data_positions] = campaign_consultant['건수'].to_numpy()
+
+    # 총건 행
+    consultant_column[-1] = '총건'
+    count_column[-1] = campaign_consultant['건수'].sum()
+
+    return pd.DataFrame({
+        '일반회차 캠페인': campaign_column,
+        '상담사': consultant_column,
+        '건수': count_column
+    })
+
+
+def create_aggregation_tables(df: pd.DataFrame, backend: str = "pandas") -> Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]:
     """
     상담사별 집계 테이블을 생성합니다.
 
     Args:
         df: 필터링된 데이터프레임
+        backend: 집계 백엔드 ("pandas" | "duckdb", duckdb가 없으면 pandas)
 
     Returns:
         Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]: 테이블 딕셔너리, 오류 메시지
@@ -278,8 +337,19 @@ def create_aggregation_tables(df: pd.DataFrame) -> Tuple[Optional[Dict[str, pd.D
     try:
         tables = {}
 
+        # 상태 × 캠페인 × 상담사 건수를 한 번에 집계 (캠페인 빈값은 유지, 상태/상담사 빈값은 제외)
+        group_keys = ['상담DB상태', '일반회차 캠페인', '상담사'] if '일반회차 캠페인' in df.columns else ['상담DB상태', '상담사']
+        if resolve_backend(backend, AGGREGATION_BACKENDS) == "duckdb":
+            counts = count_by_keys(df, group_keys)
+        else:
+            counts = df.groupby(group_keys, dropna=False).size()
+        counts = counts[
+            counts.index.get_level_values('상담DB상태').notna()
+            & counts.index.get_level_values('상담사').notna()
+        ]
+
         # 상담DB상태의 모든 값 가져오기
-        db_statuses = df['상담DB상태'].unique()
+        db_statuses = counts.index.get_level_values('상담DB상태').unique()
 
         # 우선순위: 예약 → 체험신청 → 신규 → 나머지 (정렬)
         priority_statuses = ['예약', '체험신청', '신규']
@@ -287,7 +357,8 @@ def create_aggregation_tables(df: pd.DataFrame) -> Tuple[Optional[Dict[str, pd.D
         ordered_statuses = [s for s in priority_statuses if s in db_statuses] + other_statuses
 
         # 1. 메인 테이블 생성 (전체)
-        main_table = df.groupby(['상담사', '상담DB상태']).size().unstack(fill_value=0)
+        consultant_status = counts.groupby(level=['상담사', '상담DB상태']).sum()
+        main_table = consultant_status.unstack(fill_value=0)
 
         # 컬럼 순서 정렬
         existing_cols = [col for col in ordered_statuses if col in main_table.columns]
@@ -307,72 +378,34 @@ def create_aggregation_tables(df: pd.DataFrame) -> Tuple[Optional[Dict[str, pd.D
 
         tables['메인테이블'] = main_table
 
-        # 2. 개별 테이블 생성 (예약, 체험신청, 신규)
+        # 2. 개별 테이블 생성 (예약, 체험신청, 신규) - 같은 집계 결과에서 상태별로 추출
         for status in ['예약', '체험신청', '신규']:
-            if status in db_statuses:
-                status_df = df[df['상담DB상태'] == status]
-
-                # 신규 테이블은 캠페인별로 그룹화
-                if status == '신규' and '일반회차 캠페인' in status_df.columns:
-                    # 일반회차 캠페인별, 상담사별 집계
-                    campaign_consultant = status_df.groupby(['일반회차 캠페인', '상담사']).size().reset_index(name='건수')
-
-                    # 캠페인 빈값 처리
-                    campaign_consultant['일반회차 캠페인'] = campaign_consultant['일반회차 캠페인'].fillna('(빈값)')
-
-                    # 캠페인별로 정렬
-                    campaign_consultant = campaign_consultant.sort_values(['일반회차 캠페인', '건수'], ascending=[True, False])
-
-                    # 캠페인별로 구분선과 소계 추가
-                    result_rows = []
-                    unique_campaigns = campaign_consultant['일반회차 캠페인'].unique()
-
-                    for campaign in unique_campaigns:
-                        campaign_data = campaign_consultant[campaign_consultant['일반회차 캠페인'] == campaign]
-
-                        # 캠페인명 헤더 행 추가
-                        result_rows.append({
-                            '일반회차 캠페인': f'▼ {campaign}',
-                            '상담사': '',
-                            '건수': ''
-                        })
-
-                        # 해당 캠페인의 상담사별 데이터 추가
-                        for _, row in campaign_data.iterrows():
-                            result_rows.append({
-                                '일반회차 캠페인': '',
-                                '상담사': row['상담사'],
-                                '건수': row['건수']
-                            })
-
-                    # 총건 행 추가
-                    result_rows.append({
-                        '일반회차 캠페인': '',
-                        '상담사': '총건',
-                        '건수': campaign_consultant['건수'].sum()
-                    })
-
-                    status_table = pd.DataFrame(result_rows)
-                    tables[f'{status}테이블'] = status_table
-
-                else:
-                    # 예약, 체험신청은 기존 방식
-                    status_count = status_df.groupby('상담사').size()
-
-                    if len(status_count) > 0:
-                        status_table = pd.DataFrame({
-                            '상담사명': status_count.index,
-                            status: status_count.values
-                        })
-
-                        # 총건 행 추가
-                        total_row = pd.DataFrame({
-                            '상담사명': ['총건'],
-                            status: [status_count.sum()]
-                        })
-                        status_table = pd.concat([status_table, total_row], ignore_index=True)
-
-                        tables[f'{status}테이블'] = status_table
+            if status not in db_statuses:
+                continue
+
+            status_counts = counts.xs(status, level='상담DB상태')
+
+            # 신규 테이블은 캠페인별로 그룹화
+            if status == '신규' and '일반회차 캠페인' in df.columns:
+                tables[f'{status}테이블'] = _build_campaign_grouped_table(status_counts)
+
+            else:
+                # 예약, 체험신청은 상담사별 건수
+                status_count = status_counts.groupby(level='상담사').sum()
+
+                status_table = pd.DataFrame({
+                    '상담사명': status_count.index,
+                    status: status_count.values
+                })
+
+                # 총건 행 추가
+                total_row = pd.DataFrame({
+                    '상담사명': ['총건'],
+                    status: [status_count.sum()]
+                })
+                status_table = pd.concat([status_table, total_row], ignore_index=True)
+
+                tables[f'{status}테이블'] = status_table
 
         return tables, None
 
@@ -0,0 +1,132 @@
+"""
+문자열 조건 비즈니스 로직
+
+이 모듈은 df[col].astype(str).str.contains(pattern) 형태로 반복되는 문자열 필터를
+컬럼의 고유값에만 평가하는 로직을 포함합니다.
+컬럼은 데이터셋별로 한 번만 factorize 하여 (행별 코드, 고유값 문자열)로 공통 데이터셋 캐시에 저장하고,
+(컬럼, 조건) 결과는 고유값 기준 불리언 배열로 캐시한 뒤 코드로 한 번 take 하여 행 마스크로 펼칩니다.
+결과는 astype(str) 후 pandas .str 메서드를 적용한 것과 같습니다. (결측값은 'nan', 'None' 등 문자열로 평가)
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import re
+import pandas as pd
+import numpy as np
+from typing import Tuple, Dict, Union, Hashable
+
+from logic.dataset_cache_logic import get_dataset_cache
+
+# 데이터셋 캐시 이름공간 {컬럼: (코드, 고유값 문자열, {조건: 고유값 마스크})}
+_CACHE_NAMESPACE = "string_predicates"
+
+# 정규식 특수문자 (하나도 없으면 리터럴 비교로 처리)
+_REGEX_META_CHARACTERS = set(".^$*+?{}[]\\|()")
+
+
+def _factorize_text(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    컬럼을 astype(str) 기준 고유값 코드로 변환합니다.
+
+    결측값은 dtype에 따라 'nan', 'None', 'NaT' 등 서로 다른 문자열이 되므로
+    결측 행만 따로 astype(str) 한 뒤 고유값 목록 뒤에 이어 붙입니다.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 행별 코드, 고유값 문자열 배열
+    """
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(uniques).astype(str).to_numpy(dtype=object)
+
+    na_rows = codes < 0
+    if na_rows.any():
+        na_codes, na_uniques = pd.factorize(values[na_rows].astype(str))
+        codes = codes.copy()
+        codes[na_rows] = len(text) + na_codes
+        text = np.concatenate([text, np.asarray(na_uniques, dtype=object)])
+
+    return codes, text
+
+
+def _column_entry(df: pd.DataFrame, column: str) -> Tuple[np.ndarray, np.ndarray, Dict[Hashable, np.ndarray]]:
+    """데이터셋 컬럼의 (코드, 고유값 문자열, 조건 캐시)를 가져옵니다. (없으면 factorize)"""
+    columns = get_dataset_cache(df, _CACHE_NAMESPACE)
+    entry = columns.get(column)
+    if entry is None:
+        codes, text = _factorize_text(df[column])
+        entry = (codes, text, {})
+        columns[column] = entry
+    return entry
+
+
+def _evaluate(df: pd.DataFrame, column: str, key: Hashable, predicate) -> np.ndarray:
+    """고유값 문자열에 조건을 적용(캐시)하고 행 마스크로 펼칩니다."""
+    codes, text, predicates = _column_entry(df, column)
+    unique_mask = predicates.get(key)
+    if unique_mask is None:
+        unique_mask = np.fromiter((predicate(value) for value in text), dtype=bool, count=len(text))
+        predicates[key] = unique_mask
+    return unique_mask.take(codes)
+
+
+def contains(df: pd.DataFrame, column: str, pattern: str, case: bool = True, regex: bool = True) -> np.ndarray:
+    """
+    df[column].astype(str).str.contains(pattern, case=case, regex=regex, na=False)와 같은 행 마스크를 반환합니다.
+
+    정규식 특수문자가 없는 패턴은 리터럴 비교(regex=False)로 처리합니다.
+
+    Args:
+        df: 데이터프레임
+        column: 컬럼명
+        pattern: 포함 여부를 확인할 문자열 또는 정규식
+        case: 대소문자 구분 여부
+        regex: 정규식 패턴 여부
+
+    Returns:
+        np.ndarray: 행별 불리언 마스크
+    """
+    if regex and _REGEX_META_CHARACTERS.isdisjoint(pattern):
+        regex = False
+
+    if regex:
+        compiled = re.compile(pattern, flags=0 if case else re.IGNORECASE)
+        predicate = lambda value: compiled.search(value) is not None
+    elif case:
+        predicate = lambda value: pattern in value
+    else:
+        # pandas와 같은 대소문자 무시 리터럴 비교 (대문자로 변환 후 포함 여부)
+        upper_pattern = pattern.upper()
+        predicate = lambda value: upper_pattern in value.upper()
+
+    return _evaluate(df, column, ("contains", pattern, case, regex), predicate)
+
+
+def startswith(df: pd.DataFrame, column: str, prefix: Union[str, Tuple[str, ...]]) -> np.ndarray:
+    """
+    df[column].astype(str).str.startswith(prefix)와 같은 행 마스크를 반환합니다.
+
+    Args:
+        df: 데이터프레임
+        column: 컬럼명
+        prefix: 접두사 (튜플이면 하나라도 일치)
+
+    Returns:
+        np.ndarray: 행별 불리언 마스크
+    """
+    return _evaluate(df, column, ("startswith", prefix), lambda value: value.startswith(prefix))
+
+
+def matches(df: pd.DataFrame, column: str, pattern: str, case: bool = True) -> np.ndarray:
+    """
+    df[column].astype(str).str.match(pattern, case=case)와 같은 행 마스크를 반환합니다.
+
+    Args:
+        df: 데이터프레임
+        column: 컬럼명
+        pattern: 문자열 시작부터 일치해야 하는 정규식
+        case: 대소문자 구분 여부
+
+    Returns:
+        np.ndarray: 행별 불리언 마스크
+    """
+    compiled = re.compile(pattern, flags=0 if case else re.IGNORECASE)
+    return _evaluate(df, column, ("match", pattern, case), lambda value: compiled.match(value) is not None)
+
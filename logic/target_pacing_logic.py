@@ -0,0 +1,410 @@
+"""
+목표 진도(페이싱) 비즈니스 로직
+
+이 모듈은 월별 목표를 해당 월의 영업일에 나누어 일자별 누적 기대 달성 곡선을 만들고,
+누적 승인실적이 기대 진도보다 앞서는지 뒤처지는지 제품/구분별로 판정하는 로직을 포함합니다.
+목표 파일(targets.json)은 처음 필요할 때 읽어 수정 시각 기준으로 캐시하고,
+월별 진도 계획(영업일 달력 + 기대 누적 목표)은 월/목표별로 한 번만 계산하므로
+화면을 다시 그릴 때는 실적과 미리 계산된 곡선을 비교하는 비용만 듭니다.
+UI와 독립적으로 작동하여 단위 테스트가 가능하도록 설계되었습니다.
+"""
+
+import json
+import os
+import tempfile
+import pandas as pd
+import numpy as np
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+from utils.config import FIXED_HOLIDAYS, LUNAR_HOLIDAYS, ALTERNATIVE_HOLIDAYS
+from logic.daily_sales_logic import INSTALLATION_TARGET_DATA, derive_approval_targets
+
+# 목표 파일 경로
+DEFAULT_TARGETS_PATH = "targets.json"
+
+# 진도 구분 {목표 구분: (실적 건수 컬럼, 실적 매출액 컬럼)} - 온라인은 건수 목표 없음
+PACING_CHANNELS = {
+    "직접": ("본사직접승인_건수", "본사직접승인_매출액"),
+    "연계": ("연계승인_건수", "연계승인_매출액"),
+    "온라인": (None, "온라인_매출액")
+}
+
+# 총합계 행 이름 (analyze_approval_data_by_product 결과와 동일)
+TOTAL_ROW = "총합계"
+
+# targets.json 월별 합계 목표 키 {목표 구분: 키}
+_MONTHLY_TOTAL_KEYS = {"직접": "direct_target", "연계": "affiliate_target"}
+
+# 목표 파일 캐시 {경로: (수정 시각, 파일 내용)}
+_TARGET_FILE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# 진도 계획 캐시 {(연, 월, 경로, 수정 시각): 진도 계획}
+_PACING_PLAN_CACHE: Dict[Tuple[int, int, str, float], Dict[str, Any]] = {}
+_MAX_CACHED_PLANS = 12
+
+
+def _load_target_file(file_path: str) -> Tuple[float, Dict[str, Any]]:
+    """
+    목표 파일을 수정 시각 기준으로 캐시해서 읽습니다. (파일이 없거나 읽을 수 없으면 빈 내용)
+
+    Returns:
+        Tuple[float, Dict[str, Any]]: 수정 시각(없으면 0), 파일 내용
+    """
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return 0.0, {}
+
+    cached = _TARGET_FILE_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached
+
+    try:
+        with open(file_path, 'r') as f:
+            content = json.load(f)
+        if not isinstance(content, dict):
+            content = {}
+    except (OSError, ValueError) as e:
+        print(f"목표 파일 로드 중 오류: {str(e)}")
+        content = {}
+
+    _TARGET_FILE_CACHE[file_path] = (mtime, content)
+    return mtime, content
+
+
+def save_target_file(content: Dict[str, Any], file_path: str = DEFAULT_TARGETS_PATH) -> bool:
+    """
+    목표 파일을 원자적으로 저장합니다.
+
+    같은 폴더의 임시 파일에 먼저 쓰고 os.replace로 교체하므로, 저장 도중 오류가 나거나
+    다른 세션이 동시에 읽어도 반쯤 쓰인 파일이 보이지 않습니다.
+
+    Args:
+        content: 저장할 목표 파일 내용
+        file_path: 목표 파일 경로
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=directory, prefix=".targets_", suffix=".tmp", delete=False) as f:
+            temp_path = f.name
+            json.dump(content, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except OSError as e:
+        print(f"목표 파일 저장 중 오류: {str(e)}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+    # 수정 시각 해상도가 낮은 파일 시스템에서도 이전 내용/진도 계획이 남지 않도록 캐시 교체
+    _TARGET_FILE_CACHE[file_path] = (os.path.getmtime(file_path), content)
+    for key in [key for key in _PACING_PLAN_CACHE if key[2] == file_path]:
+        _PACING_PLAN_CACHE.pop(key)
+    return True
+
+
+def update_month_targets(
+    month: int,
+    monthly_totals: Optional[Dict[str, float]] = None,
+    installation_targets: Optional[Dict[str, Dict[str, Dict[str, Optional[int]]]]] = None,
+    file_path: str = DEFAULT_TARGETS_PATH
+) -> bool:
+    """
+    한 달의 목표만 바꿔서 목표 파일에 저장합니다. (다른 달 목표는 유지)
+
+    Args:
+        month: 월 (1~12)
+        monthly_totals: {구분(직접/연계): 매출액} 월 합계 목표 (None이면 변경 없음)
+        installation_targets: 제품별 설치매출 목표 (None이면 변경 없음)
+        file_path: 목표 파일 경로
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    _, content = _load_target_file(file_path)
+    content = json.loads(json.dumps(content))  # 캐시된 내용은 그대로 두고 복사본 수정
+    month_key = str(month)
+
+    if monthly_totals is not None:
+        monthly_entry = content.setdefault("monthly_targets", {}).setdefault(month_key, {})
+        for channel, key in _MONTHLY_TOTAL_KEYS.items():
+            if channel in monthly_totals:
+                monthly_entry[key] = monthly_totals[channel]
+
+    if installation_targets is not None:
+        content.setdefault("product_targets", {})[month_key] = installation_targets
+
+    return save_target_file(content, file_path)
+
+
+def get_month_targets(month: int, file_path: str = DEFAULT_TARGETS_PATH) -> Dict[str, Any]:
+    """
+    월별 목표를 가져옵니다.
+
+    제품별 설치매출 목표는 targets.json의 product_targets[월]이 있으면 사용하고
+    없으면 INSTALLATION_TARGET_DATA를 사용하며, 승인매출 목표(105%)는 여기서 한 번만 계산합니다.
+    월 합계(직접/연계 매출액) 목표는 monthly_targets[월]에서 가져옵니다.
+
+    Args:
+        month: 월 (1~12)
+        file_path: 목표 파일 경로
+
+    Returns:
+        Dict[str, Any]: {"installation": 제품별 설치 목표, "approval": 제품별 승인 목표,
+                         "monthly_totals": {구분: 매출액} (파일에 없으면 빈 딕셔너리)}
+    """
+    _, content = _load_target_file(file_path)
+    month_key = str(month)
+
+    installation_targets = content.get("product_targets", {}).get(month_key) or INSTALLATION_TARGET_DATA
+
+    monthly_entry = content.get("monthly_targets", {}).get(month_key) or {}
+    monthly_totals = {
+        channel: monthly_entry[key]
+        for channel, key in _MONTHLY_TOTAL_KEYS.items()
+        if monthly_entry.get(key) is not None
+    }
+
+    return {
+        "installation": installation_targets,
+        "approval": derive_approval_targets(installation_targets),
+        "monthly_totals": monthly_totals
+    }
+
+
+def targets_to_frame(installation_targets: Dict[str, Dict[str, Dict[str, Optional[int]]]]) -> pd.DataFrame:
+    """
+    제품별 설치매출 목표를 편집용 표로 변환합니다.
+
+    Args:
+        installation_targets: {제품: {구분: {"건수", "매출액"}}} 설치매출 목표
+
+    Returns:
+        pd.DataFrame: 제품 인덱스 × [직접_건수, 직접_매출액, 연계_건수, 연계_매출액, 온라인_매출액]
+    """
+    rows = {}
+    for product, targets in installation_targets.items():
+        row = {}
+        for channel, (count_column, _) in PACING_CHANNELS.items():
+            if count_column is not None:
+                row[f"{channel}_건수"] = targets.get(channel, {}).get("건수") or 0
+            row[f"{channel}_매출액"] = targets.get(channel, {}).get("매출액") or 0
+        rows[product] = row
+    frame = pd.DataFrame.from_dict(rows, orient="index")
+    frame.index.name = "제품"
+    return frame
+
+
+def targets_from_frame(frame: pd.DataFrame) -> Dict[str, Dict[str, Dict[str, Optional[int]]]]:
+    """
+    편집용 표(targets_to_frame 형식)를 제품별 설치매출 목표로 되돌립니다. (빈 칸은 0, 온라인 건수는 None)
+
+    Args:
+        frame: 제품 인덱스 × 구분별 건수/매출액 표
+
+    Returns:
+        Dict: {제품: {구분: {"건수", "매출액"}}} 설치매출 목표
+    """
+    values = frame.fillna(0)
+    return {
+        str(product): {
+            channel: {
+                "건수": int(values.at[product, f"{channel}_건수"]) if count_column is not None else None,
+                "매출액": int(values.at[product, f"{channel}_매출액"])
+            }
+            for channel, (count_column, _) in PACING_CHANNELS.items()
+        }
+        for product in values.index
+    }
+
+
+def _holiday_dates(year: int) -> np.ndarray:
+    """연도의 공휴일 목록 (법정/음력/대체 공휴일 백업 데이터, datetime64[D])"""
+    holidays = [date(year, month, day) for month, day in FIXED_HOLIDAYS]
+    holidays += [date(*day) for day in LUNAR_HOLIDAYS if day[0] == year]
+    holidays += [date(*day) for day in ALTERNATIVE_HOLIDAYS if day[0] == year]
+    return np.array(sorted(set(holidays)), dtype="datetime64[D]")
+
+
+def build_business_day_calendar(year: int, month: int) -> pd.DataFrame:
+    """
+    월의 영업일 달력과 누적 기대 진도율을 계산합니다.
+
+    영업일은 주말과 config의 공휴일(백업 데이터)을 제외한 날이며, 공휴일 API는 호출하지 않습니다.
+    기대 진도율은 해당 일자까지(당일 포함) 지난 영업일 수 / 월 전체 영업일 수입니다.
+
+    Args:
+        year: 연도
+        month: 월
+
+    Returns:
+        pd.DataFrame: 일자 인덱스 × [영업일, 누적영업일, 기대진도율] 데이터프레임
+    """
+    start = np.datetime64(f"{year:04d}-{month:02d}", "M")
+    days = np.arange(start.astype("datetime64[D]"), (start + 1).astype("datetime64[D]"))
+
+    is_business_day = np.is_busday(days, holidays=_holiday_dates(year))
+    cumulative_days = np.cumsum(is_business_day)
+    total_days = int(cumulative_days[-1])
+
+    if total_days > 0:
+        expected_ratio = cumulative_days / total_days
+    else:
+        # 영업일이 없는 달은 달력일 기준으로 균등 분배
+        expected_ratio = np.arange(1, len(days) + 1) / len(days)
+
+    return pd.DataFrame({
+        "영업일": is_business_day,
+        "누적영업일": cumulative_days,
+        "기대진도율": expected_ratio
+    }, index=pd.DatetimeIndex(days, name="일자"))
+
+
+def _target_table(targets: Dict[str, Any], products: List[str]) -> pd.DataFrame:
+    """
+    제품/총합계 × 구분별 목표 건수/매출액 표를 만듭니다.
+
+    총합계 매출액 목표는 targets.json 월 합계 목표가 있으면 사용하고 없으면 제품 목표 합계입니다.
+    """
+    approval_targets = targets["approval"]
+    rows = []
+    for channel in PACING_CHANNELS:
+        count_total = 0
+        amount_total = 0
+        for product in products:
+            channel_target = approval_targets.get(product, {}).get(channel, {})
+            count = channel_target.get("건수")
+            amount = channel_target.get("매출액") or 0
+            rows.append({"제품": product, "구분": channel, "목표_건수": count, "목표_매출액": amount})
+            count_total += count or 0
+            amount_total += amount
+        rows.append({
+            "제품": TOTAL_ROW,
+            "구분": channel,
+            "목표_건수": count_total if PACING_CHANNELS[channel][0] is not None else None,
+            "목표_매출액": targets["monthly_totals"].get(channel, amount_total)
+        })
+
+    table = pd.DataFrame(rows).set_index(["제품", "구분"])
+    return table.reindex(pd.MultiIndex.from_product([products + [TOTAL_ROW], list(PACING_CHANNELS)], names=["제품", "구분"]))
+
+
+def get_pacing_plan(
+    year: int,
+    month: int,
+    file_path: str = DEFAULT_TARGETS_PATH,
+    products: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    월별 진도 계획(영업일 달력, 목표 표, 일자별 누적 기대 목표 곡선)을 가져옵니다.
+    (연/월/목표 파일 수정 시각별로 캐시하므로 재실행 시 다시 계산하지 않음)
+
+    Args:
+        year: 연도
+        month: 월
+        file_path: 목표 파일 경로
+        products: 제품 목록 (None이면 승인 목표의 제품 순서)
+
+    Returns:
+        Dict[str, Any]: {
+            "calendar": build_business_day_calendar 결과,
+            "targets": (제품, 구분) × [목표_건수, 목표_매출액],
+            "expected_count": 일자 × (제품, 구분) 누적 기대 건수,
+            "expected_amount": 일자 × (제품, 구분) 누적 기대 매출액
+        }
+    """
+    mtime, _ = _load_target_file(file_path)
+    key = (year, month, file_path, mtime)
+    plan = _PACING_PLAN_CACHE.get(key)
+    if plan is not None and (products is None or plan["products"] == list(products)):
+        return plan
+
+    targets = get_month_targets(month, file_path)
+    products = list(products) if products is not None else list(targets["approval"])
+    calendar = build_business_day_calendar(year, month)
+    target_table = _target_table(targets, products)
+
+    # 누적 기대 목표 = 일자별 기대 진도율 × 목표 (외적으로 한 번에 계산)
+    ratio = calendar["기대진도율"].to_numpy()
+    count_targets = target_table["목표_건수"].astype(float).to_numpy()
+    amount_targets = target_table["목표_매출액"].astype(float).to_numpy()
+
+    plan = {
+        "products": products,
+        "calendar": calendar,
+        "targets": target_table,
+        "expected_count": pd.DataFrame(np.outer(ratio, count_targets), index=calendar.index, columns=target_table.index),
+        "expected_amount": pd.DataFrame(np.outer(ratio, amount_targets), index=calendar.index, columns=target_table.index)
+    }
+
+    if len(_PACING_PLAN_CACHE) >= _MAX_CACHED_PLANS:
+        _PACING_PLAN_CACHE.pop(next(iter(_PACING_PLAN_CACHE)))
+    _PACING_PLAN_CACHE[key] = plan
+    return plan
+
+
+def evaluate_pacing(
+    cumulative_approval: pd.DataFrame,
+    as_of: Union[date, datetime, pd.Timestamp],
+    file_path: str = DEFAULT_TARGETS_PATH
+) -> pd.DataFrame:
+    """
+    누적 승인실적을 기준일의 기대 진도와 비교합니다.
+
+    Args:
+        cumulative_approval: analyze_approval_data_by_product 결과 (제품 컬럼 + 구분별 건수/매출액)
+        as_of: 기준일 (보통 승인 데이터의 최신 주문 일자)
+        file_path: 목표 파일 경로
+
+    Returns:
+        pd.DataFrame: 제품/구분별 [목표_매출액, 기대_매출액, 실적_매출액, 차이_매출액, 기대대비_매출액,
+                      목표_건수, 기대_건수, 실적_건수, 차이_건수, 진도율, 상태] 데이터프레임
+                      (상태: "앞섬" / "뒤처짐" / "목표 없음")
+    """
+    as_of = pd.Timestamp(as_of).normalize()
+    products = [product for product in cumulative_approval["제품"] if product != TOTAL_ROW]
+    plan = get_pacing_plan(as_of.year, as_of.month, file_path, products)
+
+    actual = cumulative_approval.set_index("제품")
+    index = plan["targets"].index
+    actual_count = np.array([
+        actual.at[product, PACING_CHANNELS[channel][0]] if PACING_CHANNELS[channel][0] and product in actual.index else np.nan
+        for product, channel in index
+    ], dtype=float)
+    actual_amount = np.array([
+        actual.at[product, PACING_CHANNELS[channel][1]] if product in actual.index else np.nan
+        for product, channel in index
+    ], dtype=float)
+
+    expected_count = plan["expected_count"].loc[as_of].to_numpy()
+    expected_amount = plan["expected_amount"].loc[as_of].to_numpy()
+    target_amount = plan["targets"]["목표_매출액"].astype(float).to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amount_vs_expected = np.where(expected_amount > 0, actual_amount / expected_amount * 100, np.nan)
+
+    result = pd.DataFrame({
+        "목표_매출액": target_amount,
+        "기대_매출액": np.round(expected_amount),
+        "실적_매출액": actual_amount,
+        "차이_매출액": actual_amount - np.round(expected_amount),
+        "기대대비_매출액": np.round(amount_vs_expected, 1),
+        "목표_건수": plan["targets"]["목표_건수"].to_numpy(),
+        "기대_건수": np.round(expected_count, 1),
+        "실적_건수": actual_count,
+        "차이_건수": np.round(actual_count - expected_count, 1),
+        "진도율": round(float(plan["calendar"].at[as_of, "기대진도율"]) * 100, 1),
+        "상태": np.where(
+            target_amount > 0,
+            np.where(actual_amount >= np.round(expected_amount), "앞섬", "뒤처짐"),
+            "목표 없음"
+        )
+    }, index=index)
+
+    return result.reset_index()
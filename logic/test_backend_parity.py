@@ -0,0 +1,179 @@
+"""
+분석 백엔드 결과 일치 테스트
+
+이 모듈은 Polars/DuckDB 백엔드가 같은 입력에서 pandas 백엔드와 같은 결과를 내는지 검증합니다.
+결측값, 대소문자, 중복 계약 번호가 섞인 무작위 데이터프레임을 생성해 공개 분석 함수를 백엔드별로 실행하고 비교하며,
+polars/duckdb 패키지가 없으면 해당 테스트는 건너뜁니다.
+
+실행 방법:
+    pytest logic/test_backend_parity.py -v
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from logic.promotion_logic import get_promotion_matrix, clear_promotion_cache
+from logic.daily_approval_logic import analyze_daily_approval
+from logic.daily_sales_logic import analyze_approval_data_by_product
+from logic.campaign_logic import build_campaign_crosstab
+from logic import duckdb_backend_logic
+
+# 생성 데이터 크기와 시드
+ROW_COUNTS = [1, 500, 5000]
+SEED = 20240601
+
+
+def _pick(rng: np.random.Generator, values, size: int) -> np.ndarray:
+    """값 목록(None은 결측값)에서 무작위로 선택한 object 배열"""
+    return np.array(values, dtype=object)[rng.integers(0, len(values), size)]
+
+
+def make_promotion_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    """프로모션 분석용 무작위 데이터프레임"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "상담사": _pick(rng, ["김철수", "이영희", "박민수", "최지원", None], rows),
+        "상담사 조직": _pick(rng, ["CRM파트", "CRM팀", "온라인파트", None], rows),
+        "판매 인입경로": _pick(rng, ["CRM", "CRM-아웃", "온라인", None], rows),
+        "대분류": _pick(rng, ["안마의자", "라클라우드", "정수기", "비데", "LACLOUD", None], rows),
+        "판매 유형": _pick(rng, ["일반", "더케어", "멤버십", "케어 서비스", None], rows),
+        "매출 금액": rng.integers(0, 5_000_000, rows),
+        "주문 일자": pd.Timestamp("2024-05-01") + pd.to_timedelta(rng.integers(0, 31, rows), unit="D"),
+    })
+
+
+def make_approval_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    """일일 승인 현황 분석용 무작위 데이터프레임"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "상담사": _pick(rng, ["김철수", "이영희", "박민수", None], rows),
+        "대분류": _pick(rng, ["안마의자", "라클라우드", "정수기", "비데", None], rows),
+        "매출 금액": rng.integers(0, 5_000_000, rows),
+        "주문 일자": pd.Timestamp("2024-05-01") + pd.to_timedelta(rng.integers(0, 10, rows), unit="D"),
+    })
+
+
+def make_sales_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    """제품별 승인매출 분석용 무작위 데이터프레임 (계약 번호 중복 포함)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "계약 번호": rng.integers(0, max(1, rows // 2), rows),
+        "일반회차 캠페인": _pick(rng, ["V-봄", "C-여름", "CB-온라인", "정규캠", "AS-01", "재분배", "기타", None], rows),
+        "판매인입경로": _pick(rng, ["CRM", "CRM-아웃", "연계", None], rows),
+        "대분류": _pick(rng, ["안마의자", "라클라우드", "정수기", "비데", None], rows),
+        "판매유형": _pick(rng, ["일반", "더케어", "렌탈", None], rows),
+        "매출액": rng.integers(0, 5_000_000, rows),
+    })
+
+
+def make_consultation_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    """상담 건수 집계용 무작위 데이터프레임"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "상담DB상태": _pick(rng, ["예약", "체험신청", "신규", "주문승인", "부재", None], rows),
+        "일반회차 캠페인": _pick(rng, ["V-봄", "C-여름", "정규캠", "재분배", None], rows),
+        "상담사": _pick(rng, ["김철수", "이영희", "박민수", None], rows),
+    })
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """테스트 사이에 데이터셋별 캐시가 섞이지 않도록 비웁니다."""
+    clear_promotion_cache()
+    yield
+    clear_promotion_cache()
+
+
+class TestPolarsParity:
+    """pandas 백엔드와 Polars 백엔드 결과 비교"""
+
+    @pytest.fixture(autouse=True)
+    def _require_polars(self):
+        pytest.importorskip("polars")
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    @pytest.mark.parametrize("include_online, include_indirect", [(False, False), (True, True)])
+    def test_count_promotion_products(self, rows, include_online, include_indirect):
+        """프로모션 제품 분류와 상담사 × 제품 건수 행렬"""
+        df = make_promotion_frame(rows)
+        start, end = pd.Timestamp("2024-05-05"), pd.Timestamp("2024-05-25")
+
+        pandas_filtered, pandas_matrix = get_promotion_matrix(
+            df, start, end, include_online, include_indirect, backend="pandas"
+        )
+        polars_filtered, polars_matrix = get_promotion_matrix(
+            df, start, end, include_online, include_indirect, backend="polars"
+        )
+
+        pd.testing.assert_frame_equal(polars_matrix, pandas_matrix, check_dtype=False)
+        assert polars_filtered["제품분류"].tolist() == pandas_filtered["제품분류"].tolist()
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_sum_daily_approval_metrics(self, rows):
+        """일일 승인 현황 (상담사별 / 전체 누적 / 일일 합계)"""
+        pandas_result, pandas_error = analyze_daily_approval(make_approval_frame(rows), backend="pandas")
+        polars_result, polars_error = analyze_daily_approval(make_approval_frame(rows), backend="polars")
+
+        assert pandas_error is None and polars_error is None
+        assert polars_result["total_data"] == pytest.approx(pandas_result["total_data"])
+        assert polars_result["daily_data"] == pytest.approx(pandas_result["daily_data"])
+        assert polars_result["latest_date"] == pandas_result["latest_date"]
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(polars_result["consultant_data"]),
+            pd.DataFrame(pandas_result["consultant_data"]),
+            check_dtype=False
+        )
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_sum_approval_by_product(self, rows):
+        """제품 × 구분별 승인 건수/매출액 (계약 번호 중복 제거 포함)"""
+        df = make_sales_frame(rows)
+        pd.testing.assert_frame_equal(
+            analyze_approval_data_by_product(df, backend="polars"),
+            analyze_approval_data_by_product(df, backend="pandas"),
+            check_dtype=False
+        )
+
+
+class TestDuckDBParity:
+    """pandas 백엔드와 DuckDB 백엔드 결과 비교"""
+
+    @pytest.fixture(autouse=True)
+    def _require_duckdb(self):
+        pytest.importorskip("duckdb")
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    @pytest.mark.parametrize("keys", [["상담DB상태", "일반회차 캠페인", "상담사"], ["상담DB상태", "상담사"]])
+    def test_count_by_keys(self, rows, keys):
+        """키 조합별 건수 (결측값 키 유지)"""
+        df = make_consultation_frame(rows)
+        expected = df.groupby(keys, dropna=False).size()
+        result = duckdb_backend_logic.count_by_keys(df, keys)
+
+        # 결측값 키의 인덱스 레벨 표현은 pandas 버전마다 다르므로 키 값과 건수를 행 단위로 비교
+        pd.testing.assert_frame_equal(
+            result.rename("n").reset_index(),
+            expected.sort_index(na_position="last").rename("n").reset_index(),
+            check_dtype=False
+        )
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_count_crosstab(self, rows):
+        """캠페인 × 상담DB상태 교차표"""
+        df = make_consultation_frame(rows)
+        pd.testing.assert_frame_equal(
+            duckdb_backend_logic.count_crosstab(df, "일반회차 캠페인", "상담DB상태"),
+            build_campaign_crosstab(df, "일반회차 캠페인", "상담DB상태"),
+            check_dtype=False
+        )
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_sum_approval_by_product(self, rows):
+        """제품 × 구분별 승인 건수/매출액 (계약 번호 중복 제거 포함)"""
+        df = make_sales_frame(rows)
+        pd.testing.assert_frame_equal(
+            analyze_approval_data_by_product(df, backend="duckdb"),
+            analyze_approval_data_by_product(df, backend="pandas"),
+            check_dtype=False
+        )
@@ -0,0 +1,73 @@
+"""
+추첨권 당첨 확률 추정 테스트
+
+이 모듈은 estimate_win_probabilities의 중복 없는 추첨 확률이 회차별 순차 추첨의 정확한 확률과 일치하는지,
+추첨권이 한 상담사에게 몰린 경우에도 빠르게 끝나는지 검증합니다.
+정확한 확률은 후보가 적은 경우 당첨 순서를 모두 나열하여 계산합니다.
+
+실행 방법:
+    pytest logic/test_promotion_lottery_logic.py -v
+"""
+
+import time
+from itertools import permutations
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from logic.promotion_lottery_logic import estimate_win_probabilities
+
+
+def exact_win_probabilities(weights, n_winners: int) -> np.ndarray:
+    """회차별 순차 추첨(중복 없음)의 상담사별 정확한 당첨 확률"""
+    weights = np.asarray(weights, dtype=float)
+    probabilities = np.zeros(len(weights))
+    for order in permutations(range(len(weights)), n_winners):
+        remaining = weights.sum()
+        probability = 1.0
+        for winner in order:
+            probability *= weights[winner] / remaining
+            remaining -= weights[winner]
+        probabilities[list(order)] += probability
+    return probabilities
+
+
+def make_tickets(weights) -> pd.DataFrame:
+    """추첨권 테이블 [상담사, 추첨권]"""
+    return pd.DataFrame({
+        "상담사": [f"상담사{i}" for i in range(len(weights))],
+        "추첨권": weights
+    })
+
+
+class TestEstimateWinProbabilities:
+    """중복 없는 추첨의 당첨 확률 추정"""
+
+    @pytest.mark.parametrize("weights, n_winners", [
+        ([5, 3, 1, 1], 2),
+        ([10, 4, 3, 2, 1], 3),
+        ([100000, 1, 1, 1], 3),
+    ])
+    def test_matches_sequential_draw(self, weights, n_winners):
+        """추첨권 편중 여부와 관계없이 순차 추첨의 정확한 확률과 일치"""
+        probabilities, error = estimate_win_probabilities(
+            make_tickets(weights), n_winners, n_simulations=200000, seed=7
+        )
+        assert error is None
+
+        expected = pd.Series(exact_win_probabilities(weights, n_winners), index=make_tickets(weights)["상담사"])
+        estimated = probabilities.set_index("상담사")["당첨확률"].reindex(expected.index)
+        np.testing.assert_allclose(estimated.to_numpy(), expected.to_numpy(), atol=0.005)
+
+    def test_skewed_weights_finish_quickly(self):
+        """추첨권이 한 상담사에게 몰려 있어도 100만 회 시뮬레이션이 재추첨 없이 끝남"""
+        started = time.perf_counter()
+        probabilities, error = estimate_win_probabilities(
+            make_tickets([100000, 1, 1, 1]), 3, n_simulations=1000000, seed=1
+        )
+        elapsed = time.perf_counter() - started
+
+        assert error is None
+        assert probabilities["당첨확률"].sum() == pytest.approx(3.0)
+        assert elapsed < 5.0
@@ -0,0 +1,125 @@
+"""
+프로모션 시나리오 비교 테스트
+
+이 모듈은 simulate_promotion_scenarios가 promotion_configs에 저장된 설정마다
+단일 설정 분석(analyze_promotion_data)과 같은 대상자, 추첨권, 순위, 포상금을 내는지 검증합니다.
+동점자의 순서는 두 엔진이 다를 수 있으므로 순위는 각 순위에 놓인 상담사의 정렬 키 값으로 비교합니다.
+
+실행 방법:
+    pytest logic/test_promotion_scenario_logic.py -v
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from logic.promotion_logic import (
+    analyze_promotion_data, get_promotion_matrix, build_promotion_amount_matrix, clear_promotion_cache
+)
+from logic.promotion_scenario_logic import normalize_promotion_scenario, simulate_promotion_scenarios
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "promotion_configs"
+CONFIG_PATHS = sorted(CONFIG_DIR.glob("*.json"))
+
+START_DATE = pd.Timestamp("2024-05-01")
+END_DATE = pd.Timestamp("2024-05-31 23:59:59")
+
+
+def make_promotion_frame(rows: int = 3000, seed: int = 20240601) -> pd.DataFrame:
+    """상담사 결측값, 서비스 품목, 비대상 제품, 비CRM 인입이 섞인 프로모션 데이터프레임"""
+    rng = np.random.default_rng(seed)
+    consultants = np.array(["김철수", "이영희", "박민수", "최지원", "정다은", "한승우", None], dtype=object)
+    return pd.DataFrame({
+        "상담사": consultants[rng.integers(0, len(consultants), rows)],
+        "상담사 조직": "CRM파트",
+        "판매 인입경로": np.array(["CRM", "CRM-아웃", "온라인"], dtype=object)[rng.integers(0, 3, rows)],
+        "대분류": np.array(["안마의자", "라클라우드", "정수기", "비데"], dtype=object)[rng.integers(0, 4, rows)],
+        "판매 유형": np.array(["일반", "케어", "멤버십"], dtype=object)[rng.integers(0, 3, rows)],
+        "매출 금액": rng.integers(0, 5_000_000, rows),
+        "주문 일자": START_DATE + pd.to_timedelta(rng.integers(0, 40, rows), unit="D"),
+    })
+
+
+def analyze_with_config(df: pd.DataFrame, config: dict) -> pd.DataFrame:
+    """저장된 설정으로 analyze_promotion_data 실행 (UI의 저장 설정 적용과 같은 인자, 순위는 위치 순)"""
+    settings = config["settings"]
+    promotion_type = settings.get("promotion_type", "포상금")
+    reward_config = config.get("data") if promotion_type == "포상금" else None
+    result_df, error = analyze_promotion_data(
+        df,
+        settings.get("include_products", ["안마의자", "라클라우드", "정수기"]),
+        settings.get("include_services", False),
+        settings.get("direct_only", True),
+        settings.get("criteria", ["승인건수"]),
+        settings.get("min_condition", 0),
+        sum(item.get("count", 0) for item in reward_config) if reward_config else len(df),
+        START_DATE,
+        END_DATE,
+        promotion_type,
+        reward_config,
+        config.get("data") if promotion_type == "추첨권" else None,
+        rank_method="ordinal",
+        lottery_count_config=(
+            config.get("lottery_count_config")
+            if promotion_type == "추첨권" and config.get("lottery_method") == "approval_count" else None
+        )
+    )
+    assert error is None
+    return result_df.set_index("상담사")
+
+
+@pytest.fixture(scope="module")
+def promotion_df() -> pd.DataFrame:
+    """모듈 전체에서 공유하는 프로모션 데이터프레임 (단계 캐시 초기화 후 생성)"""
+    clear_promotion_cache()
+    return make_promotion_frame()
+
+
+class TestSimulateMatchesSingleConfig:
+    """저장된 설정별 시나리오 결과와 단일 설정 분석 결과 비교"""
+
+    @pytest.mark.parametrize("config_path", CONFIG_PATHS, ids=[path.stem for path in CONFIG_PATHS])
+    def test_matches_analyze_promotion_data(self, promotion_df, config_path):
+        """대상자, 추첨권, 순위별 정렬 키, 순위별 포상금이 단일 설정 분석과 일치"""
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        settings = config["settings"]
+        expected = analyze_with_config(promotion_df, config)
+
+        filtered_df, matrix = get_promotion_matrix(
+            promotion_df, START_DATE, END_DATE,
+            include_online=True, include_indirect=not settings.get("direct_only", True)
+        )
+        results, error = simulate_promotion_scenarios(
+            matrix, [normalize_promotion_scenario(config_path.stem, config)],
+            product_amounts=build_promotion_amount_matrix(filtered_df)
+        )
+        assert error is None
+
+        name = config_path.stem
+        qualified = results["labels"][name] == "Y"
+        assert set(qualified[qualified].index) == set(expected.index)
+
+        if settings.get("promotion_type") == "추첨권":
+            scores = results["scores"].loc[expected.index, name]
+            np.testing.assert_array_equal(scores.to_numpy(), expected["추첨권"].to_numpy())
+
+        # 각 순위에 놓인 상담사의 정렬 키 값 비교 (동점자 순서 차이는 허용)
+        key_columns = [column for column in ["누적승인(건)", "누적승인(액)", "추첨권"] if column in expected.columns]
+        ranks = results["ranks"].loc[expected.index, name].sort_values()
+        assert ranks.tolist() == list(range(1, len(expected) + 1))
+        expected_by_rank = expected.sort_values("순위")
+        np.testing.assert_array_equal(
+            expected.loc[ranks.index, key_columns].to_numpy(),
+            expected_by_rank[key_columns].to_numpy()
+        )
+
+        if "포상금" in expected.columns:
+            expected_payouts = [
+                0 if reward == "N" else int(reward.replace(",", "").rstrip("원"))
+                for reward in expected_by_rank["포상금"]
+            ]
+            payouts = results["payouts"].loc[ranks.index, name]
+            assert payouts.tolist() == expected_payouts
@@ -691,7 +691,7 @@ USAGE_GUIDE_MARKDOWN = """
 <div class="nanumgothic-guide">
 <h3>사용 가이드</h3>
 <ol>
-<li>상담주문계약내역 및 콜타임 엑셀 파일을 업로드하세요.</li>
+<li>상담주문계약내역 및 콜타임 엑셀 파일을 업로드하세요. (콜타임 리포트가 그룹/층별로 나뉘어 있으면 여러 파일을 함께 선택)</li>
 <li>파일이 업로드되면 자동으로 분석이 진행됩니다.</li>
 <li>조직별로 상담원 실적을 확인하고 엑셀로 다운로드할 수 있습니다.</li>
 </ol>
@@ -13,11 +13,14 @@ from typing import Dict, List, Optional, Any, Union
 
 # 비즈니스 로직 가져오기
 from logic.campaign_logic import (
+    CAMPAIGN_BACKENDS,
     process_campaign_files,
     process_consultant_data,
     create_excel_file,
     format_dataframe_for_display
 )
+from logic.analysis_backend_logic import get_available_backends
+from ui.history_ui import show_history_section, record_analysis_history
 
 # CSS 스타일 가져오기
 from styles.campaign_styles import apply_styles
@@ -146,6 +149,18 @@ def show():
     # 파일 업로드 전 안내 화면
     st.info("상담주문내역 파일을 모두 업로드한 후 분석 시작을 누르면 분석이 시작됩니다.")
     
+    # 분석 백엔드 선택 (duckdb 설치 시에만 표시)
+    available_backends = get_available_backends(CAMPAIGN_BACKENDS)
+    backend = "pandas"
+    if len(available_backends) > 1:
+        backend = st.selectbox(
+            "분석 엔진",
+            options=list(available_backends.keys()),
+            format_func=lambda key: available_backends[key],
+            key="campaign_backend",
+            help="수백만 행 규모의 월/분기 데이터는 DuckDB가 더 빠릅니다. 결과는 동일합니다."
+        )
+    
     # 분석 버튼
     analyze_button = st.button("분석 시작", key="analyze_campaign_tab3")
     
@@ -156,10 +171,14 @@ def show():
             start_time = time.time()
 
             # 캠페인 분석 실행
-            results, cleaned_data, before_count, after_count = process_campaign_files(st.session_state.campaign_files)
+            results, cleaned_data, before_count, after_count = process_campaign_files(st.session_state.campaign_files, backend)
             st.session_state.campaign_results = results
             st.session_state.cleaned_data = cleaned_data
             
+            # 캠페인 전환 집계 이력 저장 (영업일 + 원본 파일 해시 기준, 같은 파일은 한 번만)
+            if results is not None:
+                record_analysis_history("campaign", None, st.session_state.campaign_files, results, "행 레이블")
+            
             # 상담사별 분석 실행 (상담DB상태가 "신규"인 데이터가 있는 경우에만)
             if cleaned_data is not None:
                 consultant_results, error = process_consultant_data(cleaned_data)
@@ -191,6 +210,9 @@ def show():
             st.session_state.cleaned_data, 
             st.session_state.consultant_results
         )
+    
+    # 누적 이력 추이
+    show_history_section("campaign", default_metric="전환율", default_entities=["총합계"])
 
 def display_results(results_df, cleaned_data, consultant_df):
     """
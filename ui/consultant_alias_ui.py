@@ -0,0 +1,47 @@
+"""
+상담사 이름 별칭 지정 UI 모듈
+
+콜타임/주문 데이터의 이름 매칭이 모호한 상담사를 안내하고,
+후보 중 하나를 직접 골라 별칭으로 저장하는 공통 위젯을 제공합니다.
+저장된 별칭은 다음 분석부터 모든 자동 매칭보다 먼저 적용됩니다.
+"""
+
+import streamlit as st
+from typing import Dict, List
+
+from utils.consultant_alias_manager import add_consultant_alias
+
+
+def show_ambiguous_name_editor(ambiguous_names: Dict[str, List[str]], scope: str, key: str, message: str) -> None:
+    """
+    이름 매칭이 모호한 상담사를 경고로 표시하고, 후보를 골라 별칭을 저장하는 폼을 표시합니다.
+
+    Args:
+        ambiguous_names: 모호한 이름 → 후보 목록 (resolve_consultant_names 결과)
+        scope: 별칭 매칭 방향 (consultant_alias_manager.SCOPE_*)
+        key: 위젯 키 접두사 (탭별로 구분)
+        message: 경고 문구 (이름 목록 앞에 표시)
+    """
+    if not ambiguous_names:
+        return
+
+    ambiguous_text = ", ".join(f"{name} → {'/'.join(targets)}" for name, targets in ambiguous_names.items())
+    st.warning(f"⚠️ {message}: {ambiguous_text}")
+
+    with st.expander("모호한 이름 직접 지정", expanded=False):
+        with st.form(f"{key}_alias_form"):
+            selections = {
+                name: st.selectbox(
+                    name, options=["지정 안 함"] + list(targets), key=f"{key}_alias_{name}"
+                )
+                for name, targets in ambiguous_names.items()
+            }
+            submitted = st.form_submit_button("별칭 저장")
+
+        if submitted:
+            chosen = {name: target for name, target in selections.items() if target != "지정 안 함"}
+            failed = [name for name, target in chosen.items() if not add_consultant_alias(name, target, scope)]
+            if failed:
+                st.error(f"❌ 별칭 저장에 실패했습니다: {', '.join(failed)}")
+            elif chosen:
+                st.success(f"✅ {len(chosen)}명의 별칭을 저장했습니다. 다시 분석하면 반영됩니다.")
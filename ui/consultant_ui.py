@@ -9,15 +9,23 @@ import streamlit as st
 import pandas as pd
 import base64
 import plotly.express as px
-from datetime import datetime, time
+from datetime import datetime
 import uuid
 from typing import Dict, List, Optional, Any
 
 # 비즈니스 로직 가져오기
 from logic.consultant_logic import (
-    process_consultant_file, process_calltime_file, 
-    analyze_consultant_performance, create_excel_report
+    process_consultant_file, analyze_consultant_performance, create_excel_report
 )
+from logic.calltime_target_logic import (
+    WORK_CONFIG, get_work_config, get_work_profile_name, calculate_target_calltime_seconds,
+    compute_calltime_targets, status_emojis
+)
+from logic.calltime_snapshot_logic import (
+    load_calltime_uploads, record_calltime_snapshot, PACE_DROP_THRESHOLD, DEFAULT_SNAPSHOT_SCOPE
+)
+from ui.history_ui import show_history_section, record_analysis_history
+from ui.consultant_alias_ui import show_ambiguous_name_editor
 # CSS 스타일 가져오기
 from styles.consultant_styles import (
     CONSULTANT_TABLE_STYLE, CONSULTANT_SAMPLE_TABLE_STYLE,
@@ -25,7 +33,7 @@ from styles.consultant_styles import (
     CONSULTANT_DESCRIPTION, USAGE_GUIDE_MARKDOWN
 )
 # 유틸리티 함수 가져오기
-from utils.utils import format_time, get_previous_business_day, is_holiday
+from utils.utils import format_time, parse_duration_seconds, get_previous_business_day, is_holiday
 from utils.consultant_manager import (
     load_consultants, save_consultants, add_consultant, remove_consultant,
     add_team, remove_team, get_all_teams, get_part_name, get_team_name
@@ -34,154 +42,16 @@ from utils.trainee_group_manager import (
     load_trainee_groups, add_trainee_group, remove_trainee_group,
     get_trainee_group_target, update_trainee_group
 )
+from utils.consultant_alias_manager import SCOPE_CALLTIME_TO_ORDER
 
-# 근무 설정 상수
-WORK_CONFIG = {
-    "평일근무": {
-        "target_hours": 3,
-        "target_minutes": 30,
-        "work_start": "09:30",
-        "lunch_start": "11:50",
-        "lunch_end": "13:00",
-        "work_end": "18:30"
-    },
-    "휴일근무": {
-        "target_hours": 2,
-        "target_minutes": 0,
-        "work_start": "10:00",
-        "lunch_start": "12:30",
-        "lunch_end": "13:00",
-        "work_end": "15:30"
-    }
-}
-
-def get_work_config(target_date=None, manual_config=None):
-    """
-    근무 설정을 반환합니다.
-
-    Args:
-        target_date: 목표 날짜 (None이면 오늘)
-        manual_config: 수동 설정 딕셔너리 (None이면 자동)
-
-    Returns:
-        dict: 근무 설정
-    """
-    # 1. 수동 설정 최우선
-    if manual_config is not None:
-        return manual_config
-
-    # 2. 자동 감지
-    if target_date is None:
-        target_date = datetime.now()
-
-    # 3. 휴일 여부 확인 (기존 is_holiday 함수 활용)
-    if is_holiday(target_date):
-        return WORK_CONFIG["휴일근무"]
-    else:
-        return WORK_CONFIG["평일근무"]
-
-def calculate_target_calltime_seconds(current_time=None, work_config=None):
-    """
-    현재 시간 기준으로 목표 콜타임을 계산합니다.
-
-    Args:
-        current_time: 현재 시간 (None일 경우 실제 현재 시간 사용)
-        work_config: 근무 설정 딕셔너리 (None이면 기본 평일 설정)
-
-    Returns:
-        int: 현재 시간까지 목표 콜타임 (초 단위)
-    """
-    if current_time is None:
-        current_time = datetime.now().time()
-
-    # 기본 설정 (평일)
-    if work_config is None:
-        work_config = WORK_CONFIG["평일근무"]
-
-    # 목표 시간 (초)
-    total_target_seconds = (
-        work_config["target_hours"] * 3600 +
-        work_config["target_minutes"] * 60
-    )
-
-    # 근무 시간 파싱
-    work_start = time(*map(int, work_config["work_start"].split(":")))
-    lunch_start = time(*map(int, work_config["lunch_start"].split(":")))
-    lunch_end = time(*map(int, work_config["lunch_end"].split(":")))
-    work_end = time(*map(int, work_config["work_end"].split(":")))
-
-    # 전체 근무 시간 (점심 시간 제외, 분 단위)
-    total_work_minutes = (
-        (work_end.hour * 60 + work_end.minute) -
-        (work_start.hour * 60 + work_start.minute)
-    ) - (
-        (lunch_end.hour * 60 + lunch_end.minute) -
-        (lunch_start.hour * 60 + lunch_start.minute)
-    )
-    
-    # 분 단위로 현재 경과 근무 시간 계산
-    elapsed_minutes = 0
-    
-    # 현재 시간이 업무 시작 시간 이전인 경우
-    if current_time < work_start:
-        return 0
-    
-    # 현재 시간이 업무 종료 시간 이후인 경우
-    if current_time > work_end:
-        return total_target_seconds
-    
-    # 현재 시간이 오전 업무 시간인 경우
-    if work_start <= current_time < lunch_start:
-        elapsed_minutes = (current_time.hour * 60 + current_time.minute) - (work_start.hour * 60 + work_start.minute)
-
-    # 현재 시간이 점심 시간인 경우
-    elif lunch_start <= current_time < lunch_end:
-        elapsed_minutes = (lunch_start.hour * 60 + lunch_start.minute) - (work_start.hour * 60 + work_start.minute)
-
-    # 현재 시간이 오후 업무 시간인 경우
-    elif lunch_end <= current_time <= work_end:
-        morning_minutes = (lunch_start.hour * 60 + lunch_start.minute) - (work_start.hour * 60 + work_start.minute)
-        afternoon_minutes = (current_time.hour * 60 + current_time.minute) - (lunch_end.hour * 60 + lunch_end.minute)
-        elapsed_minutes = morning_minutes + afternoon_minutes
-    
-    # 현재 경과 근무 시간 비율에 따라 목표 콜타임 계산
-    target_seconds = int((elapsed_minutes / total_work_minutes) * total_target_seconds)
-    
-    return target_seconds
-
-def get_consultant_status_emoji(calltime_seconds, target_seconds):
-    """
-    콜타임 달성 상태에 따라 적절한 이모지를 반환합니다.
-    
-    Args:
-        calltime_seconds: 상담원의 현재 콜타임 (초 단위)
-        target_seconds: 현재 시간까지 목표 콜타임 (초 단위)
-        
-    Returns:
-        str: 상태 이모지
-    """
-    # 달성률 계산 (%)
-    if target_seconds == 0:
-        achievement_rate = 100  # 목표가 0인 경우 (업무 시작 전)
-    else:
-        achievement_rate = (calltime_seconds / target_seconds) * 100
-    
-    # 달성률에 따른 이모지 반환
-    if achievement_rate >= 100:  # 3시간반 초과 달성
-        return "🚩"  # 달성 깃발발
-    elif achievement_rate <= 71.4:  # 2시간반이하 페이스
-        return "⏰"  # 알람시계 (관심 필요)
-    else :
-        return ""
-
-    
-def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False):
+def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False, targets: Optional[pd.DataFrame] = None):
     """
     컴팩트한 HTML 테이블 생성 함수 - 콜타임 프로그레스 바 추가 버전
     
     Args:
         df: 상담원 실적 데이터프레임
         is_previous_day: 전날 데이터 조회 여부
+        targets: 상담원별 콜타임 목표 (compute_calltime_targets 결과, None이면 현재 근무 설정으로 계산)
         
     Returns:
         str: HTML 테이블 코드
@@ -194,33 +64,28 @@ def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False)
     time_str = f"{current_time.hour}:{current_time.minute:02d}"
     
     # 목표 콜타임 계산 - 휴일/평일 구분 및 수동 설정 반영
+    target_date = get_previous_business_day(current_time) if is_previous_day else current_time
+    manual_config = st.session_state.get('manual_work_config')
+    work_config = get_work_config(target_date=target_date, manual_config=manual_config)
     if is_previous_day:
-        # 전날 데이터를 조회하는 경우
-        prev_date = get_previous_business_day(current_time)
-        work_config = get_work_config(
-            target_date=prev_date,
-            manual_config=st.session_state.get('manual_work_config')
-        )
         current_target_seconds = (
             work_config["target_hours"] * 3600 +
             work_config["target_minutes"] * 60
         )
     else:
-        # 당일 데이터를 조회하는 경우
-        work_config = get_work_config(
-            target_date=current_time,
-            manual_config=st.session_state.get('manual_work_config')
-        )
         current_target_seconds = calculate_target_calltime_seconds(
             current_time.time(),
             work_config
         )
-
-    # 전체 목표 시간 (프로그레스 바 계산용)
-    total_target_seconds = (
-        work_config["target_hours"] * 3600 +
-        work_config["target_minutes"] * 60
-    )
+    
+    # 상담원별 목표/진행률/상태 이모지 (신입 그룹 목표 포함, 전체 상담원 일괄 계산)
+    if targets is None:
+        targets = compute_calltime_targets(
+            df, work_config, current_time.time(), full_day=is_previous_day,
+            profile_name=get_work_profile_name(target_date, manual_config)
+        )
+    trainee_groups = load_trainee_groups()
+    
        # 테이블 컨테이너 시작
     html += '<div class="table-container">'
     html += '<table class="compact-table">'
@@ -262,7 +127,7 @@ def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False)
         # 상담사 이름 (신입에게 병아리 이모지 추가)
         consultant_name = row["상담사"]
         new_consultants = ['강하나', '김서윤', '구준모', '이은경', '이보람']
-        if consultant_name in new_consultants:
+        if consultant_name in new_consultants or targets.at[i, "프로필"] in trainee_groups:
             consultant_name = f'🐥 {consultant_name}'
         html += f'<td>{consultant_name}</td>'
         
@@ -278,11 +143,9 @@ def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False)
         
         # 콜타임 (프로그레스 바 포함) - 이제 이모지도 포함
         if not is_summary:
-            # 콜타임 초 데이터를 퍼센트로 변환 (최대 100%)
-            percentage = min(100, (row["콜타임_초"] / total_target_seconds) * 100)
-            
-            # 상태 이모지 계산
-            status_emoji = get_consultant_status_emoji(row["콜타임_초"], current_target_seconds)
+            # 하루 목표 대비 진행률(최대 100%)과 상태 이모지 (목표 엔진에서 일괄 계산)
+            percentage = targets.at[i, "진행률"]
+            status_emoji = targets.at[i, "상태"]
             
             # 콜타임과 이모지를 함께 표시
             html += f'<td class="calltime-cell">{row["콜타임"]} {status_emoji}<div class="progress-bar-bg" style="width: {percentage}%;"></div></td>'
@@ -337,7 +200,7 @@ def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False)
         # 상담사 이름 (신입에게 병아리 이모지 추가)
         consultant_name = row["상담사"]
         new_consultants = ['강하나', '김서윤', '구준모', '이은경', '이보람']
-        if consultant_name in new_consultants:
+        if consultant_name in new_consultants or targets.at[i, "프로필"] in trainee_groups:
             consultant_name = f'🐥 {consultant_name}'
         html += f'<td>{consultant_name}</td>'
         
@@ -353,11 +216,9 @@ def generate_compact_html_table(df: pd.DataFrame, is_previous_day: bool = False)
         
         # 콜타임 (프로그레스 바 포함) - 이제 이모지도 포함
         if not is_summary:
-            # 콜타임 초 데이터를 퍼센트로 변환 (최대 100%)
-            percentage = min(100, (row["콜타임_초"] / total_target_seconds) * 100)
-            
-            # 상태 이모지 계산
-            status_emoji = get_consultant_status_emoji(row["콜타임_초"], current_target_seconds)
+            # 하루 목표 대비 진행률(최대 100%)과 상태 이모지 (목표 엔진에서 일괄 계산)
+            percentage = targets.at[i, "진행률"]
+            status_emoji = targets.at[i, "상태"]
             
             # 콜타임과 이모지를 함께 표시
             html += f'<td class="calltime-cell">{row["콜타임"]} {status_emoji}<div class="progress-bar-bg" style="width: {percentage}%;"></div></td>'
@@ -567,14 +428,6 @@ def generate_compact_sample_html_table() -> str:
     # 목표 시간을 초 단위로 변환 (이미 위에서 계산된 total_target_seconds 사용)
     target_seconds = total_target_seconds
     
-    # 각 시간 문자열을 초로 변환하는 함수
-    def time_to_seconds(time_str):
-        parts = time_str.split(':')
-        if len(parts) == 3:
-            h, m, s = map(int, parts)
-            return h * 3600 + m * 60 + s
-        return 0
-    
     # CRM 파트 샘플 데이터
     html += '<tbody>'
     crm_data = [
@@ -586,7 +439,12 @@ def generate_compact_sample_html_table() -> str:
         ['CRM팀', '총합/평균', 1, 1, 32, 34, 1, 34, 134, '2:18:39']
     ]
     
-    for row in crm_data:
+    # 콜타임 문자열을 초로 변환
+    crm_seconds = parse_duration_seconds([row[9] for row in crm_data]).tolist()
+    
+    crm_emojis = status_emojis(crm_seconds, current_target_seconds)
+    
+    for row, seconds, status_emoji in zip(crm_data, crm_seconds, crm_emojis):
         is_summary = row[0] == 'CRM팀'
         row_class = 'summary-row' if is_summary else ''
         html += f'<tr class="{row_class}">'
@@ -607,12 +465,8 @@ def generate_compact_sample_html_table() -> str:
         # 콜타임은 프로그레스 바와 함께 표시 (이모지도 함께 표시)
         if not is_summary:
             call_time = row[9]
-            seconds = time_to_seconds(call_time)
             percentage = min(100, (seconds / target_seconds) * 100)
             
-            # 상태 이모지 계산
-            status_emoji = get_consultant_status_emoji(seconds, current_target_seconds)
-            
             html += f'<td class="calltime-cell">{call_time} {status_emoji}<div class="progress-bar-bg" style="width: {percentage}%;"></div></td>'
         else:
             html += f'<td>{row[9]}</td>'
@@ -626,7 +480,12 @@ def generate_compact_sample_html_table() -> str:
         ['온라인팀', '총합/평균', 3, '-', '-', 2, '-', 5, 59, '2:10:58']
     ]
     
-    for row in online_data:
+    # 콜타임 문자열을 초로 변환
+    online_seconds = parse_duration_seconds([row[9] for row in online_data]).tolist()
+    
+    online_emojis = status_emojis(online_seconds, current_target_seconds)
+    
+    for row, seconds, status_emoji in zip(online_data, online_seconds, online_emojis):
         is_summary = row[0] == '온라인팀'
         row_class = 'summary-row' if is_summary else ''
         html += f'<tr class="{row_class}">'
@@ -647,12 +506,8 @@ def generate_compact_sample_html_table() -> str:
         # 콜타임은 프로그레스 바와 함께 표시 (이모지도 함께 표시)
         if not is_summary:
             call_time = row[9]
-            seconds = time_to_seconds(call_time)
             percentage = min(100, (seconds / target_seconds) * 100)
             
-            # 상태 이모지 계산
-            status_emoji = get_consultant_status_emoji(seconds, current_target_seconds)
-            
             html += f'<td class="calltime-cell">{call_time} {status_emoji}<div class="progress-bar-bg" style="width: {percentage}%;"></div></td>'
         else:
             html += f'<td>{row[9]}</td>'
@@ -828,6 +683,51 @@ def create_compact_visualization(performance_df: pd.DataFrame):
     
     return fig
 
+def show_calltime_pace(store):
+    """
+    당일 업로드된 콜타임 스냅샷으로 상담원별 페이스 추이와 직전 대비 하락 상담원을 표시합니다.
+
+    Args:
+        store: 구분별 영업일 콜타임 스냅샷 저장소 (CalltimeSnapshotStore)
+    """
+    changes = store.pace_changes()
+    dropped = changes[changes["하락"]]
+
+    title = f"📈 당일 콜타임 페이스 ({store.scope}, 업로드 {len(store.snapshots)}회"
+    title += f", 페이스 하락 {len(dropped)}명)" if len(store.snapshots) > 1 else ")"
+    if not dropped.empty:
+        st.warning(f"⬇️ 직전 업로드 대비 페이스 하락: {', '.join(dropped['상담원명'])}")
+
+    with st.expander(title, expanded=False):
+        if len(store.snapshots) < 2:
+            st.info("같은 날 콜타임 파일을 다시 업로드하면 업로드 시각별 페이스 추이가 표시됩니다.")
+            return
+
+        curve = store.pace_curve()
+        names = sorted(curve["상담원명"].unique())
+        default_names = list(dropped["상담원명"]) or names
+        selected = st.multiselect("상담원", options=names, default=default_names, key="calltime_pace_names")
+        view = curve[curve["상담원명"].isin(selected)]
+        fig = px.line(view, x="시각", y="달성률", color="상담원명", markers=True)
+        fig.add_hline(y=100, line_dash="dash", line_color="gray")
+        fig.update_layout(height=360, margin=dict(l=10, r=10, t=30, b=10), yaxis_title="목표 대비 달성률(%)")
+        st.plotly_chart(fig, use_container_width=True)
+
+        table = changes.copy()
+        table["구간 콜타임"] = table["구간 콜타임_초"].map(format_time)
+        table["하락"] = table["하락"].map({True: "⬇️", False: ""})
+        st.dataframe(
+            table[["상담원명", "직전 달성률", "현재 달성률", "변화", "구간 콜타임", "구간 페이스", "하락"]].style.format({
+                "직전 달성률": "{:.1f}%", "현재 달성률": "{:.1f}%", "변화": "{:+.1f}%p", "구간 페이스": "{:.1f}%"
+            }, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(
+            f"달성률은 업로드 시각까지의 목표 콜타임 대비 누적 콜타임입니다. 구간 페이스는 직전 업로드 이후 늘어난 콜타임 ÷ 늘어난 목표이며, "
+            f"달성률이 직전 대비 {PACE_DROP_THRESHOLD:g}%p 이상 떨어지면 하락으로 표시합니다."
+        )
+
 def show():
     """상담원 실적 현황 탭 UI를 표시하는 메인 함수"""
     
@@ -1200,19 +1100,31 @@ def show():
     
     with col2:
         st.markdown("### 콜타임 첨부")
-        calltime_file = st.file_uploader("콜타임 엑셀 파일을 업로드하세요", type=['xlsx', 'xls'], key="calltime_file")
+        calltime_files = st.file_uploader(
+            "콜타임 엑셀 파일을 업로드하세요 (그룹/층별로 나뉜 파일은 함께 선택)",
+            type=['xlsx', 'xls'],
+            accept_multiple_files=True,
+            key="calltime_files"
+        )
+        snapshot_scope = st.selectbox(
+            "콜타임 스냅샷 구분 (팀별로 나눠 올리면 팀 선택)",
+            [DEFAULT_SNAPSHOT_SCOPE] + get_all_teams(),
+            key="calltime_snapshot_scope"
+        )
     
     # 메인 로직
-    if consultant_file is not None and calltime_file is not None:
+    if consultant_file is not None and calltime_files:
         # 파일 처리 진행 상태 표시
         with st.spinner('파일 처리 중...'):
             # 파일 위치 저장을 위해 seek(0)
             consultant_file.seek(0)
-            calltime_file.seek(0)
+            for calltime_file in calltime_files:
+                calltime_file.seek(0)
             
             # 파일 처리 시도
             consultant_df, consultant_error = process_consultant_file(consultant_file)
-            calltime_df, calltime_error = process_calltime_file(calltime_file)
+            # 콜타임은 새 파일만 동시에 처리하고 상담원 기준으로 합침 (당일 스냅샷 기록용 해시 포함)
+            calltime_df, calltime_hash, calltime_conflicts, calltime_error = load_calltime_uploads(calltime_files)
         
         # 오류 체크
         if consultant_error:
@@ -1241,6 +1153,19 @@ def show():
                 if filtered_data is not None:
                     st.write(f"필터링된 원본 데이터: {len(filtered_data)}개의 행, 판매채널이 '본사' 또는 '온라인'인 데이터만 포함")
 
+                # 여러 콜타임 파일에 나온 상담원 안내
+                if calltime_conflicts is not None and not calltime_conflicts.empty:
+                    conflict_names = calltime_conflicts["상담원명"].nunique()
+                    with st.expander(f"⚠️ 콜타임 파일 {len(calltime_files)}개 통합: 여러 파일에 나온 상담원 {conflict_names}명", expanded=False):
+                        st.dataframe(calltime_conflicts, hide_index=True, use_container_width=True)
+                        st.caption("서로 다른 파일에 나온 상담원은 건수와 시간을 합산하고, 내용이 같은 파일을 다시 올린 경우만 한 번 반영했습니다.")
+
+                # 이름 매칭이 모호한 상담원 안내
+                show_ambiguous_name_editor(
+                    performance_df.attrs.get("ambiguous_names", {}), SCOPE_CALLTIME_TO_ORDER,
+                    key="consultant", message="이름 매칭이 모호하여 실적이 집계되지 않은 상담원"
+                )
+
                 # 현재 시간 가져오기
                 current_time = datetime.now()
                 # 오전 10시 30분 기준으로 표시 방식 결정
@@ -1292,6 +1217,29 @@ def show():
                 # 데이터 정보 표시
                 st.write(f"총 {len(performance_df)}명의 상담원 실적이 분석되었습니다.")
 
+                # 분석 결과 이력 저장 (영업일 + 원본 파일 해시 기준, 같은 파일은 한 번만)
+                record_analysis_history(
+                    "consultant", prev_date if is_previous_day else current_time,
+                    [consultant_file, *calltime_files], performance_df, "상담사"
+                )
+
+                # 상담원별 콜타임 목표 (근무 형태 + 신입 그룹 목표, 전체 상담원 일괄 계산)
+                business_date = prev_date if is_previous_day else current_time
+                manual_config = st.session_state.get('manual_work_config')
+                calltime_targets = compute_calltime_targets(
+                    performance_df, work_config, current_time.time(), full_day=is_previous_day,
+                    profile_name=get_work_profile_name(business_date, manual_config)
+                )
+
+                # 콜타임 업로드를 구분별 당일 스냅샷으로 이력 DB에 기록 (같은 파일은 한 번만, 상담원별 기대 콜타임 포함)
+                snapshot_store, _, snapshot_error = record_calltime_snapshot(
+                    calltime_df, calltime_hash, business_date, taken_at=current_time,
+                    target_seconds=pd.Series(calltime_targets["기대_초"].to_numpy(), index=performance_df["상담사"].to_numpy()),
+                    scope=snapshot_scope
+                )
+                if snapshot_error:
+                    st.warning(f"콜타임 스냅샷을 이력 DB에 저장하지 못했습니다: {snapshot_error}")
+
                 # 날짜 표시
                 st.markdown(DATE_DISPLAY_STYLE.format(date_display=date_display), unsafe_allow_html=True)
                 
@@ -1299,13 +1247,16 @@ def show():
                 st.markdown(f'<div class="simple-legend">⏱️ 목표시간: {current_target_time} | 🚩:달성 | ⏰:분발필요</div>', unsafe_allow_html=True)
 
                 # 컴팩트 HTML 테이블 생성 및 표시 - is_previous_day 파라미터 전달
-                html_table = generate_compact_html_table(performance_df, is_previous_day)
+                html_table = generate_compact_html_table(performance_df, is_previous_day, calltime_targets)
                 st.markdown(html_table, unsafe_allow_html=True)
                 
                 # 시각화 섹션 - 접을 수 있게 수정
                 with st.expander("시각화 보기", expanded=False):
                     st.plotly_chart(create_compact_visualization(performance_df), use_container_width=True)
                 
+                # 당일 콜타임 페이스 추이 (업로드 스냅샷 기준)
+                show_calltime_pace(snapshot_store)
+                
                 # 엑셀 내보내기
                 st.markdown("### 엑셀 파일 다운로드")
                 st.markdown(DOWNLOAD_BUTTON_STYLE, unsafe_allow_html=True)
@@ -1383,4 +1334,7 @@ def show():
         st.markdown(html_table, unsafe_allow_html=True)
         
         # 간소화된 사용 가이드
-        st.markdown(USAGE_GUIDE_MARKDOWN, unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(USAGE_GUIDE_MARKDOWN, unsafe_allow_html=True)
+
+    # 누적 이력 추이
+    show_history_section("consultant", default_metric="콜타임_초")
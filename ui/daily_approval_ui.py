@@ -18,8 +18,13 @@ from typing import Dict, List, Optional, Any
 # 비즈니스 로직 가져오기
 from logic.daily_approval_logic import (
     process_approval_file, process_calltime_file, 
-    analyze_daily_approval, match_consultant_calltime, create_excel_report
+    analyze_daily_approval, match_consultant_calltime, create_excel_report,
+    DAILY_APPROVAL_BACKENDS
 )
+from logic.analysis_backend_logic import get_available_backends
+from ui.rolling_stats_ui import show_rolling_section
+from ui.consultant_alias_ui import show_ambiguous_name_editor
+from utils.consultant_alias_manager import SCOPE_ROSTER_TO_CALLTIME
 
 # CSS 스타일 가져오기
 from styles.daily_approval_styles import (
@@ -549,6 +554,18 @@ def show():
         st.markdown("### 콜타임 파일 첨부")
         calltime_file = st.file_uploader("콜타임 엑셀 파일을 업로드하세요", type=['xlsx', 'xls'], key="daily_approval_calltime_file")
     
+    # 분석 백엔드 선택 (polars 설치 시에만 표시)
+    available_backends = get_available_backends(DAILY_APPROVAL_BACKENDS)
+    backend = "pandas"
+    if len(available_backends) > 1:
+        backend = st.selectbox(
+            "분석 엔진",
+            options=list(available_backends.keys()),
+            format_func=lambda key: available_backends[key],
+            key="daily_approval_backend",
+            help="수백만 행 규모의 데이터는 Polars가 더 빠릅니다. 결과는 동일합니다."
+        )
+    
     # 분석 버튼
     analyze_button = st.button("분석 시작", key="analyze_daily_approval")
     
@@ -580,7 +597,7 @@ def show():
             st.session_state.daily_calltime_df = calltime_df
             
             # 분석 실행
-            results, analysis_error = analyze_daily_approval(approval_df)
+            results, analysis_error = analyze_daily_approval(approval_df, backend)
             
             if analysis_error:
                 st.error(analysis_error)
@@ -623,6 +640,12 @@ def display_results(results: Dict, approval_df: pd.DataFrame):
     # 데이터 정보 표시
     st.markdown(f'<div class="status-container"><div class="status-chip success">분석 완료</div><div class="timestamp">{current_time.strftime("%Y년 %m월 %d일 %H시 %M분")} 기준</div></div>', unsafe_allow_html=True)
     
+    # 콜타임 이름 매칭이 모호한 상담사 안내 (후보를 골라 별칭으로 저장)
+    show_ambiguous_name_editor(
+        results.get('ambiguous_calltime_names', {}), SCOPE_ROSTER_TO_CALLTIME,
+        key="daily_approval", message="콜타임 이름 매칭이 모호한 상담사"
+    )
+    
     # 전체 상담사 수와 테이블 스타일 정보
     consultant_count = len(results['consultant_data'])
     st.write(f"총 {consultant_count}명의 상담원 실적이 분석되었습니다.")
@@ -692,6 +715,9 @@ def display_results(results: Dict, approval_df: pd.DataFrame):
             )
             st.plotly_chart(fig4, use_container_width=True)
     
+    # 제품/상담사/조직별 승인 건수 이동평균/이상 감지
+    show_rolling_section("daily_approval", approval_df)
+    
     # 엑셀 내보내기
     st.subheader("📥 엑셀 파일 다운로드")
     st.markdown(DOWNLOAD_BUTTON_STYLE, unsafe_allow_html=True)
@@ -17,8 +17,19 @@ import os
 # 비즈니스 로직 가져오기
 from logic.daily_sales_logic import (
     process_approval_file, process_installation_file, 
-    analyze_sales_data, create_excel_report, analyze_daily_approval_by_date
+    analyze_sales_data, create_excel_report, analyze_daily_approval_by_date,
+    apply_targets, derive_approval_targets, get_approval_prefix_sums, analyze_approval_range,
+    SALES_ANALYSIS_BACKENDS
 )
+from logic.analysis_backend_logic import get_available_backends
+from logic.target_pacing_logic import (
+    evaluate_pacing, get_month_targets, update_month_targets, save_target_file,
+    targets_to_frame, targets_from_frame
+)
+from logic.reconciliation_logic import get_reconciliation, create_reconciliation_excel, CONTRACT_KEY
+from ui.history_ui import show_history_section, record_analysis_history
+from ui.rolling_stats_ui import show_rolling_section
+from ui.range_comparison_ui import select_comparison_periods, warn_uncovered_periods
 
 # CSS 스타일 가져오기
 from styles.daily_sales_styles import (
@@ -85,6 +96,18 @@ def show():
         # 키 이름 변경: installation_file -> daily_installation_file
         installation_file = st.file_uploader("설치매출 엑셀 파일을 업로드하세요", type=['xlsx', 'xls'], key="daily_installation_file")
     
+    # 분석 백엔드 선택 (duckdb/polars 설치 시에만 표시)
+    available_backends = get_available_backends(SALES_ANALYSIS_BACKENDS)
+    backend = "pandas"
+    if len(available_backends) > 1:
+        backend = st.selectbox(
+            "분석 엔진",
+            options=list(available_backends.keys()),
+            format_func=lambda key: available_backends[key],
+            key="daily_sales_backend",
+            help="수백만 행 규모의 월/분기 데이터는 DuckDB/Polars가 더 빠릅니다. 결과는 동일합니다."
+        )
+    
     # 분석 버튼
     st.markdown('<div class="button-container">', unsafe_allow_html=True)
     # 키 이름 변경: analyze_daily_sales -> analyze_daily_button
@@ -118,9 +141,10 @@ def show():
             # 세션 상태에 데이터프레임 저장
             st.session_state.daily_approval_df = approval_df
             st.session_state.daily_installation_df = installation_df
+            st.session_state.reconciliation_excel = None
             
             # 분석 실행
-            results = analyze_sales_data(approval_df, installation_df)
+            results = analyze_sales_data(approval_df, installation_df, backend)
             
             if 'error' in results:
                 st.error(results['error'])
@@ -131,6 +155,12 @@ def show():
                 st.session_state.cumulative_installation = results['cumulative_installation']
                 st.session_state.latest_date = results['latest_date']
                 
+                # 누적 승인 집계 이력 저장 (영업일 + 원본 파일 해시 기준, 같은 파일은 한 번만)
+                record_analysis_history(
+                    "daily_sales", results['latest_date'], [approval_file, installation_file],
+                    results['cumulative_approval'], "제품"
+                )
+                
                 # 사용 가능한 날짜 목록 가져오기 (주문 일자 기준)
                 if '주문 일자' in approval_df.columns:
                     # NaT 제거 후 날짜만 추출하여 고유값 가져오기
@@ -176,6 +206,9 @@ def show():
         st.info("승인매출 파일을 업로드하고 설치매출 파일(선택사항)도 업로드한 후 분석 시작 버튼을 클릭하세요.")
         st.markdown(USAGE_GUIDE_MARKDOWN, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)  # 카드 닫기
+    
+    # 누적 이력 추이
+    show_history_section("daily_sales", default_metric="총승인(본사/연계)_매출액", default_entities=["총합계"])
 
 def load_targets_from_file(file_path='targets.json'):
     """
@@ -255,13 +288,8 @@ def save_targets_to_file(targets, file_path='targets.json'):
         targets: 저장할 목표 값 딕셔너리
         file_path: JSON 파일 경로
     """
-    try:
-        with open(file_path, 'w') as f:
-            json.dump(targets, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"목표 값 저장 중 오류: {str(e)}")
-        return False
+    # 임시 파일에 쓴 뒤 교체하는 원자적 저장 (저장 도중 오류가 나도 기존 파일 유지)
+    return save_target_file(targets, file_path)
 
 def display_results(
     cumulative_approval: pd.DataFrame,
@@ -322,35 +350,48 @@ def display_results(
             key="affiliate_target_input"
         )
         
-        # 저장 버튼
-        if st.button("목표 저장", key="save_targets_button"):
-            # 세션 상태 업데이트
-            st.session_state.direct_target = direct_target
-            st.session_state.affiliate_target = affiliate_target
-            
-            # 파일에서 전체 목표 데이터 로드
-            try:
-                with open('targets.json', 'r') as f:
-                    all_targets = json.load(f)
-            except:
-                # 파일이 없거나 읽을 수 없으면 기본 구조 생성
-                all_targets = {"monthly_targets": {}}
-            
-            # monthly_targets 키가 없으면 추가
-            if 'monthly_targets' not in all_targets:
-                all_targets['monthly_targets'] = {}
-            
-            # 현재 월의 목표 업데이트
-            all_targets['monthly_targets'][current_month] = {
-                'direct_target': direct_target,
-                'affiliate_target': affiliate_target
-            }
-            
-            # 파일에 저장
-            if save_targets_to_file(all_targets):
-                st.success(f"{current_month}월 목표가 저장되었습니다!")
-            else:
-                st.error("목표 저장 중 오류가 발생했습니다.")
+        # 제품별 목표 (설치매출 기준, 승인매출 목표는 105%) - 편집하면 재분석 없이 달성률만 다시 계산
+        st.markdown("**제품별 목표 (설치매출 기준)**")
+        month_targets = get_month_targets(int(current_month))
+        if st.session_state.get('what_if_month') != current_month:
+            st.session_state.what_if_month = current_month
+            st.session_state.what_if_targets = targets_to_frame(month_targets["installation"])
+        edited_targets = st.data_editor(
+            st.session_state.what_if_targets,
+            use_container_width=True,
+            key="product_targets_editor"
+        )
+        st.caption("표를 수정하면 저장하지 않아도 아래 표의 목표/달성률에 바로 반영됩니다. (가정 시나리오)")
+        
+        button_col1, button_col2 = st.columns(2)
+        with button_col1:
+            # 저장 버튼 (월 합계 목표 + 제품별 목표를 원자적으로 저장)
+            if st.button("목표 저장", key="save_targets_button"):
+                # 세션 상태 업데이트
+                st.session_state.direct_target = direct_target
+                st.session_state.affiliate_target = affiliate_target
+                st.session_state.what_if_targets = edited_targets
+                
+                if update_month_targets(
+                    int(current_month),
+                    monthly_totals={"직접": direct_target, "연계": affiliate_target},
+                    installation_targets=targets_from_frame(edited_targets)
+                ):
+                    st.success(f"{current_month}월 목표가 저장되었습니다!")
+                else:
+                    st.error("목표 저장 중 오류가 발생했습니다.")
+        with button_col2:
+            # 저장된 목표로 되돌리기
+            if st.button("저장된 목표로 되돌리기", key="reset_targets_button"):
+                st.session_state.what_if_targets = targets_to_frame(month_targets["installation"])
+                st.session_state.pop("product_targets_editor", None)
+                st.rerun()
+    
+    # 편집 중인 목표로 달성률 다시 계산 (실적은 분석 결과 그대로 사용)
+    approval_targets = derive_approval_targets(targets_from_frame(edited_targets))
+    cumulative_approval = apply_targets(cumulative_approval, approval_targets)
+    daily_approval = apply_targets(daily_approval, approval_targets)
+    cumulative_installation = apply_targets(cumulative_installation, approval_targets)
     
     # 현재 세션 상태의 목표 값 사용
     direct_target = st.session_state.direct_target
@@ -484,7 +525,7 @@ def display_results(
             # 해당 날짜의 데이터 표시
             if selected_date and approval_df is not None:
                 # 선택한 날짜에 대한 일일 승인실적 분석
-                selected_date_daily_approval = analyze_daily_approval_by_date(approval_df, selected_date)
+                selected_date_daily_approval = apply_targets(analyze_daily_approval_by_date(approval_df, selected_date), approval_targets)
                 
                 if selected_date_daily_approval.empty:
                     st.info(f"{selected_date.strftime('%Y-%m-%d')}에 해당하는 승인 데이터가 없습니다.")
@@ -506,6 +547,18 @@ def display_results(
     
     st.markdown('</div>', unsafe_allow_html=True)  # 행 닫기
     
+    # 영업일 기준 목표 진도 (앞섬/뒤처짐)
+    display_pacing(cumulative_approval, approval_df)
+    
+    # 제품별 승인 건수 이동평균/이상 감지
+    show_rolling_section("daily_sales", approval_df)
+    
+    # 주간/월간 누계, 사용자 지정 기간 비교 (일자 누적합)
+    display_range_comparison(approval_df, approval_targets)
+    
+    # 승인-설치 대사 (미설치/미승인 설치 계약, 리드타임 분포)
+    display_reconciliation(approval_df, installation_df)
+    
     # 일일 데이터에서 건수 정보 추출 (선택한 날짜 기준)
     daily_df = selected_date_daily_approval if selected_date_daily_approval is not None else daily_approval
     
@@ -718,7 +771,7 @@ def display_results(
         
         # 선택한 날짜에 대한 일일 승인실적 데이터 생성
         if selected_date_for_excel and approval_df is not None:
-            selected_daily_approval = analyze_daily_approval_by_date(approval_df, selected_date_for_excel)
+            selected_daily_approval = apply_targets(analyze_daily_approval_by_date(approval_df, selected_date_for_excel), approval_targets)
         else:
             selected_daily_approval = daily_approval
         
@@ -749,6 +802,171 @@ def display_results(
     
     st.markdown('</div>', unsafe_allow_html=True)  # 카드 닫기
 
+def display_pacing(cumulative_approval: pd.DataFrame, approval_df: Optional[pd.DataFrame]):
+    """
+    누적 승인실적의 영업일 기준 목표 진도(앞섬/뒤처짐)를 제품/구분별로 표시하는 함수
+    
+    Args:
+        cumulative_approval: 누적 승인 실적 데이터프레임
+        approval_df: 원본 승인 데이터프레임 (최신 주문 일자를 기준일로 사용)
+    """
+    if cumulative_approval is None or cumulative_approval.empty:
+        return
+    if approval_df is None or '주문 일자' not in approval_df.columns:
+        return
+    
+    as_of = pd.to_datetime(approval_df['주문 일자'], errors='coerce').max()
+    if pd.isna(as_of):
+        return
+    
+    try:
+        pacing = evaluate_pacing(cumulative_approval, as_of)
+    except Exception as e:
+        st.warning(f"목표 진도 계산 중 오류가 발생했습니다: {str(e)}")
+        return
+    
+    progress = pacing["진도율"].iloc[0]
+    with st.expander(f"📅 목표 진도 ({as_of.strftime('%m월%d일')} 기준, 영업일 진도율 {progress:.1f}%)", expanded=False):
+        table = pacing[["제품", "구분", "목표_매출액", "기대_매출액", "실적_매출액", "차이_매출액", "기대대비_매출액", "실적_건수", "기대_건수", "상태"]].copy()
+        table["상태"] = table["상태"].map({"앞섬": "🟢 앞섬", "뒤처짐": "🔴 뒤처짐"}).fillna(table["상태"])
+        st.dataframe(
+            table.style.format({
+                "목표_매출액": "{:,.0f}", "기대_매출액": "{:,.0f}", "실적_매출액": "{:,.0f}",
+                "차이_매출액": "{:+,.0f}", "기대대비_매출액": "{:.1f}%",
+                "실적_건수": "{:,.0f}", "기대_건수": "{:,.1f}"
+            }, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption("기대 실적 = 월 목표 × (기준일까지 지난 영업일 / 월 전체 영업일). 주말과 공휴일은 영업일에서 제외됩니다.")
+
+def display_range_comparison(approval_df: Optional[pd.DataFrame], approval_targets: Dict):
+    """
+    선택한 기간과 비교 기간의 제품별 승인실적을 나란히 표시하는 함수 (일자 누적합으로 계산)
+    
+    Args:
+        approval_df: 원본 승인 데이터프레임
+        approval_targets: 현재 적용 중인 승인매출 목표 (달성률 계산용)
+    """
+    required_columns = ['주문 일자', '일반회차 캠페인', '판매인입경로', '대분류', '매출액']
+    if approval_df is None or not all(col in approval_df.columns for col in required_columns):
+        return
+    
+    try:
+        prefix = get_approval_prefix_sums(approval_df)
+    except Exception as e:
+        st.warning(f"기간 누적합 계산 중 오류가 발생했습니다: {str(e)}")
+        return
+    if prefix.last_day is None:
+        return
+    
+    with st.expander("🗓️ 기간별 승인실적 비교 (주간/월간 누계, 전월 동기간)", expanded=False):
+        current, previous = select_comparison_periods("daily_sales_range", prefix.first_day, prefix.last_day)
+        warn_uncovered_periods(prefix, current, previous)
+        current_result = analyze_approval_range(approval_df, current[0], current[1], approval_targets)
+        previous_result = analyze_approval_range(approval_df, previous[0], previous[1], approval_targets)
+        
+        # 데이터 범위를 벗어난 기간은 0 대신 '-'로 표시
+        if not prefix.covers(*current):
+            current_result = current_result[["제품"]].reindex(columns=current_result.columns)
+        if not prefix.covers(*previous):
+            previous_result = previous_result[["제품"]].reindex(columns=previous_result.columns)
+        
+        comparison = pd.DataFrame({"제품": current_result["제품"]})
+        for column, label in (("총승인(본사/연계)_건수", "건수"), ("총승인(본사/연계)_매출액", "매출액")):
+            comparison[f"{label}_기준"] = current_result[column]
+            comparison[f"{label}_비교"] = previous_result[column]
+            comparison[f"{label}_증감"] = current_result[column] - previous_result[column]
+        comparison["본사_매출액"] = current_result["본사직접승인_매출액"]
+        comparison["연계_매출액"] = current_result["연계승인_매출액"]
+        comparison["온라인_매출액"] = current_result["온라인_매출액"]
+        comparison["달성률_매출액"] = current_result["달성률_매출액"]
+        
+        st.dataframe(
+            comparison.style.format({
+                "건수_기준": "{:,.0f}", "건수_비교": "{:,.0f}", "건수_증감": "{:+,.0f}",
+                "매출액_기준": "{:,.0f}", "매출액_비교": "{:,.0f}", "매출액_증감": "{:+,.0f}",
+                "본사_매출액": "{:,.0f}", "연계_매출액": "{:,.0f}", "온라인_매출액": "{:,.0f}",
+                "달성률_매출액": "{:.1f}%"
+            }, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption("계약 번호 중복은 전체 데이터에서 한 번 제거하며, 계약은 첫 행의 주문 일자에 집계됩니다. 달성률은 월 목표 대비입니다.")
+
+def display_reconciliation(approval_df: Optional[pd.DataFrame], installation_df: Optional[pd.DataFrame]):
+    """
+    승인매출과 설치매출의 계약 번호 대사 결과(설치완료/미설치/미승인 설치, 리드타임 분포)를 표시하는 함수
+    
+    Args:
+        approval_df: 원본 승인 데이터프레임
+        installation_df: 원본 설치 데이터프레임 (없으면 표시하지 않음)
+    """
+    if approval_df is None or installation_df is None or installation_df.empty:
+        return
+    if CONTRACT_KEY not in approval_df.columns or CONTRACT_KEY not in installation_df.columns:
+        return
+    
+    result, error = get_reconciliation(approval_df, installation_df)
+    if error:
+        st.warning(error)
+        return
+    
+    total = result["summary"].iloc[-1]
+    as_of_text = result["as_of"].strftime('%m월%d일') if result["as_of"] is not None else "-"
+    with st.expander(
+        f"🔗 승인-설치 대사 ({as_of_text} 기준, 미설치 {int(total['미설치']):,}건 / 미승인 설치 {int(total['미승인설치']):,}건)",
+        expanded=False
+    ):
+        st.dataframe(
+            result["summary"].style.format({
+                "승인": "{:,.0f}", "설치완료": "{:,.0f}", "미설치": "{:,.0f}", "설치율": "{:.1f}%",
+                "평균_리드타임": "{:.1f}일", "중앙값_리드타임": "{:.0f}일", "P90_리드타임": "{:.0f}일",
+                "미승인설치": "{:,.0f}"
+            }, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**승인 → 설치 리드타임 (설치완료)**")
+            st.dataframe(result["lag_histogram"], use_container_width=True)
+        with col2:
+            st.markdown("**미설치 경과일**")
+            st.dataframe(result["pending_aging"], use_container_width=True)
+        
+        missing = result["missing_keys"]
+        if missing["승인"] or missing["설치"]:
+            st.caption(f"계약 번호가 없어 대사에서 제외된 행: 승인 {missing['승인']:,}행, 설치 {missing['설치']:,}행")
+        
+        # 대사 결과별 CSV 다운로드
+        today = datetime.now().strftime('%Y%m%d')
+        download_cols = st.columns(4)
+        for col, (label, key) in zip(download_cols, (("미설치", "pending"), ("설치완료", "installed"), ("미승인 설치", "orphan"))):
+            with col:
+                st.download_button(
+                    label=f"{label} CSV ({len(result[key]):,}건)",
+                    data=result[key].to_csv(index=False).encode('utf-8-sig'),
+                    file_name=f"{today}_승인설치대사_{label}.csv",
+                    mime="text/csv",
+                    key=f"download_reconciliation_{key}"
+                )
+        with download_cols[3]:
+            # 전체 엑셀은 행이 많으면 오래 걸리므로 요청 시에만 생성
+            if st.button("엑셀 생성 (전체 시트)", key="build_reconciliation_excel"):
+                with st.spinner("대사 엑셀 파일을 생성하는 중..."):
+                    st.session_state.reconciliation_excel = create_reconciliation_excel(result)
+            excel_data = st.session_state.get("reconciliation_excel")
+            if excel_data:
+                st.download_button(
+                    label="엑셀 다운로드",
+                    data=excel_data,
+                    file_name=f"{today}_승인설치대사.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    key="download_reconciliation_excel"
+                )
+
 def format_value(value):
     """
     값을 포맷팅하는 함수 - 백만 단위로 표시 (소수점 없음)
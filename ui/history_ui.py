@@ -0,0 +1,100 @@
+"""
+분석 이력 추이 UI 모듈
+
+각 분석 탭 하단에 이력 DB(data/analysis_history.sqlite3)에 누적된 결과의
+영업일별 추이 차트와 전월 대비 비교표를 표시하고,
+분석 완료 시 결과를 (영업일, 원본 파일 해시)마다 한 번만 이력 DB에 기록합니다.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from typing import Any, Iterable, Optional
+
+from utils.analysis_history_manager import (
+    HISTORY_KINDS, list_history_metrics, load_metric_history, load_month_over_month,
+    compute_source_hash, save_analysis_snapshot
+)
+
+
+def record_analysis_history(kind: str, business_date: Any, files: Iterable[Any], result_df: pd.DataFrame, entity_column: str):
+    """
+    분석 결과를 이력 DB에 기록합니다. (같은 영업일/원본 파일은 세션에서 한 번만, 실패 시 경고 표시)
+
+    Streamlit은 위젯을 조작할 때마다 화면 전체를 다시 실행하므로,
+    마지막으로 기록한 (영업일, 원본 파일 해시)를 세션 상태에 보관해 재실행 때는 다시 저장하지 않습니다.
+
+    Args:
+        kind: 분석 종류 (HISTORY_KINDS 키)
+        business_date: 영업일 (없으면 오늘)
+        files: 업로드된 원본 파일 목록
+        result_df: 분석 결과 데이터프레임
+        entity_column: 행 구분 컬럼
+    """
+    try:
+        source_hash = compute_source_hash(files)
+    except Exception as e:
+        st.warning(f"분석 이력을 저장하지 못했습니다: 원본 파일 해시 계산 중 오류: {str(e)}")
+        return
+
+    day = pd.Timestamp(business_date).strftime("%Y-%m-%d") if business_date is not None else None
+    state_key = f"history_recorded_{kind}"
+    if st.session_state.get(state_key) == (day, source_hash):
+        return
+
+    success, error = save_analysis_snapshot(kind, business_date, source_hash, result_df, entity_column)
+    if success:
+        st.session_state[state_key] = (day, source_hash)
+    else:
+        st.warning(f"분석 이력을 저장하지 못했습니다: {error}")
+
+
+def show_history_section(kind: str, default_metric: Optional[str] = None, default_entities: Optional[list] = None):
+    """
+    저장된 분석 이력의 추이 차트와 전월 대비 비교표를 표시합니다.
+
+    Args:
+        kind: 분석 종류 (HISTORY_KINDS 키)
+        default_metric: 기본 선택 지표
+        default_entities: 기본 선택 항목 (없으면 앞에서 5개)
+    """
+    with st.expander(f"📈 {HISTORY_KINDS[kind]} 이력 추이", expanded=False):
+        metrics, entities = list_history_metrics(kind)
+        if not metrics:
+            st.info("저장된 분석 이력이 없습니다. 분석을 완료하면 결과가 자동으로 누적됩니다.")
+            return
+
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            metric = st.selectbox(
+                "지표",
+                options=metrics,
+                index=metrics.index(default_metric) if default_metric in metrics else 0,
+                key=f"history_metric_{kind}"
+            )
+        with col2:
+            if default_entities:
+                default_selection = [entity for entity in default_entities if entity in entities]
+            else:
+                default_selection = entities[:5]
+            selected_entities = st.multiselect(
+                "항목",
+                options=entities,
+                default=default_selection,
+                key=f"history_entities_{kind}"
+            )
+
+        trend = load_metric_history(kind, metric, selected_entities or None)
+        if trend.empty:
+            st.info("선택한 조건의 이력이 없습니다.")
+            return
+
+        chart_df = trend.reset_index().melt(id_vars="영업일", var_name="항목", value_name=metric)
+        fig = px.line(chart_df, x="영업일", y=metric, color="항목", markers=True)
+        fig.update_layout(height=360, margin=dict(l=10, r=10, t=30, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+
+        monthly = load_month_over_month(kind, metric, selected_entities or None)
+        if not monthly.empty:
+            st.markdown("**월별 비교 (월 마지막 영업일 기준)**")
+            st.dataframe(monthly.style.format("{:,.1f}", na_rep="-"), use_container_width=True)
@@ -8,13 +8,59 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, date
 from typing import Dict, List
+import json
 
 # 로직 및 설정 관리 가져오기
-from logic.promotion_logic import process_promotion_file, analyze_promotion_data_new, create_promotion_excel
+from logic.promotion_logic import (
+    process_promotion_file, analyze_promotion_data_new, analyze_promotion_data, create_promotion_excel,
+    get_promotion_matrix, list_promotion_configs, load_promotion_config, get_promotion_prefix_sums,
+    build_promotion_amount_matrix, compare_promotion_periods, PROMOTION_BACKENDS, DEFAULT_TIE_BREAKERS
+)
+from logic.analysis_backend_logic import get_available_backends
+from ui.history_ui import show_history_section, record_analysis_history
+from ui.range_comparison_ui import select_comparison_periods, warn_uncovered_periods
+from logic.promotion_scenario_logic import (
+    normalize_promotion_scenario, load_promotion_scenarios, simulate_promotion_scenarios
+)
+from logic.promotion_ranking_logic import RANK_METHODS, TIE_BREAKER_COLUMNS, resolve_rank_method
+from logic.promotion_lottery_logic import (
+    build_ticket_table, ticket_table_fingerprint, draw_lottery, estimate_win_probabilities, create_lottery_log_excel
+)
 from utils.promotion_config_manager import save_config, load_config, reset_config, get_default_config
 import base64
 
 
+def select_tie_breakers(label: str, columns: List[str], default: List, key: str) -> List:
+    """
+    동점 해소 기준을 선택하는 위젯 (선택한 순서대로 적용)
+
+    Args:
+        label: 위젯 라벨
+        columns: 선택 가능한 컬럼 목록 (TIE_BREAKER_COLUMNS 키)
+        default: 기본 선택 [(컬럼, 오름차순 여부)]
+        key: 위젯 키
+
+    Returns:
+        List: 선택된 동점 해소 기준 [(컬럼, 오름차순 여부)]
+    """
+    # 상담사 이름은 가나다순만, 나머지는 높은 순/낮은 순
+    options = []
+    for column in columns:
+        options.extend([(column, True)] if column == "상담사" else [(column, False), (column, True)])
+    default = [tuple(item) for item in default if tuple(item) in options]
+
+    def format_option(option) -> str:
+        column, ascending = option
+        if column == "상담사":
+            return f"{TIE_BREAKER_COLUMNS[column]} (가나다순)"
+        return f"{TIE_BREAKER_COLUMNS[column]} {'낮은 순' if ascending else '높은 순'}"
+
+    return st.multiselect(
+        label, options=options, default=default, format_func=format_option, key=key,
+        help="1차 정렬 기준이 같은 상담사를 선택한 순서대로 비교합니다. 모든 기준이 같으면 동점입니다."
+    )
+
+
 def style_promotion_table(df: pd.DataFrame, analysis_mode: str) -> pd.DataFrame:
     """
     프로모션 결과 테이블에 스타일링 적용
@@ -191,11 +237,17 @@ def show():
 
     if uploaded_file:
         with st.spinner("🔄 파일 처리 중..."):
-            df, error = process_promotion_file(uploaded_file)
+            # 같은 파일이면 다시 처리하지 않음 (분석 단계 캐시가 같은 데이터프레임을 재사용)
+            file_key = (uploaded_file.name, uploaded_file.size)
+            if st.session_state.get("promo_file_key") == file_key and st.session_state.promo_df is not None:
+                df, error = st.session_state.promo_df, None
+            else:
+                df, error = process_promotion_file(uploaded_file)
             if error:
                 st.error(f"❌ {error}")
             else:
                 st.session_state.promo_df = df
+                st.session_state.promo_file_key = file_key
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("총 레코드", f"{len(df):,}개")
@@ -300,6 +352,44 @@ def show():
 
     # === 상세 설정 (expander) ===
     with st.expander("🔧 상세 설정", expanded=False):
+        # 동점자 순위 방식
+        # 예전 설정의 "min"은 같은 동작의 "competition"으로 표시
+        rank_method_options = list(RANK_METHODS)
+        saved_rank_method = resolve_rank_method(config.get("rank_method"))
+        rank_method = st.selectbox(
+            "동점자 순위 방식",
+            options=rank_method_options,
+            index=rank_method_options.index(saved_rank_method) if saved_rank_method in rank_method_options else 0,
+            format_func=lambda method: RANK_METHODS[method],
+            key="rank_method_select",
+            help="정렬 기준 값이 모두 같은 상담사를 같은 순위로 볼지 정합니다. 순번은 동점자도 정렬 순서대로 다른 순위를 받습니다."
+        )
+        config["rank_method"] = rank_method
+
+        # 동점 해소 기준 (분석 기준별로 저장, 1차 정렬 기준 컬럼은 제외)
+        primary_column = {"제품별": "점수", "금액별": "승인액"}.get(analysis_mode, "승인건수")
+        tie_breaker_columns = [
+            column for column in ["점수", "승인액", "승인건수", "안마의자", "라클라우드", "정수기", "상담사"]
+            if column != primary_column and (column != "점수" or analysis_mode == "제품별")
+        ]
+        saved_tie_breakers = config.get("tie_breakers", {}).get(analysis_mode, DEFAULT_TIE_BREAKERS[analysis_mode])
+        tie_breakers = select_tie_breakers(
+            f"동점 해소 기준 (1차 기준: {primary_column})", tie_breaker_columns, saved_tie_breakers,
+            key=f"tie_breakers_{analysis_mode}"
+        )
+        config.setdefault("tie_breakers", {})[analysis_mode] = [list(item) for item in tie_breakers]
+
+        # 분석 백엔드 선택 (polars 설치 시에만 표시)
+        available_backends = get_available_backends(PROMOTION_BACKENDS)
+        backend = "pandas"
+        if len(available_backends) > 1:
+            backend = st.selectbox(
+                "분석 엔진",
+                options=list(available_backends.keys()),
+                format_func=lambda key: available_backends[key],
+                key="promo_backend",
+                help="수백만 행 규모의 데이터는 Polars가 제품 분류/건수 집계를 더 빠르게 처리합니다. 결과는 동일합니다."
+            )
 
         # 제품별 가중치 설정
         st.markdown("#### 제품별 가중치")
@@ -449,7 +539,10 @@ def show():
                     start_date=start_dt,
                     end_date=end_dt,
                     include_online=include_online,
-                    include_indirect=include_indirect
+                    include_indirect=include_indirect,
+                    rank_method=rank_method,
+                    backend=backend,
+                    tie_breakers=tie_breakers
                 )
 
                 if error:
@@ -457,6 +550,8 @@ def show():
                 else:
                     st.session_state.promo_results = result_df
                     st.session_state.promo_filtered_df = filtered_df
+                    # 프로모션 순위 이력 저장 (분석 종료일 + 원본 파일 해시 기준, 같은 파일은 한 번만)
+                    record_analysis_history("promotion", end_date, [uploaded_file], result_df, "상담사")
                     st.session_state.promo_analysis_mode = analysis_mode  # 분석 모드 저장
                     st.session_state.prev_analysis_mode = analysis_mode  # 이전 모드 업데이트
                     st.success("✅ 분석이 완료되었습니다!")
@@ -613,3 +708,315 @@ def show():
                     st.error("엑셀 파일 생성 실패")
             except Exception as e:
                 st.error(f"엑셀 다운로드 오류: {str(e)}")
+
+    # === 추첨 ===
+    if st.session_state.promo_results is not None:
+        st.divider()
+        show_lottery_draw(st.session_state.promo_results)
+
+    # === 기간 비교 ===
+    if st.session_state.promo_df is not None:
+        st.divider()
+        show_period_comparison(include_online, include_indirect)
+
+    # === 시나리오 비교 ===
+    if st.session_state.promo_df is not None:
+        st.divider()
+        show_scenario_comparison(config, start_date, end_date, include_online, include_indirect, backend)
+
+    # === 저장된 포상금/추첨권 설정 적용 ===
+    if st.session_state.promo_df is not None:
+        st.divider()
+        show_saved_promotion_ranking(start_date, end_date, rank_method)
+
+    # 누적 이력 추이
+    st.divider()
+    show_history_section("promotion", default_metric="승인건수")
+
+
+def show_period_comparison(include_online: bool, include_indirect: bool):
+    """
+    주간/월간 누계 또는 사용자 지정 기간의 상담사별 실적을 비교 기간과 나란히 표시하는 섹션
+
+    Args:
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+    """
+    st.markdown("### 🗓️ 기간별 실적 비교")
+    st.caption("필터 옵션은 현재 설정을 공유합니다. 기간을 바꿔도 원본 데이터를 다시 집계하지 않고 일자 누적합에서 계산합니다.")
+
+    try:
+        prefix = get_promotion_prefix_sums(st.session_state.promo_df, include_online, include_indirect)
+    except Exception as e:
+        st.warning(f"기간 누적합 계산 중 오류가 발생했습니다: {str(e)}")
+        return
+    if prefix.last_day is None:
+        st.info("일자 정보가 있는 실적이 없습니다.")
+        return
+
+    current, previous = select_comparison_periods("promotion_range", prefix.first_day, prefix.last_day)
+    warn_uncovered_periods(prefix, current, previous)
+    comparison = compare_promotion_periods(st.session_state.promo_df, current, previous, include_online, include_indirect)
+    if comparison.empty:
+        st.info("두 기간 모두 실적이 없습니다.")
+        return
+
+    number_columns = [column for column in comparison.columns if not column.endswith("_증감")]
+    delta_columns = [column for column in comparison.columns if column.endswith("_증감")]
+    formats = {column: "{:,.0f}" for column in number_columns}
+    formats.update({column: "{:+,.0f}" for column in delta_columns})
+    st.dataframe(comparison.style.format(formats, na_rep="-"), use_container_width=True)
+
+
+def show_scenario_comparison(config: Dict, start_date: date, end_date: date,
+                             include_online: bool, include_indirect: bool, backend: str = "pandas"):
+    """
+    저장된 프로모션 설정들과 현재 설정을 같은 데이터로 한 번에 비교하는 섹션
+
+    Args:
+        config: 현재 프로모션 설정
+        start_date: 분석 시작일
+        end_date: 분석 종료일
+        include_online: 온라인파트 포함 여부
+        include_indirect: 연계승인 포함 여부
+        backend: 분류/집계 백엔드
+    """
+    st.markdown("### 🧪 프로모션 시나리오 비교")
+    st.caption("분석 기간과 필터 옵션은 현재 설정을 공유하고, 가중치/등급/최소 기준/포상금만 시나리오별로 비교합니다.")
+
+    saved_configs = list_promotion_configs()
+    selected_configs = st.multiselect(
+        "비교할 저장 설정",
+        options=saved_configs,
+        default=saved_configs,
+        key="scenario_config_select"
+    )
+    include_current = st.checkbox("현재 설정 포함", value=True, key="scenario_include_current")
+
+    extra_json = st.text_area(
+        "추가 시나리오 (JSON, 선택)",
+        value="",
+        key="scenario_extra_json",
+        help='{"시나리오명": {promotion_config.json 형식 설정}, ...} 형태로 입력합니다.'
+    )
+
+    if st.button("🧪 시나리오 비교하기", key="scenario_compare_btn", use_container_width=True):
+        scenarios, errors = load_promotion_scenarios(selected_configs)
+        if include_current:
+            scenarios.insert(0, normalize_promotion_scenario("현재 설정", config))
+
+        if extra_json.strip():
+            try:
+                for name, scenario_config in json.loads(extra_json).items():
+                    scenarios.append(normalize_promotion_scenario(name, scenario_config))
+            except Exception as e:
+                errors.append(f"추가 시나리오 JSON 오류: {str(e)}")
+
+        for error in errors:
+            st.warning(f"⚠️ {error}")
+
+        start_dt = pd.Timestamp(start_date)
+        end_dt = pd.Timestamp(end_date).replace(hour=23, minute=59, second=59)
+        filtered_df, matrix = get_promotion_matrix(
+            st.session_state.promo_df, start_dt, end_dt, include_online, include_indirect, backend
+        )
+
+        results, error = simulate_promotion_scenarios(
+            matrix, scenarios, product_amounts=build_promotion_amount_matrix(filtered_df)
+        )
+        if error:
+            st.error(f"❌ {error}")
+        else:
+            st.session_state.promo_scenario_results = results
+
+    results = st.session_state.get("promo_scenario_results")
+    if results is not None:
+        st.dataframe(
+            results["summary"],
+            column_config={
+                "총포상금": st.column_config.NumberColumn("총포상금", format="%d원")
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+
+        with st.expander("상담사별 시나리오 결과"):
+            st.dataframe(results["labels"], use_container_width=True)
+            st.dataframe(results["scores"], use_container_width=True)
+            st.dataframe(results["payouts"], use_container_width=True)
+
+
+def show_saved_promotion_ranking(start_date: date, end_date: date, rank_method: str):
+    """
+    promotion_configs에 저장된 포상금/추첨권 설정으로 순위와 포상금(또는 추첨권)을 계산하는 섹션
+
+    Args:
+        start_date: 분석 시작일
+        end_date: 분석 종료일
+        rank_method: 동점 순위 방식
+    """
+    st.markdown("### 💰 저장된 포상금/추첨권 설정 적용")
+    st.caption("분석 기간과 동점 순위 방식은 현재 설정을 공유하고, 제품/기준/최소 건수/포상금은 저장된 설정을 따릅니다.")
+
+    saved_configs = list_promotion_configs()
+    if not saved_configs:
+        st.info("저장된 포상금/추첨권 설정이 없습니다.")
+        return
+
+    config_name = st.selectbox("적용할 저장 설정", options=saved_configs, key="saved_promo_config_select")
+    config_data, error = load_promotion_config(config_name)
+    if error:
+        st.warning(f"⚠️ {error}")
+        return
+
+    settings = config_data.get("settings", {})
+    promotion_type = settings.get("promotion_type", "포상금")
+    reward_config = config_data.get("data") if promotion_type == "포상금" else None
+    lottery_weights = config_data.get("data") if promotion_type == "추첨권" else None
+    lottery_count_config = (
+        config_data.get("lottery_count_config")
+        if promotion_type == "추첨권" and config_data.get("lottery_method") == "approval_count" else None
+    )
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        tie_breaker_columns = ["누적승인(액)", "누적승인(건)", "안마의자", "라클라우드", "정수기", "상담사"]
+        if promotion_type == "추첨권":
+            tie_breaker_columns.insert(0, "추첨권")
+        tie_breakers = select_tie_breakers(
+            f"동점 해소 기준 (기준: {', '.join(settings.get('criteria', [])) or promotion_type})",
+            tie_breaker_columns, [], key="saved_promo_tie_breakers"
+        )
+    with col2:
+        split_ties = st.checkbox(
+            "구간 경계 동점자 포상금 나누기", value=True, key="saved_promo_split_ties",
+            disabled=promotion_type != "포상금",
+            help="포상 구간 경계에 걸친 동점자가 해당 위치들의 포상금 합계를 나눠 받습니다."
+        )
+
+    if st.button("💰 저장 설정으로 순위 계산", key="saved_promo_rank_btn", use_container_width=True):
+        # 포상 인원은 포상금 구간 인원 합계 (추첨권은 최소 건수를 넘은 전원이 추첨 대상)
+        reward_positions = (
+            sum(item.get("count", 0) for item in reward_config) if reward_config
+            else len(st.session_state.promo_df)
+        )
+        result_df, error = analyze_promotion_data(
+            st.session_state.promo_df,
+            settings.get("include_products", ["안마의자", "라클라우드", "정수기"]),
+            settings.get("include_services", False),
+            settings.get("direct_only", True),
+            settings.get("criteria", ["승인건수"]),
+            settings.get("min_condition", 0),
+            reward_positions,
+            pd.Timestamp(start_date),
+            pd.Timestamp(end_date).replace(hour=23, minute=59, second=59),
+            promotion_type,
+            reward_config,
+            lottery_weights,
+            rank_method=rank_method,
+            split_ties=split_ties,
+            tie_breakers=tie_breakers,
+            lottery_count_config=lottery_count_config
+        )
+        if error:
+            st.error(f"❌ {error}")
+            st.session_state.saved_promo_results = None
+        else:
+            st.session_state.saved_promo_results = (config_name, result_df)
+
+    saved_results = st.session_state.get("saved_promo_results")
+    if saved_results is not None:
+        result_config_name, result_df = saved_results
+        st.caption(f"적용 설정: {result_config_name}")
+        st.dataframe(result_df, use_container_width=True, hide_index=True)
+
+
+def show_lottery_draw(result_df: pd.DataFrame):
+    """
+    분석 결과의 추첨권(또는 점수)을 가중치로 추첨하고 추첨 로그를 내려받는 섹션
+
+    Args:
+        result_df: 프로모션 분석 결과 데이터프레임
+    """
+    st.markdown("### 🎟️ 추첨권 추첨")
+
+    ticket_columns = [col for col in ["추첨권", "점수", "승인건수"] if col in result_df.columns]
+    if not ticket_columns:
+        st.info("추첨에 사용할 수 있는 컬럼이 없습니다.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        ticket_column = st.selectbox("추첨권 기준", options=ticket_columns, key="lottery_ticket_column")
+    with col2:
+        n_winners = st.number_input("당첨자 수", min_value=1, value=3, step=1, key="lottery_n_winners")
+    with col3:
+        seed = st.number_input("난수 시드", min_value=0, value=int(datetime.now().strftime("%Y%m%d")),
+                               step=1, key="lottery_seed", help="같은 시드로 다시 추첨하면 같은 결과가 나옵니다.")
+    with col4:
+        with_replacement = st.checkbox("중복 당첨 허용", value=False, key="lottery_with_replacement")
+
+    tickets, error = build_ticket_table(result_df, ticket_column=ticket_column)
+    if error:
+        st.warning(f"⚠️ {error}")
+        return
+
+    # 확률 미리보기와 추첨 결과는 계산에 사용한 조건(기준 컬럼, 당첨자 수, 시드, 방식, 입력 지문)과 함께 저장
+    lottery_params = (ticket_column, int(n_winners), int(seed), bool(with_replacement), ticket_table_fingerprint(tickets))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("📈 당첨 확률 미리보기", key="lottery_probability_btn", use_container_width=True):
+            with st.spinner("🔄 당첨 확률 계산 중..."):
+                probabilities, error = estimate_win_probabilities(
+                    tickets, int(n_winners), seed=int(seed), with_replacement=with_replacement
+                )
+            if error:
+                st.error(f"❌ {error}")
+            else:
+                st.session_state.lottery_probabilities = (lottery_params, probabilities)
+    with col2:
+        if st.button("🎲 추첨하기", key="lottery_draw_btn", type="primary", use_container_width=True):
+            draw_log, error = draw_lottery(tickets, int(n_winners), int(seed), with_replacement)
+            if error:
+                st.error(f"❌ {error}")
+            else:
+                st.session_state.lottery_draw = (lottery_params, draw_log, tickets, int(seed), with_replacement)
+
+    probability_params, probabilities = st.session_state.get("lottery_probabilities") or (None, None)
+    if probabilities is not None and probability_params == lottery_params:
+        st.dataframe(
+            probabilities,
+            column_config={
+                "당첨확률": st.column_config.ProgressColumn("당첨확률", min_value=0.0, max_value=1.0)
+            },
+            use_container_width=True,
+            hide_index=True,
+            height=300
+        )
+    elif probabilities is not None:
+        st.caption("추첨 조건 또는 분석 결과가 바뀌어 이전 당첨 확률 미리보기를 숨겼습니다. 다시 계산하려면 미리보기를 누르세요.")
+
+    lottery_draw = st.session_state.get("lottery_draw")
+    if lottery_draw is not None:
+        draw_params, draw_log, draw_tickets, draw_seed, draw_with_replacement = lottery_draw
+        st.success(f"🎉 당첨자: {', '.join(draw_log['당첨자'])}")
+        st.dataframe(draw_log, use_container_width=True, hide_index=True)
+
+        # 당첨 확률 시트는 추첨과 같은 조건으로 계산한 경우에만 감사 로그에 포함
+        draw_probabilities = probabilities if probability_params == draw_params else None
+        if probabilities is not None and draw_probabilities is None:
+            st.caption("당첨 확률 미리보기가 이 추첨과 다른 조건으로 계산되어 추첨 로그에서 제외했습니다.")
+
+        excel_data = create_lottery_log_excel(
+            draw_log, draw_tickets, draw_seed, draw_with_replacement, draw_probabilities
+        )
+        if excel_data:
+            st.download_button(
+                label="📥 추첨 로그 다운로드",
+                data=excel_data,
+                file_name=f"추첨로그_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key="download_lottery_log_btn",
+                use_container_width=True
+            )
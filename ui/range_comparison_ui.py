@@ -0,0 +1,78 @@
+"""
+기간 비교 선택 UI 모듈
+
+일일 매출/프로모션 탭에서 주간 누계, 월간 누계, 사용자 지정 기간(A~B)과
+비교 기간(지난주 같은 요일까지 / 전월 동기간)을 선택하는 공통 위젯을 제공합니다.
+기간 합계는 각 탭의 일자 누적합에서 계산하므로 기간을 바꿔도 원본 데이터를 다시 필터링하지 않습니다.
+"""
+
+import streamlit as st
+import pandas as pd
+from typing import Tuple
+
+from logic.prefix_sum_logic import DailyPrefixSums, period_presets, same_period_last_month
+
+CUSTOM_PERIOD = "사용자 지정"
+
+
+def select_comparison_periods(
+    key: str,
+    first_day: pd.Timestamp,
+    last_day: pd.Timestamp
+) -> Tuple[Tuple[pd.Timestamp, pd.Timestamp], Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    기준 기간과 비교 기간을 선택합니다.
+
+    Args:
+        key: 위젯 키 접두사 (탭별로 구분)
+        first_day: 데이터의 첫 일자
+        last_day: 데이터의 마지막 일자 (프리셋 기준일)
+
+    Returns:
+        Tuple: ((시작일, 종료일), (비교 시작일, 비교 종료일))
+    """
+    presets = period_presets(last_day)
+    options = list(presets) + [CUSTOM_PERIOD]
+    period = st.radio("기간", options=options, horizontal=True, key=f"{key}_period")
+
+    if period == CUSTOM_PERIOD:
+        col1, col2 = st.columns(2)
+        with col1:
+            start = st.date_input("시작일", value=max(first_day, last_day.replace(day=1)).date(), key=f"{key}_start")
+        with col2:
+            end = st.date_input("종료일", value=last_day.date(), key=f"{key}_end")
+        current = (pd.Timestamp(start), pd.Timestamp(end))
+        previous = same_period_last_month(*current)
+    else:
+        current, previous = presets[period]
+
+    st.caption(
+        f"기준 {current[0].strftime('%Y-%m-%d')} ~ {current[1].strftime('%Y-%m-%d')} / "
+        f"비교 {previous[0].strftime('%Y-%m-%d')} ~ {previous[1].strftime('%Y-%m-%d')}"
+    )
+    return current, previous
+
+
+def warn_uncovered_periods(
+    prefix: DailyPrefixSums,
+    current: Tuple[pd.Timestamp, pd.Timestamp],
+    previous: Tuple[pd.Timestamp, pd.Timestamp]
+) -> None:
+    """
+    데이터 범위가 기준/비교 기간을 모두 포함하지 않으면 경고를 표시합니다.
+    (범위 밖 일자는 0으로 잘리므로 해당 기간의 값은 '-'로 표시)
+
+    Args:
+        prefix: 탭의 일자 누적합
+        current: (시작일, 종료일) 기준 기간
+        previous: (시작일, 종료일) 비교 기간
+    """
+    uncovered = [
+        label for label, period in (("기준", current), ("비교", previous))
+        if not prefix.covers(*period)
+    ]
+    if uncovered:
+        st.warning(
+            f"⚠️ 업로드한 데이터({prefix.first_day.strftime('%Y-%m-%d')} ~ {prefix.last_day.strftime('%Y-%m-%d')})가 "
+            f"{'/'.join(uncovered)} 기간을 모두 포함하지 않아 해당 기간의 값은 '-'로 표시합니다."
+        )
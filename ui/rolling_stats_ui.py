@@ -0,0 +1,72 @@
+"""
+이동평균/이상치 UI 모듈
+
+일일 매출/일일 승인 탭에서 승인 데이터의 7일/28일 이동평균과
+직전 28일 대비 급증/급감 항목(제품, 상담사, 조직별 제품)을 표시합니다.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from typing import Optional
+
+from logic.rolling_stats_logic import (
+    build_daily_counts, update_rolling_stats, summarize_anomalies,
+    ANOMALY_Z_THRESHOLD, MIN_HISTORY_DAYS
+)
+
+
+def show_rolling_section(name: str, approval_df: Optional[pd.DataFrame]):
+    """
+    승인 건수 이동평균과 이상 항목 표를 표시합니다.
+
+    Args:
+        name: 이동 통계 캐시 이름 (탭별로 구분)
+        approval_df: 원본 승인 데이터프레임 (주문 일자, 대분류 필요)
+    """
+    if approval_df is None or '주문 일자' not in approval_df.columns or '대분류' not in approval_df.columns:
+        return
+
+    try:
+        daily = build_daily_counts(approval_df)
+        if daily.empty:
+            return
+        stats, _ = update_rolling_stats(name, daily)
+        table = summarize_anomalies(stats)
+    except Exception as e:
+        st.warning(f"이동평균 계산 중 오류가 발생했습니다: {str(e)}")
+        return
+
+    flagged = int((table["이상"] != "").sum())
+    latest_day = stats.days[-1].strftime('%m월%d일')
+    with st.expander(f"📉 승인 이동평균/이상 감지 ({latest_day} 기준, 이상 {flagged}건)", expanded=False):
+        groups = list(table["구분"].unique())
+        selected_groups = st.multiselect("구분", options=groups, default=groups, key=f"rolling_groups_{name}")
+        view = table[table["구분"].isin(selected_groups)].copy()
+        view["이상"] = view["이상"].map({"급감": "🔴 급감", "급증": "🟢 급증"}).fillna("")
+        st.dataframe(
+            view.style.format({
+                "당일": "{:,.0f}", "MA7": "{:,.1f}", "MA28": "{:,.1f}",
+                "직전평균": "{:,.1f}", "z": "{:+.2f}"
+            }, na_rep="-"),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(
+            f"이동평균은 승인 실적이 있는 일자 기준입니다. 당일 건수가 직전 28일 평균에서 "
+            f"표준편차의 {ANOMALY_Z_THRESHOLD:g}배 이상 벗어나면 급증/급감으로 표시합니다. "
+            f"(직전 이력 {MIN_HISTORY_DAYS}일 미만은 제외)"
+        )
+
+        options = list(zip(table["구분"], table["항목"]))
+        selected = st.selectbox(
+            "추이 항목",
+            options=options,
+            format_func=lambda option: f"{option[0]} - {option[1]}",
+            key=f"rolling_trend_{name}"
+        )
+        if selected is not None:
+            trend = stats.trend(selected).reset_index().melt(id_vars="일자", var_name="지표", value_name="건수")
+            fig = px.line(trend, x="일자", y="건수", color="지표", markers=True)
+            fig.update_layout(height=320, margin=dict(l=10, r=10, t=30, b=10))
+            st.plotly_chart(fig, use_container_width=True)
@@ -16,8 +16,10 @@ from logic.sales_logic import (
     filter_sales_data,
     filter_by_reservation_date,
     create_aggregation_tables,
-    create_excel_output
+    create_excel_output,
+    AGGREGATION_BACKENDS
 )
+from logic.analysis_backend_logic import get_available_backends
 
 
 def show():
@@ -67,6 +69,18 @@ def show():
             help="예약/체험신청의 관리대상만 집계합니다. (과거 예약, 기준일 초과, 빈값)\n로우데이터는 영향 받지 않습니다."
         )
 
+    # 분석 백엔드 선택 (duckdb 설치 시에만 표시)
+    available_backends = get_available_backends(AGGREGATION_BACKENDS)
+    backend = "pandas"
+    if len(available_backends) > 1:
+        backend = st.selectbox(
+            "분석 엔진",
+            options=list(available_backends.keys()),
+            format_func=lambda key: available_backends[key],
+            key="sales_backend",
+            help="수백만 행 규모의 월/분기 데이터는 DuckDB가 더 빠릅니다. 결과는 동일합니다."
+        )
+
     # 예약일자 필터 설정
     custom_end_date = None
     custom_start_date = None
@@ -180,7 +194,7 @@ def show():
                         st.success(f"✅ 예약일자 필터 적용: {len(table_df)}건 (관리대상만)")
 
                 # 4. 집계 테이블 생성 (예약일자 필터 적용된 데이터로)
-                tables, error = create_aggregation_tables(table_df)
+                tables, error = create_aggregation_tables(table_df, backend)
 
                 if error:
                     st.error(f"❌ {error}")
@@ -0,0 +1,426 @@
+"""
+분석 결과 이력 관리 모듈
+
+완료된 분석의 집계 결과(일일 매출 현황, 상담원 실적, 캠페인 전환, 프로모션 순위)를
+영업일과 원본 파일 해시 기준으로 로컬 SQLite 파일(data/analysis_history.sqlite3)에 누적 저장하고,
+추이 차트와 전월 대비 비교용 데이터를 원본 파일 재처리 없이 조회하는 기능을 제공합니다.
+결과는 (분석 종류, 영업일, 파일 해시) 단위로 저장되며, 같은 파일을 다시 분석하면 덮어씁니다.
+같은 DB에 당일 콜타임 업로드 스냅샷(구분/영업일/파일 해시별 상담원 누적 콜타임)도 저장하여
+앱을 다시 시작해도 당일 페이스 추이가 유지됩니다.
+"""
+
+import os
+import sqlite3
+import hashlib
+from datetime import datetime, date
+from typing import Any, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import numpy as np
+
+# 기본 DB 파일 경로 (consultants.json과 같은 data 폴더)
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "analysis_history.sqlite3")
+
+# 분석 종류 {키: 표시 이름}
+HISTORY_KINDS = {
+    "daily_sales": "일일 매출 현황",
+    "consultant": "상담원 실적",
+    "campaign": "캠페인 전환",
+    "promotion": "프로모션 순위"
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    business_date TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    UNIQUE (kind, business_date, source_hash)
+);
+CREATE TABLE IF NOT EXISTS analysis_values (
+    run_id INTEGER NOT NULL,
+    entity TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, metric, entity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_analysis_runs_kind_date ON analysis_runs (kind, business_date);
+CREATE TABLE IF NOT EXISTS calltime_snapshots (
+    snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL,
+    business_date TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    taken_at TEXT NOT NULL,
+    UNIQUE (scope, business_date, source_hash)
+);
+CREATE TABLE IF NOT EXISTS calltime_snapshot_values (
+    snapshot_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    consultant TEXT NOT NULL,
+    seconds INTEGER NOT NULL,
+    calls INTEGER NOT NULL,
+    target_seconds INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, position)
+) WITHOUT ROWID;
+"""
+
+# 영업일별 최신 실행 (같은 날 파일을 여러 번 분석했으면 마지막 결과 사용)
+_LATEST_RUNS_SQL = """
+SELECT r.run_id, r.business_date
+FROM analysis_runs r
+WHERE r.kind = ?
+  AND r.created_at = (
+      SELECT MAX(created_at) FROM analysis_runs
+      WHERE kind = r.kind AND business_date = r.business_date
+  )
+"""
+
+# 스키마를 생성한 DB 경로 (프로세스당 한 번만 실행)
+_INITIALIZED_PATHS = set()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """DB에 연결하고, 처음 연결하는 경로면 스키마를 생성합니다."""
+    if db_path not in _INITIALIZED_PATHS:
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    if db_path not in _INITIALIZED_PATHS:
+        conn.executescript(_SCHEMA)
+        _INITIALIZED_PATHS.add(db_path)
+    return conn
+
+
+def _to_date_text(value: Any) -> str:
+    """영업일 값을 'YYYY-MM-DD' 문자열로 변환합니다. (없으면 오늘)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        value = date.today()
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def compute_source_hash(files: Iterable[Any]) -> str:
+    """
+    업로드된 원본 파일들의 내용 해시를 계산합니다.
+
+    Args:
+        files: 파일 객체(getvalue/read 지원) 또는 bytes 목록 (None은 무시)
+
+    Returns:
+        str: SHA-256 해시 앞 16자리
+    """
+    digest = hashlib.sha256()
+    for file in files:
+        if file is None:
+            continue
+        if isinstance(file, (bytes, bytearray)):
+            content = bytes(file)
+        elif hasattr(file, "getvalue"):
+            content = file.getvalue()
+        else:
+            position = file.tell()
+            file.seek(0)
+            content = file.read()
+            file.seek(position)
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()[:16]
+
+
+def save_analysis_snapshot(
+    kind: str,
+    business_date: Any,
+    source_hash: str,
+    result_df: pd.DataFrame,
+    entity_column: str,
+    db_path: str = DEFAULT_DB_PATH
+) -> Tuple[bool, Optional[str]]:
+    """
+    분석 결과 데이터프레임의 숫자 컬럼을 이력 DB에 저장합니다.
+
+    Args:
+        kind: 분석 종류 (HISTORY_KINDS 키)
+        business_date: 영업일 (없으면 오늘)
+        source_hash: 원본 파일 해시 (compute_source_hash 결과)
+        result_df: 분석 결과 데이터프레임
+        entity_column: 행 구분 컬럼 (예: "상담사", "제품", "행 레이블")
+        db_path: DB 파일 경로
+
+    Returns:
+        Tuple[bool, Optional[str]]: (성공 여부, 오류 메시지)
+    """
+    try:
+        if kind not in HISTORY_KINDS:
+            return False, f"지원하지 않는 분석 종류입니다: {kind}"
+        if result_df is None or result_df.empty:
+            return False, "저장할 분석 결과가 없습니다."
+        if entity_column not in result_df.columns:
+            return False, f"{entity_column} 컬럼이 없습니다."
+
+        # 숫자 컬럼만 (엔티티, 지표, 값) 행으로 펼침
+        metric_columns = [
+            col for col in result_df.columns
+            if col != entity_column
+            and pd.api.types.is_numeric_dtype(result_df[col])
+            and not pd.api.types.is_bool_dtype(result_df[col])
+        ]
+        if not metric_columns:
+            return False, "저장할 숫자 지표가 없습니다."
+
+        values = result_df[[entity_column] + metric_columns].dropna(subset=[entity_column])
+        values = values.drop_duplicates(subset=[entity_column], keep="first")
+        entities = values[entity_column].astype(str).to_numpy()
+        rows = [
+            (entity, metric, None if pd.isna(value) else float(value))
+            for metric in metric_columns
+            for entity, value in zip(entities, values[metric].to_numpy())
+        ]
+
+        conn = _connect(db_path)
+        try:
+            with conn:
+                key = (kind, _to_date_text(business_date), source_hash)
+                previous = conn.execute(
+                    "SELECT run_id FROM analysis_runs WHERE kind = ? AND business_date = ? AND source_hash = ?", key
+                ).fetchone()
+                if previous is not None:
+                    conn.execute("DELETE FROM analysis_values WHERE run_id = ?", previous)
+                    conn.execute("DELETE FROM analysis_runs WHERE run_id = ?", previous)
+
+                run_id = conn.execute(
+                    "INSERT INTO analysis_runs (kind, business_date, source_hash, created_at) VALUES (?, ?, ?, ?)",
+                    key + (datetime.now().isoformat(timespec="microseconds"),)
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO analysis_values (run_id, entity, metric, value) VALUES (?, ?, ?, ?)",
+                    [(run_id,) + row for row in rows]
+                )
+        finally:
+            conn.close()
+
+        return True, None
+
+    except Exception as e:
+        return False, f"분석 이력 저장 중 오류: {str(e)}"
+
+
+def list_history_metrics(kind: str, db_path: str = DEFAULT_DB_PATH) -> Tuple[List[str], List[str]]:
+    """
+    저장된 이력의 지표 목록과 엔티티 목록을 반환합니다.
+
+    Args:
+        kind: 분석 종류
+        db_path: DB 파일 경로
+
+    Returns:
+        Tuple[List[str], List[str]]: 지표 목록, 엔티티 목록 (이름순)
+    """
+    if not os.path.exists(db_path):
+        return [], []
+
+    conn = _connect(db_path)
+    try:
+        metric_rows = conn.execute(
+            "SELECT DISTINCT v.metric FROM analysis_runs r JOIN analysis_values v ON v.run_id = r.run_id "
+            "WHERE r.kind = ? ORDER BY v.metric", (kind,)
+        ).fetchall()
+        entity_rows = conn.execute(
+            "SELECT DISTINCT v.entity FROM analysis_runs r JOIN analysis_values v ON v.run_id = r.run_id "
+            "WHERE r.kind = ? ORDER BY v.entity", (kind,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [row[0] for row in metric_rows], [row[0] for row in entity_rows]
+
+
+def load_metric_history(
+    kind: str,
+    metric: str,
+    entities: Optional[List[str]] = None,
+    start_date: Any = None,
+    end_date: Any = None,
+    db_path: str = DEFAULT_DB_PATH
+) -> pd.DataFrame:
+    """
+    지표의 영업일별 추이를 조회합니다. (영업일마다 가장 마지막에 저장된 결과 사용)
+
+    Args:
+        kind: 분석 종류
+        metric: 지표(컬럼)명
+        entities: 조회할 엔티티 목록 (None이면 전체)
+        start_date: 시작 영업일 (포함)
+        end_date: 종료 영업일 (포함)
+        db_path: DB 파일 경로
+
+    Returns:
+        pd.DataFrame: 영업일(DatetimeIndex) × 엔티티 값 (이력이 없으면 빈 데이터프레임)
+    """
+    if not os.path.exists(db_path):
+        return pd.DataFrame()
+
+    sql = (
+        f"SELECT latest.business_date, v.entity, v.value FROM ({_LATEST_RUNS_SQL}) latest "
+        "JOIN analysis_values v ON v.run_id = latest.run_id WHERE v.metric = ?"
+    )
+    params: List[Any] = [kind, metric]
+    if start_date is not None:
+        sql += " AND latest.business_date >= ?"
+        params.append(_to_date_text(start_date))
+    if end_date is not None:
+        sql += " AND latest.business_date <= ?"
+        params.append(_to_date_text(end_date))
+    if entities:
+        sql += f" AND v.entity IN ({', '.join('?' * len(entities))})"
+        params.extend(str(entity) for entity in entities)
+
+    conn = _connect(db_path)
+    try:
+        history = pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+    if history.empty:
+        return pd.DataFrame()
+
+    history["business_date"] = pd.to_datetime(history["business_date"])
+    trend = history.pivot(index="business_date", columns="entity", values="value").sort_index()
+    trend.index.name = "영업일"
+    trend.columns.name = None
+    return trend
+
+
+def load_month_over_month(
+    kind: str,
+    metric: str,
+    entities: Optional[List[str]] = None,
+    db_path: str = DEFAULT_DB_PATH
+) -> pd.DataFrame:
+    """
+    월별 마지막 영업일의 지표 값으로 전월 대비 비교표를 만듭니다.
+    (일일 매출 현황처럼 월 누적 값을 저장하는 지표는 마지막 영업일 값이 곧 월 실적)
+
+    Args:
+        kind: 분석 종류
+        metric: 지표(컬럼)명
+        entities: 조회할 엔티티 목록 (None이면 전체)
+        db_path: DB 파일 경로
+
+    Returns:
+        pd.DataFrame: 엔티티 × 월(YYYY-MM) 값 + 전월대비 증감, 증감률(%) (2개월 이상일 때)
+    """
+    trend = load_metric_history(kind, metric, entities, db_path=db_path)
+    if trend.empty:
+        return pd.DataFrame()
+
+    # 월별 마지막 영업일 값 (엔티티별로 값이 있는 마지막 날)
+    monthly = trend.groupby(trend.index.to_period("M")).last().T
+    monthly.columns = [str(period) for period in monthly.columns]
+
+    if monthly.shape[1] >= 2:
+        previous, current = monthly.columns[-2], monthly.columns[-1]
+        monthly["전월대비"] = monthly[current] - monthly[previous]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            monthly["증감률(%)"] = np.where(
+                monthly[previous] != 0, monthly["전월대비"] / monthly[previous] * 100, np.nan
+            )
+
+    monthly.index.name = "항목"
+    return monthly
+
+
+def save_calltime_snapshot(
+    scope: str,
+    business_date: Any,
+    source_hash: str,
+    taken_at: datetime,
+    values: pd.DataFrame,
+    keep_days: int = 7,
+    db_path: str = DEFAULT_DB_PATH
+) -> Tuple[bool, Optional[str]]:
+    """
+    콜타임 업로드 스냅샷을 이력 DB에 저장합니다. (같은 구분/영업일/파일 해시는 한 번만 저장)
+
+    구분별로 최근 keep_days개 영업일의 스냅샷만 남기고 오래된 영업일은 삭제합니다.
+
+    Args:
+        scope: 스냅샷 구분 (예: 팀 이름, 전체)
+        business_date: 영업일 (없으면 오늘)
+        source_hash: 원본 파일 해시
+        taken_at: 업로드 시각
+        values: [상담원명, 콜타임_초, 통화건수, 목표_초] 데이터프레임 (행 순서 유지)
+        keep_days: 구분별 보관 영업일 수
+        db_path: DB 파일 경로
+
+    Returns:
+        Tuple[bool, Optional[str]]: (성공 여부, 오류 메시지)
+    """
+    try:
+        rows = [
+            (position, str(name), int(seconds), int(calls), int(target))
+            for position, (name, seconds, calls, target) in enumerate(zip(
+                values["상담원명"], values["콜타임_초"], values["통화건수"], values["목표_초"]
+            ))
+        ]
+
+        conn = _connect(db_path)
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO calltime_snapshots (scope, business_date, source_hash, taken_at) VALUES (?, ?, ?, ?)",
+                    (scope, _to_date_text(business_date), source_hash, taken_at.isoformat(timespec="microseconds"))
+                )
+                if cursor.rowcount:
+                    conn.executemany(
+                        "INSERT INTO calltime_snapshot_values (snapshot_id, position, consultant, seconds, calls, target_seconds) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(cursor.lastrowid,) + row for row in rows]
+                    )
+
+                # 구분별 최근 keep_days개 영업일만 유지
+                expired = (
+                    "SELECT snapshot_id FROM calltime_snapshots WHERE scope = ? AND business_date NOT IN ("
+                    "SELECT DISTINCT business_date FROM calltime_snapshots WHERE scope = ? "
+                    "ORDER BY business_date DESC LIMIT ?)"
+                )
+                params = (scope, scope, keep_days)
+                conn.execute(f"DELETE FROM calltime_snapshot_values WHERE snapshot_id IN ({expired})", params)
+                conn.execute(f"DELETE FROM calltime_snapshots WHERE snapshot_id IN ({expired})", params)
+        finally:
+            conn.close()
+
+        return True, None
+
+    except Exception as e:
+        return False, f"콜타임 스냅샷 저장 중 오류: {str(e)}"
+
+
+def load_calltime_snapshots(scope: str, business_date: Any, db_path: str = DEFAULT_DB_PATH) -> pd.DataFrame:
+    """
+    구분/영업일의 콜타임 스냅샷을 조회합니다.
+
+    Args:
+        scope: 스냅샷 구분
+        business_date: 영업일
+        db_path: DB 파일 경로
+
+    Returns:
+        pd.DataFrame: [업로드시각, 파일해시, 상담원명, 콜타임_초, 통화건수, 목표_초]
+            (업로드 시각, 저장 순서 정렬 / 이력이 없으면 빈 데이터프레임)
+    """
+    columns = ["업로드시각", "파일해시", "상담원명", "콜타임_초", "통화건수", "목표_초"]
+    if not os.path.exists(db_path):
+        return pd.DataFrame(columns=columns)
+
+    conn = _connect(db_path)
+    try:
+        snapshots = pd.read_sql_query(
+            "SELECT s.taken_at, s.source_hash, v.consultant, v.seconds, v.calls, v.target_seconds "
+            "FROM calltime_snapshots s JOIN calltime_snapshot_values v ON v.snapshot_id = s.snapshot_id "
+            "WHERE s.scope = ? AND s.business_date = ? ORDER BY s.taken_at, s.snapshot_id, v.position",
+            conn, params=(scope, _to_date_text(business_date))
+        )
+    finally:
+        conn.close()
+
+    snapshots.columns = columns
+    snapshots["업로드시각"] = pd.to_datetime(snapshots["업로드시각"])
+    return snapshots
@@ -0,0 +1,223 @@
+"""
+상담사 이름 별칭(alias) 관리 모듈
+
+콜타임 파일(상담원명)과 CRM 주문 파일(상담사)의 이름 표기가 공백, 접미사, 팀 태그 등으로
+다를 때 사용하는 이름 매칭 인덱스를 제공합니다.
+양쪽의 고유 이름만으로 인덱스를 만들고, 학습된 별칭은 consultants.json 옆의
+consultant_aliases.json 파일에 저장하여 다음 실행부터는 딕셔너리 조회로 처리합니다.
+"""
+
+import os
+import re
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 기본 JSON 파일 경로 (consultants.json과 같은 data 폴더)
+DEFAULT_JSON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "consultant_aliases.json")
+
+# 매칭 방향 (같은 이름이라도 방향별로 별칭을 따로 관리)
+SCOPE_CALLTIME_TO_ORDER = "calltime_to_order"  # 콜타임 상담원명 → 주문 데이터 상담사
+SCOPE_ROSTER_TO_CALLTIME = "roster_to_calltime"  # 등록 상담사명 → 콜타임 상담원명
+
+# 이름 정규화 시 제거할 패턴 (괄호/대괄호 안의 팀 태그, 공백, 호칭 접미사)
+_TAG_PATTERN = re.compile(r"\(.*?\)|\[.*?\]|（.*?）")
+_SPACE_PATTERN = re.compile(r"\s+")
+_SUFFIX_PATTERN = re.compile(r"(님|상담사|상담원|매니저|팀장)$")
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """
+    비교용으로 상담사 이름을 정규화합니다.
+
+    Args:
+        name: 원본 이름 (예: "김미정 (CRM)", " 김미정님 ")
+
+    Returns:
+        str: 정규화된 이름 (예: "김미정")
+    """
+    normalized = _TAG_PATTERN.sub("", str(name))
+    normalized = _SPACE_PATTERN.sub("", normalized)
+    normalized = _SUFFIX_PATTERN.sub("", normalized)
+    return normalized.lower()
+
+
+def load_consultant_aliases(json_path: str = DEFAULT_JSON_PATH) -> Dict[str, Dict]:
+    """
+    학습된 별칭 테이블을 로드합니다.
+
+    Args:
+        json_path: 별칭 JSON 파일 경로
+
+    Returns:
+        Dict[str, Dict]: 매칭 방향별 별칭 딕셔너리와 모호한 이름 목록
+        예: {
+            "calltime_to_order": {"김미정(CRM)": "김미정"},
+            "ambiguous": {"calltime_to_order": {"김미": ["김미정", "김미경"]}}
+        }
+    """
+    try:
+        if os.path.exists(json_path):
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        else:
+            return {}
+    except Exception as e:
+        print(f"상담사 별칭 로드 중 오류: {str(e)}")
+        return {}
+
+
+def save_consultant_aliases(aliases: Dict[str, Dict], json_path: str = DEFAULT_JSON_PATH) -> bool:
+    """
+    별칭 테이블을 JSON 파일로 저장합니다.
+
+    Args:
+        aliases: 별칭 테이블
+        json_path: 저장할 JSON 파일 경로
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    try:
+        # 디렉터리가 없으면 생성
+        os.makedirs(os.path.dirname(json_path), exist_ok=True)
+
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(aliases, f, ensure_ascii=False, indent=2)
+        return True
+    except Exception as e:
+        print(f"상담사 별칭 저장 중 오류: {str(e)}")
+        return False
+
+
+def add_consultant_alias(name: str, target: str, scope: str = SCOPE_CALLTIME_TO_ORDER,
+                         json_path: str = DEFAULT_JSON_PATH) -> bool:
+    """
+    별칭을 수동으로 등록합니다. (모호한 이름을 관리자가 직접 지정할 때 사용)
+
+    Args:
+        name: 원본 이름
+        target: 매칭할 상대편 이름
+        scope: 매칭 방향
+        json_path: JSON 파일 경로
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    aliases = load_consultant_aliases(json_path)
+    aliases.setdefault(scope, {})[name] = target
+
+    # 수동 지정은 후보가 여러 개여도 유지되도록 따로 기록
+    aliases.setdefault("manual", {}).setdefault(scope, {})[name] = target
+
+    # 지정된 이름은 더 이상 모호하지 않음
+    aliases.get("ambiguous", {}).get(scope, {}).pop(name, None)
+
+    return save_consultant_aliases(aliases, json_path)
+
+
+def resolve_consultant_names(
+    names: Iterable[str],
+    candidates: Iterable[str],
+    scope: str = SCOPE_CALLTIME_TO_ORDER,
+    json_path: Optional[str] = DEFAULT_JSON_PATH
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    고유 이름 목록을 상대편 고유 이름 목록에 매칭하는 인덱스를 생성합니다.
+
+    매칭 순서:
+    1. 정확히 일치하는 이름
+    2. 수동으로 지정한 별칭 (상대편에 해당 이름이 있는 경우만)
+    3. 학습된 별칭 (상대편에 해당 이름이 있는 경우만)
+    4. 정규화된 이름이 일치하는 경우 (후보가 하나일 때만)
+    5. 정규화된 이름의 포함 관계 (후보가 하나일 때만)
+
+    4, 5는 별칭이 없거나 별칭의 상대편 이름이 더 이상 후보에 없는 이름만 검사합니다.
+    후보가 둘 이상이면 임의로 고르지 않고 모호한 이름으로 표시하며,
+    상대편에서 사라진 이름을 가리키던 학습 별칭은 삭제합니다.
+    새로 학습된 별칭과 모호한 이름은 json_path에 저장됩니다 (None이면 저장하지 않음).
+
+    Args:
+        names: 매칭할 이름 목록 (중복 허용)
+        candidates: 상대편 이름 목록 (중복 허용)
+        scope: 매칭 방향
+        json_path: 별칭 JSON 파일 경로
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, List[str]]]: 이름 → 상대편 이름 매핑, 모호한 이름 → 후보 목록
+    """
+    unique_names = {str(name) for name in names if isinstance(name, str) and name.strip()}
+    unique_candidates = {str(name) for name in candidates if isinstance(name, str) and name.strip()}
+
+    aliases = load_consultant_aliases(json_path) if json_path else {}
+    learned = aliases.get(scope, {})
+    manual = aliases.get("manual", {}).get(scope, {})
+
+    # 정규화 이름 → 원본 이름 목록 (상대편 이름은 한 번만 정규화)
+    normalized_candidates: Dict[str, List[str]] = {}
+    for candidate in sorted(unique_candidates):
+        normalized_candidates.setdefault(normalize_name(candidate), []).append(candidate)
+
+    name_map: Dict[str, str] = {}
+    ambiguous: Dict[str, List[str]] = {}
+    newly_learned: Dict[str, str] = {}
+    stale_aliases: List[str] = []
+
+    for name in sorted(unique_names):
+        # 1. 정확히 일치
+        if name in unique_candidates:
+            name_map[name] = name
+            continue
+
+        # 2. 수동 지정 별칭
+        manual_target = manual.get(name)
+        if manual_target in unique_candidates:
+            name_map[name] = manual_target
+            continue
+
+        # 3. 학습된 별칭 (이전 실행에서 하나로 확정된 매칭)
+        learned_target = learned.get(name)
+        if learned_target in unique_candidates:
+            name_map[name] = learned_target
+            continue
+
+        normalized = normalize_name(name)
+        if not normalized:
+            continue
+
+        # 4. 정규화 이름 일치
+        matches = normalized_candidates.get(normalized, [])
+
+        # 5. 포함 관계 (양방향)
+        if not matches:
+            matches = [
+                original
+                for key, originals in normalized_candidates.items()
+                if key and (normalized in key or key in normalized)
+                for original in originals
+            ]
+
+        if len(matches) == 1:
+            name_map[name] = matches[0]
+            newly_learned[name] = matches[0]
+        elif len(matches) > 1:
+            # 학습 별칭의 상대편 이름이 사라진 뒤 모호해진 이름은 별칭을 삭제
+            ambiguous[name] = matches
+            if name in learned:
+                stale_aliases.append(name)
+
+    # 학습 결과 저장 (변경이 있을 때만)
+    if json_path:
+        stored_ambiguous = aliases.get("ambiguous", {}).get(scope, {})
+        if newly_learned or stale_aliases or ambiguous != {k: v for k, v in stored_ambiguous.items() if k in unique_names}:
+            scope_aliases = aliases.setdefault(scope, {})
+            scope_aliases.update(newly_learned)
+            for name in stale_aliases:
+                scope_aliases.pop(name, None)
+            scope_ambiguous = {k: v for k, v in stored_ambiguous.items() if k not in unique_names}
+            scope_ambiguous.update(ambiguous)
+            aliases.setdefault("ambiguous", {})[scope] = scope_ambiguous
+            save_consultant_aliases(aliases, json_path)
+
+    return name_map, ambiguous
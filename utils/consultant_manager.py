@@ -184,6 +184,27 @@ def get_team_by_consultant(name: str, json_path: str = DEFAULT_JSON_PATH) -> Opt
 
     return None
 
+def get_consultant_team_map(json_path: str = DEFAULT_JSON_PATH) -> Dict[str, str]:
+    """
+    상담사 이름 → 팀 이름 매핑을 한 번에 가져옵니다.
+    (여러 상담사의 팀을 조회할 때 JSON 파일을 반복해서 읽지 않도록 사용)
+
+    Args:
+        json_path: JSON 파일 경로
+
+    Returns:
+        Dict[str, str]: 상담사 이름을 키로 하는 팀 이름 딕셔너리
+    """
+    consultants = load_consultants(json_path)
+    team_map = {}
+
+    # get_team_by_consultant와 같이 먼저 나오는 팀을 우선
+    for team, members in consultants.items():
+        for member in members:
+            team_map.setdefault(member, team)
+
+    return team_map
+
 def add_team(team_name: str, json_path: str = DEFAULT_JSON_PATH) -> bool:
     """
     새로운 팀을 추가합니다.
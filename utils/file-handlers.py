@@ -18,7 +18,7 @@ from config import CONSULTANT_SETTINGS, SALES_ANALYSIS
 # 개선된 유틸리티 함수 가져오기
 from improved_utils import (
     read_excel_file, normalize_column_names, standardized_error_handler, 
-    time_to_seconds, logger
+    parse_duration_seconds, logger
 )
 
 
@@ -361,14 +361,10 @@ def process_calltime_html(file) -> pd.DataFrame:
                     
                     # 0:00:00 시간은 제외
                     if time not in ['0:00:00', '00:00:00', '0']:
-                        # 시간을 초로 변환
-                        seconds = time_to_seconds(time)
-                        
                         result_data.append({
                             '상담원명': name,
                             '총 건수': count,
-                            '총 시간': time,
-                            '총 시간_초': seconds
+                            '총 시간': time
                         })
                 except:
                     continue
@@ -376,6 +372,8 @@ def process_calltime_html(file) -> pd.DataFrame:
         # 결과 데이터프레임 생성
         if result_data:
             result_df = pd.DataFrame(result_data)
+            # 시간을 초로 변환 (전체 행을 한 번에)
+            result_df['총 시간_초'] = parse_duration_seconds(result_df['총 시간']).to_numpy()
             return result_df
         else:
             raise ValueError("유효한 상담원 데이터를 추출할 수 없습니다.")
@@ -413,6 +411,6 @@ def clean_calltime_data(df: pd.DataFrame) -> pd.DataFrame:
     df = df[~df['총 시간'].astype(str).isin(zero_time_patterns)].copy()
     
     # 시간을 초로 변환
-    df['총 시간_초'] = df['총 시간'].apply(time_to_seconds)
+    df['총 시간_초'] = parse_duration_seconds(df['총 시간']).to_numpy()
     
     return df
\ No newline at end of file
@@ -34,6 +34,8 @@ DEFAULT_CONFIG = {
         {"name": "3등급", "min_score": 3, "max_score": 4}
     ],
     "analysis_mode": "건수별",  # "제품별" | "건수별" | "금액별"
+    "rank_method": "competition",  # 동점 순위 방식 (promotion_ranking_logic.RANK_METHODS)
+    "tie_breakers": {},  # 분석 기준별 동점 해소 기준 {"건수별": [["승인액", false]], ...} (없으면 기본값)
     "date_range": {
         "start_date": None,
         "end_date": None
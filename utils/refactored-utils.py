@@ -10,7 +10,6 @@ import base64
 from io import BytesIO, StringIO
 import io
 import html
-import re
 import os
 import time
 import logging
@@ -26,6 +25,9 @@ from config import (
     FILE_SETTINGS, ERROR_MESSAGES, SUCCESS_MESSAGES
 )
 
+# 콜타임 변환은 utils.utils의 공통 파서 사용
+from utils.utils import parse_duration_seconds
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -387,6 +389,7 @@ def normalize_column_names(df: pd.DataFrame, name_map: Dict[str, List[str]], req
 def time_to_seconds(time_str: str) -> int:
     """
     시간 문자열(HH:MM:SS)을 초 단위로 변환합니다.
+    여러 값을 변환할 때는 parse_duration_seconds를 사용합니다.
     
     Args:
         time_str (str): 변환할 시간 문자열
@@ -394,27 +397,7 @@ def time_to_seconds(time_str: str) -> int:
     Returns:
         int: 초 단위 시간
     """
-    try:
-        if pd.isna(time_str):
-            return 0
-        
-        time_str = str(time_str)
-        time_parts = re.findall(r'\d+', time_str)
-        
-        if not time_parts:
-            return 0
-            
-        # 시간 형식에 따라 변환
-        if len(time_parts) == 3:  # HH:MM:SS
-            h, m, s = map(int, time_parts)
-            return h * 3600 + m * 60 + s
-        elif len(time_parts) == 2:  # MM:SS
-            m, s = map(int, time_parts)
-            return m * 60 + s
-        else:
-            return int(time_parts[0])
-    except:
-        return 0
+    return int(parse_duration_seconds([time_str]).iloc[0])
 
 
 def copy_to_clipboard(text: Any) -> str:
@@ -6,12 +6,13 @@ CRM 데이터 분석기 유틸리티 함수 모듈
 """
 
 import pandas as pd
+import numpy as np
 import base64
 from io import BytesIO
 import io
 import html
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
 import requests
 import xml.etree.ElementTree as ET
 import logging
@@ -117,6 +118,145 @@ def format_time(seconds: Union[int, float]) -> str:
     secs = int(seconds % 60)
     return f"{hours}:{minutes:02d}:{secs:02d}"
 
+# 시간 문자열에서 숫자 묶음을 최대 4개까지 추출 (4개 이상이면 첫 값을 초로 간주)
+_DURATION_PATTERN = r'^\D*(\d+)(?:\D+(\d+))?(?:\D+(\d+))?(?:\D+(\d+))?'
+
+# Excel 날짜 기준일 (24시간 이상 [h]:mm:ss 값은 이 날짜 기준 datetime으로 읽힘)
+_EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+_EXCEL_LEAP_BUG_DATE = pd.Timestamp('1900-03-01')
+
+def _text_duration_seconds(text: pd.Series) -> np.ndarray:
+    """
+    시간 문자열을 초 단위로 변환합니다. (숫자 묶음 3개: H:M:S, 2개: M:S, 그 외: 첫 값이 초)
+    """
+    seconds = np.zeros(len(text))
+
+    # 대부분을 차지하는 H:MM:SS 문자열은 pd.to_timedelta로 바로 변환
+    is_hms = text.str.fullmatch(r'\s*\d+:\d+:\d+\s*').fillna(False).to_numpy(dtype=bool)
+    if is_hms.any():
+        seconds[is_hms] = pd.to_timedelta(text[is_hms], errors='coerce').dt.total_seconds().to_numpy()
+
+    # 나머지 형식과 변환 실패 값(예: 1:60:00)은 숫자 묶음 추출로 처리
+    rest = ~is_hms | np.isnan(seconds)
+    if rest.any():
+        parts = text[rest].str.extract(_DURATION_PATTERN).apply(pd.to_numeric)
+        n_parts = parts.notna().sum(axis=1).to_numpy()
+        first, second, third = (parts[col].to_numpy(dtype=float) for col in range(3))
+        seconds[rest] = np.select(
+            [n_parts == 3, n_parts == 2, n_parts >= 1],
+            [first * 3600 + second * 60 + third, first * 60 + second, first],
+            default=0
+        )
+
+    return seconds
+
+def _datetime_duration_seconds(values: pd.Series) -> np.ndarray:
+    """
+    datetime 값을 초 단위로 변환합니다. (1900년 이전이면 Excel 기준일부터의 경과 시간, 그 외는 시각)
+    """
+    values = pd.to_datetime(values, errors='coerce')
+    # 1900-03-01 이전 값은 Excel의 1900년 윤년 버그 때문에 기준일이 하루 늦음 (1900-01-01 = 1일)
+    elapsed = (values - _EXCEL_EPOCH).dt.total_seconds() - np.where(values < _EXCEL_LEAP_BUG_DATE, 86400, 0)
+    time_of_day = (values - values.dt.normalize()).dt.total_seconds()
+    return np.where(values.dt.year <= 1900, elapsed, time_of_day)
+
+def _numeric_duration_seconds(values: pd.Series) -> np.ndarray:
+    """
+    숫자 값을 초 단위로 변환합니다. (정수는 초, 소수는 Excel 시간 값인 일(day) 단위)
+    """
+    values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+    is_fraction = np.isfinite(values) & (values != np.floor(values))
+    return np.where(is_fraction, values * 86400, values)
+
+def parse_duration_seconds(values: Any) -> pd.Series:
+    """
+    콜타임 값들을 초 단위 정수로 한 번에 변환합니다.
+
+    지원 형식:
+    - 문자열: "H:MM:SS", "MM:SS", "초", "2시간 3분 4초" 등 (숫자 묶음 개수로 판단)
+    - datetime.time / timedelta / pd.Timedelta
+    - datetime / pd.Timestamp (24시간 이상 Excel 값은 1899-12-30 기준 경과 시간)
+    - 숫자 (정수는 초, 소수는 Excel 시간 값)
+    변환할 수 없는 값과 결측값은 0이 됩니다.
+
+    Args:
+        values (Any): 시간 값 Series 또는 리스트
+
+    Returns:
+        pd.Series: 초 단위 시간 (int)
+
+    Example:
+        >>> parse_duration_seconds(["1:01:05", "02:30", datetime.time(0, 1, 0), 0.5]).tolist()
+        [3665, 150, 60, 43200]
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    seconds = pd.Series(0.0, index=series.index)
+
+    if series.empty:
+        return seconds.astype(int)
+
+    if pd.api.types.is_timedelta64_dtype(series):
+        seconds[:] = series.dt.total_seconds().to_numpy()
+    elif pd.api.types.is_datetime64_any_dtype(series):
+        seconds[:] = _datetime_duration_seconds(series)
+    elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        seconds[:] = _numeric_duration_seconds(series)
+    else:
+        # 혼합 타입 컬럼은 값의 타입별로 나누어 변환
+        kinds = series.map(type)
+        text_mask = kinds == str
+        time_mask = kinds == dt_time
+        timedelta_mask = kinds.isin([timedelta, pd.Timedelta])
+        datetime_mask = kinds.isin([datetime, pd.Timestamp])
+        numeric_mask = kinds.isin([int, float, np.int64, np.float64, np.int32, np.float32])
+
+        if text_mask.any():
+            seconds[text_mask] = _text_duration_seconds(series[text_mask])
+        if time_mask.any():
+            seconds[time_mask] = _text_duration_seconds(series[time_mask].map(lambda t: t.strftime('%H:%M:%S')))
+        if timedelta_mask.any():
+            seconds[timedelta_mask] = pd.to_timedelta(series[timedelta_mask]).dt.total_seconds().to_numpy()
+        if datetime_mask.any():
+            seconds[datetime_mask] = _datetime_duration_seconds(series[datetime_mask])
+        if numeric_mask.any():
+            seconds[numeric_mask] = _numeric_duration_seconds(series[numeric_mask])
+
+    return seconds.fillna(0).round().astype(int)
+
+def format_duration(seconds: Any) -> pd.Series:
+    """
+    초 단위 시간들을 H:MM:SS 형식 문자열로 한 번에 변환합니다. (format_time의 벡터 버전)
+
+    Args:
+        seconds (Any): 초 단위 시간 Series 또는 리스트
+
+    Returns:
+        pd.Series: H:MM:SS 형식의 시간 문자열
+
+    Example:
+        >>> format_duration([3665, 0, None, 90061]).tolist()
+        ['1:01:05', '0:00:00', '0:00:00', '25:01:01']
+    """
+    series = seconds if isinstance(seconds, pd.Series) else pd.Series(list(seconds), dtype=object)
+    total = np.floor(pd.to_numeric(series, errors='coerce').fillna(0)).astype('int64')
+
+    hours = (total // 3600).astype(str)
+    minutes = (total % 3600 // 60).astype(str).str.zfill(2)
+    secs = (total % 60).astype(str).str.zfill(2)
+    return hours + ':' + minutes + ':' + secs
+
+def duration_to_excel_time(values: Any) -> pd.Series:
+    """
+    콜타임 값들을 Excel 시간 값(일 단위 분수, 1시간 = 1/24)으로 변환합니다.
+
+    Args:
+        values (Any): 시간 값 Series 또는 리스트 (parse_duration_seconds 지원 형식)
+
+    Returns:
+        pd.Series: Excel 시간 값
+    """
+    return parse_duration_seconds(values) / 86400
+
 def copy_to_clipboard(text: Any) -> str:
     """
     텍스트를 클립보드에 복사하는 JavaScript 함수를 생성합니다.